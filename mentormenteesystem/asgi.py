@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mentormenteesystem.settings')
 
 application = get_asgi_application()
+
+# Compiles templates and primes caches when WARMUP_ON_BOOT is set
+from system.warmup import warm_up_worker  # noqa: E402
+
+warm_up_worker()
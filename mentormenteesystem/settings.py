@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from datetime import timedelta
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,11 +42,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'system.middleware.RequestLoggingMiddleware',
+    'system.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'system.middleware.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'system.middleware.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -56,13 +61,20 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': ['templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Compiled templates are kept per process; `manage.py warmup` (or
+            # WARMUP_ON_BOOT) fills this cache before the first request
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -80,6 +92,21 @@ DATABASES = {
     }
 }
 
+# Cache shared by every worker process: sidebars, mentor facets and page ETags
+# are keyed on version stamps (system.caching) that signals bump in whichever
+# worker saved the row, so a per-process cache such as LocMemCache would leave
+# the other workers serving stale pages. Use Redis or Memcached where available.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+# Runs the tests with their own cache directory
+TEST_RUNNER = 'system.test_runner.TestRunner'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -117,6 +144,12 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Page styles and scripts live in system/static/system/ and are linked from
+# the templates (all extend base.html). collectstatic copies them to
+# STATIC_ROOT under fingerprinted names (app.<hash>.css), which
+# system.views.serve_static marks immutable; run it on every deploy.
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -133,6 +166,42 @@ import os
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Uploaded files are stored under their content hash (system.storage); the
+# default storage is kept for files whose names are chosen by the code, such
+# as profile picture renditions.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'content_addressed': {
+        'BACKEND': 'system.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'system.storage.FingerprintedStaticFilesStorage',
+    },
+}
+
+# Cache lifetime for media served by system.views.serve_media. Content-addressed
+# files never change, so browsers keep them for a year, marked immutable.
+MEDIA_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+STATIC_IMMUTABLE_MAX_AGE = MEDIA_IMMUTABLE_MAX_AGE
+
+# Media access is checked by Django in every environment (system.media). Set
+# MEDIA_SENDFILE to 'x-accel-redirect' (nginx) or 'x-sendfile' (Apache, lighttpd)
+# to let the front proxy send the file and handle Range requests instead of a
+# worker; nginx needs an internal location at MEDIA_ACCEL_PREFIX aliasing MEDIA_ROOT.
+MEDIA_SENDFILE = None
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# CSV files uploaded to the bulk import page (system.importers) hash their
+# passwords in at most IMPORT_UPLOAD_WORKERS processes, so one upload can't
+# take every core from the web workers; 1 hashes in the request's own process.
+# Hashing still takes a few hundred milliseconds per row, so the page refuses
+# files over IMPORT_UPLOAD_MAX_ROWS rows before it would outlast the request
+# timeout; import those with `manage.py import_users`, which uses all cores.
+IMPORT_UPLOAD_WORKERS = 2
+IMPORT_UPLOAD_MAX_ROWS = 200
+
 # Email configuration for password reset
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'  # or your email provider
@@ -142,4 +211,101 @@ EMAIL_HOST_USER = 'your-email@gmail.com'
 EMAIL_HOST_PASSWORD = 'your-app-password'
 
 # Or for development, use console backend:
-# EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
\ No newline at end of file
+# EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+# Per-request SQL instrumentation (system.middleware.QueryInstrumentationMiddleware)
+SQL_N_PLUS_ONE_THRESHOLD = 10  # repeats of one statement in a request before warning
+SQL_TOP_STATEMENTS = 3         # repeated statements included in each request's log line
+SLOW_REQUEST_MS = 500          # requests slower than this are logged at INFO, the rest at DEBUG
+
+# Prometheus metrics at /metrics (system.metrics). Each worker flushes its
+# counters to METRICS_DB every METRICS_FLUSH_INTERVAL seconds and the
+# endpoint sums them; None keeps metrics per process. Staff sessions can
+# always scrape; set METRICS_TOKEN to let Prometheus scrape with a bearer token.
+METRICS_DB = BASE_DIR / '.metrics.sqlite3'
+METRICS_FLUSH_INTERVAL = 10
+METRICS_TOKEN = None
+
+# On-demand profiling (system.profiling): staff and head users add ?__profile
+# (or ?__profile=memory) to a URL; the newest PROFILE_RETENTION captures are
+# kept in PROFILE_DIR and listed in the admin under Request profiles.
+PROFILE_DIR = BASE_DIR / '.profiles'
+PROFILE_RETENTION = 50
+
+# Chunked uploads of session materials and report files (system.uploads).
+# Parts are assembled in UPLOAD_TEMP_DIR; uploads untouched for UPLOAD_EXPIRY
+# are discarded.
+UPLOAD_TEMP_DIR = BASE_DIR / '.uploads'
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+UPLOAD_MAX_SIZE = 1024 * 1024 * 1024
+UPLOAD_EXPIRY = timedelta(days=1)
+
+# Response compression (system.compression): text responses of at least
+# COMPRESS_MIN_SIZE bytes go out as brotli (when the brotli package is
+# installed) or gzip. collectstatic stores .br/.gz copies of static files;
+# compressed JSON bodies are cached for COMPRESS_VARIANT_TIMEOUT seconds.
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_VARIANT_TIMEOUT = 60 * 60
+
+# Live updates (system.events): /mmms/events/ streams assignment and session
+# events to mentors and mentees when served over ASGI. Events are shared
+# between workers through EVENTS_DB (None keeps them in each process) and kept
+# for EVENTS_RETENTION seconds so reconnecting browsers catch up. Streams look
+# for other workers' events every EVENTS_POLL_INTERVAL seconds, send a comment
+# every EVENTS_KEEPALIVE seconds and close after EVENTS_STREAM_TIMEOUT; under
+# WSGI the browser polls every EVENTS_WSGI_RETRY seconds instead.
+EVENTS_DB = BASE_DIR / '.events.sqlite3'
+EVENTS_RETENTION = 60 * 60
+EVENTS_POLL_INTERVAL = 2
+EVENTS_KEEPALIVE = 15
+EVENTS_STREAM_TIMEOUT = 5 * 60
+EVENTS_WSGI_RETRY = 30
+
+# Homepages (system.dashboards): with ASYNC_DASHBOARDS the three homepages are
+# async views that run their independent statistics queries at the same time
+# on up to DASHBOARD_QUERY_WORKERS pooled connections. That pays off against a
+# networked database; on a local SQLite file the thread hand-offs cost more
+# than they save, so it is off here. Compare both versions on your database
+# with `manage.py benchmark_dashboards`.
+ASYNC_DASHBOARDS = False
+DASHBOARD_QUERY_WORKERS = 4
+
+# Warm-up (system.warmup): compile every template and prime caches when a
+# worker loads wsgi.py/asgi.py, so the first requests after a deploy aren't
+# the slow ones. `manage.py warmup` does the same on demand and reports timings.
+WARMUP_ON_BOOT = False
+
+# Structured logging (system.logs). Every record carries the request's
+# correlation id (X-Request-ID). Set LOG_LEVEL to 'DEBUG' for the assignment
+# and attendance traces and a SQL summary of every request; they are then kept for LOG_DEBUG_SAMPLE_RATE of
+# requests (1.0 = all), so production can sample without flooding the logs.
+LOG_LEVEL = 'INFO'
+LOG_DEBUG_SAMPLE_RATE = 1.0 if DEBUG else 0.01
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'request_context': {
+            '()': 'system.logs.RequestContextFilter',
+        },
+    },
+    'formatters': {
+        'json': {
+            '()': 'system.logs.JsonFormatter',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'filters': ['request_context'],
+            'formatter': 'json',
+        },
+    },
+    'loggers': {
+        'system': {
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
+        },
+    },
+}
@@ -15,14 +15,16 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+
+from system.views import metrics_view, serve_media, serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('mmms/', include('system.urls'))
+    path('mmms/', include('system.urls')),
+    path('metrics', metrics_view, name='metrics'),
+    re_path(r'^%s(?P<path>.*)$' % settings.STATIC_URL.lstrip('/'), serve_static, name='static'),
+    # Access-checked in every environment; see system/media.py for proxy offload
+    re_path(r'^%s(?P<path>.*)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
 ]
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mentormenteesystem.settings')
 
 application = get_wsgi_application()
+
+# Compiles templates and primes caches when WARMUP_ON_BOOT is set
+from system.warmup import warm_up_worker  # noqa: E402
+
+warm_up_worker()
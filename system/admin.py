@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import CustomUser, Mentee, Mentor, HeadofMentorMentee, Activity, Attendance, MentoringSession, ActivityReport
+from .models import CustomUser, Mentee, Mentor, HeadofMentorMentee, Activity, Attendance, MentoringSession, ActivityReport, RequestProfile
+from .profiling import stats_table, STATS_SORTS
 
 @admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
@@ -72,4 +73,33 @@ class MentoringSessionAdmin(admin.ModelAdmin):
 class ActivityReportAdmin(admin.ModelAdmin):
     list_display = ('activity', 'created_at', 'updated_at')
     search_fields = ('activity__ActivityName', 'summary')
-    readonly_fields = ('created_at', 'updated_at')
\ No newline at end of file
+    readonly_fields = ('created_at', 'updated_at')
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    """Read-only captures from ?__profile; the change page shows the sorted profile table"""
+    list_display = ('created_at', 'method', 'path', 'view_name', 'status_code', 'duration_ms', 'query_count', 'query_ms', 'user')
+    list_filter = ('view_name', 'status_code')
+    search_fields = ('path', 'view_name', 'request_id')
+    date_hierarchy = 'created_at'
+    change_form_template = 'admin/system/requestprofile/change_form.html'
+    fields = ('created_at', 'user', 'request_id', 'method', 'path', 'view_name', 'status_code',
+              'duration_ms', 'query_count', 'query_ms', 'stats_file')
+    readonly_fields = fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        capture = self.get_object(request, object_id)
+        sort = request.GET.get('sort', 'cumulative')
+        extra_context = {
+            **(extra_context or {}),
+            'stats_rows': stats_table(capture, sort) if capture else None,
+            'stats_sort': sort if sort in STATS_SORTS else 'cumulative',
+            'stats_sorts': STATS_SORTS,
+        }
+        return super().change_view(request, object_id, form_url, extra_context)
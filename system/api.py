@@ -0,0 +1,220 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import BadRequest, FieldDoesNotExist, ValidationError
+from django.http import JsonResponse
+
+from .filters import filter_mentees, filter_assignments, filter_activities, filter_attendance
+from .models import Activity, Attendance, Mentee, Mentor, MentorMenteeAssignment, get_course_full_name
+
+# Read-only JSON lists for internal tools. Rows come from .values() over only
+# the requested columns (?fields=a,b), so no model instances are built, and
+# pages follow a keyset cursor on each resource's primary key rather than
+# OFFSET, so deep pages cost the same as the first one.
+#
+#   GET /mmms/head/api/mentees/?fields=id,name,mentor_id&status=active&limit=500
+#   -> {"results": [...], "next_cursor": "WyJNMDAxMjMiXQ"}   (null on the last page)
+#
+# Each list takes the same filters as its HTML page (see filters.py).
+
+API_DEFAULT_LIMIT = 100
+API_MAX_LIMIT = 1000
+
+
+class ApiError(Exception):
+    """A bad query string; reported to the client as a 400"""
+
+
+class _ApiResource:
+    """Public field names, their ORM lookups and the filters for one list"""
+
+    def __init__(self, model, key, fields, default_fields, filter_rows=None, formatters=None):
+        self.model = model
+        self.key = key  # unique, orderable column the cursor pages on
+        self.fields = fields
+        self.default_fields = default_fields
+        self.filter_rows = filter_rows
+        self.formatters = formatters or {}
+
+    def queryset(self, params):
+        rows = self.model.objects.all()
+        if self.filter_rows is not None:
+            try:
+                rows = self.filter_rows(rows, params)
+            except (BadRequest, ValidationError, ValueError) as error:
+                raise ApiError(_error_message(error))
+        return rows
+
+    def key_value(self, value):
+        """``value`` as the key column's Python type, or ApiError if it can't be one"""
+        try:
+            return self.model._meta.get_field(self.key).to_python(value)
+        except (FieldDoesNotExist, ValidationError, ValueError, TypeError):
+            raise ApiError('Invalid cursor')
+
+
+def _error_message(error):
+    if isinstance(error, ValidationError):
+        return '; '.join(error.messages)
+    return str(error)
+
+
+API_RESOURCES = {
+    'mentees': _ApiResource(
+        Mentee, 'MenteeID',
+        fields={
+            'id': 'MenteeID',
+            'name': 'MenteeName',
+            'course': 'MenteeCourse',
+            'semester': 'MenteeSemester',
+            'year': 'Year',
+            'gender': 'MenteeGender',
+            'status': 'MenteeStatus',
+            'email': 'MenteeEmail',
+            'phone': 'MenteePhone',
+            'join_date': 'MenteeJoinDate',
+            'current_cgpa': 'CurrentCGPA',
+            'target_cgpa': 'TargetCGPA',
+            'mentor_id': 'assigned_mentor_id',
+            'mentor_name': 'assigned_mentor__MentorName',
+        },
+        default_fields=['id', 'name', 'course', 'semester', 'status', 'mentor_id'],
+        filter_rows=filter_mentees,
+        # Shown by full name, as on manage_mentees and in the CSV export
+        formatters={'course': get_course_full_name},
+    ),
+    'mentors': _ApiResource(
+        Mentor, 'MentorID',
+        fields={
+            'id': 'MentorID',
+            'name': 'MentorName',
+            'email': 'MentorEmail',
+            'phone': 'MentorPhone',
+            'department': 'MentorDepartment',
+            'max_mentees': 'MaxMentees',
+            'current_mentees': 'CurrentMentees',
+            'join_date': 'MentorJoinDate',
+        },
+        default_fields=['id', 'name', 'department', 'max_mentees', 'current_mentees'],
+    ),
+    'assignments': _ApiResource(
+        MentorMenteeAssignment, 'assignment_id',
+        fields={
+            'id': 'assignment_id',
+            'mentee_id': 'mentee_id',
+            'mentee_name': 'mentee__MenteeName',
+            'mentor_id': 'mentor_id',
+            'mentor_name': 'mentor__MentorName',
+            'status': 'assignment_status',
+            'assigned_date': 'assigned_date',
+            'assigned_by': 'assigned_by__username',
+            'notes': 'notes',
+        },
+        default_fields=['id', 'mentee_id', 'mentor_id', 'status', 'assigned_date'],
+        filter_rows=filter_assignments,
+    ),
+    'activities': _ApiResource(
+        Activity, 'ActivityID',
+        fields={
+            'id': 'ActivityID',
+            'name': 'ActivityName',
+            'type': 'ActivityType',
+            'description': 'Description',
+            'date': 'Date',
+            'start_time': 'StartTime',
+            'end_time': 'EndTime',
+            'location': 'Location',
+            'is_mentoring_session': 'IsMentoringSession',
+            'primary_mentor_id': 'PrimaryMentor_id',
+            'created_at': 'CreatedAt',
+        },
+        default_fields=['id', 'name', 'type', 'date', 'start_time', 'end_time', 'location'],
+        filter_rows=filter_activities,
+    ),
+    'attendance': _ApiResource(
+        Attendance, 'id',
+        fields={
+            'id': 'id',
+            'activity_id': 'activity_id',
+            'activity_name': 'activity__ActivityName',
+            'date': 'activity__Date',
+            'mentee_id': 'mentee_id',
+            'mentee_name': 'mentee__MenteeName',
+            'attended': 'attended',
+            'notes': 'notes',
+        },
+        default_fields=['id', 'activity_id', 'mentee_id', 'attended'],
+        filter_rows=filter_attendance,
+    ),
+}
+
+
+def encode_cursor(value):
+    """Opaque cursor for the page after the row whose key is ``value``"""
+    return base64.urlsafe_b64encode(json.dumps([value]).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ApiError('Invalid cursor')
+    if not isinstance(value, (str, int)):
+        raise ApiError('Invalid cursor')
+    return value
+
+
+def _requested_fields(resource, params):
+    requested = params.get('fields')
+    if not requested:
+        return list(resource.default_fields)
+    names = list(dict.fromkeys(name.strip() for name in requested.split(',') if name.strip()))
+    unknown = [name for name in names if name not in resource.fields]
+    if unknown or not names:
+        raise ApiError('Unknown field(s): {}. Available: {}'.format(
+            ', '.join(unknown) or '(none given)', ', '.join(resource.fields)))
+    return names
+
+
+def _limit(params):
+    try:
+        limit = int(params.get('limit', API_DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError('limit must be an integer')
+    return max(1, min(limit, API_MAX_LIMIT))
+
+
+def list_page(resource, params):
+    """One page of ``resource`` as {'results': [...], 'next_cursor': str | None}"""
+    names = _requested_fields(resource, params)
+    limit = _limit(params)
+    rows = resource.queryset(params).order_by(resource.key)
+    cursor = params.get('cursor')
+    if cursor:
+        rows = rows.filter(**{f'{resource.key}__gt': resource.key_value(decode_cursor(cursor))})
+
+    # The key is always fetched (last) to build the next cursor, even if not requested
+    columns = [resource.fields[name] for name in names] + [resource.key]
+    results = []
+    last_key = None
+    for values in rows.values_list(*columns)[:limit + 1].iterator():
+        if len(results) == limit:
+            return {'results': results, 'next_cursor': encode_cursor(last_key)}
+        record = dict(zip(names, values))
+        for name, formatter in resource.formatters.items():
+            if name in record:
+                record[name] = formatter(record[name])
+        results.append(record)
+        last_key = values[-1]
+    return {'results': results, 'next_cursor': None}
+
+
+def api_list_response(resource_name, params):
+    """JsonResponse for GET /head/api/<resource_name>/, or a 400 for a bad query string"""
+    try:
+        page = list_page(API_RESOURCES[resource_name], params)
+    except ApiError as error:
+        return JsonResponse({'error': str(error)}, status=400)
+    return JsonResponse(page)
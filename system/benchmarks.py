@@ -0,0 +1,360 @@
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import math
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+import django
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.test import Client, RequestFactory
+from django.urls import URLPattern, reverse
+
+from .instrumentation import QueryRecorder
+from .models import Mentee, Mentor, Activity, MentorMenteeAssignment, HeadofMentorMentee
+from .seeding import seed_dataset
+
+# Per-view latency benchmarks. Each data scale gets its own seeded SQLite
+# file (reused between runs), every GET route in system/urls.py is driven
+# through the test client as the role that owns it, and each request runs in
+# a rolled-back transaction so destructive views leave the data untouched.
+
+DEFAULT_SCALES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 5
+
+# A view regresses when its p95 grows by more than this fraction *and* by
+# more than the noise floor, or when it runs more queries than the baseline.
+DEFAULT_THRESHOLD = 0.20
+NOISE_FLOOR_MS = 5.0
+
+# Routes that can't be driven with a plain GET by a seeded user
+SKIPPED_ROUTES = {'logout', 'password_reset_confirm'}
+
+
+def database_path(db_dir, scale, seed):
+    return os.path.join(db_dir, f'bench-{scale}-seed{seed}.sqlite3')
+
+
+@contextlib.contextmanager
+def use_database(path):
+    """Point the default SQLite connection at another database file for the duration"""
+    connection = connections['default']
+    original = connection.settings_dict['NAME']
+    connection.close()
+    connection.settings_dict['NAME'] = path
+    try:
+        yield
+    finally:
+        connection.close()
+        connection.settings_dict['NAME'] = original
+
+
+def prepare_database(path, scale, seed, stdout=None):
+    """Create and seed the database for one scale unless it already exists"""
+    if os.path.exists(path):
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with use_database(path):
+            call_command('migrate', verbosity=0)
+            counts = seed_dataset(mentees=scale, seed=seed)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    if stdout:
+        stdout.write(f"  seeded {path}: {counts}")
+    return True
+
+
+def route_role(route):
+    """Which kind of user a route belongs to, from its URL prefix"""
+    for role in ('mentee', 'mentor', 'head'):
+        if route.startswith(f'{role}/') or route.startswith(f'homepage/{role}/'):
+            return role
+    return None
+
+
+def pick_subjects():
+    """Representative users and objects to fill in URL arguments.
+
+    The mentor is the busiest one who also runs sessions, so list views see
+    a full page of mentees and schedule views see real activities.
+    """
+    mentor = (
+        Mentor.objects.filter(primary_activities__IsMentoringSession=True)
+        .order_by('-CurrentMentees', 'MentorID').select_related('user').first()
+    )
+    mentee = Mentee.objects.filter(assigned_mentor=mentor).select_related('user').order_by('MenteeID').first()
+    head = HeadofMentorMentee.objects.select_related('user').order_by('HeadofMentorMenteeID').first()
+    session = (
+        Activity.objects.filter(PrimaryMentor=mentor, activityreport__isnull=False).order_by('ActivityID').first()
+        or Activity.objects.filter(PrimaryMentor=mentor).order_by('ActivityID').first()
+    )
+    event = Activity.objects.filter(IsMentoringSession=False).order_by('ActivityID').first() or session
+    assignment = MentorMenteeAssignment.objects.filter(mentee=mentee, assignment_status='active').first()
+
+    users = {
+        'mentee': mentee.user if mentee else None,
+        'mentor': mentor.user if mentor else None,
+        'head': head.user if head else None,
+    }
+    kwargs = {
+        'mentee': {'activity_id': session and session.ActivityID},
+        # No upload is in flight in a seeded database; the status lookup answers 404
+        'mentor': {'mentee_id': mentee and mentee.MenteeID, 'activity_id': session and session.ActivityID,
+                   'upload_id': uuid.UUID(int=0)},
+        'head': {
+            'mentee_id': mentee and mentee.MenteeID,
+            'mentor_id': mentor and mentor.MentorID,
+            'activity_id': event and event.ActivityID,
+            'assignment_id': assignment and assignment.pk,
+            'user_id': mentee and mentee.user_id,
+        },
+    }
+    return users, kwargs
+
+
+def iter_routes(urlconf_module):
+    """(name, route, role) for every named pattern in a urls module"""
+    for pattern in urlconf_module.urlpatterns:
+        if isinstance(pattern, URLPattern) and pattern.name and pattern.name not in SKIPPED_ROUTES:
+            yield pattern.name, str(pattern.pattern), route_role(str(pattern.pattern))
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+@contextlib.contextmanager
+def _muted_logger(name):
+    logger = logging.getLogger(name)
+    previous = logger.disabled
+    logger.disabled = True
+    try:
+        yield
+    finally:
+        logger.disabled = previous
+
+
+def measure_get(client, url):
+    """One GET inside a rolled-back transaction; returns (status, seconds, [sql, ...])"""
+    connection = connections['default']
+    recorder = QueryRecorder()
+    with transaction.atomic():
+        with connection.execute_wrapper(recorder):
+            started = time.perf_counter()
+            response = client.get(url)
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+            elapsed = time.perf_counter() - started
+        transaction.set_rollback(True)
+    return response.status_code, elapsed, recorder.queries
+
+
+def route_requests(urlconf_module, only=None):
+    """Yield (name, role, url, client) for each route, or (name, role, None, reason) when it can't be filled in.
+
+    Clients are logged in once per role as the users from pick_subjects().
+    """
+    users, role_kwargs = pick_subjects()
+    clients = {}
+    for name, route, role in iter_routes(urlconf_module):
+        if only and name not in only:
+            continue
+        if role and users.get(role) is None:
+            yield name, role, None, f'no seeded {role}'
+            continue
+
+        pattern_kwargs = [part.split('>')[0].split(':')[-1] for part in route.split('<')[1:]]
+        kwargs = {key: role_kwargs.get(role, {}).get(key) for key in pattern_kwargs}
+        if any(value is None for value in kwargs.values()):
+            yield name, role, None, f'no value for {", ".join(kwargs)}'
+            continue
+
+        if role not in clients:
+            clients[role] = Client(raise_request_exception=False)
+            if role:
+                clients[role].force_login(users[role])
+        yield name, role, reverse(name, kwargs=kwargs), clients[role]
+
+
+@contextlib.contextmanager
+def quiet_views():
+    """Silence view debug output, 500 tracebacks and per-request SQL/profiler/upload logs; callers report results themselves"""
+    with contextlib.redirect_stdout(io.StringIO()), _muted_logger('django.request'), \
+            _muted_logger('system.middleware'), _muted_logger('system.profiling'), _muted_logger('system.uploads'):
+        yield
+
+
+def benchmark_scale(urlconf_module, repeat=DEFAULT_REPEAT, only=None):
+    """Benchmark every route against the current database; returns {url_name: stats}"""
+    cache.clear()
+    results = {}
+    for name, role, url, client in route_requests(urlconf_module, only):
+        if url is None:
+            results[name] = {'role': role, 'skipped': client}
+            continue
+
+        with quiet_views():
+            measure_get(client, url)  # warm-up: template loading, cache fill
+            samples = [measure_get(client, url) for _ in range(repeat)]
+
+        timings = [elapsed * 1000 for _, elapsed, _ in samples]
+        results[name] = {
+            'url': url,
+            'role': role or 'anonymous',
+            'status': samples[-1][0],
+            'p50_ms': round(statistics.median(timings), 2),
+            'p95_ms': round(percentile(timings, 0.95), 2),
+            'mean_ms': round(statistics.fmean(timings), 2),
+            'queries': max(len(queries) for _, _, queries in samples),
+        }
+    return results
+
+
+def run_benchmarks(urlconf_module, scales, db_dir, seed=42, repeat=DEFAULT_REPEAT, only=None, stdout=None):
+    """Seed (if needed) and benchmark each scale; returns the JSON-ready report"""
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'django': django.get_version(),
+            'seed': seed,
+            'repeat': repeat,
+            'scales': scales,
+        },
+        'results': {},
+    }
+    for scale in scales:
+        path = database_path(db_dir, scale, seed)
+        if stdout:
+            stdout.write(f"Scale {scale}:")
+        prepare_database(path, scale, seed, stdout)
+        with use_database(path):
+            report['results'][str(scale)] = benchmark_scale(urlconf_module, repeat, only)
+    cache.clear()
+    return report
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD, noise_floor_ms=NOISE_FLOOR_MS):
+    """Rows comparing two reports; each row has a 'regression' flag"""
+    rows = []
+    for scale, views in current['results'].items():
+        base_views = baseline.get('results', {}).get(scale, {})
+        for name, stats in views.items():
+            base = base_views.get(name)
+            if 'skipped' in stats or not base or 'skipped' in base:
+                continue
+            slower = (stats['p95_ms'] > base['p95_ms'] * (1 + threshold)
+                      and stats['p95_ms'] - base['p95_ms'] > noise_floor_ms)
+            more_queries = stats['queries'] > base['queries']
+            rows.append({
+                'scale': scale,
+                'view': name,
+                'base_p95_ms': base['p95_ms'],
+                'p95_ms': stats['p95_ms'],
+                'change': (stats['p95_ms'] - base['p95_ms']) / base['p95_ms'] if base['p95_ms'] else 0.0,
+                'base_queries': base['queries'],
+                'queries': stats['queries'],
+                'regression': slower or more_queries,
+            })
+    return rows
+
+
+def load_report(path):
+    with open(path) as stream:
+        return json.load(stream)
+
+
+def save_report(report, path):
+    with open(path, 'w') as stream:
+        json.dump(report, stream, indent=2, sort_keys=True)
+
+
+# Sync vs async homepages (manage.py benchmark_dashboards). The views are
+# called directly, outside any transaction, so the async ones really run
+# their aggregates on pooled connections.
+
+DASHBOARD_VIEWS = {
+    'head': ('head_homepage', 'head_homepage_async'),
+    'mentor': ('mentor_homepage', 'mentor_homepage_async'),
+    'mentee': ('mentee_homepage', 'mentee_homepage_async'),
+}
+
+
+@contextlib.contextmanager
+def simulated_latency(seconds):
+    """Wait ``seconds`` before every query, as a database across the network would.
+
+    The delay wraps the default connection; gather() installs its wrappers on
+    the pooled connections too, so async homepages wait the same per query.
+    """
+    def delay(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    with connections['default'].execute_wrapper(delay):
+        yield
+
+
+def _dashboard_request(user):
+    request = RequestFactory().get('/')
+    request.user = user
+
+    async def auser():
+        return user
+
+    request.auser = auser
+    return request
+
+
+def benchmark_dashboards(repeat=DEFAULT_REPEAT, roles=None):
+    """{role: stats} timing each homepage's sync and async view against the current database"""
+    from . import views
+
+    users, _ = pick_subjects()
+    results = {}
+    for role, (sync_name, async_name) in DASHBOARD_VIEWS.items():
+        if roles and role not in roles:
+            continue
+        if users.get(role) is None:
+            results[role] = {'skipped': f'no seeded {role}'}
+            continue
+        sync_view, async_view = getattr(views, sync_name), getattr(views, async_name)
+        request = _dashboard_request(users[role])
+
+        def timed_sync():
+            started = time.perf_counter()
+            sync_view(request)
+            return (time.perf_counter() - started) * 1000
+
+        async def timed_async():
+            samples = []
+            for _ in range(repeat + 1):
+                started = time.perf_counter()
+                await async_view(request)
+                samples.append((time.perf_counter() - started) * 1000)
+            return samples[1:]  # the first fills the pool's connections
+
+        with quiet_views():
+            timed_sync()  # warm-up: templates, sidebar cache
+            sync_ms = [timed_sync() for _ in range(repeat)]
+            async_ms = asyncio.run(timed_async())
+        results[role] = {
+            'sync_p50_ms': round(statistics.median(sync_ms), 2),
+            'async_p50_ms': round(statistics.median(async_ms), 2),
+            'sync_mean_ms': round(statistics.fmean(sync_ms), 2),
+            'async_mean_ms': round(statistics.fmean(async_ms), 2),
+            'speedup': round(statistics.median(sync_ms) / statistics.median(async_ms), 2),
+        }
+    return results
@@ -0,0 +1,104 @@
+import uuid
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from . import metrics
+
+# Lookups cached here are invalidated by bumping a per-namespace version
+# stamp instead of deleting individual keys, so every derived key for that
+# namespace goes stale at once. The stamps live in the default cache, which
+# must be shared by all worker processes (see CACHES in settings.py) for a
+# bump in one worker to reach the others. A bump stores a fresh random
+# stamp rather than incrementing, so a stamp evicted by the cache comes back
+# as a new value and never repeats one that older entries were keyed on.
+FACET_CACHE_TIMEOUT = 60 * 15
+
+MENTOR_FACETS = 'mentor_facets'
+
+
+def _new_version():
+    return uuid.uuid4().hex[:12]
+
+
+def get_cache_version(namespace):
+    """Return the current version stamp for a cache namespace"""
+    key = f'cache_version:{namespace}'
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, None):
+            # Another worker set it first
+            version = cache.get(key, version)
+    return version
+
+
+def bump_cache_version(namespace):
+    """Invalidate every cached entry in a namespace"""
+    cache.set(f'cache_version:{namespace}', _new_version(), None)
+
+
+def get_mentor_facets():
+    """Mentor list for filter dropdowns with vacancy counts, from one query"""
+    key = f'{MENTOR_FACETS}:v{get_cache_version(MENTOR_FACETS)}'
+    facets = cache.get(key)
+    metrics.record_cache(MENTOR_FACETS, facets is not None)
+    if facets is None:
+        # Local import to avoid a circular import with models.py
+        from .models import Mentor
+
+        mentors = Mentor.objects.annotate(
+            active_count=Count('assignments', filter=Q(assignments__assignment_status='active'))
+        ).values(
+            'MentorID', 'MentorName', 'MentorDepartment', 'MaxMentees', 'active_count'
+        ).order_by('MentorName')
+
+        facets = [
+            {
+                'MentorID': mentor['MentorID'],
+                'MentorName': mentor['MentorName'],
+                'MentorDepartment': mentor['MentorDepartment'],
+                'vacancy_count': mentor['MaxMentees'] - mentor['active_count'],
+            }
+            for mentor in mentors
+        ]
+        cache.set(key, facets, FACET_CACHE_TIMEOUT)
+    return facets
+
+
+# Sidebars (templatetags/sidebar.py) are cached per user. Profile edits bump
+# the user's profile namespace; activity and assignment changes bump the
+# shared counters namespace, since one activity can move every badge.
+SIDEBAR_CACHE_TIMEOUT = 60 * 60
+
+SIDEBAR_COUNTERS = 'sidebar_counters'
+
+
+def profile_namespace(user_id):
+    """Version namespace for everything rendered from one user's profile"""
+    return f'profile:{user_id}'
+
+
+def sidebar_counters(user):
+    """Badge counts shown in a role's sidebar navigation"""
+    # Local import to avoid a circular import with models.py
+    from .models import Activity
+
+    today = timezone.now().date()
+    # user.mentor / user.mentee are cached on the user, so the sidebar reuses them
+    if user.role == 'mentor':
+        mentor = getattr(user, 'mentor', None)
+        return {'upcoming_sessions': Activity.objects.filter(
+            PrimaryMentor=mentor, Date__gte=today, IsMentoringSession=True,
+        ).count() if mentor else 0}
+    if user.role == 'head':
+        return {'upcoming_sessions': Activity.objects.filter(Date__gt=today).count()}
+    if user.role == 'mentee':
+        # Same activities the mentee's schedule lists as upcoming
+        mentee = getattr(user, 'mentee', None)
+        schedule_filter = Q(IsMentoringSession=False)
+        if mentee and mentee.assigned_mentor_id:
+            schedule_filter |= Q(IsMentoringSession=True, PrimaryMentor_id=mentee.assigned_mentor_id)
+        return {'upcoming_activities': Activity.objects.filter(schedule_filter, Date__gt=today).count()}
+    return {}
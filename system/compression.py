@@ -0,0 +1,132 @@
+import gzip
+import os
+from functools import wraps
+
+from django.conf import settings
+from django.utils.cache import set_response_etag
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # optional; without it everything is served as gzip
+    brotli = None
+
+# Response compression (CompressionMiddleware), build-time compressed static
+# files (FingerprintedStaticFilesStorage.post_process writes name.br/name.gz
+# next to each file, serve_static picks one by Accept-Encoding) and cached
+# compressed bodies for JSON endpoints marked with @compressed_variants.
+#
+# BREACH: a page that reflects user input next to a secret leaks the secret
+# through its compressed size. gzip responses get random header bytes, as
+# Django's GZipMiddleware does; brotli has no equivalent, so responses that
+# carry the CSRF token (the view asked for it, or the body has a form field
+# for it) are only ever sent as gzip.
+
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'application/xml', 'image/svg+xml')
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.map', '.xml'}
+FILE_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+# Dynamic responses trade ratio for speed; static files are compressed once, as hard as possible
+DYNAMIC_LEVELS = {'br': 5, 'gzip': 6}
+STATIC_LEVELS = {'br': 11, 'gzip': 9}
+
+# Random bytes in the gzip header per response, as GZipMiddleware does against BREACH
+MAX_RANDOM_BYTES = 100
+
+CSRF_FIELD = b'csrfmiddlewaretoken'
+
+
+def min_size():
+    return getattr(settings, 'COMPRESS_MIN_SIZE', 1024)
+
+
+def encodings():
+    """Encodings this server can produce, preferred first"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def response_encodings(request, content):
+    """Encodings a dynamic response may use: no brotli for one that carries the CSRF token"""
+    available = encodings()
+    if 'br' in available and (request.META.get('CSRF_COOKIE_NEEDS_UPDATE') or CSRF_FIELD in content):
+        available.remove('br')
+    return available
+
+
+def negotiate(accept_encoding, available=None):
+    """The preferred encoding the client accepts (q > 0), or None for identity"""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    for coding in encodings() if available is None else available:
+        if accepted.get(coding, accepted.get('*', 0)) > 0:
+            return coding
+    return None
+
+
+def compress(data, encoding, static=False):
+    """``data`` compressed with ``encoding`` ('br' or 'gzip')"""
+    level = (STATIC_LEVELS if static else DYNAMIC_LEVELS)[encoding]
+    if encoding == 'br':
+        return brotli.compress(data, quality=level)
+    if static:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    return compress_string(data, max_random_bytes=MAX_RANDOM_BYTES)
+
+
+def is_compressible_type(content_type):
+    return (content_type or '').split(';')[0].strip().lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def precompress_file(path):
+    """Write path.br / path.gz beside a static file; returns the variants kept.
+
+    A variant that would not be smaller than the original is removed, so
+    serve_static falls back to the plain file for it.
+    """
+    if os.path.splitext(path)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+        return []
+    with open(path, 'rb') as original:
+        data = original.read()
+    written = []
+    for encoding in encodings():
+        variant = path + FILE_SUFFIXES[encoding]
+        body = compress(data, encoding, static=True) if len(data) >= min_size() else None
+        if body is None or len(body) >= len(data):
+            if os.path.exists(variant):
+                os.remove(variant)
+            continue
+        with open(variant, 'wb') as handle:
+            handle.write(body)
+        written.append(variant)
+    return written
+
+
+def compressed_variants(view):
+    """Cache the compressed bodies of a JSON view's responses, keyed by their ETag.
+
+    The ETag is derived from the content, so equal responses (for any user)
+    share one compressed copy and CompressionMiddleware skips recompressing.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            if not response.has_header('ETag'):
+                set_response_etag(response)
+            response.cache_compressed_variants = True
+        return response
+
+    return wrapper
@@ -0,0 +1,145 @@
+import hashlib
+import os
+from functools import wraps
+
+from django.contrib import messages
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.db.models import Count, Max, Q
+from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .caching import SIDEBAR_COUNTERS, get_cache_version, profile_namespace
+from .models import Mentee, Mentor
+from .warmup import TEMPLATE_DIR, template_names
+
+# Conditional GETs for detail and profile pages. A page's state is the
+# updated_at of the rows it shows plus whatever else changes its HTML - the
+# signed-in user's sidebar (profile and counter cache versions, the day, WebP
+# support), the CSRF token of pages with forms and the deployed templates and
+# static files - hashed into an ETag. A browser revalidating an unchanged
+# page gets a 304 after a query or two, without the view or the template
+# running. Pages are `private, no-cache`: browsers keep them but always ask.
+
+_build_fingerprint = None
+
+
+def build_fingerprint():
+    """Hash of the templates and static manifest this process renders with; changes on deploy"""
+    global _build_fingerprint
+    if _build_fingerprint is None:
+        digest = hashlib.sha256()
+        for name in template_names():
+            digest.update(name.encode())
+            with open(os.path.join(TEMPLATE_DIR, name), 'rb') as template:
+                digest.update(template.read())
+        for name in sorted(getattr(staticfiles_storage, 'hashed_files', {}).values()):
+            digest.update(name.encode())
+        _build_fingerprint = digest.hexdigest()[:16]
+    return _build_fingerprint
+
+
+def _viewer_parts(request):
+    # Everything the cached sidebar key (templatetags/sidebar.py) varies on
+    user = request.user
+    return (
+        user.pk, get_cache_version(profile_namespace(user.pk)), get_cache_version(SIDEBAR_COUNTERS),
+        timezone.now().date().isoformat(), 'image/webp' in request.headers.get('Accept', ''),
+    )
+
+
+def page_etag(request, parts, form=False):
+    """Strong ETag for a page showing ``parts`` to the signed-in user"""
+    state = [build_fingerprint(), *_viewer_parts(request), *parts]
+    if form:
+        # {% csrf_token %} masks the secret differently on every render; any mask stays valid
+        get_token(request)
+        state.append(request.META['CSRF_COOKIE'])
+    return quote_etag(hashlib.sha256(repr(state).encode()).hexdigest()[:32])
+
+
+def conditional_page(page_state, form=False):
+    """Answer GETs of a detail view with 304 while its page state is unchanged.
+
+    ``page_state(request, *args, **kwargs)`` returns (last_modified, parts)
+    for the rows the page shows, or None to just run the view (wrong role,
+    missing row). A request with flash messages waiting always renders, since
+    the page is what shows them.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or len(messages.get_messages(request)):
+                return view(request, *args, **kwargs)
+            state = page_state(request, *args, **kwargs)
+            if state is None:
+                return view(request, *args, **kwargs)
+            last_modified, parts = state
+            etag = page_etag(request, parts, form=form)
+            timestamp = int(last_modified.timestamp())
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(timestamp)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
+
+
+def _latest(*timestamps):
+    return max(timestamp for timestamp in timestamps if timestamp is not None)
+
+
+def _mentee_state(mentees):
+    # The mentee and the mentor shown beside them, in one query
+    row = mentees.values_list('MenteeID', 'updated_at', 'assigned_mentor_id', 'assigned_mentor__updated_at').first()
+    if row is None:
+        return None
+    mentee_id, updated_at, mentor_id, mentor_updated_at = row
+    return _latest(updated_at, mentor_updated_at), (mentee_id, updated_at, mentor_id, mentor_updated_at)
+
+
+def _mentor_state(mentors):
+    """A mentor with their assigned mentees and the active assignments behind their vacancy count"""
+    # Queryset update() in assign_to_mentor() ends assignments without touching any updated_at
+    active = Q(assignments__assignment_status='active')
+    row = mentors.annotate(
+        mentees=Count('mentee', distinct=True),
+        mentees_updated_at=Max('mentee__updated_at'),
+        active_assignments=Count('assignments', filter=active, distinct=True),
+        latest_assignment=Max('assignments__assignment_id', filter=active),
+    ).values_list('MentorID', 'updated_at', 'mentees', 'mentees_updated_at',
+                  'active_assignments', 'latest_assignment').first()
+    if row is None:
+        return None
+    return _latest(row[1], row[3]), row
+
+
+def head_mentee_state(request, mentee_id):
+    if request.user.role != 'head':
+        return None
+    return _mentee_state(Mentee.objects.filter(MenteeID=mentee_id))
+
+
+def head_mentor_state(request, mentor_id):
+    if request.user.role != 'head':
+        return None
+    return _mentor_state(Mentor.objects.filter(MentorID=mentor_id))
+
+
+def own_mentee_state(request):
+    if request.user.role != 'mentee':
+        return None
+    return _mentee_state(Mentee.objects.filter(user=request.user))
+
+
+def own_mentor_state(request):
+    if request.user.role != 'mentor':
+        return None
+    return _mentor_state(Mentor.objects.filter(user=request.user))
@@ -0,0 +1,223 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.models import Count, Q
+from django.db.models.functions import ExtractMonth, TruncMonth
+
+from .models import Activity, Attendance, Mentee, MentoringSession, Mentor
+
+# Homepage statistics, split into aggregates that don't depend on each other.
+# Each aggregate is a zero-argument callable running one query. The sync
+# homepages run them one after another (collect); the async ones (gather)
+# run them at the same time in DASHBOARD_QUERY_WORKERS threads, each thread
+# with its own database connection, and build the same context from the
+# results. The gain is the overlap of query waits, so it grows with database
+# latency and available cores (see `manage.py benchmark_dashboards`).
+#
+# Pool threads run each aggregate with the request connection's execute
+# wrappers installed, so QueryInstrumentationMiddleware (Server-Timing,
+# metrics, N+1 warnings) counts their queries, and close their connections
+# afterwards by CONN_MAX_AGE the way request_finished does for request threads.
+
+_executor = None
+
+
+def _query_pool():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=getattr(settings, 'DASHBOARD_QUERY_WORKERS', 4),
+                                       thread_name_prefix='dashboard')
+    return _executor
+
+
+def reset_query_pool():
+    """Stop the worker threads; the next gather() starts new ones with fresh connections"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def _run_in_pool(aggregate, wrappers):
+    close_old_connections()
+    connection = connections[DEFAULT_DB_ALIAS]
+    try:
+        with ExitStack() as stack:
+            for wrapper in wrappers:
+                stack.enter_context(connection.execute_wrapper(wrapper))
+            return aggregate()
+    finally:
+        # Also drops a connection left unusable by an error
+        close_old_connections()
+
+
+def _request_connection_state():
+    # Connections are per thread: ask from the thread that runs the request's queries
+    connection = connections[DEFAULT_DB_ALIAS]
+    return connection.in_atomic_block, list(connection.execute_wrappers)
+
+
+def collect(aggregates):
+    """{name: result} running each aggregate in turn on the current connection"""
+    return {name: aggregate() for name, aggregate in aggregates.items()}
+
+
+async def gather(aggregates):
+    """{name: result} with the aggregates running concurrently on pooled connections.
+
+    Inside a transaction (tests, ATOMIC_REQUESTS) other connections can't
+    see its writes, so the aggregates run in turn on the request's own
+    connection instead.
+    """
+    in_transaction, wrappers = await sync_to_async(_request_connection_state)()
+    if len(aggregates) < 2 or in_transaction:
+        return await sync_to_async(collect)(aggregates)
+    loop = asyncio.get_running_loop()
+    pool = _query_pool()
+    results = await asyncio.gather(*(loop.run_in_executor(pool, _run_in_pool, aggregate, wrappers)
+                                     for aggregate in aggregates.values()))
+    return dict(zip(aggregates, results))
+
+
+# Head
+
+def head_aggregates(today):
+    six_months_ago = today - timedelta(days=180)
+    return {
+        'mentors': lambda: Mentor.objects.aggregate(
+            total=Count('MentorID'),
+            with_mentees=Count('MentorID', filter=Q(CurrentMentees__gt=0)),
+        ),
+        'mentees': lambda: Mentee.objects.count(),
+        'activities': lambda: Activity.objects.aggregate(
+            completed=Count('ActivityID', filter=Q(Date__lt=today)),
+            upcoming=Count('ActivityID', filter=Q(Date__gt=today)),
+            today=Count('ActivityID', filter=Q(Date=today)),
+        ),
+        'departments': lambda: list(
+            Mentor.objects.values('MentorDepartment').annotate(count=Count('MentorID')).order_by('-count')
+        ),
+        'activity_trend': lambda: list(
+            Activity.objects.filter(Date__gte=six_months_ago).annotate(month=TruncMonth('Date'))
+            .values('month').annotate(count=Count('ActivityID')).order_by('month')
+        ),
+        'intake': lambda: list(Mentee.objects.values('Year').annotate(count=Count('MenteeID')).order_by('Year')),
+        'recent_activities': lambda: list(Activity.objects.all().order_by('-CreatedAt')[:5]),
+    }
+
+
+def head_context(results):
+    mentors, activities = results['mentors'], results['activities']
+    total_mentors = mentors['total']
+    return {
+        'total_mentors': total_mentors,
+        'total_mentees': results['mentees'],
+        'total_sessions': activities['completed'] + activities['upcoming'] + activities['today'],
+        'completed_sessions': activities['completed'],
+        'upcoming_sessions': activities['upcoming'],
+        'today_sessions': activities['today'],
+        # Percentage of mentors with mentees
+        'system_usage': int(mentors['with_mentees'] / total_mentors * 100) if total_mentors > 0 else 0,
+
+        # Graph data
+        'dept_labels': [item['MentorDepartment'] for item in results['departments']],
+        'dept_counts': [item['count'] for item in results['departments']],
+        'activity_labels': [item['month'].strftime('%b %Y') for item in results['activity_trend']],
+        'activity_data': [item['count'] for item in results['activity_trend']],
+        'intake_labels': [str(item['Year']) for item in results['intake']],
+        'intake_counts': [item['count'] for item in results['intake']],
+
+        'recent_activities': results['recent_activities'],
+    }
+
+
+# Mentor
+
+def mentor_aggregates(mentor, today):
+    sessions = Activity.objects.filter(PrimaryMentor=mentor, IsMentoringSession=True)
+    return {
+        'mentees': lambda: Mentee.objects.aggregate(
+            assigned_to_mentor=Count('MenteeID', filter=Q(assigned_mentor=mentor)),
+            total=Count('MenteeID'),
+            with_mentor=Count('MenteeID', filter=Q(assigned_mentor__isnull=False)),
+        ),
+        'sessions': lambda: sessions.aggregate(
+            upcoming=Count('ActivityID', filter=Q(Date__gte=today)),
+            past=Count('ActivityID', filter=Q(Date__lt=today)),
+        ),
+        # Past sessions not marked completed
+        'pending_reports': lambda: sessions.filter(Date__lt=today).exclude(mentoringsession__completed=True).count(),
+        'completed_with_materials': lambda: MentoringSession.objects.filter(
+            activity__PrimaryMentor=mentor, activity__Date__lt=today, completed=True,
+        ).count(),
+        'monthly_sessions': lambda: list(
+            sessions.filter(Date__year=today.year).annotate(month=ExtractMonth('Date'))
+            .values('month').annotate(count=Count('ActivityID')).order_by('month')
+        ),
+    }
+
+
+def mentor_context(results):
+    mentees, sessions = results['mentees'], results['sessions']
+    past_sessions = sessions['past']
+    # Sessions per month of the current year, for the graph
+    monthly_sessions = [0] * 12
+    for item in results['monthly_sessions']:
+        monthly_sessions[item['month'] - 1] = item['count']
+    return {
+        'assigned_mentees': mentees['assigned_to_mentor'],
+        'total_mentees_system': mentees['total'],
+        'mentees_with_mentor': mentees['with_mentor'],
+        'mentees_pending': mentees['total'] - mentees['with_mentor'],
+        'total_sessions': sessions['upcoming'] + past_sessions,
+        'upcoming_sessions': sessions['upcoming'],
+        'pending_reports': results['pending_reports'],
+        'completion_rate': (int(results['completed_with_materials'] / past_sessions * 100)
+                            if past_sessions > 0 else 0),
+        'monthly_sessions': json.dumps(monthly_sessions),
+    }
+
+
+# Mentee
+
+def mentee_aggregates(mentee, today):
+    # Activities the mentee is invited to, or sessions run by their mentor
+    mentee_activities = Activity.objects.filter(
+        Q(attendance__mentee=mentee) | Q(PrimaryMentor=mentee.assigned_mentor_id)
+    )
+    # Mentoring sessions with their mentor plus general activities, for the notification badge
+    badge_filter = Q(IsMentoringSession=False)
+    if mentee.assigned_mentor_id:
+        badge_filter |= Q(IsMentoringSession=True, PrimaryMentor=mentee.assigned_mentor_id)
+    return {
+        'upcoming_sessions': lambda: mentee_activities.filter(
+            Date__gte=today, IsMentoringSession=True,
+        ).distinct().count(),
+        'completed_activities': lambda: mentee_activities.filter(Date__lt=today).distinct().count(),
+        'attendance': lambda: Attendance.objects.filter(mentee=mentee).aggregate(
+            invited=Count('id'), attended=Count('id', filter=Q(attended=True)),
+        ),
+        # Completed mentoring sessions the mentee attended
+        'achievements': lambda: MentoringSession.objects.filter(
+            activity__attendance__mentee=mentee, activity__attendance__attended=True, completed=True,
+        ).distinct().count(),
+        'upcoming_activities': lambda: Activity.objects.filter(badge_filter, Date__gte=today).count(),
+    }
+
+
+def mentee_context(results):
+    attendance = results['attendance']
+    return {
+        'upcoming_sessions': results['upcoming_sessions'],
+        'completed_activities': results['completed_activities'],
+        'progress_rate': (int(attendance['attended'] / attendance['invited'] * 100)
+                          if attendance['invited'] > 0 else 0),
+        'achievements': results['achievements'],
+        'upcoming_activities_count': results['upcoming_activities'],
+    }
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+# Server-sent events for mentors and mentees (views.event_stream). Views and
+# signals publish small JSON events addressed to users; each is a row in a
+# SQLite file (EVENTS_DB) so every worker process sees it, and streams in the
+# publishing process are woken at once while the rest notice within
+# EVENTS_POLL_INTERVAL seconds. With EVENTS_DB = None events stay in memory
+# and only reach streams served by the same process. Rows older than
+# EVENTS_RETENTION seconds are pruned; a browser reconnecting with
+# Last-Event-ID gets whatever it missed in between.
+#
+# An event's data may carry {'counters': {name: delta}}: the change to that
+# user's badge or dashboard counter, applied by static/system/js/live-events.js.
+
+ASSIGNMENT_CREATED = 'assignment.created'
+ASSIGNMENT_TRANSFERRED = 'assignment.transferred'
+SESSION_CREATED = 'session.created'
+SESSION_COMPLETED = 'session.completed'
+
+# Roles that can open a stream; heads get nothing addressed to them yet
+EVENT_ROLES = ('mentor', 'mentee')
+
+# Events sent per read while catching a stream up
+BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    """Event rows in EVENTS_DB plus the asyncio events of this process's open streams"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connection = None
+        self.path = None
+        self.pid = None
+        self.pruned_at = 0.0
+        # user_id: {(loop, asyncio.Event), ...}
+        self.listeners = {}
+
+    def _connection(self):
+        path = str(getattr(settings, 'EVENTS_DB', None) or ':memory:')
+        if self.connection is None or self.path != path or self.pid != os.getpid():
+            connection = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+            if path != ':memory:':
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS event ('
+                ' id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL,'
+                ' kind TEXT NOT NULL, data TEXT NOT NULL, created REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS event_user ON event (user_id, id)')
+            self.connection, self.path, self.pid = connection, path, os.getpid()
+        return self.connection
+
+    def publish(self, user_ids, kind, data):
+        """Store one event per user and wake their streams in this process"""
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return
+        body = json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'))
+        now = time.time()
+        with self.lock:
+            connection = self._connection()
+            connection.executemany('INSERT INTO event (user_id, kind, data, created) VALUES (?, ?, ?, ?)',
+                                   [(user_id, kind, body, now) for user_id in user_ids])
+            if now - self.pruned_at >= 60:
+                retention = getattr(settings, 'EVENTS_RETENTION', 60 * 60)
+                connection.execute('DELETE FROM event WHERE created < ?', (now - retention,))
+                self.pruned_at = now
+            waiting = [listener for user_id in user_ids for listener in self.listeners.get(user_id, ())]
+        for loop, wake in waiting:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # that stream's loop has already closed
+
+    def since(self, user_id, after_id, limit=BATCH_SIZE):
+        """[(id, kind, data_json)] addressed to ``user_id`` after event ``after_id``, oldest first"""
+        with self.lock:
+            return self._connection().execute(
+                'SELECT id, kind, data FROM event WHERE user_id = ? AND id > ? ORDER BY id LIMIT ?',
+                (user_id, after_id, limit),
+            ).fetchall()
+
+    def latest_id(self):
+        with self.lock:
+            return self._connection().execute('SELECT COALESCE(MAX(id), 0) FROM event').fetchone()[0]
+
+    def listen(self, user_id):
+        """asyncio.Event set whenever this process publishes to ``user_id``; call from the stream's loop"""
+        listener = (asyncio.get_running_loop(), asyncio.Event())
+        with self.lock:
+            self.listeners.setdefault(user_id, set()).add(listener)
+        return listener
+
+    def unlisten(self, user_id, listener):
+        with self.lock:
+            listeners = self.listeners.get(user_id, set())
+            listeners.discard(listener)
+            if not listeners:
+                self.listeners.pop(user_id, None)
+
+
+BUS = EventBus()
+
+
+def publish(user_ids, kind, data, counters=None):
+    """Send ``kind`` to ``user_ids`` once the current transaction commits.
+
+    Like metrics, events must never break the request that caused them, so a
+    failure to store one is logged and dropped.
+    """
+    payload = dict(data, counters=counters or {})
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+
+    def send():
+        try:
+            BUS.publish(user_ids, kind, payload)
+        except sqlite3.Error:
+            logger.exception('Publishing %s event failed', kind)
+
+    transaction.on_commit(send)
+
+
+# Domain events
+
+def _assignment_data(assignment):
+    return {
+        'assignment_id': assignment.pk,
+        'mentee_id': assignment.mentee.MenteeID,
+        'mentee_name': assignment.mentee.MenteeName,
+        'mentor_id': assignment.mentor.MentorID,
+        'mentor_name': assignment.mentor.MentorName,
+    }
+
+
+def assignment_created(assignment):
+    """A mentee was assigned: the mentor gains one, the mentee has a (new) mentor"""
+    data = _assignment_data(assignment)
+    publish([assignment.mentor.user_id], ASSIGNMENT_CREATED, data, counters={'assigned_mentees': 1})
+    publish([assignment.mentee.user_id], ASSIGNMENT_CREATED, data)
+
+
+def assignment_transferred(assignment):
+    """The mentee moved away from ``assignment.mentor``; the new mentor hears via assignment_created"""
+    data = _assignment_data(assignment)
+    publish([assignment.mentor.user_id], ASSIGNMENT_TRANSFERRED, data, counters={'assigned_mentees': -1})
+    publish([assignment.mentee.user_id], ASSIGNMENT_TRANSFERRED, data)
+
+
+def _session_data(activity):
+    # Activity.objects.create() keeps the posted strings until the row is re-read
+    day = activity.Date if not isinstance(activity.Date, str) else parse_date(activity.Date)
+    return {'activity_id': activity.ActivityID, 'name': activity.ActivityName, 'date': day}, day
+
+
+def session_created(activity):
+    """A mentor scheduled a session; their mentees' schedules show it as upcoming.
+
+    Counter deltas follow caching.sidebar_counters: mentors count sessions
+    from today on, mentees count activities after today.
+    """
+    from .models import Mentee  # local import to avoid a circular import with models.py
+
+    data, day = _session_data(activity)
+    today = timezone.now().date()
+    mentor = activity.PrimaryMentor
+    publish([mentor.user_id], SESSION_CREATED, data,
+            counters={'total_sessions': 1, 'upcoming_sessions': 1 if day and day >= today else 0})
+    mentee_users = Mentee.objects.filter(assigned_mentor=mentor).values_list('user_id', flat=True)
+    publish(list(mentee_users), SESSION_CREATED, data,
+            counters={'upcoming_activities': 1 if day and day > today else 0})
+
+
+def session_completed(activity):
+    """The mentor marked a session completed; tell them and its attendees"""
+    from .models import Attendance
+
+    data, _ = _session_data(activity)
+    attendee_users = Attendance.objects.filter(activity=activity).values_list('mentee__user_id', flat=True)
+    publish([activity.PrimaryMentor.user_id, *attendee_users], SESSION_COMPLETED, data)
+
+
+# Streaming
+
+def format_event(event_id, kind, data):
+    return f'id: {event_id}\nevent: {kind}\ndata: {data}\n\n'
+
+
+def preamble(last_id, retry_seconds):
+    # An id-only message sets the browser's Last-Event-ID without firing an event
+    return f'retry: {int(retry_seconds * 1000)}\nid: {last_id}\n\n'
+
+
+def start_id(last_event_id):
+    """Where a stream resumes: the Last-Event-ID header, else the newest event"""
+    try:
+        return max(0, int(last_event_id))
+    except (TypeError, ValueError):
+        return BUS.latest_id()
+
+
+def pending(user_id, last_id):
+    """One-shot body for servers that can't hold a stream open (WSGI); the browser polls"""
+    events = BUS.since(user_id, last_id)
+    if events:
+        last_id = events[-1][0]
+    body = ''.join(format_event(*event) for event in events)
+    return preamble(last_id, getattr(settings, 'EVENTS_WSGI_RETRY', 30)) + body
+
+
+async def stream(user_id, last_id):
+    """Async iterator of SSE messages for ``user_id``, ending after EVENTS_STREAM_TIMEOUT seconds.
+
+    The browser reconnects (with Last-Event-ID) when it ends, which keeps
+    connections from outliving a deploy for long.
+    """
+    poll = getattr(settings, 'EVENTS_POLL_INTERVAL', 2)
+    keepalive = getattr(settings, 'EVENTS_KEEPALIVE', 15)
+    deadline = time.monotonic() + getattr(settings, 'EVENTS_STREAM_TIMEOUT', 5 * 60)
+    read = sync_to_async(BUS.since, thread_sensitive=False)
+
+    listener = BUS.listen(user_id)
+    _, wake = listener
+    try:
+        yield preamble(last_id, poll)
+        written = time.monotonic()
+        while True:
+            wake.clear()
+            events = await read(user_id, last_id)
+            if events:
+                last_id = events[-1][0]
+                yield ''.join(format_event(*event) for event in events)
+                written = time.monotonic()
+                if len(events) == BATCH_SIZE:
+                    continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(wake.wait(), min(poll, remaining))
+            except asyncio.TimeoutError:
+                if time.monotonic() - written >= keepalive:
+                    yield ': keepalive\n\n'
+                    written = time.monotonic()
+    finally:
+        BUS.unlisten(user_id, listener)
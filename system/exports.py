@@ -0,0 +1,112 @@
+import csv
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import get_course_full_name
+
+# Rows fetched per database round trip while streaming. The server-side
+# cursor keeps only this many rows in memory at a time.
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """File-like object whose write() hands the CSV line straight back"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(filename, header, rows):
+    """StreamingHttpResponse that writes ``header`` and then each row of ``rows`` lazily"""
+    writer = csv.writer(_Echo())
+
+    def generate():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    stamp = timezone.localtime().strftime('%Y%m%d-%H%M')
+    response = StreamingHttpResponse(generate(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}-{stamp}.csv"'
+    return response
+
+
+MENTEE_EXPORT_FIELDS = [
+    ('MenteeID', 'Mentee ID'),
+    ('MenteeName', 'Name'),
+    ('MenteeCourse', 'Course'),
+    ('MenteeSemester', 'Semester'),
+    ('Year', 'Year'),
+    ('MenteeGender', 'Gender'),
+    ('MenteeStatus', 'Status'),
+    ('MenteeEmail', 'Email'),
+    ('MenteePhone', 'Phone'),
+    ('MenteeJoinDate', 'Join Date'),
+    ('assigned_mentor__MentorID', 'Mentor ID'),
+    ('assigned_mentor__MentorName', 'Mentor Name'),
+]
+
+ASSIGNMENT_EXPORT_FIELDS = [
+    ('assignment_id', 'Assignment ID'),
+    ('mentee__MenteeID', 'Mentee ID'),
+    ('mentee__MenteeName', 'Mentee Name'),
+    ('mentee__MenteeCourse', 'Course'),
+    ('mentor__MentorID', 'Mentor ID'),
+    ('mentor__MentorName', 'Mentor Name'),
+    ('assignment_status', 'Status'),
+    ('assigned_date', 'Assigned Date'),
+    ('assigned_by__username', 'Assigned By'),
+    ('notes', 'Notes'),
+]
+
+ATTENDANCE_EXPORT_FIELDS = [
+    ('activity__ActivityID', 'Activity ID'),
+    ('activity__ActivityName', 'Activity Name'),
+    ('activity__ActivityType', 'Type'),
+    ('activity__Date', 'Date'),
+    ('activity__StartTime', 'Start Time'),
+    ('activity__Location', 'Location'),
+    ('mentee__MenteeID', 'Mentee ID'),
+    ('mentee__MenteeName', 'Mentee Name'),
+    ('attended', 'Attended'),
+    ('notes', 'Notes'),
+]
+
+
+def _export_rows(queryset, fields):
+    """Stream tuples for ``fields`` straight from the cursor, without building model instances"""
+    return queryset.values_list(*[field for field, _ in fields]).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def export_mentees_csv(mentees):
+    """CSV of a (filtered) Mentee queryset, courses shown by full name as on manage_mentees"""
+    course_index = [field for field, _ in MENTEE_EXPORT_FIELDS].index('MenteeCourse')
+
+    def rows():
+        for row in _export_rows(mentees.order_by('MenteeID'), MENTEE_EXPORT_FIELDS):
+            row = list(row)
+            row[course_index] = get_course_full_name(row[course_index])
+            yield row
+
+    return stream_csv('mentees', [label for _, label in MENTEE_EXPORT_FIELDS], rows())
+
+
+def export_assignments_csv(assignments):
+    """CSV of a (filtered) MentorMenteeAssignment queryset, newest first"""
+    rows = _export_rows(assignments.order_by('-assigned_date', '-assignment_id'), ASSIGNMENT_EXPORT_FIELDS)
+    return stream_csv('assignments', [label for _, label in ASSIGNMENT_EXPORT_FIELDS], rows)
+
+
+def export_attendance_csv(attendance):
+    """CSV of a (filtered) Attendance queryset, one row per mentee per activity"""
+    attended_index = [field for field, _ in ATTENDANCE_EXPORT_FIELDS].index('attended')
+
+    def rows():
+        for row in _export_rows(attendance.order_by('-activity__Date', 'activity__StartTime', 'mentee__MenteeID'),
+                                ATTENDANCE_EXPORT_FIELDS):
+            row = list(row)
+            row[attended_index] = 'Present' if row[attended_index] else 'Absent'
+            yield row
+
+    return stream_csv('attendance', [label for _, label in ATTENDANCE_EXPORT_FIELDS], rows())
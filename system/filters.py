@@ -0,0 +1,136 @@
+from django.core.exceptions import BadRequest
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+# Query-string filters shared by the list pages and their CSV exports, so an
+# export always contains exactly the rows the head was looking at. A malformed
+# value raises BadRequest, which Django answers with a 400.
+
+ACTIVITY_SEARCH_FIELDS = ('ActivityID', 'ActivityName', 'ActivityType', 'Location')
+
+
+def _date_param(params, name):
+    """The YYYY-MM-DD date in ``params[name]``, None if absent, or BadRequest"""
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        date = parse_date(value)
+    except ValueError:  # well formed but not a real day, e.g. 2024-02-30
+        date = None
+    if date is None:
+        raise BadRequest(f'Invalid {name}: expected YYYY-MM-DD')
+    return date
+
+
+def filter_mentees(mentees, params):
+    """Apply the manage_mentees search box and status filter to a Mentee queryset"""
+    search_query = params.get('search', '')
+    if search_query:
+        mentees = mentees.filter(
+            Q(MenteeID__icontains=search_query) |
+            Q(MenteeName__icontains=search_query) |
+            Q(MenteeCourse__icontains=search_query) |
+            Q(assigned_mentor__MentorName__icontains=search_query)
+        )
+
+    status_filter = params.get('status')
+    if status_filter == 'unassigned':
+        mentees = mentees.filter(assigned_mentor__isnull=True)
+    elif status_filter and status_filter != 'all':
+        mentees = mentees.filter(MenteeStatus=status_filter)
+
+    return mentees
+
+
+def filter_assignments(assignments, params, mentor_id=None):
+    """Apply the assignment_history search box and mentor/status/date filters to an assignment queryset"""
+    search_query = params.get('search', '')
+    mentor_filter = params.get('mentor') or mentor_id
+    status_filter = params.get('status')
+    date_from = _date_param(params, 'date_from')
+    date_to = _date_param(params, 'date_to')
+
+    if search_query:
+        assignments = assignments.filter(
+            Q(mentee__MenteeID__icontains=search_query) |
+            Q(mentee__MenteeName__icontains=search_query) |
+            Q(mentee__MenteeCourse__icontains=search_query) |
+            Q(mentor__MentorName__icontains=search_query)
+        )
+
+    if mentor_filter:
+        assignments = assignments.filter(mentor__MentorID=mentor_filter)
+
+    if status_filter:
+        assignments = assignments.filter(assignment_status=status_filter)
+
+    if date_from is not None:
+        assignments = assignments.filter(assigned_date__gte=date_from)
+
+    if date_to is not None:
+        assignments = assignments.filter(assigned_date__lte=date_to)
+
+    return assignments
+
+
+def _activity_search(search_query, prefix=''):
+    """Q matching the activities search box; ``prefix`` is the path to the Activity, e.g. 'activity__'"""
+    query = Q()
+    for field in ACTIVITY_SEARCH_FIELDS:
+        query |= Q(**{f'{prefix}{field}__icontains': search_query})
+    return query
+
+
+def _activity_status_and_type(params, prefix=''):
+    """Q for the activities status (relative to today) and type filters; ``prefix`` as in _activity_search"""
+    query = Q()
+    # upcoming / ongoing (today) / completed, relative to today's date
+    status_filter = params.get('status')
+    today = timezone.now().date()
+    if status_filter == 'upcoming':
+        query &= Q(**{f'{prefix}Date__gt': today})
+    elif status_filter == 'ongoing':
+        query &= Q(**{f'{prefix}Date': today})
+    elif status_filter == 'completed':
+        query &= Q(**{f'{prefix}Date__lt': today})
+
+    type_filter = params.get('type')
+    if type_filter and type_filter != 'all':
+        query &= Q(**{f'{prefix}ActivityType': type_filter})
+    return query
+
+
+def filter_activities(activities, params):
+    """Apply the mentor_mentee_activities search box, status and type filters to an Activity queryset"""
+    search_query = params.get('search', '')
+    if search_query:
+        activities = activities.filter(_activity_search(search_query))
+    return activities.filter(_activity_status_and_type(params))
+
+
+def filter_attendance(attendance, params):
+    """Filter Attendance rows by their activity (the activities page's search, status and type,
+    or one activity and a date range) and attended flag"""
+    search_query = params.get('search', '')
+    if search_query:
+        attendance = attendance.filter(_activity_search(search_query, prefix='activity__'))
+    attendance = attendance.filter(_activity_status_and_type(params, prefix='activity__'))
+
+    activity_id = params.get('activity')
+    if activity_id:
+        attendance = attendance.filter(activity__ActivityID=activity_id)
+
+    attended = params.get('attended')
+    if attended in ('yes', 'no'):
+        attendance = attendance.filter(attended=(attended == 'yes'))
+
+    date_from = _date_param(params, 'date_from')
+    date_to = _date_param(params, 'date_to')
+    if date_from is not None:
+        attendance = attendance.filter(activity__Date__gte=date_from)
+    if date_to is not None:
+        attendance = attendance.filter(activity__Date__lte=date_to)
+
+    return attendance
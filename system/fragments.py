@@ -0,0 +1,21 @@
+from django.shortcuts import render
+
+# List pages (manage_mentees, view_assigned_mentees, assignment_history,
+# mentor_mentee_activities) keep their table body and pagination in a
+# partials/*_rows.html template. A request with ?fragment=rows renders only
+# that partial, so the view can skip its stat cards, filter facets and the
+# sidebar; static/system/js/list-fragments.js fetches it when the search,
+# filter, page or per-page controls change and swaps it into the page.
+
+FRAGMENT_PARAM = 'fragment'
+FRAGMENT_ROWS = 'rows'
+
+
+def wants_fragment(request):
+    """True when the request only asks for a list page's rows and pagination"""
+    return request.GET.get(FRAGMENT_PARAM) == FRAGMENT_ROWS
+
+
+def render_list(request, template_name, fragment_name, context):
+    """Render the full list page, or just its rows partial for a fragment request"""
+    return render(request, fragment_name if wants_fragment(request) else template_name, context)
@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import os
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from . import metrics
+
+# Fixed-size derivatives of uploaded profile pictures. Each original gets an
+# avatar, card and full rendition in WebP and JPEG, stored next to it under
+# derived/ with names computed from the original's name, so templates can
+# find them without a database lookup (see templatetags/profile_pictures.py).
+# Renditions always live in the default storage, whichever storage holds the
+# original. Whether an original has its renditions is cached in the shared
+# cache, so pages don't check the disk for every picture they show.
+
+# name: (pixels, crop to square). Avatars back the 36-80px list and sidebar
+# images, cards the 120-180px profile photos (both at 2x); full is capped.
+DERIVATIVE_SIZES = {
+    'avatar': (96, True),
+    'card': (400, True),
+    'full': (1200, False),
+}
+DERIVATIVE_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+# Missing renditions are re-checked after this long, in case they were
+# generated somewhere that couldn't clear the cached answer
+MISSING_DERIVATIVES_TIMEOUT = 60 * 5
+
+DERIVATIVES_CACHE = 'picture_derivatives'
+
+logger = logging.getLogger(__name__)
+
+
+def derivative_name(name, size, extension):
+    """Storage name of one rendition, e.g. mentee_profile_pictures/derived/x-avatar.webp"""
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    return f'{directory}/derived/{stem}-{size}.{extension}' if directory else f'derived/{stem}-{size}.{extension}'
+
+
+def derivative_names(name):
+    return [derivative_name(name, size, extension) for size in DERIVATIVE_SIZES for extension in DERIVATIVE_FORMATS]
+
+
+def has_derivatives(name, storage=default_storage):
+    return all(storage.exists(derived) for derived in derivative_names(name))
+
+
+def _availability_key(name):
+    return f'{DERIVATIVES_CACHE}:{hashlib.sha1(name.encode()).hexdigest()}'
+
+
+def derivatives_available(name):
+    """Whether every rendition of the original ``name`` is in the default storage, cached"""
+    key = _availability_key(name)
+    available = cache.get(key)
+    metrics.record_cache(DERIVATIVES_CACHE, available is not None)
+    if available is None:
+        available = has_derivatives(name)
+        cache.set(key, available, None if available else MISSING_DERIVATIVES_TIMEOUT)
+    return available
+
+
+def _render(image, pixels, crop):
+    if crop:
+        return ImageOps.fit(image, (pixels, pixels), Image.LANCZOS)
+    image = image.copy()
+    image.thumbnail((pixels, pixels), Image.LANCZOS)
+    return image
+
+
+def _encode(image, extension):
+    image_format, options = DERIVATIVE_FORMATS[extension]
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        # JPEG has no alpha channel; flatten transparent images onto white
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def generate_derivatives(name, storage=default_storage, force=False):
+    """Write every missing rendition of the stored image ``name``; returns how many were written.
+
+    Raises OSError if the original is missing or not a readable image.
+    """
+    targets = [derived for derived in derivative_names(name) if force or not storage.exists(derived)]
+    if not targets:
+        return 0
+
+    try:
+        with storage.open(name, 'rb') as original:
+            image = Image.open(original)
+            image = ImageOps.exif_transpose(image)
+            image = image.convert('RGBA' if 'A' in image.getbands() or image.mode == 'P' else 'RGB')
+    except UnidentifiedImageError as error:
+        raise OSError(f'{name} is not a readable image') from error
+
+    written = 0
+    for size, (pixels, crop) in DERIVATIVE_SIZES.items():
+        rendition = None
+        for extension in DERIVATIVE_FORMATS:
+            derived = derivative_name(name, size, extension)
+            if derived not in targets:
+                continue
+            if rendition is None:
+                rendition = _render(image, pixels, crop)
+            if storage.exists(derived):
+                storage.delete(derived)
+            storage.save(derived, ContentFile(_encode(rendition, extension)))
+            written += 1
+    cache.delete(_availability_key(name))
+    return written
+
+
+def delete_derivatives(name, storage=default_storage):
+    for derived in derivative_names(name):
+        if storage.exists(derived):
+            storage.delete(derived)
+    cache.delete(_availability_key(name))
+
+
+def refresh_derivatives(field_file):
+    """Generate renditions for a just-uploaded picture; failures are logged, the original still serves"""
+    if not field_file:
+        return
+    try:
+        # Renditions keep their computed names, so they go through the default storage
+        generate_derivatives(field_file.name)
+    except OSError:
+        logger.exception('Could not generate derivatives for %s', field_file.name)
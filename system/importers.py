@@ -0,0 +1,274 @@
+import csv
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction, IntegrityError
+
+from .caching import bump_cache_version, MENTOR_FACETS
+from .models import (
+    CustomUser, Mentee, Mentor, MENTEE_ID_REGEX, MENTOR_ID_REGEX, get_course_full_name,
+)
+
+# Rows validated and inserted together; each batch is one transaction
+DEFAULT_BATCH_SIZE = 500
+
+MENTEE_REQUIRED_COLUMNS = ['MenteeID', 'MenteeName', 'MenteeCourse', 'MenteeSemester',
+                           'MenteeGender', 'MenteeEmail', 'MenteeIC']
+MENTEE_OPTIONAL_COLUMNS = ['MenteePhone', 'MenteeAddress', 'MenteePostcode', 'MenteeCity',
+                           'MenteeState', 'MenteeRace', 'MenteeReligion', 'MenteePreviousSchool',
+                           'MenteeFatherName', 'MenteeFatherIC', 'MenteeFatherOccupation',
+                           'MenteeFatherPhone', 'MenteeMotherName', 'MenteeMotherIC',
+                           'MenteeMotherOccupation', 'MenteeMotherPhone']
+
+MENTOR_REQUIRED_COLUMNS = ['MentorID', 'MentorName', 'MentorEmail', 'MentorIC', 'MentorDepartment']
+MENTOR_OPTIONAL_COLUMNS = ['MentorPhone', 'MentorAddress', 'MentorPostcode', 'MentorCity',
+                           'MentorState', 'MentorRace', 'MentorReligion']
+
+
+def _init_hash_worker():
+    """Make sure Django is configured in pool workers started with 'spawn'"""
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mentormenteesystem.settings')
+        django.setup()
+
+
+def hash_passwords(passwords, pool=None, workers=1):
+    """Hash a list of raw passwords, in parallel when a process pool is given"""
+    if pool is None or len(passwords) < 2:
+        return [make_password(password) for password in passwords]
+    # A few chunks per worker keeps cores busy without per-password IPC
+    chunksize = max(1, len(passwords) // (4 * workers))
+    return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+class _ImportSpec:
+    """Role-specific pieces of the import pipeline"""
+
+    def __init__(self, role):
+        self.role = role
+        if role == 'mentee':
+            self.model = Mentee
+            self.id_field, self.email_field, self.ic_field = 'MenteeID', 'MenteeEmail', 'MenteeIC'
+            self.name_field = 'MenteeName'
+            self.id_regex = MENTEE_ID_REGEX
+            self.required = MENTEE_REQUIRED_COLUMNS
+            self.optional = MENTEE_OPTIONAL_COLUMNS
+        elif role == 'mentor':
+            self.model = Mentor
+            self.id_field, self.email_field, self.ic_field = 'MentorID', 'MentorEmail', 'MentorIC'
+            self.name_field = 'MentorName'
+            self.id_regex = MENTOR_ID_REGEX
+            self.required = MENTOR_REQUIRED_COLUMNS
+            self.optional = MENTOR_OPTIONAL_COLUMNS
+        else:
+            raise ValueError(f"Unsupported import role: {role}")
+
+    def build_profile(self, row, user):
+        """Build (but do not save) the profile object for a validated row"""
+        fields = {column: row.get(column, '') or '' for column in self.optional}
+        if self.role == 'mentee':
+            return Mentee(
+                user=user,
+                MenteeID=row['MenteeID'],
+                MenteeName=row['MenteeName'],
+                MenteeEmail=row['MenteeEmail'],
+                MenteeIC=row['MenteeIC'],
+                MenteeGender=row['MenteeGender'],
+                # Store FULL course name, same as add_mentee
+                MenteeCourse=get_course_full_name(row['MenteeCourse']),
+                MenteeSemester=int(row['MenteeSemester']),
+                MenteeJoinDate=date.today(),
+                Year=date.today().year,
+                **fields,
+            )
+        mentor = Mentor(
+            user=user,
+            MentorID=row['MentorID'],
+            MentorName=row['MentorName'],
+            MentorEmail=row['MentorEmail'],
+            MentorIC=row['MentorIC'],
+            MentorDepartment=row['MentorDepartment'],
+            MaxMentees=int(row.get('MaxMentees') or 20),
+            MentorJoinDate=date.today(),
+            CurrentMentees=0,
+            **fields,
+        )
+        # bulk_create skips save(), so apply the department clean-up here
+        mentor.clean()
+        return mentor
+
+
+class _SeenValues:
+    """In-memory sets of identifiers already in the database or earlier in the file"""
+
+    def __init__(self, spec):
+        self.usernames = {u.lower() for u in CustomUser.objects.values_list('username', flat=True).iterator()}
+        self.emails = {e.lower() for e in CustomUser.objects.values_list('email', flat=True).iterator()}
+        self.ids = set(spec.model.objects.values_list(spec.id_field, flat=True).iterator())
+        self.ics = set(spec.model.objects.values_list(spec.ic_field, flat=True).iterator()) - {''}
+
+
+def _validate_row(spec, row, seen):
+    """Return an error message for a row, or None if it can be imported"""
+    missing = [column for column in spec.required if not row.get(column)]
+    if missing:
+        return f"Missing required fields: {', '.join(missing)}"
+
+    record_id = row[spec.id_field]
+    if not re.match(spec.id_regex, record_id):
+        return f"Invalid ID format: {record_id}"
+    if record_id in seen.ids or record_id.lower() in seen.usernames:
+        return f"This ID already exists: {record_id}"
+    if row[spec.email_field].lower() in seen.emails:
+        return "This email address is already registered."
+    if row[spec.ic_field] in seen.ics:
+        return "This IC number is already registered."
+
+    if spec.role == 'mentee':
+        if row['MenteeGender'] not in ('male', 'female'):
+            return "Gender must be 'male' or 'female'."
+        if not str(row['MenteeSemester']).isdigit():
+            return "Semester must be a number."
+    elif row.get('MaxMentees') and not str(row['MaxMentees']).isdigit():
+        return "MaxMentees must be a number."
+    return None
+
+
+def _insert_batch(spec, rows, hashed):
+    """Insert one validated batch; returns per-row errors for rows that failed"""
+    def build_user(row, password_hash):
+        return CustomUser(
+            username=row[spec.id_field].lower(),
+            password=password_hash,  # IC number, pre-hashed
+            role=spec.role,
+            first_name=row[spec.name_field],
+            email=row[spec.email_field],
+        )
+
+    try:
+        with transaction.atomic():
+            users = CustomUser.objects.bulk_create(
+                [build_user(row, password_hash) for (_, row), password_hash in zip(rows, hashed)]
+            )
+            spec.model.objects.bulk_create(
+                [spec.build_profile(row, user) for (_, row), user in zip(rows, users)]
+            )
+        return []
+    except IntegrityError:
+        # Something changed underneath us - retry row by row so one bad row
+        # doesn't take the rest of the batch down with it
+        pass
+
+    errors = []
+    for (line_number, row), password_hash in zip(rows, hashed):
+        try:
+            with transaction.atomic():
+                user = build_user(row, password_hash)
+                user.save()
+                spec.build_profile(row, user).save()
+        except Exception as e:
+            errors.append({'row': line_number, 'id': row.get(spec.id_field, ''), 'error': str(e)})
+    return errors
+
+
+def import_users(stream, role, batch_size=DEFAULT_BATCH_SIZE, workers=None):
+    """Stream a CSV of mentees or mentors into the database.
+
+    ``stream`` is a text file object; rows are read, validated and inserted
+    ``batch_size`` at a time so memory stays flat for large files. Returns
+    ``{'created': int, 'errors': [{'row', 'id', 'error'}, ...]}``.
+    """
+    spec = _ImportSpec(role)
+    reader = csv.DictReader(stream)
+    result = {'created': 0, 'errors': []}
+
+    missing_columns = [column for column in spec.required if column not in (reader.fieldnames or [])]
+    if missing_columns:
+        result['errors'].append({'row': 1, 'id': '', 'error': f"Missing columns: {', '.join(missing_columns)}"})
+        return result
+
+    seen = _SeenValues(spec)
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_hash_worker) if workers > 1 else None
+
+    try:
+        # Header is line 1, so data rows start at 2
+        numbered_rows = enumerate(reader, start=2)
+        while True:
+            batch = list(islice(numbered_rows, batch_size))
+            if not batch:
+                break
+
+            valid_rows = []
+            for line_number, row in batch:
+                row = {key: (value or '').strip() for key, value in row.items() if key}
+                # IDs are stored upper-case, as in signup_view
+                if row.get(spec.id_field):
+                    row[spec.id_field] = row[spec.id_field].upper()
+                error = _validate_row(spec, row, seen)
+                if error:
+                    result['errors'].append({'row': line_number, 'id': row.get(spec.id_field, ''), 'error': error})
+                    continue
+                # Reserve identifiers so duplicates later in the file are caught
+                seen.ids.add(row[spec.id_field])
+                seen.usernames.add(row[spec.id_field].lower())
+                seen.emails.add(row[spec.email_field].lower())
+                seen.ics.add(row[spec.ic_field])
+                valid_rows.append((line_number, row))
+
+            if not valid_rows:
+                continue
+
+            # Use IC number as initial password, same as add_mentee/add_mentor
+            hashed = hash_passwords([row[spec.ic_field] for _, row in valid_rows], pool, workers)
+            batch_errors = _insert_batch(spec, valid_rows, hashed)
+            result['errors'].extend(batch_errors)
+            result['created'] += len(valid_rows) - len(batch_errors)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if role == 'mentor' and result['created']:
+        # bulk_create doesn't send post_save
+        bump_cache_version(MENTOR_FACETS)
+
+    result['errors'].sort(key=lambda error: error['row'])
+    return result
+
+
+@contextmanager
+def _uploaded_text(uploaded_file):
+    """Read a Django UploadedFile as text from the start without reading it into memory"""
+    uploaded_file.seek(0)
+    stream = io.TextIOWrapper(uploaded_file.file, encoding='utf-8-sig', newline='')
+    try:
+        yield stream
+    finally:
+        # Don't let the wrapper close the underlying upload
+        stream.detach()
+
+
+def import_uploaded_file(uploaded_file, role, **kwargs):
+    """Run import_users over a Django UploadedFile without reading it into memory"""
+    with _uploaded_text(uploaded_file) as stream:
+        return import_users(stream, role, **kwargs)
+
+
+def uploaded_row_count(uploaded_file, limit):
+    """Count the data rows of an uploaded CSV, stopping once it passes ``limit``.
+
+    Returns at most ``limit + 1``, so checking a huge file against the cap
+    costs no more than reading the first ``limit`` rows.
+    """
+    with _uploaded_text(uploaded_file) as stream:
+        reader = csv.reader(stream)
+        next(reader, None)  # header
+        return sum(1 for _ in islice(reader, limit + 1))
@@ -0,0 +1,40 @@
+import re
+from collections import Counter
+
+# Helpers for watching the SQL a request runs. QueryRecorder plugs into
+# connection.execute_wrapper(), so it works with DEBUG off and has no cap on
+# how many queries it can see.
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN \((?:\s*(?:%s|\?)\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+class QueryRecorder:
+    """execute_wrapper that keeps the SQL of every query it sees"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __len__(self):
+        return len(self.queries)
+
+
+def normalize_sql(sql):
+    """Reduce a query to its shape so the same statement with different parameters compares equal"""
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = sql.replace('%s', '?')
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def duplicate_queries(queries, minimum=2):
+    """[(normalized_sql, count)] for statements run at least ``minimum`` times, most repeated first"""
+    counts = Counter(normalize_sql(sql) for sql in queries)
+    return [(sql, count) for sql, count in counts.most_common() if count >= minimum]
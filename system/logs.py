@@ -0,0 +1,81 @@
+import contextlib
+import contextvars
+import json
+import logging
+import re
+from datetime import datetime, timezone
+
+# Request-scoped logging context. RequestLoggingMiddleware gives each request
+# a correlation id and decides whether its DEBUG records are kept (sampled);
+# RequestContextFilter stamps the id on every record and drops DEBUG records
+# from requests that weren't sampled. Outside a request (management commands,
+# shell) there is no id and nothing is sampled out.
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+_request_id = contextvars.ContextVar('request_id', default=None)
+_sampled = contextvars.ContextVar('log_sampled', default=True)
+
+# LogRecord attributes that aren't user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'request_id'}
+
+
+def current_request_id():
+    return _request_id.get()
+
+
+def clean_request_id(value):
+    """An incoming X-Request-ID if it's safe to echo and log, else None"""
+    if value and _VALID_REQUEST_ID.match(value):
+        return value
+    return None
+
+
+@contextlib.contextmanager
+def request_context(request_id, sampled=True):
+    """Bind a correlation id and sampling decision to everything logged inside"""
+    id_token = _request_id.set(request_id)
+    sampled_token = _sampled.set(sampled)
+    try:
+        yield
+    finally:
+        _sampled.reset(sampled_token)
+        _request_id.reset(id_token)
+
+
+def debug_enabled(logger):
+    """Whether ``logger.debug()`` output would be kept for the current request.
+
+    Check it once before a loop of per-row debug calls so the detail costs
+    nothing - not even building the arguments - when DEBUG is off or the
+    request wasn't sampled.
+    """
+    return _sampled.get() and logger.isEnabledFor(logging.DEBUG)
+
+
+class RequestContextFilter(logging.Filter):
+    """Handler filter: add ``request_id`` to records and apply DEBUG sampling"""
+
+    def filter(self, record):
+        record.request_id = _request_id.get() or '-'
+        return record.levelno > logging.DEBUG or _sampled.get()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, request_id, message, plus any ``extra`` fields"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', None) or _request_id.get(),
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
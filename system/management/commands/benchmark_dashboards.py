@@ -0,0 +1,56 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from system.benchmarks import (
+    benchmark_dashboards, database_path, prepare_database, simulated_latency, use_database, DASHBOARD_VIEWS,
+)
+
+
+class Command(BaseCommand):
+    help = "Time the sync and async homepages against a seeded file-backed database, optionally with per-query latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=10000,
+                            help='Mentees in the seeded database (default: %(default)s)')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Timed requests per view after one warm-up (default: %(default)s)')
+        parser.add_argument('--latency-ms', default='0,2',
+                            help='Comma-separated per-query delays to simulate a networked database (default: %(default)s)')
+        parser.add_argument('--roles', default='',
+                            help=f"Comma-separated homepages to time (default: {','.join(DASHBOARD_VIEWS)})")
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--db-dir', default=os.path.join(settings.BASE_DIR, '.benchmarks'),
+                            help='Where seeded databases are kept between runs')
+
+    def handle(self, *args, **options):
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError("benchmark_dashboards seeds a throwaway SQLite database; the default database must be SQLite")
+        try:
+            latencies = [float(value) for value in options['latency_ms'].split(',') if value.strip()]
+        except ValueError:
+            raise CommandError("--latency-ms must be a comma-separated list of numbers")
+        roles = {role.strip() for role in options['roles'].split(',') if role.strip()}
+        unknown = roles - set(DASHBOARD_VIEWS)
+        if unknown:
+            raise CommandError(f"Unknown roles: {', '.join(sorted(unknown))}")
+
+        path = database_path(options['db_dir'], options['scale'], options['seed'])
+        prepare_database(path, options['scale'], options['seed'], self.stdout)
+        workers = getattr(settings, 'DASHBOARD_QUERY_WORKERS', 4)
+        self.stdout.write(f"{options['scale']} mentees, {options['repeat']} requests per view, "
+                          f"{workers} query workers, {os.cpu_count()} CPUs")
+        self.stdout.write(f"  {'latency':>8} {'homepage':<8} {'sync p50':>9} {'async p50':>10} {'speedup':>8}")
+        with use_database(path):
+            for latency in latencies:
+                with simulated_latency(latency / 1000):
+                    results = benchmark_dashboards(options['repeat'], roles)
+                for role, stats in results.items():
+                    if 'skipped' in stats:
+                        self.stdout.write(f"  {latency:>6.1f}ms {role:<8} skipped ({stats['skipped']})")
+                        continue
+                    line = (f"  {latency:>6.1f}ms {role:<8} {stats['sync_p50_ms']:>7.1f}ms "
+                            f"{stats['async_p50_ms']:>8.1f}ms {stats['speedup']:>7.2f}x")
+                    self.stdout.write(self.style.SUCCESS(line) if stats['speedup'] > 1 else line)
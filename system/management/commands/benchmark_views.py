@@ -0,0 +1,101 @@
+import importlib
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from system.benchmarks import (
+    run_benchmarks, compare_reports, load_report, save_report,
+    DEFAULT_SCALES, DEFAULT_REPEAT, DEFAULT_THRESHOLD, NOISE_FLOOR_MS,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark every view at several data scales (p50/p95 latency and query counts), optionally against a baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', default=','.join(str(scale) for scale in DEFAULT_SCALES),
+                            help='Comma-separated mentee counts (default: %(default)s)')
+        parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                            help='Timed requests per view after one warm-up (default: %(default)s)')
+        parser.add_argument('--views', default='',
+                            help='Comma-separated URL names to benchmark (default: all)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--db-dir', default=os.path.join(settings.BASE_DIR, '.benchmarks'),
+                            help='Where seeded databases are kept between runs')
+        parser.add_argument('--output', default='benchmark_results.json',
+                            help='JSON results file to write')
+        parser.add_argument('--results', metavar='PATH',
+                            help='Compare an existing results file instead of running the benchmarks')
+        parser.add_argument('--compare', metavar='BASELINE',
+                            help='Baseline results file; exits non-zero if any view regressed')
+        parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help='Allowed p95 slowdown as a fraction (default: %(default)s)')
+        parser.add_argument('--noise-floor', type=float, default=NOISE_FLOOR_MS,
+                            help='Ignore p95 slowdowns smaller than this many ms (default: %(default)s)')
+
+    def handle(self, *args, **options):
+        if options['results']:
+            report = load_report(options['results'])
+        else:
+            report = self.run(options)
+
+        if options['compare']:
+            self.compare(load_report(options['compare']), report, options['threshold'], options['noise_floor'])
+
+    def run(self, options):
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError("benchmark_views seeds throwaway SQLite databases; the default database must be SQLite")
+        try:
+            scales = [int(scale) for scale in options['scales'].split(',') if scale.strip()]
+        except ValueError:
+            raise CommandError("--scales must be a comma-separated list of integers")
+        only = {name.strip() for name in options['views'].split(',') if name.strip()}
+
+        setup_test_environment()
+        try:
+            report = run_benchmarks(
+                importlib.import_module('system.urls'),
+                scales,
+                options['db_dir'],
+                seed=options['seed'],
+                repeat=options['repeat'],
+                only=only,
+                stdout=self.stdout,
+            )
+        finally:
+            teardown_test_environment()
+
+        for scale, views in report['results'].items():
+            self.stdout.write(f"\n{scale} mentees")
+            self.stdout.write(f"  {'view':<34} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+            for name, stats in sorted(views.items()):
+                if 'skipped' in stats:
+                    self.stdout.write(f"  {name:<34} skipped ({stats['skipped']})")
+                    continue
+                self.stdout.write(
+                    f"  {name:<34} {stats['status']:>6} {stats['p50_ms']:>9.1f} "
+                    f"{stats['p95_ms']:>9.1f} {stats['queries']:>8}"
+                )
+
+        save_report(report, options['output'])
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {options['output']}"))
+        return report
+
+    def compare(self, baseline, report, threshold, noise_floor_ms):
+        rows = compare_reports(baseline, report, threshold, noise_floor_ms)
+        regressions = [row for row in rows if row['regression']]
+
+        self.stdout.write(f"\n  {'scale':>7} {'view':<34} {'base p95':>9} {'p95':>9} {'change':>8} {'queries':>11}")
+        for row in rows:
+            line = (
+                f"  {row['scale']:>7} {row['view']:<34} {row['base_p95_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+                f"{row['change']:>+8.0%} {row['base_queries']:>5} -> {row['queries']:<4}"
+            )
+            self.stdout.write(self.style.ERROR(line) if row['regression'] else line)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)} view(s) regressed against the baseline")
+        self.stdout.write(self.style.SUCCESS(f"No regressions across {len(rows)} view/scale pairs"))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from system.storage import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete content-addressed uploads (and their renditions) that no row refers to any more"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only list the files that would be deleted')
+        parser.add_argument('--grace-hours', type=float, default=24,
+                            help='Keep unreferenced files younger than this (uploads in flight); default 24')
+
+    def handle(self, *args, **options):
+        removed = collect_garbage(grace_seconds=options['grace_hours'] * 3600, dry_run=options['dry_run'])
+        if options['verbosity'] > 1 or options['dry_run']:
+            for name, size in removed:
+                self.stdout.write(f"  {name} ({size} bytes)")
+
+        verb = 'would be deleted' if options['dry_run'] else 'deleted'
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(removed)} unreferenced files {verb}, {sum(size for _, size in removed)} bytes"
+        ))
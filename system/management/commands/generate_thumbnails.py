@@ -0,0 +1,44 @@
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from system.images import generate_derivatives, has_derivatives
+from system.models import CustomUser, Mentee, Mentor
+
+
+class Command(BaseCommand):
+    help = "Create missing avatar/card/full WebP and JPEG renditions for existing profile pictures"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help='Regenerate renditions that already exist (e.g. after changing sizes)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many pictures are missing renditions')
+
+    def handle(self, *args, **options):
+        names = set()
+        for model in (Mentee, Mentor, CustomUser):
+            names.update(
+                model.objects.exclude(profile_picture='').exclude(profile_picture__isnull=True)
+                .values_list('profile_picture', flat=True).iterator()
+            )
+
+        processed = skipped = failed = written = 0
+        for name in sorted(names):
+            if not options['force'] and has_derivatives(name):
+                skipped += 1
+                continue
+            if options['dry_run']:
+                processed += 1
+                continue
+            try:
+                written += generate_derivatives(name, default_storage, force=options['force'])
+                processed += 1
+            except OSError as error:
+                failed += 1
+                self.stderr.write(f"  {name}: {error}")
+
+        verb = 'need renditions' if options['dry_run'] else 'processed'
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(names)} pictures: {processed} {verb}, {skipped} already complete, {failed} failed"
+            + ('' if options['dry_run'] else f", {written} files written")
+        ))
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from system.models import Mentee, Mentor, Activity
+from system.seeding import seed_dataset, clear_dataset, max_mentees, DEFAULT_PASSWORD
+
+
+class Command(BaseCommand):
+    help = "Generate a realistic synthetic dataset (mentees, mentors, heads, activities, attendance, assignments) for scale testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mentees', type=int, default=1000)
+        parser.add_argument('--mentors', type=int, default=None,
+                            help='Default: one per ~18 mentees')
+        parser.add_argument('--heads', type=int, default=2)
+        parser.add_argument('--activities', type=int, default=None,
+                            help='Default: one per 20 mentees')
+        parser.add_argument('--seed', type=int, default=42,
+                            help='Random seed; the same seed always builds the same data')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD,
+                            help='Password for every generated account')
+        parser.add_argument('--clear', action='store_true',
+                            help='Delete existing mentees, mentors, heads and activities first (superusers are kept)')
+
+    def handle(self, *args, **options):
+        if options['mentees'] < 1 or options['mentees'] > max_mentees():
+            raise CommandError(f"--mentees must be between 1 and {max_mentees()}")
+
+        if options['clear']:
+            clear_dataset()
+        elif Mentee.objects.exists() or Mentor.objects.exists() or Activity.objects.exists():
+            raise CommandError("Database already has mentees, mentors or activities; rerun with --clear to replace them")
+
+        started = time.monotonic()
+        try:
+            counts = seed_dataset(
+                mentees=options['mentees'],
+                mentors=options['mentors'],
+                heads=options['heads'],
+                activities=options['activities'],
+                seed=options['seed'],
+                password=options['password'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        elapsed = time.monotonic() - started
+        summary = ', '.join(f"{count} {name.replace('_', ' ')}" for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Seeded {summary} in {elapsed:.1f}s"))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from system.warmup import cache_is_process_local, compile_templates, prime_caches
+
+
+class Command(BaseCommand):
+    help = "Compile every template through the cached loader and prime shared caches, timing each step"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10,
+                            help='Templates to list, slowest first; 0 lists all (default: %(default)s)')
+        parser.add_argument('--skip-caches', action='store_true',
+                            help='Only compile templates')
+
+    def handle(self, *args, **options):
+        timings = compile_templates()
+        failed = [name for name, seconds in timings if seconds is None]
+        compiled = [(name, seconds) for name, seconds in timings if seconds is not None]
+
+        shown = compiled if options['top'] <= 0 else compiled[:options['top']]
+        self.stdout.write(f"Compiled {len(compiled)} templates in {sum(s for _, s in compiled) * 1000:.1f} ms")
+        for name, seconds in shown:
+            self.stdout.write(f"  {seconds * 1000:8.1f} ms  {name}")
+        if len(shown) < len(compiled):
+            self.stdout.write(f"  ... {len(compiled) - len(shown)} more (--top 0 lists all)")
+
+        if not options['skip_caches']:
+            self.stdout.write("Primed caches:")
+            for label, result, seconds in prime_caches():
+                outcome = 'failed' if result is None else result
+                self.stdout.write(f"  {seconds * 1000:8.1f} ms  {label} ({outcome})")
+            if cache_is_process_local():
+                self.stdout.write(self.style.WARNING(
+                    "The default cache is per process (LocMemCache): entries primed here are not "
+                    "shared with running workers. Set WARMUP_ON_BOOT to warm each worker instead."
+                ))
+
+        if failed:
+            raise CommandError(f"{len(failed)} templates failed to compile: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS("Warm-up complete"))
@@ -0,0 +1,186 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from .models import ActivityReport, MentoringSession
+from .storage import content_hash
+
+# Uploaded files, served by views.serve_media to signed-in users only. Which
+# user may read a file depends on the directory it was uploaded to:
+#
+#   profile pictures     anyone signed in (they appear in every role's lists)
+#   session_materials/   heads, the session's mentor, and mentees invited to
+#                        it or assigned to that mentor (as on their schedule)
+#   activity_reports/    heads and the activity's mentor
+#
+# Anything else under MEDIA_ROOT is not served. Responses carry an ETag and
+# Last-Modified and answer conditional and single Range requests. With
+# MEDIA_SENDFILE set, Django only checks access and a front proxy sends the
+# bytes: 'x-sendfile' (Apache mod_xsendfile, lighttpd) gets the file's path,
+# 'x-accel-redirect' (nginx) gets MEDIA_ACCEL_PREFIX + the name, which must
+# map to an internal location aliasing MEDIA_ROOT, e.g.
+#
+#   location /protected-media/ { internal; alias /srv/mmms/media/; }
+
+PROFILE_PICTURE_DIRS = ('profile_pictures', 'mentee_profile_pictures', 'mentor_profile_pictures')
+SESSION_MATERIALS_DIR = 'session_materials'
+ACTIVITY_REPORTS_DIR = 'activity_reports'
+
+SENDFILE_HEADERS = {
+    'x-sendfile': 'X-Sendfile',
+    'x-accel-redirect': 'X-Accel-Redirect',
+}
+
+# bytes=first-last, bytes=first- or bytes=-suffix; several ranges get the whole file
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def can_read(user, name):
+    """Whether ``user`` may download the media file ``name``"""
+    directory = name.split('/', 1)[0]
+    if directory in PROFILE_PICTURE_DIRS:
+        return True
+    if user.role == 'head' and directory in (SESSION_MATERIALS_DIR, ACTIVITY_REPORTS_DIR):
+        return True
+    # Content-addressed files may be shared by several rows; any one that grants access will do
+    if directory == SESSION_MATERIALS_DIR:
+        sessions = MentoringSession.objects.filter(materials=name)
+        if user.role == 'mentor':
+            return sessions.filter(activity__PrimaryMentor__user=user).exists()
+        if user.role == 'mentee':
+            return sessions.filter(
+                Q(activity__attendance__mentee__user=user)
+                | Q(activity__PrimaryMentor__mentee__user=user)
+            ).exists()
+    if directory == ACTIVITY_REPORTS_DIR and user.role == 'mentor':
+        return ActivityReport.objects.filter(report_file=name, activity__PrimaryMentor__user=user).exists()
+    return False
+
+
+def media_path(name):
+    """Absolute path of an existing file under MEDIA_ROOT, or Http404"""
+    try:
+        path = safe_join(settings.MEDIA_ROOT, name)
+    except ValueError:  # escapes MEDIA_ROOT
+        raise Http404('Not found')
+    if not os.path.isfile(path):
+        raise Http404('Not found')
+    return path
+
+
+def file_etag(name, stat):
+    """Content-addressed names carry their hash; other files are identified by size and mtime"""
+    digest = content_hash(name)
+    if digest:
+        return quote_etag(digest)
+    return quote_etag(f'{stat.st_mtime_ns:x}-{stat.st_size:x}')
+
+
+def parse_range(header, size):
+    """(first, last) byte offsets for a single Range header, None to send the whole file, or 'unsatisfiable'"""
+    match = RANGE.match((header or '').strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # The final N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            return 'unsatisfiable'
+        return max(0, size - length), size - 1
+    first = int(first)
+    last = min(int(last), size - 1) if last else size - 1
+    if last < first:
+        return None if first < size else 'unsatisfiable'
+    if first >= size:
+        return 'unsatisfiable'
+    return first, last
+
+
+def _range_applies(request, etag, last_modified):
+    """If-Range: only answer the range if the client's copy is still current"""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        # Only strong validators may be used with If-Range
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def _read_range(path, first, last):
+    with open(path, 'rb') as handle:
+        handle.seek(first)
+        remaining = last - first + 1
+        while remaining > 0:
+            chunk = handle.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _sendfile_response(name, path):
+    backend = getattr(settings, 'MEDIA_SENDFILE', None)
+    if not backend:
+        return None
+    header = SENDFILE_HEADERS.get(backend.lower())
+    if header is None:
+        raise ValueError(f"MEDIA_SENDFILE must be one of {', '.join(SENDFILE_HEADERS)}, not {backend!r}")
+    content_type, _ = mimetypes.guess_type(path)
+    response = HttpResponse(content_type=content_type or 'application/octet-stream')
+    # The proxy fills in the body, Content-Length and any Range itself
+    if header == 'X-Accel-Redirect':
+        response[header] = getattr(settings, 'MEDIA_ACCEL_PREFIX', '/protected-media/') + name
+    else:
+        response[header] = path
+    return response
+
+
+def file_response(request, name):
+    """The media file ``name`` for ``request``: 200, 206, 304, 412 or 416, or handed to the proxy"""
+    path = media_path(name)
+    stat = os.stat(path)
+    etag = file_etag(name, stat)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _sendfile_response(name, path)
+    if response is None:
+        byte_range = None
+        if request.method == 'GET' and _range_applies(request, etag, last_modified):
+            byte_range = parse_range(request.headers.get('Range'), stat.st_size)
+        if byte_range == 'unsatisfiable':
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+        elif byte_range:
+            first, last = byte_range
+            content_type, _ = mimetypes.guess_type(path)
+            response = StreamingHttpResponse(_read_range(path, first, last), status=206,
+                                             content_type=content_type or 'application/octet-stream')
+            response['Content-Range'] = f'bytes {first}-{last}/{stat.st_size}'
+            response['Content-Length'] = str(last - first + 1)
+        else:
+            response = FileResponse(open(path, 'rb'))
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # Access depends on the session, so only the browser may keep a copy
+    if content_hash(name):
+        response['Cache-Control'] = f'private, max-age={settings.MEDIA_IMMUTABLE_MAX_AGE}, immutable'
+    else:
+        response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,317 @@
+import atexit
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+# Prometheus metrics shared across worker processes without an external
+# service. Each process counts in memory and every METRICS_FLUSH_INTERVAL
+# seconds writes its cumulative totals to one row per series in a SQLite file
+# (METRICS_DB). The /metrics view sums the rows of every process. Rows of
+# processes that have exited are folded into one retired row per series at
+# scrape time, so counters stay monotonic across restarts without the table
+# growing with every worker ever started; their gauges are dropped, and live
+# gauges only count processes that flushed recently. With METRICS_DB = None
+# the endpoint shows the serving process alone.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+AUTO_ASSIGN_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# name: (type, help, histogram buckets)
+METRICS = {
+    'mmms_http_requests_total': (
+        'counter', 'Requests served, by URL name, method and status', None),
+    'mmms_http_request_duration_seconds': (
+        'histogram', 'Request latency by URL name', LATENCY_BUCKETS),
+    'mmms_http_requests_in_progress': (
+        'gauge', 'Requests currently being handled across all workers', None),
+    'mmms_db_queries_total': (
+        'counter', 'Database queries run, by URL name', None),
+    'mmms_db_query_seconds_total': (
+        'counter', 'Time spent in database queries, by URL name', None),
+    'mmms_db_queries_per_request': (
+        'histogram', 'Database queries per request, by URL name', QUERY_COUNT_BUCKETS),
+    'mmms_cache_requests_total': (
+        'counter', 'Cache lookups by cache and result (hit or miss)', None),
+    'mmms_auto_assign_duration_seconds': (
+        'histogram', 'Auto-assignment run time by strategy', AUTO_ASSIGN_BUCKETS),
+    'mmms_auto_assign_mentees_total': (
+        'counter', 'Mentees placed by auto-assignment, by strategy', None),
+}
+
+# Derived at scrape time from mmms_cache_requests_total
+CACHE_HIT_RATIO = 'mmms_cache_hit_ratio'
+
+# Requests with no matching URL pattern share one label value
+UNRESOLVED_VIEW = '<unresolved>'
+
+# Process key of the folded-in totals of exited workers
+RETIRED_PROCESS = 'retired'
+
+
+class Registry:
+    """In-memory metric values for this process, keyed by (name, sorted label pairs)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.pid = os.getpid()
+        self.process = f'{self.pid}-{uuid.uuid4().hex[:8]}'
+        self.flushed_at = time.monotonic()
+
+    def _check_fork(self):
+        # A forked worker inherits the parent's numbers; start it from zero
+        if os.getpid() != self.pid:
+            self.values = {}
+            self.pid = os.getpid()
+            self.process = f'{self.pid}-{uuid.uuid4().hex[:8]}'
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self._check_fork()
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        buckets = METRICS[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self._check_fork()
+            # [count per bucket..., count above the last bucket, sum, count]
+            series = self.values.get(key)
+            if series is None:
+                series = self.values[key] = [0] * (len(buckets) + 3)
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    break
+            else:
+                index = len(buckets)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self):
+        with self.lock:
+            self._check_fork()
+            return {key: list(value) if isinstance(value, list) else value for key, value in self.values.items()}
+
+
+REGISTRY = Registry()
+
+
+def inc(name, amount=1, **labels):
+    REGISTRY.inc(name, amount, **labels)
+
+
+def observe(name, value, **labels):
+    REGISTRY.observe(name, value, **labels)
+
+
+def record_request(view, method, status, seconds, queries, query_seconds):
+    """Everything the middleware knows about one finished request"""
+    view = view or UNRESOLVED_VIEW
+    inc('mmms_http_requests_total', view=view, method=method, status=str(status))
+    observe('mmms_http_request_duration_seconds', seconds, view=view)
+    inc('mmms_db_queries_total', queries, view=view)
+    inc('mmms_db_query_seconds_total', query_seconds, view=view)
+    observe('mmms_db_queries_per_request', queries, view=view)
+    maybe_flush()
+
+
+def record_cache(cache_name, hit):
+    inc('mmms_cache_requests_total', cache=cache_name, result='hit' if hit else 'miss')
+
+
+def record_auto_assign(strategy, seconds, assigned):
+    observe('mmms_auto_assign_duration_seconds', seconds, strategy=strategy)
+    inc('mmms_auto_assign_mentees_total', assigned, strategy=strategy)
+    maybe_flush(force=True)
+
+
+# Shared storage
+
+_store_lock = threading.Lock()
+_store = {}
+
+
+def _connection():
+    path = getattr(settings, 'METRICS_DB', None)
+    if not path:
+        return None
+    path = str(path)
+    if _store.get('path') != path or _store.get('pid') != os.getpid():
+        connection = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS metric_series ('
+            ' process TEXT NOT NULL, name TEXT NOT NULL, labels TEXT NOT NULL,'
+            ' value TEXT NOT NULL, updated REAL NOT NULL,'
+            ' PRIMARY KEY (process, name, labels))'
+        )
+        _store.update(path=path, pid=os.getpid(), connection=connection)
+    return _store['connection']
+
+
+def flush():
+    """Write this process's cumulative values to the shared file"""
+    with _store_lock:
+        snapshot = REGISTRY.snapshot()
+        REGISTRY.flushed_at = time.monotonic()
+        # Nothing recorded yet: don't create the file just to write no rows
+        if not snapshot:
+            return
+        connection = _connection()
+        if connection is None:
+            return
+        now = time.time()
+        rows = [
+            (REGISTRY.process, name, json.dumps(labels), json.dumps(value), now)
+            for (name, labels), value in snapshot.items()
+        ]
+        connection.executemany('INSERT OR REPLACE INTO metric_series VALUES (?, ?, ?, ?, ?)', rows)
+
+
+def maybe_flush(force=False):
+    interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 10)
+    if force or time.monotonic() - REGISTRY.flushed_at >= interval:
+        try:
+            flush()
+        except sqlite3.Error:
+            # Metrics must never break a request; try again next interval
+            REGISTRY.flushed_at = time.monotonic()
+
+
+atexit.register(maybe_flush, force=True)
+
+
+def _add(total, value):
+    if isinstance(value, list):
+        return [a + b for a, b in zip(total, value)]
+    return total + value
+
+
+def _is_running(pid):
+    if os.name == 'nt':
+        # os.kill() can't probe a process on Windows; keep every row
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # alive, but owned by another user
+        return True
+    return True
+
+
+def retire_exited_processes(connection):
+    """Fold the rows of processes that have exited into the retired totals"""
+    with _store_lock:
+        processes = [process for process, in connection.execute(
+            'SELECT DISTINCT process FROM metric_series WHERE process != ?', (RETIRED_PROCESS,))]
+        exited = [process for process in processes if not _is_running(int(process.split('-', 1)[0]))]
+        if not exited:
+            return
+        marks = ', '.join('?' * len(exited))
+        # IMMEDIATE: two workers scraping at once must not both add the same rows
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            retired = {
+                (name, labels): json.loads(value)
+                for name, labels, value in connection.execute(
+                    'SELECT name, labels, value FROM metric_series WHERE process = ?', (RETIRED_PROCESS,))
+            }
+            for name, labels, value in connection.execute(
+                    f'SELECT name, labels, value FROM metric_series WHERE process IN ({marks})', exited):
+                if name not in METRICS or METRICS[name][0] == 'gauge':
+                    continue
+                key, value = (name, labels), json.loads(value)
+                retired[key] = _add(retired[key], value) if key in retired else value
+            now = time.time()
+            connection.executemany('INSERT OR REPLACE INTO metric_series VALUES (?, ?, ?, ?, ?)', [
+                (RETIRED_PROCESS, name, labels, json.dumps(value), now) for (name, labels), value in retired.items()
+            ])
+            connection.execute(f'DELETE FROM metric_series WHERE process IN ({marks})', exited)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+
+def collect():
+    """{(name, labels): value} summed over every process"""
+    flush()
+    connection = _connection()
+    if connection is None:
+        return REGISTRY.snapshot()
+    retire_exited_processes(connection)
+
+    stale_before = time.time() - getattr(settings, 'METRICS_FLUSH_INTERVAL', 10) * 3
+    totals = {}
+    with _store_lock:
+        rows = connection.execute('SELECT name, labels, value, updated FROM metric_series').fetchall()
+    for name, labels, value, updated in rows:
+        if name not in METRICS or (METRICS[name][0] == 'gauge' and updated < stale_before):
+            continue
+        key = (name, tuple(tuple(pair) for pair in json.loads(labels)))
+        value = json.loads(value)
+        totals[key] = _add(totals[key], value) if key in totals else value
+    return totals
+
+
+# Exposition
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _number(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(round(value, 6))
+    return str(value)
+
+
+def render():
+    """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+    totals = collect()
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        series = sorted((labels, value) for (metric, labels), value in totals.items() if metric == name)
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in series:
+            if kind != 'histogram':
+                lines.append(f'{name}{_labels(labels)} {_number(value)}')
+                continue
+            cumulative = 0
+            for bound, count in zip(list(buckets) + [math.inf], value):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(labels + (("le", _number(bound)),))} {cumulative}')
+            lines.append(f'{name}_sum{_labels(labels)} {_number(float(value[-2]))}')
+            lines.append(f'{name}_count{_labels(labels)} {value[-1]}')
+
+    lookups = {}
+    for (metric, labels), value in totals.items():
+        if metric == 'mmms_cache_requests_total':
+            labels = dict(labels)
+            hits, total = lookups.get(labels['cache'], (0, 0))
+            lookups[labels['cache']] = (hits + (value if labels['result'] == 'hit' else 0), total + value)
+    lines.append(f'# HELP {CACHE_HIT_RATIO} Share of cache lookups that were hits, by cache')
+    lines.append(f'# TYPE {CACHE_HIT_RATIO} gauge')
+    for cache_name, (hits, total) in sorted(lookups.items()):
+        lines.append(f'{CACHE_HIT_RATIO}{_labels((("cache", cache_name),))} {_number(hits / total if total else 0.0)}')
+    return '\n'.join(lines) + '\n'
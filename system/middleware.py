@@ -0,0 +1,248 @@
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+
+from . import metrics
+from .compression import compress, is_compressible_type, min_size, negotiate, response_encodings
+from .instrumentation import normalize_sql
+from .logs import REQUEST_ID_HEADER, clean_request_id, request_context
+from .profiling import PROFILE_PARAM, can_profile, profile_request
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLoggingMiddleware:
+    """Give each request a correlation id and a DEBUG-logging sampling decision.
+
+    The id comes from a well-formed incoming X-Request-ID header (so ids from
+    a proxy carry through) or is generated, is echoed back on the response
+    and is stamped on every log record. DEBUG records are kept for
+    LOG_DEBUG_SAMPLE_RATE of requests; other levels are always kept.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'LOG_DEBUG_SAMPLE_RATE', 1.0)
+
+    def __call__(self, request):
+        request.request_id = clean_request_id(request.headers.get(REQUEST_ID_HEADER)) or uuid.uuid4().hex
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        with request_context(request.request_id, sampled):
+            response = self.get_response(request)
+        if response.streaming and not response.is_async:
+            response.streaming_content = self._stream(response.streaming_content, request.request_id, sampled)
+        response[REQUEST_ID_HEADER] = request.request_id
+        return response
+
+    @staticmethod
+    def _stream(content, request_id, sampled):
+        # Streamed bodies are generated after __call__ returns; keep the context for them too
+        with request_context(request_id, sampled):
+            yield from content
+
+
+class CompressionMiddleware:
+    """Compress text responses of COMPRESS_MIN_SIZE bytes or more with brotli or gzip.
+
+    The encoding follows Accept-Encoding (brotli only when the package is
+    installed, and never for a response carrying the CSRF token: see BREACH
+    in system.compression). Responses from @compressed_variants views reuse a cached
+    compressed body for their ETag instead of compressing again. Streaming
+    responses (media, static files) are left alone; collected static files
+    come pre-compressed (see serve_static).
+    """
+
+    VARIANT_CACHE = 'compressed_variants'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.timeout = getattr(settings, 'COMPRESS_VARIANT_TIMEOUT', 60 * 60)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (response.streaming or response.has_header('Content-Encoding')
+                or not is_compressible_type(response.get('Content-Type'))
+                or len(response.content) < min_size()):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate(request.headers.get('Accept-Encoding'), response_encodings(request, response.content))
+        if encoding is None:
+            return response
+
+        key = None
+        if getattr(response, 'cache_compressed_variants', False) and response.has_header('ETag'):
+            key = f'{self.VARIANT_CACHE}:{encoding}:{response["ETag"]}'
+        body = cache.get(key) if key else None
+        if key:
+            metrics.record_cache(self.VARIANT_CACHE, body is not None)
+        if body is None:
+            body = compress(response.content, encoding)
+            if key:
+                cache.set(key, body, self.timeout)
+        if len(body) >= len(response.content):
+            return response
+
+        response.content = body
+        response['Content-Length'] = str(len(body))
+        response['Content-Encoding'] = encoding
+        # The compressed body differs from the one the strong ETag was computed on
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+
+class ProfilerMiddleware:
+    """Profile one request when a staff or head user adds ?__profile to its URL.
+
+    ?__profile=memory also takes a tracemalloc snapshot. The capture is saved
+    as a RequestProfile (see the admin) and its id returned in X-Profile-ID.
+    Requests without the flag cost one substring check on the query string.
+    Needs to run after AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if (PROFILE_PARAM not in request.META.get('QUERY_STRING', '')
+                or PROFILE_PARAM not in request.GET or not can_profile(request.user)):
+            return self.get_response(request)
+
+        response, capture = profile_request(request, self.get_response)
+        if capture is not None:
+            response['X-Profile-ID'] = str(capture.pk)
+        return response
+
+
+class _RequestQueries:
+    """execute_wrapper that counts and times queries for one request.
+
+    Raw SQL strings are counted as-is (ORM statements carry their values as
+    separate params, so they already repeat verbatim); literals are only
+    normalized for the handful of distinct statements at report time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+        # Async homepages run queries on pooled threads too (see dashboards.py)
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.seconds += elapsed
+                self.count += 1
+                self.statements[sql] += 1
+
+    def repeated(self):
+        """[(normalized_sql, count)] most repeated first, merging statements that differ only in literals"""
+        merged = Counter()
+        for sql, count in self.statements.items():
+            merged[normalize_sql(sql)] += count
+        return merged.most_common()
+
+
+class QueryInstrumentationMiddleware:
+    """Record query count, SQL time and repeated statements for every request.
+
+    Adds a Server-Timing header (visible in browser dev tools) and logs one
+    structured record per request on the ``system.middleware`` logger (the
+    fields travel as ``extra`` for system.logs.JsonFormatter): at DEBUG
+    normally, at INFO when the request took SLOW_REQUEST_MS or longer or a
+    statement repeated SQL_N_PLUS_ONE_THRESHOLD times or more, in which case
+    a warning names the statement too.
+    Streaming responses are measured until their content is exhausted; they
+    get the log line but no header, since headers are sent first. The same
+    numbers feed the per-view series in system.metrics.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold = getattr(settings, 'SQL_N_PLUS_ONE_THRESHOLD', 10)
+        self.top = getattr(settings, 'SQL_TOP_STATEMENTS', 3)
+        self.slow_seconds = getattr(settings, 'SLOW_REQUEST_MS', 500) / 1000
+
+    def __call__(self, request):
+        stats = _RequestQueries()
+        started = time.perf_counter()
+        metrics.inc('mmms_http_requests_in_progress')
+        try:
+            with self._recording(stats):
+                response = self.get_response(request)
+        finally:
+            metrics.inc('mmms_http_requests_in_progress', -1)
+
+        if response.streaming and not response.is_async:
+            response.streaming_content = self._stream(response.streaming_content, stats, request, response, started)
+            return response
+
+        elapsed = time.perf_counter() - started
+        if response.streaming:
+            # Async streams iterate outside this thread; report what the view itself ran
+            self._report(request, response, stats, elapsed)
+            return response
+
+        response['Server-Timing'] = (
+            f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", app;dur={elapsed * 1000:.1f}'
+        )
+        self._report(request, response, stats, elapsed)
+        return response
+
+    @staticmethod
+    def _recording(stats):
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        return stack
+
+    def _stream(self, content, stats, request, response, started):
+        with self._recording(stats):
+            yield from content
+        self._report(request, response, stats, time.perf_counter() - started)
+
+    def _report(self, request, response, stats, elapsed):
+        match = getattr(request, 'resolver_match', None)
+        metrics.record_request(match.view_name if match else None, request.method, response.status_code,
+                               elapsed, stats.count, stats.seconds)
+
+        repeated = stats.repeated() if stats.count else []
+        suspects = [(sql, count) for sql, count in repeated if count >= self.threshold]
+        level = logging.INFO if suspects or elapsed >= self.slow_seconds else logging.DEBUG
+        if not logger.isEnabledFor(level) and not suspects:
+            return
+
+        record = {
+            'event': 'request_sql',
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'queries': stats.count,
+            'sql_ms': round(stats.seconds * 1000, 1),
+            'total_ms': round(elapsed * 1000, 1),
+            'top': [{'sql': sql[:300], 'count': count} for sql, count in repeated[:self.top] if count > 1],
+            'n_plus_one': bool(suspects),
+        }
+        logger.log(level, '%s %s %d: %d queries, %.1f ms SQL, %.1f ms total',
+                   request.method, request.path, response.status_code,
+                   stats.count, record['sql_ms'], record['total_ms'], extra=record)
+        for sql, count in suspects:
+            logger.warning('Possible N+1 in %s: statement ran %d times: %s',
+                           record['view'] or record['path'], count, sql[:500])
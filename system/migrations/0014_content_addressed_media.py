@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:09
+
+import system.models
+import system.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('system', '0013_requestprofile'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activityreport',
+            name='report_file',
+            field=models.FileField(blank=True, null=True, storage=system.storage.content_addressed_storage, upload_to='activity_reports/'),
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='profile_picture',
+            field=models.ImageField(blank=True, null=True, storage=system.storage.content_addressed_storage, upload_to=system.models.user_profile_picture_path),
+        ),
+        migrations.AlterField(
+            model_name='mentee',
+            name='profile_picture',
+            field=models.ImageField(blank=True, null=True, storage=system.storage.content_addressed_storage, upload_to='mentee_profile_pictures/'),
+        ),
+        migrations.AlterField(
+            model_name='mentor',
+            name='profile_picture',
+            field=models.ImageField(blank=True, null=True, storage=system.storage.content_addressed_storage, upload_to='mentor_profile_pictures/'),
+        ),
+        migrations.AlterField(
+            model_name='mentoringsession',
+            name='materials',
+            field=models.FileField(blank=True, null=True, storage=system.storage.content_addressed_storage, upload_to='session_materials/'),
+        ),
+    ]
@@ -2,6 +2,25 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
 import os
+import uuid
+
+from .storage import content_addressed_storage
+
+# Identification number formats accepted at signup and import
+MENTEE_ID_REGEX = r'^(B(CS|DA|DB|LH)\d{4}-\d{3}|(IEP|CFAB)\d{4}-\d{3})$'
+MENTOR_ID_REGEX = r'^ST(A|B|C|D|GS)\d{3}$'
+
+def get_course_full_name(course_code):
+    """Map course codes to full course names"""
+    course_mapping = {
+        'CS': 'Diploma in Computer Science',
+        'DA': 'Diploma in Accounting', 
+        'DB': 'Diploma in Business Studies',
+        'LH': 'Diploma in Landscape Horticulture',
+        'IEP': 'Intensive English Programme',
+        'CFAB': 'Certificate in Finance, Accountancy and Business'
+    }
+    return course_mapping.get(course_code, course_code)
 
 def user_profile_picture_path(instance, filename):
     # File will be uploaded to MEDIA_ROOT/profile_pictures/user_<id>/<filename>
@@ -15,7 +34,7 @@ class CustomUser(AbstractUser):
     )
     
     role = models.CharField(max_length=10, choices=ROLE_CHOICES)
-    profile_picture = models.ImageField(upload_to=user_profile_picture_path, blank=True, null=True)
+    profile_picture = models.ImageField(upload_to=user_profile_picture_path, storage=content_addressed_storage, blank=True, null=True)
     email = models.EmailField(unique=True)
     
     def __str__(self):
@@ -34,7 +53,7 @@ class Mentee(models.Model):
     )
     
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    profile_picture = models.ImageField(upload_to='mentee_profile_pictures/', null=True, blank=True)
+    profile_picture = models.ImageField(upload_to='mentee_profile_pictures/', storage=content_addressed_storage, null=True, blank=True)
     MenteeID = models.CharField(max_length=12, primary_key=True)
     MenteeName = models.CharField(max_length=100)
     MenteeCourse = models.CharField(max_length=100)
@@ -84,6 +103,7 @@ class Mentee(models.Model):
     
     # Mentor assignment
     assigned_mentor = models.ForeignKey('Mentor', on_delete=models.SET_NULL, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.MenteeName
@@ -114,7 +134,10 @@ class Mentee(models.Model):
         """Assign mentee to mentor using the assignment model"""
         # Deactivate any existing active assignments
         self.assignments.filter(assignment_status='active').update(assignment_status='completed')
-        
+        # Queryset update() skips post_save, so invalidate cached vacancy counts here
+        from .caching import bump_cache_version, MENTOR_FACETS
+        bump_cache_version(MENTOR_FACETS)
+
         # Create new assignment
         assignment = MentorMenteeAssignment.objects.create(
             mentor=mentor,
@@ -156,7 +179,7 @@ class Mentee(models.Model):
 
 class Mentor(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    profile_picture = models.ImageField(upload_to='mentor_profile_pictures/', null=True, blank=True)
+    profile_picture = models.ImageField(upload_to='mentor_profile_pictures/', storage=content_addressed_storage, null=True, blank=True)
     MentorID = models.CharField(max_length=12, primary_key=True)
     MentorName = models.CharField(max_length=100)
     MentorEmail = models.EmailField()
@@ -172,6 +195,7 @@ class Mentor(models.Model):
     MaxMentees = models.IntegerField(default=20)
     CurrentMentees = models.IntegerField(default=0)
     MentorJoinDate = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.MentorName
@@ -351,6 +375,7 @@ class Activity(models.Model):
     Location = models.CharField(max_length=200)
     CreatedBy = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     CreatedAt = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     # For mentoring sessions
     IsMentoringSession = models.BooleanField(default=False)
@@ -400,7 +425,7 @@ class MentoringSession(models.Model):
     activity = models.OneToOneField(Activity, on_delete=models.CASCADE)
     session_type = models.CharField(max_length=20, choices=SESSION_TYPES, default='individual')
     topic = models.CharField(max_length=200)
-    materials = models.FileField(upload_to='session_materials/', blank=True, null=True)
+    materials = models.FileField(upload_to='session_materials/', storage=content_addressed_storage, blank=True, null=True)
     completed = models.BooleanField(default=False)
     completion_date = models.DateTimeField(null=True, blank=True)
     
@@ -409,7 +434,7 @@ class MentoringSession(models.Model):
 
 class ActivityReport(models.Model):
     activity = models.OneToOneField(Activity, on_delete=models.CASCADE)
-    report_file = models.FileField(upload_to='activity_reports/', blank=True, null=True)
+    report_file = models.FileField(upload_to='activity_reports/', storage=content_addressed_storage, blank=True, null=True)
     summary = models.TextField(blank=True)
     attendance_summary = models.TextField(blank=True)  # Add attendance summary
     total_attendees = models.IntegerField(default=0)   # Add total attendees count
@@ -461,12 +486,75 @@ class MentorMenteeAssignment(models.Model):
         unique_together = ['mentor', 'mentee']
         ordering = ['-assigned_date']
     
+    # assignment_status as last read from or written to the database, so the
+    # post_save signal can tell a transfer from a re-save (None: unknown)
+    saved_status = None
+
     def __str__(self):
         return f"{self.mentor.MentorName} - {self.mentee.MenteeName}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'assignment_status' in field_names:
+            status = values[field_names.index('assignment_status')]
+            instance.saved_status = None if status is models.DEFERRED else status
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Also how a deferred assignment_status is loaded on first access
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if fields is None or 'assignment_status' in fields:
+            self.saved_status = self.assignment_status
     
     def save(self, *args, **kwargs):
         # Update the mentee's assigned_mentor field when assignment is created
         if self.assignment_status == 'active':
             self.mentee.assigned_mentor = self.mentor
             self.mentee.save()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+        self.saved_status = self.assignment_status
+
+class RequestProfile(models.Model):
+    """One request captured by ProfilerMiddleware; the cProfile dump lives in PROFILE_DIR"""
+    created_at = models.DateTimeField(auto_now_add=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    request_id = models.CharField(max_length=64, blank=True)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    view_name = models.CharField(max_length=200, blank=True)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField(default=0)
+    query_ms = models.FloatField(default=0)
+    stats_file = models.CharField(max_length=255)
+    sql_log = models.JSONField(default=list, blank=True)
+    memory_top = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+class ChunkedUpload(models.Model):
+    """A file being uploaded in parts (system.uploads); the bytes received so far live in UPLOAD_TEMP_DIR"""
+    TARGET_CHOICES = (
+        ('session_materials', 'Session materials'),
+        ('report_file', 'Activity report file'),
+    )
+
+    upload_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    activity = models.ForeignKey(Activity, on_delete=models.CASCADE)
+    target = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    offset = models.PositiveBigIntegerField(default=0)
+    checksum = models.CharField(max_length=64, blank=True)  # SHA-256 of the whole file, if the client sent one
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size} bytes)"
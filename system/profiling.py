@@ -0,0 +1,172 @@
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .logs import current_request_id
+from .models import RequestProfile
+
+# On-demand request profiling. A staff or head user appends ?__profile to a
+# URL (?__profile=memory adds a tracemalloc snapshot); ProfilerMiddleware runs
+# that one request under cProfile and stores a RequestProfile row plus the
+# .prof dump in PROFILE_DIR, keeping the newest PROFILE_RETENTION captures.
+
+PROFILE_PARAM = '__profile'
+STATS_SORTS = {
+    'cumulative': 'Cumulative time',
+    'tottime': 'Own time',
+    'calls': 'Calls',
+}
+STATS_ROWS = 80
+MEMORY_TOP = 25
+
+logger = logging.getLogger(__name__)
+
+# cProfile can't run two profilers at once; concurrent flagged requests run unprofiled
+_profiler_lock = threading.Lock()
+
+
+def profile_dir():
+    return str(getattr(settings, 'PROFILE_DIR', os.path.join(settings.BASE_DIR, '.profiles')))
+
+
+def can_profile(user):
+    return user.is_authenticated and (user.is_staff or getattr(user, 'role', None) == 'head')
+
+
+class _SqlLog:
+    """execute_wrapper keeping each statement with its duration"""
+
+    def __init__(self):
+        self.entries = []
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.seconds += elapsed
+            self.entries.append({'sql': sql, 'ms': round(elapsed * 1000, 3)})
+
+
+def profile_request(request, get_response):
+    """Run get_response(request) under cProfile and save the capture; returns (response, capture or None)"""
+    if not _profiler_lock.acquire(blocking=False):
+        logger.warning('Profiler busy, serving %s unprofiled', request.path)
+        return get_response(request), None
+
+    try:
+        memory = request.GET.get(PROFILE_PARAM) == 'memory'
+        started_tracing = memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        sql_log = _SqlLog()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(sql_log))
+            profiler.enable()
+            try:
+                response = get_response(request)
+            finally:
+                profiler.disable()
+        elapsed = time.perf_counter() - started
+
+        memory_top = []
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            memory_top = [
+                {'location': str(stat.traceback), 'kib': round(stat.size / 1024, 1), 'blocks': stat.count}
+                for stat in snapshot.statistics('lineno')[:MEMORY_TOP]
+            ]
+    finally:
+        _profiler_lock.release()
+
+    return response, save_capture(request, response, profiler, elapsed, sql_log, memory_top)
+
+
+def save_capture(request, response, profiler, elapsed, sql_log, memory_top):
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    match = getattr(request, 'resolver_match', None)
+    view_name = match.view_name if match else ''
+    filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{(view_name or 'unresolved').replace(':', '-')}-{uuid.uuid4().hex[:8]}.prof"
+    profiler.dump_stats(os.path.join(directory, filename))
+
+    capture = RequestProfile.objects.create(
+        user=request.user if request.user.is_authenticated else None,
+        request_id=current_request_id() or '',
+        method=request.method,
+        path=request.get_full_path()[:500],
+        view_name=view_name,
+        status_code=response.status_code,
+        duration_ms=round(elapsed * 1000, 1),
+        query_count=len(sql_log.entries),
+        query_ms=round(sql_log.seconds * 1000, 1),
+        stats_file=filename,
+        sql_log=sql_log.entries,
+        memory_top=memory_top,
+    )
+    prune_captures()
+    logger.info('Profiled %s %s in %.1f ms as capture %d', request.method, request.path, elapsed * 1000, capture.pk)
+    return capture
+
+
+def prune_captures(keep=None):
+    """Delete all but the newest ``keep`` captures (PROFILE_RETENTION by default)"""
+    if keep is None:
+        keep = getattr(settings, 'PROFILE_RETENTION', 50)
+    stale = list(RequestProfile.objects.order_by('-created_at', '-pk')[keep:])
+    for capture in stale:
+        capture.delete()  # post_delete removes the .prof file
+    return len(stale)
+
+
+def remove_stats_file(capture):
+    path = os.path.join(profile_dir(), capture.stats_file)
+    if capture.stats_file and os.path.isfile(path):
+        os.remove(path)
+
+
+def _short_path(filename):
+    """Trim site-packages and project prefixes so rows fit on screen"""
+    for prefix in sorted({str(settings.BASE_DIR), *sys.path}, key=len, reverse=True):
+        if prefix and filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1:]
+    return filename
+
+
+def stats_table(capture, sort='cumulative', limit=STATS_ROWS):
+    """Rows of the capture's profile sorted by ``sort``, or None if the dump is gone"""
+    path = os.path.join(profile_dir(), capture.stats_file)
+    if not os.path.isfile(path):
+        return None
+    sort = sort if sort in STATS_SORTS else 'cumulative'
+    stats = pstats.Stats(path)
+    key = {'cumulative': 3, 'tottime': 2, 'calls': 1}[sort]
+    rows = []
+    for (filename, line, function), (primitive, calls, own, cumulative, _) in sorted(
+            stats.stats.items(), key=lambda item: item[1][key], reverse=True)[:limit]:
+        rows.append({
+            'calls': calls if calls == primitive else f'{calls}/{primitive}',
+            'tottime_ms': round(own * 1000, 2),
+            'cumtime_ms': round(cumulative * 1000, 2),
+            'percall_ms': round(cumulative * 1000 / calls, 3) if calls else 0,
+            'function': function if filename == '~' else f'{_short_path(filename)}:{line}({function})',
+        })
+    return rows
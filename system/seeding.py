@@ -0,0 +1,423 @@
+import random
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import bump_cache_version, MENTOR_FACETS
+from .models import (
+    CustomUser, Mentee, Mentor, HeadofMentorMentee, Activity, Attendance, MentoringSession,
+    ActivityReport, MentorMenteeAssignment, get_course_full_name,
+)
+
+# Synthetic data for scale testing. Everything is derived from one
+# random.Random(seed), so the same arguments always build the same database.
+
+DEFAULT_PASSWORD = 'password123'
+
+# Course code -> (share of mentees, mentor ID prefix). Mentor prefixes map to
+# departments exactly as extract_department_from_mentor_id does.
+COURSE_MIX = {
+    'CS': (0.30, 'C'),
+    'DA': (0.20, 'A'),
+    'DB': (0.20, 'B'),
+    'LH': (0.10, 'D'),
+    'IEP': (0.10, 'GS'),
+    'CFAB': (0.10, 'A'),
+}
+
+MENTOR_DEPARTMENTS = {
+    'A': 'Accounting Department',
+    'B': 'Business Studies Department',
+    'C': 'Quantitative Science Department',
+    'D': 'Landscape and Horticulture Department',
+    'GS': 'General Studies',
+}
+
+# Intakes run Jan/Mar/.../Nov; the 4 digits in a mentee ID are YYMM of the
+# intake and the 3 after the dash a sequence number within it.
+INTAKE_MONTHS = (1, 3, 5, 7, 9, 11)
+INTAKE_COUNT = 48  # eight years of intakes, newest first
+MAX_PER_INTAKE = 999
+MAX_PER_MENTOR_PREFIX = 999
+
+MALE_NAMES = ['Ahmad', 'Muhammad', 'Amirul', 'Hafiz', 'Daniel', 'Wei Jie', 'Jun Hao', 'Arjun',
+              'Ravi', 'Iskandar', 'Farhan', 'Syafiq', 'Kevin', 'Haziq', 'Aiman', 'Vikram']
+FEMALE_NAMES = ['Nur Aina', 'Siti', 'Aisyah', 'Nurul', 'Mei Ling', 'Xin Yi', 'Priya', 'Kavitha',
+                'Farah', 'Alya', 'Sofea', 'Hui Min', 'Anis', 'Divya', 'Syahirah', 'Balqis']
+SURNAMES = ['Abdullah', 'Ismail', 'Rahman', 'Hassan', 'Ibrahim', 'Tan', 'Lim', 'Wong', 'Lee',
+            'Chong', 'Subramaniam', 'Krishnan', 'Yusof', 'Osman', 'Razak', 'Ng']
+STATES = ['Kedah', 'Perlis', 'Pulau Pinang', 'Perak', 'Selangor', 'Kelantan', 'Terengganu',
+          'Pahang', 'Johor', 'Melaka', 'Negeri Sembilan', 'Sabah', 'Sarawak']
+RACES = [('Malay', 'Islam'), ('Chinese', 'Buddhism'), ('Indian', 'Hinduism'), ('Others', 'Christianity')]
+LOCATIONS = ['Dewan Kuliah 1', 'Dewan Kuliah 2', 'Bilik Seminar A', 'Makmal Komputer 3',
+             'Perpustakaan', 'Mentor Office']
+TOPICS = ['Study planning', 'Exam preparation', 'Career guidance', 'Time management',
+          'Academic progress review', 'Wellbeing check-in', 'Internship preparation']
+HEAD_ACTIVITY_TYPES = ['workshop', 'seminar', 'meeting', 'other']
+
+
+@contextmanager
+def _explicit_dates(*fields):
+    """Let bulk_create keep the dates we set on auto_now_add fields"""
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def _ic_number(rng, index, birth_year):
+    """Malaysian-style IC (YYMMDD-PB-####), unique per index"""
+    born = date(birth_year, 1, 1) + timedelta(days=rng.randrange(365))
+    place = 1 + (index // 10000) % 59
+    return f"{born:%y%m%d}{place:02d}{index % 10000:04d}"
+
+
+def _phone(rng):
+    return f"01{rng.randrange(10)}{rng.randrange(1000000, 9999999)}"
+
+
+def _person(rng, gender):
+    first = rng.choice(MALE_NAMES if gender == 'male' else FEMALE_NAMES)
+    joiner = 'bin' if gender == 'male' else 'binti'
+    return f"{first} {joiner} {rng.choice(SURNAMES)}" if rng.random() < 0.5 else f"{first} {rng.choice(SURNAMES)}"
+
+
+def _intakes(today):
+    """The most recent INTAKE_COUNT intake dates on or before ``today``, newest first"""
+    intakes = []
+    year = today.year
+    while len(intakes) < INTAKE_COUNT:
+        intakes.extend(date(year, month, 1) for month in reversed(INTAKE_MONTHS)
+                       if date(year, month, 1) <= today)
+        year -= 1
+    return intakes[:INTAKE_COUNT]
+
+
+def _mentee_ids(rng, count, today):
+    """Yield (mentee_id, course_code, intake_date) for ``count`` mentees"""
+    intakes = _intakes(today)
+    capacity = {code: len(intakes) * MAX_PER_INTAKE for code in COURSE_MIX}
+    codes = list(COURSE_MIX)
+    weights = [share for share, _ in COURSE_MIX.values()]
+    issued = dict.fromkeys(codes, 0)
+
+    for _ in range(count):
+        code = rng.choices(codes, weights)[0]
+        if issued[code] >= capacity[code]:
+            # This course is full - fall back to any course with room left
+            code = next(c for c in codes if issued[c] < capacity[c])
+        intake = intakes[issued[code] // MAX_PER_INTAKE]
+        sequence = issued[code] % MAX_PER_INTAKE + 1
+        issued[code] += 1
+        prefix = code if code in ('IEP', 'CFAB') else f'B{code}'
+        yield f"{prefix}{intake:%y%m}-{sequence:03d}", code, intake
+
+
+_COURSE_PREFIX = {get_course_full_name(code): prefix for code, (_, prefix) in COURSE_MIX.items()}
+
+
+def max_mentees():
+    """Largest mentee count the ID scheme can represent"""
+    return len(COURSE_MIX) * INTAKE_COUNT * MAX_PER_INTAKE
+
+
+def clear_dataset():
+    """Delete all activities and every non-superuser mentee, mentor and head account"""
+    with transaction.atomic():
+        Activity.objects.all().delete()
+        # Profiles and assignments cascade from their users
+        CustomUser.objects.filter(is_superuser=False, role__in=['mentee', 'mentor', 'head']).delete()
+    bump_cache_version(MENTOR_FACETS)
+
+
+def seed_dataset(mentees=1000, mentors=None, heads=2, activities=None, seed=42,
+                 password=DEFAULT_PASSWORD, today=None):
+    """Build a realistic synthetic dataset with bulk inserts.
+
+    Mentors default to one per ~18 mentees in each department (up to the 999
+    the ID format allows) and activities to one per 20 mentees. Every account
+    shares a single pre-computed password hash. Returns a dict of row counts.
+    """
+    rng = random.Random(seed)
+    today = today or timezone.localdate()
+    if mentees > max_mentees():
+        raise ValueError(f"At most {max_mentees()} mentees fit the mentee ID format")
+    if activities is None:
+        activities = max(10, mentees // 20)
+    password_hash = make_password(password)
+
+    # Rows are planned as plain dicts first so mentor loads and assigned_mentor
+    # are known up front - every table is then written once, with no updates.
+    mentee_specs, mentee_profiles = _plan_mentees(rng, mentees, today)
+    mentor_specs, mentor_profiles = _plan_mentors(rng, mentors, mentee_profiles, today)
+
+    with transaction.atomic():
+        head_rows = _create_heads(rng, heads, password_hash)
+        assignments = _plan_assignments(rng, mentee_profiles, mentor_profiles, head_rows, today)
+        mentor_rows = _create_profiles(Mentor, 'mentor', mentor_specs, mentor_profiles, password_hash)
+        mentee_rows = _create_profiles(Mentee, 'mentee', mentee_specs, mentee_profiles, password_hash)
+        with _explicit_dates(MentorMenteeAssignment._meta.get_field('assigned_date')):
+            MentorMenteeAssignment.objects.bulk_create(assignments)
+        activity_counts = _create_activities(rng, activities, mentee_rows, mentor_rows, head_rows, today)
+
+    bump_cache_version(MENTOR_FACETS)
+    return {
+        'heads': len(head_rows),
+        'mentors': len(mentor_rows),
+        'mentees': len(mentee_rows),
+        'assignments': len(assignments),
+        **activity_counts,
+    }
+
+
+def _create_users(specs, role, password_hash):
+    """bulk_create users for (username, email, first_name) tuples; returns them with pks"""
+    return CustomUser.objects.bulk_create([
+        CustomUser(username=username, email=email, first_name=name, role=role, password=password_hash)
+        for username, email, name in specs
+    ])
+
+
+def _create_profiles(model, role, specs, profiles, password_hash):
+    """bulk_create the users for ``specs``, then one ``model`` row per profile dict"""
+    users = _create_users(specs, role, password_hash)
+    return model.objects.bulk_create([model(user=user, **profile) for user, profile in zip(users, profiles)])
+
+
+def _create_heads(rng, count, password_hash):
+    specs, profiles = [], []
+    for i in range(count):
+        gender = rng.choice(['male', 'female'])
+        name = _person(rng, gender)
+        ic = _ic_number(rng, i, rng.randrange(1970, 1985))
+        username = f'head{i + 1:03d}'
+        specs.append((username, f'{username}@mmms.edu.my', name))
+        profiles.append(dict(
+            HeadofMentorMenteeID=ic,
+            HeadofMentorMenteeName=name,
+            HeadofMentorMenteeEmail=f'{username}@mmms.edu.my',
+            HeadofMentorMenteePhone=_phone(rng),
+            HeadofMentorMenteeIC=ic,
+            HeadofMentorMenteeState=rng.choice(STATES),
+            HeadofMentorMenteeDepartment='Student Affairs',
+        ))
+    return _create_profiles(HeadofMentorMentee, 'head', specs, profiles, password_hash)
+
+
+def _plan_mentees(rng, count, today):
+    specs, profiles = [], []
+    for index, (mentee_id, code, intake) in enumerate(_mentee_ids(rng, count, today)):
+        gender = 'male' if rng.random() < 0.5 else 'female'
+        name = _person(rng, gender)
+        race, religion = rng.choice(RACES)
+        months_enrolled = max(0, (today.year - intake.year) * 12 + today.month - intake.month)
+        semester = min(6, months_enrolled // 6 + 1)
+        specs.append((mentee_id.lower(), f'{mentee_id.lower()}@student.mmms.edu.my', name))
+        profiles.append(dict(
+            MenteeID=mentee_id,
+            MenteeName=name,
+            MenteeCourse=get_course_full_name(code),
+            MenteeSemester=semester,
+            Year=intake.year,
+            MenteeJoinDate=intake,
+            MenteeEmail=f'{mentee_id.lower()}@student.mmms.edu.my',
+            MenteePhone=_phone(rng),
+            MenteeIC=_ic_number(rng, index, intake.year - 18),
+            MenteeCity=rng.choice(STATES),
+            MenteeState=rng.choice(STATES),
+            MenteeRace=race,
+            MenteeReligion=religion,
+            MenteeGender=gender,
+            MenteeStatus='active' if semester < 6 or rng.random() < 0.7 else 'graduated',
+            MenteePreviousSchool=f'SMK {rng.choice(STATES)}',
+        ))
+    return specs, profiles
+
+
+def _mentor_counts(mentees, count):
+    """Mentors per department prefix, and the MaxMentees that lets them cover every mentee"""
+    prefixes = list(MENTOR_DEPARTMENTS)
+    if count is not None and count > len(prefixes) * MAX_PER_MENTOR_PREFIX:
+        raise ValueError(f"At most {len(prefixes) * MAX_PER_MENTOR_PREFIX} mentors fit the mentor ID format")
+
+    demand = Counter(_COURSE_PREFIX[mentee['MenteeCourse']] for mentee in mentees)
+    if count is None:
+        # One mentor per ~18 mentees, so most mentors have a vacancy or two
+        per_prefix = {prefix: max(1, -(-demand[prefix] // 18)) for prefix in prefixes}
+    else:
+        # Spread the requested mentors over departments in proportion to demand
+        total = sum(demand.values()) or 1
+        per_prefix = {prefix: max(1, round(count * demand[prefix] / total)) for prefix in prefixes}
+        while sum(per_prefix.values()) > count and max(per_prefix.values()) > 1:
+            per_prefix[max(per_prefix, key=per_prefix.get)] -= 1
+
+    plan = {}
+    for prefix in prefixes:
+        mentors = min(per_prefix[prefix], MAX_PER_MENTOR_PREFIX)
+        # Departments capped by the ID format take on bigger groups instead
+        plan[prefix] = (mentors, max(20, -(-demand[prefix] * 11 // (mentors * 10))))
+    return plan
+
+
+def _plan_mentors(rng, count, mentees, today):
+    specs, profiles = [], []
+    index = 0
+    for prefix, (mentor_count, max_mentees_each) in _mentor_counts(mentees, count).items():
+        for n in range(mentor_count):
+            gender = rng.choice(['male', 'female'])
+            name = _person(rng, gender)
+            mentor_id = f'ST{prefix}{n + 1:03d}'
+            race, religion = rng.choice(RACES)
+            specs.append((mentor_id.lower(), f'{mentor_id.lower()}@mentor.mmms.edu.my', name))
+            profiles.append(dict(
+                MentorID=mentor_id,
+                MentorName=name,
+                MentorEmail=f'{mentor_id.lower()}@mentor.mmms.edu.my',
+                MentorPhone=_phone(rng),
+                MentorIC=_ic_number(rng, index, rng.randrange(1965, 1995)),
+                MentorCity=rng.choice(STATES),
+                MentorState=rng.choice(STATES),
+                MentorRace=race,
+                MentorReligion=religion,
+                MentorDepartment=MENTOR_DEPARTMENTS[prefix],
+                MaxMentees=max_mentees_each,
+                CurrentMentees=0,
+                MentorJoinDate=today - timedelta(days=rng.randrange(90, 3650)),
+            ))
+            index += 1
+    return specs, profiles
+
+
+def _plan_assignments(rng, mentees, mentors, heads, today):
+    """Give ~95% of mentees an active mentor in their course's department, ~10% after an earlier one.
+
+    Sets assigned_mentor_id on the mentee dicts and CurrentMentees on the
+    mentor dicts, and returns the unsaved assignment rows.
+    """
+    by_prefix = {}
+    for mentor in mentors:
+        by_prefix.setdefault(mentor['MentorID'][2:-3], []).append(mentor)
+    cursor = {}
+
+    def next_mentor(prefix, exclude=None):
+        """Round-robin over the department's mentors, skipping full ones"""
+        pool = by_prefix.get(prefix) or mentors
+        for _ in range(len(pool)):
+            mentor = pool[cursor.get(prefix, 0) % len(pool)]
+            cursor[prefix] = cursor.get(prefix, 0) + 1
+            if mentor['MentorID'] != exclude and mentor['CurrentMentees'] < mentor['MaxMentees']:
+                return mentor
+        return None
+
+    head_users = [head.user_id for head in heads] or [None]
+    assignments = []
+    for mentee in mentees:
+        if rng.random() < 0.05:
+            continue
+        prefix = _COURSE_PREFIX[mentee['MenteeCourse']]
+        mentor = next_mentor(prefix)
+        if mentor is None:
+            continue
+        assigned_by = rng.choice(head_users)
+        if rng.random() < 0.10:
+            previous = next_mentor(prefix, exclude=mentor['MentorID'])
+            if previous is not None:
+                assignments.append(MentorMenteeAssignment(
+                    mentor_id=previous['MentorID'], mentee_id=mentee['MenteeID'], assigned_by_id=assigned_by,
+                    assigned_date=mentee['MenteeJoinDate'],
+                    assignment_status=rng.choice(['transferred', 'completed']),
+                    notes='Transferred to balance mentor load',
+                ))
+        mentor['CurrentMentees'] += 1
+        mentee['assigned_mentor_id'] = mentor['MentorID']
+        assignments.append(MentorMenteeAssignment(
+            mentor_id=mentor['MentorID'], mentee_id=mentee['MenteeID'], assigned_by_id=assigned_by,
+            assigned_date=min(today, mentee['MenteeJoinDate'] + timedelta(days=rng.randrange(0, 120))),
+            assignment_status='active',
+        ))
+    return assignments
+
+
+def _create_activities(rng, count, mentees, mentors, heads, today):
+    """~60% mentor sessions (attended by the mentor's mentees), the rest head-run events"""
+    mentees_by_mentor = {}
+    for mentee in mentees:
+        if mentee.assigned_mentor_id:
+            mentees_by_mentor.setdefault(mentee.assigned_mentor_id, []).append(mentee)
+    mentors_with_mentees = [mentor for mentor in mentors if mentor.MentorID in mentees_by_mentor]
+    head_users = [head.user for head in heads]
+
+    activities, sessions, attendance, reports = [], [], [], []
+    session_number = event_number = 0
+    for _ in range(count):
+        day = today + timedelta(days=rng.randrange(-365, 90))
+        start = time(rng.choice([8, 9, 10, 11, 14, 15, 16]), rng.choice([0, 30]))
+        end = (datetime.combine(day, start) + timedelta(hours=rng.choice([1, 2]))).time()
+        is_session = mentors_with_mentees and (rng.random() < 0.6 or not head_users)
+        past = day < today
+
+        if is_session:
+            mentor = rng.choice(mentors_with_mentees)
+            session_number += 1
+            topic = rng.choice(TOPICS)
+            activity = Activity(
+                ActivityID=f'S{session_number:05d}', ActivityName=topic, ActivityType='mentoring',
+                Date=day, StartTime=start, EndTime=end, Location='Mentor Office',
+                CreatedBy_id=mentor.user_id, IsMentoringSession=True, PrimaryMentor=mentor,
+                Description=f'{topic} with {mentor.MentorName}',
+            )
+            completed = past and rng.random() < 0.85
+            sessions.append(MentoringSession(
+                activity=activity,
+                session_type=rng.choice(['individual', 'group']),
+                topic=topic,
+                completed=completed,
+                completion_date=timezone.make_aware(datetime.combine(day, end)) if completed else None,
+            ))
+            invited = mentees_by_mentor[mentor.MentorID]
+        else:
+            if not head_users:
+                continue
+            event_number += 1
+            activity_type = rng.choice(HEAD_ACTIVITY_TYPES)
+            activity = Activity(
+                ActivityID=f'A{event_number:05d}', ActivityName=f'{activity_type.title()} {event_number}',
+                ActivityType=activity_type, Date=day, StartTime=start, EndTime=end,
+                Location=rng.choice(LOCATIONS), CreatedBy=rng.choice(head_users),
+            )
+            invited = rng.sample(mentees, min(len(mentees), rng.randrange(10, 40)))
+
+        activity.CreatedAt = timezone.make_aware(datetime.combine(day - timedelta(days=14), time(9)))
+        activities.append(activity)
+        present = 0
+        for mentee in invited:
+            attended = past and rng.random() < 0.8
+            present += attended
+            attendance.append(Attendance(activity=activity, mentee=mentee, attended=attended))
+        if past and rng.random() < 0.5:
+            reports.append(ActivityReport(
+                activity=activity,
+                summary=f'{activity.ActivityName} went ahead as planned.',
+                attendance_summary=f'Present ({present}/{len(invited)})',
+                total_attendees=len(invited),
+                present_count=present,
+            ))
+
+    with _explicit_dates(Activity._meta.get_field('CreatedAt')):
+        Activity.objects.bulk_create(activities)
+    MentoringSession.objects.bulk_create(sessions)
+    Attendance.objects.bulk_create(attendance, batch_size=5000)
+    ActivityReport.objects.bulk_create(reports)
+    return {
+        'activities': len(activities),
+        'mentoring_sessions': len(sessions),
+        'attendance': len(attendance),
+        'reports': len(reports),
+    }
@@ -0,0 +1,66 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import events
+from .caching import bump_cache_version, profile_namespace, MENTOR_FACETS, SIDEBAR_COUNTERS
+from .models import Activity, ChunkedUpload, CustomUser, Mentee, Mentor, MentorMenteeAssignment, RequestProfile
+from .profiling import remove_stats_file
+from .uploads import remove_part_file
+
+
+@receiver([post_save, post_delete], sender=Mentor)
+@receiver([post_save, post_delete], sender=MentorMenteeAssignment)
+def invalidate_mentor_facets(sender, **kwargs):
+    """Mentor names and vacancy counts change with mentors and assignments"""
+    bump_cache_version(MENTOR_FACETS)
+
+
+@receiver([post_save, post_delete], sender=Mentor)
+@receiver([post_save, post_delete], sender=Mentee)
+def invalidate_profile(sender, instance, **kwargs):
+    """Names and pictures in cached sidebars come from the mentor/mentee profile"""
+    bump_cache_version(profile_namespace(instance.user_id))
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_profile(sender, instance, update_fields=None, **kwargs):
+    """The username stands in for a mentee's name until they fill in their profile"""
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return  # every sign-in saves last_login
+    bump_cache_version(profile_namespace(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Activity)
+def invalidate_sidebar_counters(sender, **kwargs):
+    """Upcoming-activity badges count activities across every sidebar"""
+    bump_cache_version(SIDEBAR_COUNTERS)
+
+
+@receiver(post_save, sender=MentorMenteeAssignment)
+def publish_assignment_events(sender, instance, created, **kwargs):
+    """Push new and transferred assignments to the mentor and mentee (see events.py)"""
+    if created and instance.assignment_status == 'active':
+        events.assignment_created(instance)
+    elif (not created and instance.assignment_status == 'transferred'
+          and instance.saved_status != 'transferred'):
+        # Only the transition: re-saving an old transferred row must not move the badge again
+        events.assignment_transferred(instance)
+
+
+@receiver(post_save, sender=Activity)
+def publish_session_created(sender, instance, created, **kwargs):
+    """Push newly scheduled mentoring sessions to the mentor and their mentees"""
+    if created and instance.IsMentoringSession and instance.PrimaryMentor_id:
+        events.session_created(instance)
+
+
+@receiver(post_delete, sender=RequestProfile)
+def delete_profile_stats(sender, instance, **kwargs):
+    """Captures and their .prof dumps are pruned together"""
+    remove_stats_file(instance)
+
+
+@receiver(post_delete, sender=ChunkedUpload)
+def delete_upload_part(sender, instance, **kwargs):
+    """Claimed, abandoned or cancelled uploads leave no part file behind"""
+    remove_part_file(instance)
@@ -0,0 +1,18 @@
+        window.onerror = function (msg, url, line, col, error) {
+            const debugLog = document.getElementById('debug-log');
+            const debugContent = document.getElementById('debug-content');
+            if (debugLog && debugContent) {
+                debugLog.style.display = 'block';
+                debugContent.textContent += `Error: ${msg}\nLine: ${line}:${col}\n\n`;
+            }
+            return false;
+        };
+
+        window.addEventListener('unhandledrejection', function (event) {
+            const debugLog = document.getElementById('debug-log');
+            const debugContent = document.getElementById('debug-content');
+            if (debugLog && debugContent) {
+                debugLog.style.display = 'block';
+                debugContent.textContent += `Promise Rejection: ${event.reason}\n\n`;
+            }
+        });
@@ -0,0 +1,128 @@
+// List pages render their rows and pagination into the element marked
+// data-list-fragment. Filtering and paging fetch the same URL with
+// ?fragment=rows (see system/fragments.py) and swap that element's contents
+// instead of reloading the page, then fire 'fragment:loaded' on document.
+(function () {
+    const FRAGMENT_PARAM = 'fragment';
+    let pending = null;
+
+    function fragmentContainer() {
+        return document.querySelector('[data-list-fragment]');
+    }
+
+    // The current page URL with `changes` applied; a null/''/undefined value
+    // removes the parameter. Any filter change starts again from page 1.
+    function listUrl(changes) {
+        const url = new URL(window.location.href);
+        if (!('page' in changes)) {
+            url.searchParams.delete('page');
+        }
+        Object.entries(changes).forEach(([key, value]) => {
+            if (value === null || value === undefined || value === '') {
+                url.searchParams.delete(key);
+            } else {
+                url.searchParams.set(key, value);
+            }
+        });
+        url.searchParams.delete(FRAGMENT_PARAM);
+        return url;
+    }
+
+    // Links marked data-list-query (e.g. CSV exports) follow the list's filters
+    function syncListQueryLinks(pageUrl) {
+        document.querySelectorAll('a[data-list-query]').forEach(link => {
+            const url = new URL(link.href);
+            url.search = pageUrl.search;
+            ['page', 'per_page'].forEach(key => url.searchParams.delete(key));
+            link.href = url.toString();
+        });
+    }
+
+    // Load `url`'s rows into the page. options.history: 'push' (default),
+    // 'replace' (e.g. while typing a search) or 'none' (back/forward).
+    function loadListFragment(url, options = {}) {
+        const pageUrl = new URL(url, window.location.href);
+        pageUrl.searchParams.delete(FRAGMENT_PARAM);
+        const container = fragmentContainer();
+        if (!container || !window.fetch) {
+            window.location.href = pageUrl.toString();
+            return Promise.resolve();
+        }
+
+        const fragmentUrl = new URL(pageUrl);
+        fragmentUrl.searchParams.set(FRAGMENT_PARAM, 'rows');
+        if (pending) {
+            pending.abort();
+        }
+        const controller = new AbortController();
+        pending = controller;
+        container.setAttribute('aria-busy', 'true');
+
+        return fetch(fragmentUrl, {
+            credentials: 'same-origin',
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            signal: controller.signal,
+        })
+            .then(response => {
+                // A redirect means the session expired or access changed; let the full page handle it
+                if (!response.ok || response.redirected) {
+                    throw new Error(`Fragment request failed (${response.status})`);
+                }
+                return response.text();
+            })
+            .then(html => {
+                container.innerHTML = html;
+                const mode = options.history || 'push';
+                if (mode === 'push') {
+                    history.pushState({ listFragment: true }, '', pageUrl);
+                } else if (mode === 'replace') {
+                    history.replaceState({ listFragment: true }, '', pageUrl);
+                }
+                syncListQueryLinks(pageUrl);
+                document.dispatchEvent(new CustomEvent('fragment:loaded', { detail: { url: pageUrl } }));
+            })
+            .catch(error => {
+                if (error.name !== 'AbortError') {
+                    window.location.href = pageUrl.toString();
+                }
+            })
+            .finally(() => {
+                if (pending === controller) {
+                    pending = null;
+                    container.removeAttribute('aria-busy');
+                }
+            });
+    }
+
+    // Call handler (with `this` set to the matching element) for clicks inside
+    // elements matching `selector`, including rows swapped in later.
+    function onListRowClick(selector, handler) {
+        document.addEventListener('click', function (event) {
+            const element = event.target.closest(selector);
+            if (element) {
+                handler.call(element, event);
+            }
+        });
+    }
+
+    // Links marked data-fragment-link (e.g. pagination) load in place
+    document.addEventListener('click', function (event) {
+        const link = event.target.closest('a[data-fragment-link]');
+        if (!link || event.defaultPrevented || event.button !== 0 ||
+            event.metaKey || event.ctrlKey || event.shiftKey || event.altKey) {
+            return;
+        }
+        event.preventDefault();
+        loadListFragment(link.href);
+    });
+
+    window.addEventListener('popstate', function () {
+        if (fragmentContainer()) {
+            loadListFragment(window.location.href, { history: 'none' });
+        }
+    });
+
+    window.listUrl = listUrl;
+    window.loadListFragment = loadListFragment;
+    window.onListRowClick = onListRowClick;
+})();
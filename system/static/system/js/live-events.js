@@ -0,0 +1,41 @@
+// Live updates for mentors and mentees. Listens to the server-sent events
+// stream (views.event_stream, see system/events.py) named by this script's
+// data-events-url, applies each event's counter deltas to the elements marked
+// data-live-counter="<name>" and re-fires the event on document as
+// 'live:event' (detail: {kind, ...data}) for pages with their own counters.
+(function () {
+    const script = document.currentScript;
+    if (!window.EventSource || !script || !script.dataset.eventsUrl) {
+        return;
+    }
+    const KINDS = ['assignment.created', 'assignment.transferred', 'session.created', 'session.completed'];
+
+    // Sidebar links only render their badge while the count is above zero
+    function applyCounter(element, delta) {
+        const badgeClass = element.dataset.badgeClass || 'nav-badge';
+        let badge = element.querySelector(`.${badgeClass}`);
+        const count = Math.max(0, (badge ? parseInt(badge.textContent, 10) || 0 : 0) + delta);
+        if (!badge && count > 0) {
+            badge = document.createElement('span');
+            badge.className = badgeClass;
+            element.appendChild(badge);
+        }
+        if (badge) {
+            badge.textContent = count;
+            badge.hidden = count === 0;
+        }
+    }
+
+    const source = new EventSource(script.dataset.eventsUrl);
+    KINDS.forEach(kind => {
+        source.addEventListener(kind, function (event) {
+            const data = JSON.parse(event.data);
+            Object.entries(data.counters || {}).forEach(([name, delta]) => {
+                if (delta) {
+                    document.querySelectorAll(`[data-live-counter="${name}"]`).forEach(element => applyCounter(element, delta));
+                }
+            });
+            document.dispatchEvent(new CustomEvent('live:event', { detail: Object.assign({ kind }, data) }));
+        });
+    });
+})();
@@ -0,0 +1,155 @@
+        // Auto-refresh the page every 2 minutes to check for new activities
+        setTimeout(function() {
+            window.location.reload();
+        }, 120000);
+        
+        // Add animations to cards
+        document.addEventListener('DOMContentLoaded', function() {
+            // Update profile picture display in sidebar
+            function updateProfilePictureDisplay() {
+                // Check if profile picture exists in sidebar
+                const sidebarAvatar = document.querySelector('.user-avatar');
+                const sidebarImg = sidebarAvatar.querySelector('img');
+                const sidebarIcon = sidebarAvatar.querySelector('i');
+                
+                // If profile picture exists, show image and hide icon
+                if (sidebarImg && sidebarImg.src) {
+                    sidebarImg.style.display = 'block';
+                    sidebarIcon.style.display = 'none';
+                }
+            }
+            
+            // Initialize profile picture display
+            updateProfilePictureDisplay();
+            
+            const observerOptions = {
+                threshold: 0.1,
+                rootMargin: '0px 0px -50px 0px'
+            };
+
+            const observer = new IntersectionObserver((entries) => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        entry.target.style.opacity = '1';
+                        entry.target.style.transform = 'translateY(0)';
+                    }
+                });
+            }, observerOptions);
+
+            // Observe all cards for animation
+            document.querySelectorAll('.activity-item, .report-card').forEach(card => {
+                card.style.opacity = '0';
+                card.style.transform = 'translateY(20px)';
+                card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+                observer.observe(card);
+            });
+            
+            // Process Django messages and show as popup notifications
+            processDjangoMessages();
+        });
+
+        // Function to show popup notification
+        function showNotification(title, message, type = 'success', duration = 5000) {
+            const container = document.getElementById('notificationContainer');
+            
+            const notification = document.createElement('div');
+            notification.className = `notification ${type}`;
+            
+            // Map message types to icons
+            const icons = {
+                'success': 'fas fa-check',
+                'error': 'fas fa-exclamation-circle',
+                'warning': 'fas fa-exclamation-triangle',
+                'info': 'fas fa-info-circle'
+            };
+            
+            notification.innerHTML = `
+                <div class="notification-icon">
+                    <i class="${icons[type] || icons.info}"></i>
+                </div>
+                <div class="notification-content">
+                    <div class="notification-title">${title}</div>
+                    <div class="notification-message">${message}</div>
+                </div>
+                <button class="notification-close" onclick="this.parentElement.remove()">
+                    <i class="fas fa-times"></i>
+                </button>
+                <div class="notification-progress">
+                    <div class="notification-progress-bar"></div>
+                </div>
+            `;
+            
+            container.appendChild(notification);
+            
+            // Animate in
+            setTimeout(() => {
+                notification.classList.add('show');
+            }, 100);
+            
+            // Auto remove after duration
+            setTimeout(() => {
+                notification.classList.add('hide');
+                setTimeout(() => {
+                    if (notification.parentElement) {
+                        notification.remove();
+                    }
+                }, 300);
+            }, duration);
+        }
+
+        // Function to process Django messages and convert to popup notifications
+        function processDjangoMessages() {
+            const messagesContainer = document.querySelector('.messages');
+            if (!messagesContainer) return;
+            
+            const messages = messagesContainer.querySelectorAll('.success, .error');
+            
+            messages.forEach(messageEl => {
+                const isError = messageEl.classList.contains('error');
+                const type = isError ? 'error' : 'success';
+                const title = isError ? 'Error' : 'Success';
+                const message = messageEl.textContent.trim();
+                
+                // Show as popup notification
+                showNotification(title, message, type);
+                
+                // Remove the original message after a short delay
+                setTimeout(() => {
+                    messageEl.style.opacity = '0';
+                    messageEl.style.transform = 'translateY(-10px)';
+                    setTimeout(() => {
+                        messageEl.remove();
+                    }, 300);
+                }, 1000);
+            });
+        }
+
+        // Enhanced delete confirmation with notification
+        function confirmDelete(event) {
+            if (!confirm('Are you sure you want to delete this report? This action cannot be undone.')) {
+                event.preventDefault();
+                return false;
+            }
+            
+            // Show a notification that the deletion is in progress
+            showNotification('Deleting Report', 'Your report is being deleted...', 'info', 3000);
+            
+            return true;
+        }
+
+        // Optional: Function to manually show notifications (for other actions)
+        function showSuccess(message, title = 'Success') {
+            showNotification(title, message, 'success');
+        }
+
+        function showError(message, title = 'Error') {
+            showNotification(title, message, 'error');
+        }
+
+        function showWarning(message, title = 'Warning') {
+            showNotification(title, message, 'warning');
+        }
+
+        function showInfo(message, title = 'Information') {
+            showNotification(title, message, 'info');
+        }
@@ -0,0 +1,89 @@
+        // Update profile picture display in sidebar
+        function updateProfilePictureDisplay() {
+            // Check if profile picture exists in sidebar
+            const sidebarAvatar = document.querySelector('.user-avatar');
+            const sidebarImg = sidebarAvatar.querySelector('img');
+            const sidebarIcon = sidebarAvatar.querySelector('i');
+            
+            // If profile picture exists, show image and hide icon
+            if (sidebarImg && sidebarImg.src) {
+                sidebarImg.style.display = 'block';
+                sidebarIcon.style.display = 'none';
+            }
+        }
+
+        // Form validation
+        document.addEventListener('DOMContentLoaded', function() {
+            // Initialize profile picture display
+            updateProfilePictureDisplay();
+            
+            const form = document.getElementById('reportForm');
+            const attendanceCheckboxes = document.querySelectorAll('.attendance-checkbox');
+            const attendanceError = document.getElementById('attendanceError');
+            const submitBtn = document.getElementById('submitBtn');
+            
+            function validateAttendance() {
+                let atLeastOneChecked = false;
+                
+                attendanceCheckboxes.forEach(checkbox => {
+                    if (checkbox.checked) {
+                        atLeastOneChecked = true;
+                    }
+                });
+                
+                return atLeastOneChecked;
+            }
+            
+            form.addEventListener('submit', function(e) {
+                const summary = document.getElementById('report_summary').value.trim();
+                
+                // Validate report summary
+                if (!summary) {
+                    e.preventDefault();
+                    alert('Please provide a report summary.');
+                    document.getElementById('report_summary').focus();
+                    return;
+                }
+                
+                // Validate attendance
+                if (!validateAttendance()) {
+                    e.preventDefault();
+                    attendanceError.style.display = 'flex';
+                    
+                    // Scroll to the attendance section
+                    document.querySelector('.attendance-list-modern').scrollIntoView({
+                        behavior: 'smooth',
+                        block: 'center'
+                    });
+                } else {
+                    attendanceError.style.display = 'none';
+                }
+            });
+            
+            // Real-time validation when checkboxes change
+            attendanceCheckboxes.forEach(checkbox => {
+                checkbox.addEventListener('change', function() {
+                    if (validateAttendance()) {
+                        attendanceError.style.display = 'none';
+                    }
+                });
+            });
+            
+            // Initial validation check
+            if (!validateAttendance()) {
+                attendanceError.style.display = 'flex';
+            }
+            
+            // Add animations to form elements
+            const cards = document.querySelectorAll('.card-section');
+            cards.forEach((card, index) => {
+                card.style.opacity = '0';
+                card.style.transform = 'translateY(20px)';
+                card.style.transition = `opacity 0.6s ease ${index * 0.1}s, transform 0.6s ease ${index * 0.1}s`;
+                
+                setTimeout(() => {
+                    card.style.opacity = '1';
+                    card.style.transform = 'translateY(0)';
+                }, 100);
+            });
+        });
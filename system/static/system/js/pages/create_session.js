@@ -0,0 +1,137 @@
+        // Update profile picture display in sidebar
+        function updateProfilePictureDisplay() {
+            // Check if profile picture exists in sidebar
+            const sidebarAvatar = document.querySelector('.user-avatar');
+            const sidebarImg = sidebarAvatar.querySelector('img');
+            const sidebarIcon = sidebarAvatar.querySelector('i');
+            
+            // If profile picture exists, show image and hide icon
+            if (sidebarImg && sidebarImg.src) {
+                sidebarImg.style.display = 'block';
+                sidebarIcon.style.display = 'none';
+            }
+        }
+
+        function toggleAttendees() {
+            const sessionType = document.getElementById('session_type').value;
+            const individualDiv = document.getElementById('individual_mentee');
+            const groupDiv = document.getElementById('group_attendees');
+            
+            if (sessionType === 'individual') {
+                individualDiv.style.display = 'block';
+                groupDiv.style.display = 'none';
+                // Make individual mentee required
+                document.getElementById('mentee').required = true;
+            } else if (sessionType === 'group') {
+                individualDiv.style.display = 'none';
+                groupDiv.style.display = 'block';
+                // Remove required from individual mentee
+                document.getElementById('mentee').required = false;
+                
+                // Auto-select all mentees for group session
+                autoSelectAllMentees();
+            } else {
+                individualDiv.style.display = 'none';
+                groupDiv.style.display = 'none';
+                document.getElementById('mentee').required = false;
+            }
+        }
+
+        function autoSelectAllMentees() {
+            // Get all checkboxes in the group attendees section
+            const checkboxes = document.querySelectorAll('#group_attendees input[type="checkbox"]');
+            
+            // Check all checkboxes and disable them (since they're auto-selected)
+            checkboxes.forEach(checkbox => {
+                checkbox.checked = true;
+                checkbox.disabled = true;
+            });
+        }
+        
+        // Set minimum time to current time for today's dates
+        const today = new Date().toISOString().split('T')[0];
+        const dateInput = document.getElementById('session_date');
+        const startTimeInput = document.getElementById('session_start_time');
+        const endTimeInput = document.getElementById('session_end_time');
+        
+        dateInput.addEventListener('change', function() {
+            if (this.value === today) {
+                const now = new Date();
+                const currentTime = now.getHours().toString().padStart(2, '0') + ':' + 
+                                  now.getMinutes().toString().padStart(2, '0');
+                startTimeInput.min = currentTime;
+                
+                // Set end time to be after start time
+                startTimeInput.addEventListener('change', function() {
+                    endTimeInput.min = this.value;
+                });
+            } else {
+                startTimeInput.removeAttribute('min');
+                endTimeInput.removeAttribute('min');
+            }
+        });
+        
+        // Validate end time is after start time
+        startTimeInput.addEventListener('change', function() {
+            if (endTimeInput.value && endTimeInput.value <= this.value) {
+                endTimeInput.value = '';
+                alert('End time must be after start time');
+            }
+            endTimeInput.min = this.value;
+        });
+        
+        // Form validation
+        document.querySelector('form').addEventListener('submit', function(e) {
+            const sessionType = document.getElementById('session_type').value;
+            const mentee = document.getElementById('mentee').value;
+            
+            if (sessionType === 'individual' && !mentee) {
+                e.preventDefault();
+                alert('Please select a mentee for individual session');
+                return;
+            }
+            
+            if (sessionType === 'group') {
+                // For group sessions, we don't need to validate attendees
+                // since they're automatically selected
+                console.log('Group session - all assigned mentees will be included');
+            }
+            
+            if (sessionType === '') {
+                e.preventDefault();
+                alert('Please select a session type');
+                return;
+            }
+        });
+        
+        // Initialize
+        document.addEventListener('DOMContentLoaded', function() {
+            // Initialize profile picture display
+            updateProfilePictureDisplay();
+            
+            toggleAttendees();
+            
+            // Set default time to next hour
+            const now = new Date();
+            const nextHour = new Date(now.getTime() + 60 * 60 * 1000);
+            const defaultTime = nextHour.getHours().toString().padStart(2, '0') + ':00';
+            
+            startTimeInput.value = defaultTime;
+            
+            // Set end time to 1 hour after start time
+            const endTime = new Date(nextHour.getTime() + 60 * 60 * 1000);
+            endTimeInput.value = endTime.getHours().toString().padStart(2, '0') + ':00';
+            
+            // Add subtle animations
+            const formGroups = document.querySelectorAll('.form-group');
+            formGroups.forEach((group, index) => {
+                group.style.opacity = '0';
+                group.style.transform = 'translateY(20px)';
+                group.style.transition = `opacity 0.6s ease ${index * 0.1}s, transform 0.6s ease ${index * 0.1}s`;
+                
+                setTimeout(() => {
+                    group.style.opacity = '1';
+                    group.style.transform = 'translateY(0)';
+                }, 100);
+            });
+        });
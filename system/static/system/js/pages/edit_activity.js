@@ -0,0 +1,87 @@
+        // Mentor selection functionality - IMPROVED VERSION
+        function updateSelectedCount() {
+            const checkboxes = document.querySelectorAll('input[name="mentors"]:checked');
+            const count = checkboxes.length;
+            document.getElementById('selectedCount').textContent = count + ' selected';
+
+            console.log('Selected mentors count:', count); // Debug log
+        }
+
+        function setupMentorSelection() {
+            const selectAll = document.getElementById('selectAllMentors');
+            const mentorCheckboxes = document.querySelectorAll('input[name="mentors"]');
+
+            console.log('Total mentor checkboxes found:', mentorCheckboxes.length); // Debug log
+
+            // Select All functionality
+            selectAll.addEventListener('change', function () {
+                console.log('Select All changed, checked:', this.checked); // Debug log
+
+                mentorCheckboxes.forEach(checkbox => {
+                    checkbox.checked = this.checked;
+                    console.log('Setting checkbox', checkbox.value, 'to', this.checked); // Debug log
+                });
+                updateSelectedCount();
+            });
+
+            // Individual checkbox functionality
+            mentorCheckboxes.forEach(checkbox => {
+                checkbox.addEventListener('change', function () {
+                    console.log('Individual checkbox changed:', this.value, this.checked); // Debug log
+                    updateSelectedCount();
+
+                    // Update Select All checkbox state
+                    const allChecked = document.querySelectorAll('input[name="mentors"]:checked').length === mentorCheckboxes.length;
+                    const someChecked = document.querySelectorAll('input[name="mentors"]:checked').length > 0;
+
+                    selectAll.checked = allChecked;
+                    selectAll.indeterminate = someChecked && !allChecked;
+
+                    console.log('All checked:', allChecked, 'Some checked:', someChecked); // Debug log
+                });
+            });
+
+            // Initial count update
+            updateSelectedCount();
+
+            // Set initial Select All state
+            const checkedCount = document.querySelectorAll('input[name="mentors"]:checked').length;
+            const totalCount = mentorCheckboxes.length;
+            selectAll.checked = checkedCount === totalCount && totalCount > 0;
+            selectAll.indeterminate = checkedCount > 0 && checkedCount < totalCount;
+
+            console.log('Initial state - Checked:', checkedCount, 'Total:', totalCount); // Debug log
+        }
+
+        // Enhanced DOM ready function
+        document.addEventListener('DOMContentLoaded', function () {
+            console.log('DOM loaded, setting up mentor selection...'); // Debug log
+
+            // Set minimum date to today
+            const today = new Date().toISOString().split('T')[0];
+            document.getElementById('Date').min = today;
+
+            // Setup mentor selection with a small delay to ensure DOM is ready
+            setTimeout(() => {
+                setupMentorSelection();
+            }, 100);
+
+            // Profile button functionality
+            document.querySelector('.profile-btn').addEventListener('click', function () {
+                alert('Profile page would open here!');
+                // In a real application, this would navigate to the profile page
+                // window.location.href = '/profile/';
+            });
+        });
+
+        // Add click handler for mentor checkbox items to improve UX
+        document.addEventListener('click', function (e) {
+            if (e.target.closest('.mentor-checkbox-item')) {
+                const checkboxItem = e.target.closest('.mentor-checkbox-item');
+                const checkbox = checkboxItem.querySelector('input[type="checkbox"]');
+                if (checkbox && e.target !== checkbox) {
+                    checkbox.checked = !checkbox.checked;
+                    checkbox.dispatchEvent(new Event('change', { bubbles: true }));
+                }
+            }
+        });
@@ -0,0 +1,48 @@
+        // Simple animations
+        const observerOptions = {
+            threshold: 0.1,
+            rootMargin: '0px 0px -50px 0px'
+        };
+
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.style.opacity = '1';
+                    entry.target.style.transform = 'translateY(0)';
+                }
+            });
+        }, observerOptions);
+
+        // Observe all cards for animation
+        document.querySelectorAll('.action-item, .news-item').forEach(card => {
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(20px)';
+            card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+            observer.observe(card);
+        });
+
+        // Active nav link highlighting
+        const currentPage = window.location.pathname;
+        document.querySelectorAll('.nav-link').forEach(link => {
+            if (link.getAttribute('href') === currentPage || 
+                (currentPage === '/' && link.getAttribute('href').includes('homepage'))) {
+                link.classList.add('active');
+            } else {
+                link.classList.remove('active');
+            }
+        });
+
+        // Add loading animation for action items
+        document.querySelectorAll('.action-item').forEach(item => {
+            item.addEventListener('click', function(e) {
+                // Add loading animation
+                const icon = this.querySelector('.action-icon i');
+                const originalClass = icon.className;
+                icon.className = 'fas fa-spinner fa-spin';
+                
+                // Reset after 1 second (simulate loading)
+                setTimeout(() => {
+                    icon.className = originalClass;
+                }, 1000);
+            });
+        });
@@ -0,0 +1,105 @@
+        // Mock data for recent activities
+        const dashboardData = {
+            recent_activities: [
+                {
+                    title: "New mentee assigned",
+                    time: "Today, 10:30 AM",
+                    icon: "user-plus"
+                },
+                {
+                    title: "Mentoring session completed",
+                    time: "Yesterday, 3:45 PM",
+                    icon: "check-circle"
+                },
+                {
+                    title: "New activity scheduled",
+                    time: "October 20, 2023",
+                    icon: "calendar-plus"
+                },
+                {
+                    title: "Monthly report requested",
+                    time: "October 18, 2023",
+                    icon: "file-alt"
+                }
+            ]
+        };
+
+        // Function to populate recent activities
+        function populateActivities() {
+            const activitiesContainer = document.getElementById('recent-activities');
+            if (!activitiesContainer) return;
+
+            activitiesContainer.innerHTML = '';
+
+            dashboardData.recent_activities.forEach(activity => {
+                const activityItem = document.createElement('div');
+                activityItem.className = 'activity-item';
+                activityItem.innerHTML = `
+                <div class="activity-icon">
+                    <i class="fas fa-${activity.icon}"></i>
+                </div>
+                <div class="activity-content">
+                    <div class="activity-title">${activity.title}</div>
+                    <div class="activity-time">${activity.time}</div>
+                </div>
+            `;
+                activitiesContainer.appendChild(activityItem);
+            });
+        }
+
+        // Initialize dashboard
+        document.addEventListener('DOMContentLoaded', function () {
+            // Populate activities
+            populateActivities();
+
+            // Simple animations
+            const observerOptions = {
+                threshold: 0.1,
+                rootMargin: '0px 0px -50px 0px'
+            };
+
+            const observer = new IntersectionObserver((entries) => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        entry.target.style.opacity = '1';
+                        entry.target.style.transform = 'translateY(0)';
+                    }
+                });
+            }, observerOptions);
+
+            // Observe all cards for animation
+            document.querySelectorAll('.stat-card, .action-item, .status-item, .activity-item').forEach(card => {
+                card.style.opacity = '0';
+                card.style.transform = 'translateY(20px)';
+                card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+                observer.observe(card);
+            });
+
+            // Active nav link highlighting
+            const currentPage = window.location.pathname;
+            document.querySelectorAll('.nav-link').forEach(link => {
+                if (link.getAttribute('href') === currentPage ||
+                    (currentPage === '/' && link.getAttribute('href').includes('homepage'))) {
+                    link.classList.add('active');
+                } else {
+                    link.classList.remove('active');
+                }
+            });
+
+            // Add loading animation for action items
+            document.querySelectorAll('.action-item').forEach(item => {
+                item.addEventListener('click', function (e) {
+                    // Add loading animation
+                    const icon = this.querySelector('.action-icon i');
+                    if (icon) {
+                        const originalClass = icon.className;
+                        icon.className = 'fas fa-spinner fa-spin';
+
+                        // Reset after 1 second (simulate loading)
+                        setTimeout(() => {
+                            icon.className = originalClass;
+                        }, 1000);
+                    }
+                });
+            });
+        });
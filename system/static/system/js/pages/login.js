@@ -0,0 +1,355 @@
+        // Add interactivity to user type selection
+        document.querySelectorAll('.user-type').forEach(type => {
+            type.addEventListener('click', function () {
+                document.querySelectorAll('.user-type').forEach(t => t.classList.remove('active'));
+                this.classList.add('active');
+
+                // Update form labels based on selected user type
+                const userType = this.getAttribute('data-role');
+                updateFormLabels(userType);
+            });
+        });
+
+        // Function to update form labels based on user type
+        function updateFormLabels(userType) {
+            const usernameLabel = document.querySelector('label[for="username"]');
+            const usernameInput = document.getElementById('username');
+
+            if (userType === 'head') {
+                usernameLabel.textContent = 'Administrator ID';
+                usernameInput.placeholder = 'Enter your administrator ID';
+            } else if (userType === 'mentor') {
+                usernameLabel.textContent = 'Staff ID';
+                usernameInput.placeholder = 'Enter your staff ID';
+            } else {
+                usernameLabel.textContent = 'Student ID';
+                usernameInput.placeholder = 'Enter your student ID';
+            }
+        }
+
+        // Add focus effects to form inputs
+        const inputs = document.querySelectorAll('input');
+        inputs.forEach(input => {
+            input.addEventListener('focus', function () {
+                this.parentElement.classList.add('focused');
+            });
+
+            input.addEventListener('blur', function () {
+                if (this.value === '') {
+                    this.parentElement.classList.remove('focused');
+                }
+            });
+        });
+
+        // Function to show login status popup
+        function showLoginPopup(title, message, type = 'success', duration = 5000) {
+            const container = document.getElementById('loginPopupContainer');
+
+            // Create popup element
+            const popup = document.createElement('div');
+            popup.className = `login-popup ${type}`;
+
+            // Map message types to icons
+            const icons = {
+                'success': 'fas fa-check',
+                'error': 'fas fa-exclamation-circle',
+                'warning': 'fas fa-exclamation-triangle',
+                'info': 'fas fa-info-circle'
+            };
+
+            popup.innerHTML = `
+                <div class="login-popup-icon">
+                    <i class="${icons[type] || icons.success}"></i>
+                </div>
+                <div class="login-popup-content">
+                    <div class="login-popup-title">${title}</div>
+                    <div class="login-popup-message">${message}</div>
+                </div>
+                <button class="login-popup-close" onclick="this.parentElement.remove()">
+                    <i class="fas fa-times"></i>
+                </button>
+                <div class="login-popup-progress">
+                    <div class="login-popup-progress-bar"></div>
+                </div>
+            `;
+
+            container.appendChild(popup);
+
+            // Animate in
+            setTimeout(() => {
+                popup.classList.add('show');
+            }, 100);
+
+            // Auto remove after duration
+            if (duration > 0) {
+                setTimeout(() => {
+                    popup.classList.add('hide');
+                    setTimeout(() => {
+                        if (popup.parentElement) {
+                            popup.remove();
+                        }
+                    }, 400);
+                }, duration);
+            }
+        }
+
+        // Process Django messages on page load
+        document.addEventListener('DOMContentLoaded', function () {
+            const djangoMessages = document.getElementById('django-messages');
+            if (djangoMessages) {
+                const messages = djangoMessages.querySelectorAll('.message');
+                messages.forEach(message => {
+                    const tags = message.getAttribute('data-tags');
+                    const content = message.getAttribute('data-content');
+
+                    let type = 'info';
+                    if (tags.includes('error')) type = 'error';
+                    if (tags.includes('success')) type = 'success';
+                    if (tags.includes('warning')) type = 'warning';
+
+                    showLoginPopup(
+                        type === 'error' ? 'Login Failed' : 'Login Status',
+                        content,
+                        type,
+                        5000
+                    );
+                });
+            }
+        });
+
+        // Form submission handling
+        document.getElementById('loginForm').addEventListener('submit', function (e) {
+            const username = document.getElementById('username').value;
+            const password = document.getElementById('password').value;
+            const loginButton = document.getElementById('loginButton');
+
+            // Basic client-side validation
+            if (!username || !password) {
+                e.preventDefault();
+                showLoginPopup('Missing Information', 'Please enter both User ID and password.', 'error', 4000);
+                return;
+            }
+
+            // Show loading state
+            loginButton.classList.add('loading');
+            loginButton.disabled = true;
+
+            // Let the form submit to Django - your backend will handle authentication
+            // The form will submit normally to your Django view
+        });
+
+        // Initialize form labels
+        updateFormLabels('mentee');
+
+        // Optional: Function to manually show popups (for other actions)
+        function showLoginSuccess(message, title = 'Success') {
+            showLoginPopup(title, message, 'success');
+        }
+
+        function showLoginError(message, title = 'Error') {
+            showLoginPopup(title, message, 'error');
+        }
+
+        // Interactive AI SaaS Particle Background
+        (function () {
+            const canvas = document.getElementById('bg-canvas');
+            const ctx = canvas.getContext('2d');
+
+            let width, height;
+            let particles = [];
+
+            // Configuration
+            const spacing = 45; // Grid spacing
+            const parallaxStrength = 15; // Subtle grid distortion
+
+            // Light Wave Configuration (Diagonal: Bottom-Right -> Top-Left)
+            const waveSpeed = 0.02;
+            const waveFrequency = 0.008; // Slightly lower freq for diagonal spread
+            const waveSharpness = 4;
+
+            // Mouse Glow & Magnet Configuration
+            const glowRadius = 300;
+            const magneticRadius = 200;
+            const magneticStrength = 0.2;
+
+            // Multi-Color Palette
+            const colorPalette = [
+                { r: 100, g: 149, b: 237 }, // Cornflower Blue
+                { r: 79, g: 209, b: 197 },  // Teal/Cyan
+                { r: 167, g: 139, b: 250 }, // Soft Purple
+                { r: 147, g: 197, b: 253 }  // Light Blue
+            ];
+
+            // Mouse state
+            const mouse = { x: -1000, y: -1000 };
+            const targetMouse = { x: 0, y: 0 };
+            const smoothedMouse = { x: 0, y: 0 };
+
+            let time = 0;
+
+            // Resize handling
+            function resize() {
+                width = canvas.width = window.innerWidth;
+                height = canvas.height = window.innerHeight;
+                initParticles();
+            }
+            window.addEventListener('resize', resize);
+
+            // Track mouse
+            window.addEventListener('mousemove', (e) => {
+                mouse.x = e.clientX;
+                mouse.y = e.clientY;
+
+                targetMouse.x = (e.clientX / width) - 0.5;
+                targetMouse.y = (e.clientY / height) - 0.5;
+            });
+
+            class Particle {
+                constructor(x, y) {
+                    this.x = x;
+                    this.y = y;
+                    this.baseX = x;
+                    this.baseY = y;
+
+                    this.z = Math.random() * 0.5 + 0.8;
+                    this.size = 2.5;
+
+                    this.rgb = colorPalette[Math.floor(Math.random() * colorPalette.length)];
+
+                    // Invisible when not lit
+                    this.baseAlpha = 0.02;
+                    this.alpha = this.baseAlpha;
+
+                    // Controlled Twinkle State
+                    this.twinkleVal = 0; // 0 to 1
+                    this.twinkleDir = 0; // 0: idle, 1: fade in, -1: fade out
+                }
+
+                update(t) {
+                    // --- 1. Diagonal Wave Logic (Bottom-Right -> Top-Left) ---
+                    // To move towards Top-Left (decreasing X, Y), we need phase to increase as (x+y) decreases?
+                    // Surface: sin(k*(x+y) + w*t)
+                    // If t increases, argument increases.
+                    // For argument to stay constant (track a peak), k*(x+y) must decrease.
+                    // Decreasing (x+y) means moving towards Top-Left (0,0).
+
+                    const phase = ((this.baseX + this.baseY) * waveFrequency) + (t * waveSpeed);
+                    const sineVal = Math.sin(phase);
+                    const normSine = (sineVal + 1) / 2;
+                    const waveIntensity = Math.pow(normSine, waveSharpness) * 0.8;
+
+                    // --- 2. Controlled Twinkle Update ---
+                    // Managed by global loop, but we handle the transition here
+                    if (this.twinkleDir === 1) {
+                        this.twinkleVal += 0.05;
+                        if (this.twinkleVal >= 1) {
+                            this.twinkleVal = 1;
+                            this.twinkleDir = -1; // Start fade out
+                        }
+                    } else if (this.twinkleDir === -1) {
+                        this.twinkleVal -= 0.03; // Slower fade out
+                        if (this.twinkleVal <= 0) {
+                            this.twinkleVal = 0;
+                            this.twinkleDir = 0; // Idle
+                        }
+                    }
+                    const twinkleIntensity = this.twinkleVal * 0.6; // Max 0.6
+
+                    // --- 3. Mouse Glow & Magnet Logic ---
+                    const dx = mouse.x - this.baseX;
+                    const dy = mouse.y - this.baseY;
+                    const dist = Math.sqrt(dx * dx + dy * dy);
+
+                    let mouseIntensity = 0;
+                    let magX = 0;
+                    let magY = 0;
+
+                    if (dist < glowRadius) {
+                        mouseIntensity = 1 - (dist / glowRadius);
+                        mouseIntensity = Math.pow(mouseIntensity, 2);
+
+                        if (dist < magneticRadius) {
+                            const force = (magneticRadius - dist) / magneticRadius;
+                            magX = dx * force * magneticStrength;
+                            magY = dy * force * magneticStrength;
+                        }
+                    }
+
+                    // --- Combine Alpha ---
+                    this.alpha = this.baseAlpha + waveIntensity + twinkleIntensity + mouseIntensity;
+                    if (this.alpha > 1) this.alpha = 1;
+
+                    // --- Combine Position ---
+                    const parX = smoothedMouse.x * parallaxStrength * this.z;
+                    const parY = smoothedMouse.y * parallaxStrength * this.z;
+
+                    this.renderX = this.baseX - parX + magX;
+                    this.renderY = this.baseY - parY + magY;
+                }
+
+                draw(ctx) {
+                    if (this.alpha < 0.03) return;
+
+                    ctx.beginPath();
+                    ctx.fillStyle = `rgba(${this.rgb.r}, ${this.rgb.g}, ${this.rgb.b}, ${this.alpha})`;
+                    ctx.arc(this.renderX, this.renderY, this.size, 0, Math.PI * 2);
+                    ctx.fill();
+                }
+            }
+
+            function initParticles() {
+                particles = [];
+                const cols = Math.ceil(width / spacing) + 2;
+                const rows = Math.ceil(height / spacing) + 2;
+
+                // Random Jitter Amount (Not too structured but still organized)
+                const jitter = spacing * 0.5; // +/- 22px
+
+                for (let r = -1; r < rows; r++) {
+                    for (let c = -1; c < cols; c++) {
+                        // Apply randomness to initial position
+                        const x = c * spacing + (Math.random() - 0.5) * jitter;
+                        const y = r * spacing + (Math.random() - 0.5) * jitter;
+                        particles.push(new Particle(x, y));
+                    }
+                }
+            }
+
+            resize();
+
+            function animate() {
+                ctx.clearRect(0, 0, width, height);
+                time += 1;
+
+                // Smooth Global Mouse for Parallax
+                smoothedMouse.x += (targetMouse.x - smoothedMouse.x) * 0.05;
+                smoothedMouse.y += (targetMouse.y - smoothedMouse.y) * 0.05;
+
+                // Manage Twinkles
+                // Count active
+                const activeTwinkles = particles.filter(p => p.twinkleDir !== 0).length;
+                const targetTwinkles = 6; // 4-6 range generally
+
+                if (activeTwinkles < targetTwinkles && Math.random() < 0.2) {
+                    // Pick a random idle particle
+                    // Limit retries
+                    for (let i = 0; i < 5; i++) {
+                        const p = particles[Math.floor(Math.random() * particles.length)];
+                        if (p.twinkleDir === 0 && p.alpha < 0.1) { // Only pick dark ones
+                            p.twinkleDir = 1;
+                            break;
+                        }
+                    }
+                }
+
+                particles.forEach(p => {
+                    p.update(time);
+                    p.draw(ctx);
+                });
+
+                requestAnimationFrame(animate);
+            }
+
+            animate();
+
+        })();
@@ -0,0 +1,500 @@
+        // Add animations to form elements
+        document.addEventListener('DOMContentLoaded', function () {
+            console.log("Page loaded - initializing form");
+
+            // Initialize tabs
+            initTabs();
+
+            const formGroups = document.querySelectorAll('.form-group');
+            formGroups.forEach((group, index) => {
+                group.style.opacity = '0';
+                group.style.transform = 'translateY(20px)';
+                group.style.transition = `opacity 0.6s ease ${index * 0.1}s, transform 0.6s ease ${index * 0.1}s`;
+
+                setTimeout(() => {
+                    group.style.opacity = '1';
+                    group.style.transform = 'translateY(0)';
+                }, 100);
+            });
+
+            // Add animation to profile picture section
+            const profileSection = document.querySelector('.profile-picture-section');
+            profileSection.style.opacity = '0';
+            profileSection.style.transform = 'scale(0.9)';
+            profileSection.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+
+            setTimeout(() => {
+                profileSection.style.opacity = '1';
+                profileSection.style.transform = 'scale(1)';
+            }, 200);
+
+            // Process Django messages and show as popup notifications
+            processDjangoMessages();
+
+            // Form submission handler
+            document.getElementById('profileForm').addEventListener('submit', function (e) {
+                console.log("Form submission started");
+
+                // Validate form before submission
+                if (!validateForm()) {
+                    e.preventDefault();
+                    showNotification('Validation Error', 'Please fill in all required fields correctly.', 'error', 3000);
+                    return;
+                }
+
+                // Show loading state on button
+                const submitBtn = document.getElementById('updateProfileBtn');
+                const originalText = submitBtn.innerHTML;
+                submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Updating...';
+                submitBtn.disabled = true;
+                submitBtn.classList.add('btn-loading');
+
+                // Allow the form to submit normally to Django
+
+                // Optional: Add a timeout to re-enable button if submission takes too long
+                setTimeout(() => {
+                    submitBtn.innerHTML = originalText;
+                    submitBtn.disabled = false;
+                    submitBtn.classList.remove('btn-loading');
+                }, 5000);
+            });
+
+            // Profile Picture Modal Functionality
+            const profilePictureModal = document.getElementById('profilePictureModal');
+            const addPhotoBtn = document.getElementById('addPhotoBtn');
+            const modalClose = document.getElementById('modalClose');
+            const modalCancel = document.getElementById('modalCancel');
+            const modalSave = document.getElementById('modalSave');
+            const fileInput = document.getElementById('profile_picture'); // Main form file input
+            const modalFileInput = document.getElementById('modalProfilePicture'); // Modal file input
+            const fileUploadBtn = document.getElementById('fileUploadBtn');
+            const fileUploadArea = document.getElementById('fileUploadArea');
+            const fileUploadStatus = document.getElementById('fileUploadStatus');
+            let profilePreview = document.getElementById('profilePreview');
+            let selectedFile = null;
+
+            // Open modal when "Add Photo" button is clicked
+            addPhotoBtn.addEventListener('click', function () {
+                profilePictureModal.classList.add('active');
+            });
+
+            // Close modal when close button is clicked
+            modalClose.addEventListener('click', function () {
+                profilePictureModal.classList.remove('active');
+                resetModal();
+            });
+
+            // Close modal when cancel button is clicked
+            modalCancel.addEventListener('click', function () {
+                profilePictureModal.classList.remove('active');
+                resetModal();
+            });
+
+            // Close modal when clicking outside the modal
+            profilePictureModal.addEventListener('click', function (e) {
+                if (e.target === profilePictureModal) {
+                    profilePictureModal.classList.remove('active');
+                    resetModal();
+                }
+            });
+
+            // Open file dialog when upload button is clicked
+            fileUploadBtn.addEventListener('click', function () {
+                modalFileInput.click();
+            });
+
+            // Handle file selection in modal
+            modalFileInput.addEventListener('change', function (e) {
+                if (e.target.files.length > 0) {
+                    selectedFile = e.target.files[0];
+                    handleFileSelection(selectedFile);
+                }
+            });
+
+            // Drag and drop functionality
+            fileUploadArea.addEventListener('dragover', function (e) {
+                e.preventDefault();
+                fileUploadArea.classList.add('dragover');
+            });
+
+            fileUploadArea.addEventListener('dragleave', function () {
+                fileUploadArea.classList.remove('dragover');
+            });
+
+            fileUploadArea.addEventListener('drop', function (e) {
+                e.preventDefault();
+                fileUploadArea.classList.remove('dragover');
+
+                if (e.dataTransfer.files.length > 0) {
+                    selectedFile = e.dataTransfer.files[0];
+                    modalFileInput.files = e.dataTransfer.files;
+                    handleFileSelection(selectedFile);
+                }
+            });
+
+            // Save button functionality - FIXED: Now properly sets the file to the main form input
+            modalSave.addEventListener('click', function () {
+                if (selectedFile) {
+                    // Create a new FileList and set it to the main form file input
+                    const dataTransfer = new DataTransfer();
+                    dataTransfer.items.add(selectedFile);
+                    fileInput.files = dataTransfer.files;
+
+                    console.log("File set to main form input:", fileInput.files[0].name);
+
+                    // Update the profile preview
+                    const reader = new FileReader();
+                    reader.onload = function (e) {
+                        updateProfilePreview(e.target.result);
+
+                        // Show success notification
+                        showNotification('Profile Picture Selected', 'Your profile picture has been selected. Click "Update Profile" to save it.', 'success', 3000);
+                    };
+                    reader.readAsDataURL(selectedFile);
+
+                    // Close the modal
+                    profilePictureModal.classList.remove('active');
+                    resetModal();
+                }
+            });
+
+            // Function to update profile preview
+            function updateProfilePreview(imageDataURL) {
+                // If it's a default profile preview, replace it with an image
+                if (profilePreview.classList.contains('default-profile-preview')) {
+                    const img = document.createElement('img');
+                    img.src = imageDataURL;
+                    img.alt = 'Profile Picture Preview';
+                    img.style.width = '100%';
+                    img.style.height = '100%';
+                    img.style.objectFit = 'cover';
+
+                    profilePreview.parentNode.replaceChild(img, profilePreview);
+                    profilePreview = img;
+                } else {
+                    // If it's already an image, just update the src
+                    profilePreview.src = imageDataURL;
+                }
+
+                // Also update the sidebar profile picture
+                const sidebarProfilePic = document.getElementById('sidebarProfilePic');
+                if (sidebarProfilePic) {
+                    sidebarProfilePic.src = imageDataURL;
+                }
+            }
+
+            // Function to handle file selection
+            function handleFileSelection(file) {
+                fileUploadStatus.className = 'file-upload-status';
+                fileUploadStatus.textContent = '';
+
+                // Validate file
+                if (!validateFile(file)) {
+                    modalSave.disabled = true;
+                    return;
+                }
+
+                // Show file info
+                fileUploadStatus.className = 'file-upload-status success';
+                fileUploadStatus.innerHTML = `<i class="fas fa-check"></i> Selected: ${file.name} (${formatFileSize(file.size)})`;
+
+                // Enable save button
+                modalSave.disabled = false;
+
+                // Update the file upload area to show preview
+                const reader = new FileReader();
+                reader.onload = function (e) {
+                    fileUploadArea.innerHTML = `
+                    <div class="file-upload-icon">
+                        <i class="fas fa-check-circle" style="color: #4CAF50;"></i>
+                    </div>
+                    <div class="file-upload-text">
+                        <h3>File Selected</h3>
+                        <p>${file.name} (${formatFileSize(file.size)})</p>
+                    </div>
+                    <button class="file-upload-btn" id="changeFileBtn">
+                        <i class="fas fa-sync-alt"></i>
+                        <span>Change File</span>
+                    </button>
+                `;
+
+                    // Add event listener to the new change file button
+                    document.getElementById('changeFileBtn').addEventListener('click', function () {
+                        modalFileInput.click();
+                    });
+                };
+                reader.readAsDataURL(file);
+            }
+
+            // File validation function
+            function validateFile(file) {
+                // Check file size (15MB limit)
+                if (file.size > 15 * 1024 * 1024) {
+                    fileUploadStatus.className = 'file-upload-status error';
+                    fileUploadStatus.innerHTML = '<i class="fas fa-exclamation-triangle"></i> File too large (max 15MB)';
+                    showNotification('File Too Large', 'Image file too large ( > 15MB )', 'error', 3000);
+                    modalFileInput.value = '';
+                    return false;
+                }
+
+                // Check file type
+                const allowedTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif'];
+                if (!allowedTypes.includes(file.type)) {
+                    fileUploadStatus.className = 'file-upload-status error';
+                    fileUploadStatus.innerHTML = '<i class="fas fa-exclamation-triangle"></i> Invalid file type (use JPG, PNG, GIF)';
+                    showNotification('Invalid File Type', 'Please upload a valid image file (JPG, PNG, GIF)', 'error', 3000);
+                    modalFileInput.value = '';
+                    return false;
+                }
+
+                return true;
+            }
+
+            // Function to reset modal to initial state
+            function resetModal() {
+                selectedFile = null;
+                modalFileInput.value = '';
+                modalSave.disabled = true;
+                fileUploadStatus.className = 'file-upload-status';
+                fileUploadStatus.textContent = '';
+
+                // Reset file upload area
+                fileUploadArea.innerHTML = `
+                <div class="file-upload-icon">
+                    <i class="fas fa-cloud-upload-alt"></i>
+                </div>
+                <div class="file-upload-text">
+                    <h3>Upload new picture</h3>
+                    <p>Supported formats: JPG, PNG, GIF | Max size: 15MB</p>
+                </div>
+                <button class="file-upload-btn" id="fileUploadBtn">
+                    <i class="fas fa-folder-open"></i>
+                    <span>Choose File</span>
+                </button>
+                <div class="file-upload-info">Drag & drop your image here or click to browse</div>
+            `;
+
+                // Reattach event listener to the new button
+                document.getElementById('fileUploadBtn').addEventListener('click', function () {
+                    modalFileInput.click();
+                });
+            }
+
+            // Helper function to format file size
+            function formatFileSize(bytes) {
+                if (bytes === 0) return '0 Bytes';
+                const k = 1024;
+                const sizes = ['Bytes', 'KB', 'MB', 'GB'];
+                const i = Math.floor(Math.log(bytes) / Math.log(k));
+                return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+            }
+
+            // Add real-time validation for GPA fields
+            const gpaInputs = document.querySelectorAll('input[type="number"][step="0.01"]');
+            gpaInputs.forEach(input => {
+                input.addEventListener('blur', function () {
+                    const value = parseFloat(this.value);
+                    // Only validate if there's a value
+                    if (this.value && (value < 0 || value > 4.0)) {
+                        this.style.borderColor = '#f44336';
+                        this.style.boxShadow = '0 0 0 3px rgba(244, 67, 54, 0.1)';
+                        showNotification('Invalid GPA', 'GPA must be between 0.00 and 4.00', 'warning', 3000);
+                    } else {
+                        this.style.borderColor = '#e2e8f0';
+                        this.style.boxShadow = 'none';
+                    }
+                });
+            });
+
+            // Add semester validation
+            const semesterInput = document.getElementById('MenteeSemester');
+            if (semesterInput) {
+                semesterInput.addEventListener('blur', function () {
+                    const value = parseInt(this.value);
+                    if (value < 1 || value > 8) {
+                        this.style.borderColor = '#f44336';
+                        this.style.boxShadow = '0 0 0 3px rgba(244, 67, 54, 0.1)';
+                        showNotification('Invalid Semester', 'Semester must be between 1 and 8', 'warning', 3000);
+                    } else {
+                        this.style.borderColor = '#e2e8f0';
+                        this.style.boxShadow = 'none';
+                    }
+                });
+            }
+
+            // Add input validation styling
+            const inputs = document.querySelectorAll('input, select, textarea');
+
+            inputs.forEach(input => {
+                // Add focus effect
+                input.addEventListener('focus', function () {
+                    this.style.borderColor = '#1a3a8f';
+                    this.style.boxShadow = '0 0 0 3px rgba(26, 58, 143, 0.1)';
+                });
+
+                // Remove focus effect
+                input.addEventListener('blur', function () {
+                    if (this.checkValidity()) {
+                        this.style.borderColor = '#e2e8f0';
+                        this.style.boxShadow = 'none';
+                    }
+                });
+
+                // Real-time validation
+                input.addEventListener('input', function () {
+                    if (this.checkValidity()) {
+                        this.style.borderColor = '#4CAF50';
+                        this.style.boxShadow = '0 0 0 3px rgba(76, 175, 80, 0.1)';
+                    } else {
+                        this.style.borderColor = '#f44336';
+                        this.style.boxShadow = '0 0 0 3px rgba(244, 67, 54, 0.1)';
+                    }
+                });
+            });
+        });
+
+        // Tab functionality
+        function initTabs() {
+            const tabButtons = document.querySelectorAll('.tab-button');
+            const tabContents = document.querySelectorAll('.tab-content');
+
+            tabButtons.forEach(button => {
+                button.addEventListener('click', () => {
+                    const tabId = button.getAttribute('data-tab');
+
+                    // Remove active class from all buttons and contents
+                    tabButtons.forEach(btn => btn.classList.remove('active'));
+                    tabContents.forEach(content => content.classList.remove('active'));
+
+                    // Add active class to clicked button and corresponding content
+                    button.classList.add('active');
+                    document.getElementById(`${tabId}-tab`).classList.add('active');
+                });
+            });
+        }
+
+        // Function to show popup notification
+        function showNotification(title, message, type = 'success', duration = 5000) {
+            const container = document.getElementById('notificationContainer');
+
+            // Create notification element
+            const notification = document.createElement('div');
+            notification.className = `notification ${type}`;
+
+            // Map message types to icons
+            const icons = {
+                'success': 'fas fa-check',
+                'error': 'fas fa-exclamation-circle',
+                'warning': 'fas fa-exclamation-triangle',
+                'info': 'fas fa-info-circle'
+            };
+
+            notification.innerHTML = `
+            <div class="notification-icon">
+                <i class="${icons[type] || icons.info}"></i>
+            </div>
+            <div class="notification-content">
+                <div class="notification-title">${title}</div>
+                <div class="notification-message">${message}</div>
+            </div>
+            <button class="notification-close" onclick="this.parentElement.remove()">
+                <i class="fas fa-times"></i>
+            </button>
+            <div class="notification-progress">
+                <div class="notification-progress-bar"></div>
+            </div>
+        `;
+
+            container.appendChild(notification);
+
+            // Animate in
+            setTimeout(() => {
+                notification.classList.add('show');
+            }, 100);
+
+            // Auto remove after duration
+            setTimeout(() => {
+                notification.classList.add('hide');
+                setTimeout(() => {
+                    if (notification.parentElement) {
+                        notification.remove();
+                    }
+                }, 300);
+            }, duration);
+        }
+
+        // Function to process Django messages and convert to popup notifications
+        function processDjangoMessages() {
+            const messagesContainer = document.querySelector('.messages');
+            if (!messagesContainer) return;
+
+            const messages = messagesContainer.querySelectorAll('.success, .error');
+
+            messages.forEach(messageEl => {
+                const isError = messageEl.classList.contains('error');
+                const type = isError ? 'error' : 'success';
+                const title = isError ? 'Error' : 'Success';
+                const message = messageEl.textContent.trim();
+
+                // Show as popup notification
+                showNotification(title, message, type);
+
+                // Remove the original message after a short delay
+                setTimeout(() => {
+                    messageEl.style.opacity = '0';
+                    messageEl.style.transform = 'translateY(-10px)';
+                    setTimeout(() => {
+                        messageEl.remove();
+                    }, 300);
+                }, 1000);
+            });
+        }
+
+        // Form validation - All fields are optional, just validate GPA range if provided
+        function validateForm() {
+            let isValid = true;
+            let firstErrorField = null;
+
+            // Only validate GPA fields for range (0-4) if they have values
+            const gpaInputs = document.querySelectorAll('input[type="number"][step="0.01"]');
+            gpaInputs.forEach(input => {
+                if (input.value) {
+                    const value = parseFloat(input.value);
+                    if (value < 0 || value > 4.0) {
+                        input.style.borderColor = '#f44336';
+                        input.style.boxShadow = '0 0 0 3px rgba(244, 67, 54, 0.1)';
+                        isValid = false;
+                        if (!firstErrorField) firstErrorField = input;
+                        showNotification('Invalid GPA', 'GPA must be between 0.00 and 4.00', 'warning', 3000);
+                    } else {
+                        input.style.borderColor = '#e2e8f0';
+                        input.style.boxShadow = 'none';
+                    }
+                }
+            });
+
+            // Scroll to first error field if any
+            if (firstErrorField) {
+                firstErrorField.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                firstErrorField.focus();
+            }
+
+            return isValid;
+        }
+
+        // Optional: Function to manually show notifications (for other actions)
+        function showSuccess(message, title = 'Success') {
+            showNotification(title, message, 'success');
+        }
+
+        function showError(message, title = 'Error') {
+            showNotification(title, message, 'error');
+        }
+
+        function showWarning(message, title = 'Warning') {
+            showNotification(title, message, 'warning');
+        }
+
+        function showInfo(message, title = 'Information') {
+            showNotification(title, message, 'info');
+        }
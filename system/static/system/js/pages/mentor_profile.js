@@ -0,0 +1,448 @@
+        // Add animations to form elements
+        document.addEventListener('DOMContentLoaded', function () {
+            console.log("Page loaded - initializing form");
+
+            // Hide the messages container completely
+            const messagesContainer = document.querySelector('.messages');
+            if (messagesContainer) {
+                messagesContainer.style.display = 'none';
+            }
+
+            const formGroups = document.querySelectorAll('.form-group');
+            formGroups.forEach((group, index) => {
+                group.style.opacity = '0';
+                group.style.transform = 'translateY(20px)';
+                group.style.transition = `opacity 0.6s ease ${index * 0.1}s, transform 0.6s ease ${index * 0.1}s`;
+
+                setTimeout(() => {
+                    group.style.opacity = '1';
+                    group.style.transform = 'translateY(0)';
+                }, 100);
+            });
+
+            // Add animation to profile picture section
+            const profileSection = document.querySelector('.profile-picture-section');
+            profileSection.style.opacity = '0';
+            profileSection.style.transform = 'scale(0.9)';
+            profileSection.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+
+            setTimeout(() => {
+                profileSection.style.opacity = '1';
+                profileSection.style.transform = 'scale(1)';
+            }, 200);
+
+            // Process Django messages and show as popup notifications
+            processDjangoMessages();
+
+            // Form submission handler
+            document.getElementById('profileForm').addEventListener('submit', function (e) {
+                console.log("Form submission started");
+
+                // Validate form before submission
+                if (!validateForm()) {
+                    e.preventDefault();
+                    showNotification('Validation Error', 'Please fill in all required fields correctly.', 'error', 3000);
+                    return;
+                }
+
+                // Show loading state on button
+                const submitBtn = document.getElementById('updateProfileBtn');
+                const originalText = submitBtn.innerHTML;
+                submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Updating...';
+                submitBtn.disabled = true;
+                submitBtn.classList.add('btn-loading');
+
+                // Allow the form to submit normally to Django
+
+                // Optional: Add a timeout to re-enable button if submission takes too long
+                setTimeout(() => {
+                    submitBtn.innerHTML = originalText;
+                    submitBtn.disabled = false;
+                    submitBtn.classList.remove('btn-loading');
+                }, 5000);
+            });
+
+            // Profile Picture Modal Functionality
+            const profilePictureModal = document.getElementById('profilePictureModal');
+            const addPhotoBtn = document.getElementById('addPhotoBtn');
+            const modalClose = document.getElementById('modalClose');
+            const modalCancel = document.getElementById('modalCancel');
+            const modalSave = document.getElementById('modalSave');
+            const fileInput = document.getElementById('profile_picture'); // Main form file input
+            const modalFileInput = document.getElementById('modalProfilePicture'); // Modal file input
+            const fileUploadBtn = document.getElementById('fileUploadBtn');
+            const fileUploadArea = document.getElementById('fileUploadArea');
+            const fileUploadStatus = document.getElementById('fileUploadStatus');
+            let profilePreview = document.getElementById('profilePreview');
+            let selectedFile = null;
+            let tempPreviewImage = null; // Store temporary preview image
+
+            // Open modal when "Add Photo" button is clicked
+            addPhotoBtn.addEventListener('click', function () {
+                profilePictureModal.classList.add('active');
+            });
+
+            // Close modal when close button is clicked
+            modalClose.addEventListener('click', function () {
+                profilePictureModal.classList.remove('active');
+                resetModal();
+            });
+
+            // Close modal when cancel button is clicked
+            modalCancel.addEventListener('click', function () {
+                profilePictureModal.classList.remove('active');
+                resetModal();
+            });
+
+            // Close modal when clicking outside the modal
+            profilePictureModal.addEventListener('click', function (e) {
+                if (e.target === profilePictureModal) {
+                    profilePictureModal.classList.remove('active');
+                    resetModal();
+                }
+            });
+
+            // Open file dialog when upload button is clicked
+            fileUploadBtn.addEventListener('click', function () {
+                modalFileInput.click();
+            });
+
+            // Handle file selection in modal
+            modalFileInput.addEventListener('change', function (e) {
+                if (e.target.files.length > 0) {
+                    selectedFile = e.target.files[0];
+                    handleFileSelection(selectedFile);
+                }
+            });
+
+            // Drag and drop functionality
+            fileUploadArea.addEventListener('dragover', function (e) {
+                e.preventDefault();
+                fileUploadArea.classList.add('dragover');
+            });
+
+            fileUploadArea.addEventListener('dragleave', function () {
+                fileUploadArea.classList.remove('dragover');
+            });
+
+            fileUploadArea.addEventListener('drop', function (e) {
+                e.preventDefault();
+                fileUploadArea.classList.remove('dragover');
+
+                if (e.dataTransfer.files.length > 0) {
+                    selectedFile = e.dataTransfer.files[0];
+                    modalFileInput.files = e.dataTransfer.files;
+                    handleFileSelection(selectedFile);
+                }
+            });
+
+            // Save button functionality - FIXED: Now properly sets the file to the main form input
+            modalSave.addEventListener('click', function () {
+                if (selectedFile) {
+                    // Create a new FileList and set it to the main form file input
+                    const dataTransfer = new DataTransfer();
+                    dataTransfer.items.add(selectedFile);
+                    fileInput.files = dataTransfer.files;
+
+                    console.log("File set to main form input:", fileInput.files[0].name);
+
+                    // Update the profile preview
+                    const reader = new FileReader();
+                    reader.onload = function (e) {
+                        updateProfilePreview(e.target.result);
+
+                        // Store the temporary preview image
+                        tempPreviewImage = e.target.result;
+                    };
+                    reader.readAsDataURL(selectedFile);
+
+                    // Close the modal
+                    profilePictureModal.classList.remove('active');
+                    resetModal();
+                }
+            });
+
+            // Function to update main profile preview
+            function updateProfilePreview(imageSrc) {
+                if (profilePreview.classList.contains('default-profile-preview')) {
+                    const img = document.createElement('img');
+                    img.src = imageSrc;
+                    img.alt = 'Profile Picture Preview';
+                    img.style.width = '100%';
+                    img.style.height = '100%';
+                    img.style.objectFit = 'cover';
+
+                    profilePreview.parentNode.replaceChild(img, profilePreview);
+                    profilePreview = img;
+                } else {
+                    profilePreview.src = imageSrc;
+                }
+
+                // Add temporary preview styling
+                profilePreview.classList.add('temp-preview');
+
+                // Update button text
+                addPhotoBtn.innerHTML = '<i class="fas fa-sync-alt"></i><span>Change Photo</span>';
+            }
+
+            // Function to handle file selection
+            function handleFileSelection(file) {
+                fileUploadStatus.className = 'file-upload-status';
+                fileUploadStatus.textContent = '';
+
+                // Validate file
+                if (!validateFile(file)) {
+                    modalSave.disabled = true;
+                    return;
+                }
+
+                // Show file info
+                fileUploadStatus.className = 'file-upload-status success';
+                fileUploadStatus.innerHTML = `<i class="fas fa-check"></i> Selected: ${file.name} (${formatFileSize(file.size)})`;
+
+                // Enable save button
+                modalSave.disabled = false;
+
+                // Update the file upload area to show preview
+                const reader = new FileReader();
+                reader.onload = function (e) {
+                    fileUploadArea.innerHTML = `
+                    <div class="file-upload-icon">
+                        <i class="fas fa-check-circle" style="color: #4CAF50;"></i>
+                    </div>
+                    <div class="file-upload-text">
+                        <h3>File Selected</h3>
+                        <p>${file.name} (${formatFileSize(file.size)})</p>
+                    </div>
+                    <button class="file-upload-btn" id="changeFileBtn">
+                        <i class="fas fa-sync-alt"></i>
+                        <span>Change File</span>
+                    </button>
+                `;
+
+                    // Add event listener to the new change file button
+                    document.getElementById('changeFileBtn').addEventListener('click', function () {
+                        modalFileInput.click();
+                    });
+                };
+                reader.readAsDataURL(file);
+            }
+
+            // File validation function
+            function validateFile(file) {
+                // Check file size (15MB limit)
+                if (file.size > 15 * 1024 * 1024) {
+                    fileUploadStatus.className = 'file-upload-status error';
+                    fileUploadStatus.innerHTML = '<i class="fas fa-exclamation-triangle"></i> File too large (max 15MB)';
+                    modalFileInput.value = '';
+                    return false;
+                }
+
+                // Check file type
+                const allowedTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif'];
+                if (!allowedTypes.includes(file.type)) {
+                    fileUploadStatus.className = 'file-upload-status error';
+                    fileUploadStatus.innerHTML = '<i class="fas fa-exclamation-triangle"></i> Invalid file type (use JPG, PNG, GIF)';
+                    modalFileInput.value = '';
+                    return false;
+                }
+
+                return true;
+            }
+
+            // Function to reset modal to initial state
+            function resetModal() {
+                selectedFile = null;
+                modalFileInput.value = '';
+                modalSave.disabled = true;
+                fileUploadStatus.className = 'file-upload-status';
+                fileUploadStatus.textContent = '';
+
+                // Reset file upload area
+                fileUploadArea.innerHTML = `
+                <div class="file-upload-icon">
+                    <i class="fas fa-cloud-upload-alt"></i>
+                </div>
+                <div class="file-upload-text">
+                    <h3>Upload new picture</h3>
+                    <p>Supported formats: JPG, PNG, GIF | Max size: 15MB</p>
+                </div>
+                <button class="file-upload-btn" id="fileUploadBtn">
+                    <i class="fas fa-folder-open"></i>
+                    <span>Choose File</span>
+                </button>
+                <div class="file-upload-info">Drag & drop your image here or click to browse</div>
+            `;
+
+                // Reattach event listener to the new button
+                document.getElementById('fileUploadBtn').addEventListener('click', function () {
+                    modalFileInput.click();
+                });
+            }
+
+            // Helper function to format file size
+            function formatFileSize(bytes) {
+                if (bytes === 0) return '0 Bytes';
+                const k = 1024;
+                const sizes = ['Bytes', 'KB', 'MB', 'GB'];
+                const i = Math.floor(Math.log(bytes) / Math.log(k));
+                return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+            }
+
+            // Add input validation styling
+            const inputs = document.querySelectorAll('input, select, textarea');
+
+            inputs.forEach(input => {
+                // Add focus effect
+                input.addEventListener('focus', function () {
+                    this.style.borderColor = '#1a3a8f';
+                    this.style.boxShadow = '0 0 0 3px rgba(26, 58, 143, 0.1)';
+                });
+
+                // Remove focus effect
+                input.addEventListener('blur', function () {
+                    if (this.checkValidity()) {
+                        this.style.borderColor = '#e2e8f0';
+                        this.style.boxShadow = 'none';
+                    }
+                });
+
+                // Real-time validation
+                input.addEventListener('input', function () {
+                    if (this.checkValidity()) {
+                        this.style.borderColor = '#4CAF50';
+                        this.style.boxShadow = '0 0 0 3px rgba(76, 175, 80, 0.1)';
+                    } else {
+                        this.style.borderColor = '#f44336';
+                        this.style.boxShadow = '0 0 0 3px rgba(244, 67, 54, 0.1)';
+                    }
+                });
+            });
+        });
+
+        // Function to show popup notification
+        function showNotification(title, message, type = 'success', duration = 5000) {
+            const container = document.getElementById('notificationContainer');
+
+            // Create notification element
+            const notification = document.createElement('div');
+            notification.className = `notification ${type}`;
+
+            // Map message types to icons
+            const icons = {
+                'success': 'fas fa-check',
+                'error': 'fas fa-exclamation-circle',
+                'warning': 'fas fa-exclamation-triangle',
+                'info': 'fas fa-info-circle'
+            };
+
+            notification.innerHTML = `
+            <div class="notification-icon">
+                <i class="${icons[type] || icons.info}"></i>
+            </div>
+            <div class="notification-content">
+                <div class="notification-title">${title}</div>
+                <div class="notification-message">${message}</div>
+            </div>
+            <button class="notification-close" onclick="this.parentElement.remove()">
+                <i class="fas fa-times"></i>
+            </button>
+            <div class="notification-progress">
+                <div class="notification-progress-bar"></div>
+            </div>
+        `;
+
+            container.appendChild(notification);
+
+            // Animate in
+            setTimeout(() => {
+                notification.classList.add('show');
+            }, 100);
+
+            // Auto remove after duration
+            setTimeout(() => {
+                notification.classList.add('hide');
+                setTimeout(() => {
+                    if (notification.parentElement) {
+                        notification.remove();
+                    }
+                }, 300);
+            }, duration);
+        }
+
+        // Function to process Django messages and convert to popup notifications
+        function processDjangoMessages() {
+            const messagesContainer = document.querySelector('.messages');
+            if (!messagesContainer) return;
+
+            const messages = messagesContainer.querySelectorAll('.success, .error');
+
+            messages.forEach(messageEl => {
+                const isError = messageEl.classList.contains('error');
+                const type = isError ? 'error' : 'success';
+                const title = isError ? 'Error' : 'Success';
+                const message = messageEl.textContent.trim();
+
+                // Skip the "Profile picture updated successfully!" message
+                if (message.includes('Profile picture updated successfully')) {
+                    // Remove this message without showing notification
+                    setTimeout(() => {
+                        messageEl.style.opacity = '0';
+                        messageEl.style.transform = 'translateY(-10px)';
+                        setTimeout(() => {
+                            messageEl.remove();
+                        }, 300);
+                    }, 100);
+                    return;
+                }
+
+                // Show as popup notification for other messages
+                showNotification(title, message, type);
+
+                // Remove the original message after a short delay
+                setTimeout(() => {
+                    messageEl.style.opacity = '0';
+                    messageEl.style.transform = 'translateY(-10px)';
+                    setTimeout(() => {
+                        messageEl.remove();
+                    }, 300);
+                }, 1000);
+            });
+        }
+
+        // Enhanced form validation - Only validates required fields
+        function validateForm() {
+            const form = document.getElementById('profileForm');
+            const requiredFields = form.querySelectorAll('[required]');
+            let isValid = true;
+            let firstErrorField = null;
+
+            requiredFields.forEach(field => {
+                // Skip readonly fields even if they have required attribute
+                if (field.classList.contains('readonly-field')) {
+                    return;
+                }
+
+                if (!field.value.trim()) {
+                    field.style.borderColor = '#f44336';
+                    field.style.boxShadow = '0 0 0 3px rgba(244, 67, 54, 0.1)';
+                    isValid = false;
+
+                    // Store first error field for scrolling
+                    if (!firstErrorField) {
+                        firstErrorField = field;
+                    }
+                } else {
+                    field.style.borderColor = '#e2e8f0';
+                    field.style.boxShadow = 'none';
+                }
+            });
+
+            // Scroll to first error field
+            if (firstErrorField) {
+                firstErrorField.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                firstErrorField.focus();
+            }
+
+            return isValid;
+        }
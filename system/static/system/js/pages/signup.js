@@ -0,0 +1,279 @@
+        function updateIdField() {
+            const role = document.getElementById('role').value;
+            const idLabel = document.getElementById('id_label');
+            const idInput = document.getElementById('identification_id');
+            const idHelp = document.getElementById('id_help');
+            const genderField = document.getElementById('gender-field');
+
+            if (role === 'mentee') {
+                idLabel.innerHTML = '<i class="fas fa-graduation-cap"></i> Student ID';
+                idInput.placeholder = 'Enter your Student ID (e.g., BCS2311-017)';
+                idHelp.innerHTML = '<strong>Format:</strong> BCS2311-017, BDA2307-123<br>' +
+                    '<strong>Examples:</strong><br>' +
+                    '• BCS2311-017 (Computer Science)<br>' +
+                    '• BDA2307-123 (Accounting)<br>' +
+                    '• DB2311-001 (Business Studies)';
+                genderField.style.display = 'block';
+                document.getElementById('gender').required = true;
+
+            } else if (role === 'mentor') {
+                idLabel.innerHTML = '<i class="fas fa-user-tie"></i> Staff ID';
+                idInput.placeholder = 'Enter your Staff ID (e.g., STA001)';
+                idHelp.innerHTML = '<strong>Format:</strong> ST + Department Code + Number<br>' +
+                    '<strong>Examples:</strong> STA001, STB015, STC123';
+                genderField.style.display = 'none';
+                document.getElementById('gender').required = false;
+            } else {
+                idLabel.innerHTML = '<i class="fas fa-id-card"></i> ID Number';
+                idInput.placeholder = 'Select role first';
+                idHelp.innerHTML = 'Please select your role first';
+                genderField.style.display = 'block';
+                document.getElementById('gender').required = false;
+            }
+        }
+
+        // Initialize on page load
+        document.addEventListener('DOMContentLoaded', function () {
+            updateIdField();
+
+            // Auto-dismiss messages after 5 seconds
+            const messages = document.querySelectorAll('.message-fade-out');
+            messages.forEach(function (message) {
+                setTimeout(function () {
+                    message.classList.add('message-hidden');
+                    setTimeout(function () {
+                        if (message.parentElement) {
+                            message.remove();
+                        }
+                    }, 500);
+                }, 5000);
+            });
+
+            // Form validation
+            document.querySelector('form').addEventListener('submit', function (e) {
+                const fullName = document.getElementById('full_name').value;
+                const password = document.getElementById('password').value;
+                const confirmPassword = document.getElementById('confirmPassword').value;
+                const role = document.getElementById('role').value;
+                const gender = document.getElementById('gender').value;
+
+                if (!role) {
+                    e.preventDefault();
+                    alert('Please select your role');
+                    return;
+                }
+
+                if (!fullName.trim()) {
+                    e.preventDefault();
+                    alert('Please enter your full name');
+                    return;
+                }
+
+                if (role === 'mentee' && !gender) {
+                    e.preventDefault();
+                    alert('Please select your gender');
+                    return;
+                }
+
+                if (password !== confirmPassword) {
+                    e.preventDefault();
+                    alert('Passwords do not match');
+                    return;
+                }
+
+                if (password.length < 6) {
+                    e.preventDefault();
+                    alert('Password must be at least 6 characters long');
+                    return;
+                }
+            });
+
+            // Add subtle animations to form elements
+            const formGroups = document.querySelectorAll('.form-group');
+            formGroups.forEach((group, index) => {
+                group.style.opacity = '0';
+                group.style.transform = 'translateY(20px)';
+                group.style.transition = `opacity 0.6s ease ${index * 0.1}s, transform 0.6s ease ${index * 0.1}s`;
+
+                setTimeout(() => {
+                    group.style.opacity = '1';
+                    group.style.transform = 'translateY(0)';
+                }, 100);
+            });
+        });
+
+        // Interactive AI SaaS Particle Background
+        (function () {
+            const canvas = document.getElementById('bg-canvas');
+            const ctx = canvas.getContext('2d');
+
+            let width, height;
+            let particles = [];
+
+            // Configuration
+            const spacing = 45;
+            const parallaxStrength = 15;
+            const waveSpeed = 0.02;
+            const waveFrequency = 0.008;
+            const waveSharpness = 4;
+            const glowRadius = 300;
+            const magneticRadius = 200;
+            const magneticStrength = 0.2;
+
+            // Multi-Color Palette
+            const colorPalette = [
+                { r: 100, g: 149, b: 237 },
+                { r: 79, g: 209, b: 197 },
+                { r: 167, g: 139, b: 250 },
+                { r: 147, g: 197, b: 253 }
+            ];
+
+            // Mouse state
+            const mouse = { x: -1000, y: -1000 };
+            const targetMouse = { x: 0, y: 0 };
+            const smoothedMouse = { x: 0, y: 0 };
+
+            let time = 0;
+
+            // Resize handling
+            function resize() {
+                width = canvas.width = window.innerWidth;
+                height = canvas.height = window.innerHeight;
+                initParticles();
+            }
+            window.addEventListener('resize', resize);
+
+            // Track mouse
+            window.addEventListener('mousemove', (e) => {
+                mouse.x = e.clientX;
+                mouse.y = e.clientY;
+
+                targetMouse.x = (e.clientX / width) - 0.5;
+                targetMouse.y = (e.clientY / height) - 0.5;
+            });
+
+            class Particle {
+                constructor(x, y) {
+                    this.x = x;
+                    this.y = y;
+                    this.baseX = x;
+                    this.baseY = y;
+
+                    this.z = Math.random() * 0.5 + 0.8;
+                    this.size = 2.5;
+                    this.rgb = colorPalette[Math.floor(Math.random() * colorPalette.length)];
+                    this.baseAlpha = 0.02;
+                    this.alpha = this.baseAlpha;
+                    this.twinkleVal = 0;
+                    this.twinkleDir = 0;
+                }
+
+                update(t) {
+                    const phase = ((this.baseX + this.baseY) * waveFrequency) + (t * waveSpeed);
+                    const sineVal = Math.sin(phase);
+                    const normSine = (sineVal + 1) / 2;
+                    const waveIntensity = Math.pow(normSine, waveSharpness) * 0.8;
+
+                    if (this.twinkleDir === 1) {
+                        this.twinkleVal += 0.05;
+                        if (this.twinkleVal >= 1) {
+                            this.twinkleVal = 1;
+                            this.twinkleDir = -1;
+                        }
+                    } else if (this.twinkleDir === -1) {
+                        this.twinkleVal -= 0.03;
+                        if (this.twinkleVal <= 0) {
+                            this.twinkleVal = 0;
+                            this.twinkleDir = 0;
+                        }
+                    }
+                    const twinkleIntensity = this.twinkleVal * 0.6;
+
+                    const dx = mouse.x - this.baseX;
+                    const dy = mouse.y - this.baseY;
+                    const dist = Math.sqrt(dx * dx + dy * dy);
+
+                    let mouseIntensity = 0;
+                    let magX = 0;
+                    let magY = 0;
+
+                    if (dist < glowRadius) {
+                        mouseIntensity = 1 - (dist / glowRadius);
+                        mouseIntensity = Math.pow(mouseIntensity, 2);
+
+                        if (dist < magneticRadius) {
+                            const force = (magneticRadius - dist) / magneticRadius;
+                            magX = dx * force * magneticStrength;
+                            magY = dy * force * magneticStrength;
+                        }
+                    }
+
+                    this.alpha = this.baseAlpha + waveIntensity + twinkleIntensity + mouseIntensity;
+                    if (this.alpha > 1) this.alpha = 1;
+
+                    const parX = smoothedMouse.x * parallaxStrength * this.z;
+                    const parY = smoothedMouse.y * parallaxStrength * this.z;
+
+                    this.renderX = this.baseX - parX + magX;
+                    this.renderY = this.baseY - parY + magY;
+                }
+
+                draw(ctx) {
+                    if (this.alpha < 0.03) return;
+
+                    ctx.beginPath();
+                    ctx.fillStyle = `rgba(${this.rgb.r}, ${this.rgb.g}, ${this.rgb.b}, ${this.alpha})`;
+                    ctx.arc(this.renderX, this.renderY, this.size, 0, Math.PI * 2);
+                    ctx.fill();
+                }
+            }
+
+            function initParticles() {
+                particles = [];
+                const cols = Math.ceil(width / spacing) + 2;
+                const rows = Math.ceil(height / spacing) + 2;
+
+                const jitter = spacing * 0.5;
+
+                for (let r = -1; r < rows; r++) {
+                    for (let c = -1; c < cols; c++) {
+                        const x = c * spacing + (Math.random() - 0.5) * jitter;
+                        const y = r * spacing + (Math.random() - 0.5) * jitter;
+                        particles.push(new Particle(x, y));
+                    }
+                }
+            }
+
+            resize();
+
+            function animate() {
+                ctx.clearRect(0, 0, width, height);
+                time += 1;
+
+                smoothedMouse.x += (targetMouse.x - smoothedMouse.x) * 0.05;
+                smoothedMouse.y += (targetMouse.y - smoothedMouse.y) * 0.05;
+
+                const activeTwinkles = particles.filter(p => p.twinkleDir !== 0).length;
+                const targetTwinkles = 6;
+
+                if (activeTwinkles < targetTwinkles && Math.random() < 0.2) {
+                    for (let i = 0; i < 5; i++) {
+                        const p = particles[Math.floor(Math.random() * particles.length)];
+                        if (p.twinkleDir === 0 && p.alpha < 0.1) {
+                            p.twinkleDir = 1;
+                            break;
+                        }
+                    }
+                }
+
+                particles.forEach(p => {
+                    p.update(time);
+                    p.draw(ctx);
+                });
+
+                requestAnimationFrame(animate);
+            }
+
+            animate();
+
+        })();
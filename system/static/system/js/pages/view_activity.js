@@ -0,0 +1,189 @@
+        document.addEventListener('DOMContentLoaded', function () {
+            // Set current date for export header
+            document.getElementById('currentDate').textContent = new Date().toLocaleDateString('en-US', {
+                year: 'numeric',
+                month: 'long',
+                day: 'numeric'
+            });
+
+            // Export dropdown functionality
+            const exportBtn = document.getElementById('exportBtn');
+            const exportDropdown = document.getElementById('exportDropdown');
+
+            exportBtn.addEventListener('click', function (e) {
+                e.stopPropagation();
+                exportDropdown.classList.toggle('show');
+            });
+
+            // Close dropdown when clicking outside
+            document.addEventListener('click', function () {
+                exportDropdown.classList.remove('show');
+            });
+
+            // Export functionality
+            const exportPdfBtn = document.getElementById('exportPdf');
+            const exportImageBtn = document.getElementById('exportImage');
+            const printReportBtn = document.getElementById('printReport');
+            const loadingOverlay = document.getElementById('loadingOverlay');
+            const reportContent = document.getElementById('reportContent');
+            const exportHeader = document.getElementById('exportHeader');
+
+            // PDF Export
+            exportPdfBtn.addEventListener('click', async function (e) {
+                e.preventDefault();
+                exportDropdown.classList.remove('show');
+
+                showLoading();
+
+                try {
+                    // Show export header
+                    exportHeader.style.display = 'block';
+
+                    const { jsPDF } = window.jspdf;
+                    const pdf = new jsPDF('p', 'mm', 'a4');
+
+                    // Capture the content as image
+                    const canvas = await html2canvas(reportContent, {
+                        scale: 2,
+                        useCORS: true,
+                        logging: false,
+                        backgroundColor: '#ffffff'
+                    });
+
+                    const imgData = canvas.toDataURL('image/png');
+                    const imgWidth = 190; // A4 width in mm
+                    const pageHeight = 280; // A4 height in mm
+                    const imgHeight = canvas.height * imgWidth / canvas.width;
+
+                    let heightLeft = imgHeight;
+                    let position = 10;
+
+                    pdf.addImage(imgData, 'PNG', 10, position, imgWidth, imgHeight);
+                    heightLeft -= pageHeight;
+
+                    // Add new pages if content is too long
+                    while (heightLeft >= 0) {
+                        position = heightLeft - imgHeight + 10;
+                        pdf.addPage();
+                        pdf.addImage(imgData, 'PNG', 10, position, imgWidth, imgHeight);
+                        heightLeft -= pageHeight;
+                    }
+
+                    // Hide export header
+                    exportHeader.style.display = 'none';
+
+                    // Save the PDF
+                    pdf.save(`Activity_Report_${getCurrentDateTime()}.pdf`);
+
+                    hideLoading();
+                } catch (error) {
+                    console.error('Error generating PDF:', error);
+                    hideLoading();
+                    alert('Error generating PDF. Please try again.');
+                }
+            });
+
+            // Image Export
+            exportImageBtn.addEventListener('click', async function (e) {
+                e.preventDefault();
+                exportDropdown.classList.remove('show');
+
+                showLoading();
+
+                try {
+                    // Show export header
+                    exportHeader.style.display = 'block';
+
+                    const canvas = await html2canvas(reportContent, {
+                        scale: 2,
+                        useCORS: true,
+                        logging: false,
+                        backgroundColor: '#ffffff'
+                    });
+
+                    // Hide export header
+                    exportHeader.style.display = 'none';
+
+                    // Convert canvas to image and download
+                    const link = document.createElement('a');
+                    link.download = `Activity_Report_${getCurrentDateTime()}.png`;
+                    link.href = canvas.toDataURL('image/png');
+                    link.click();
+
+                    hideLoading();
+                } catch (error) {
+                    console.error('Error generating image:', error);
+                    hideLoading();
+                    alert('Error generating image. Please try again.');
+                }
+            });
+
+            // Print Report
+            printReportBtn.addEventListener('click', function (e) {
+                e.preventDefault();
+                exportDropdown.classList.remove('show');
+
+                // Show export header for print
+                exportHeader.style.display = 'block';
+
+                window.print();
+
+                // Hide export header after print
+                setTimeout(() => {
+                    exportHeader.style.display = 'none';
+                }, 500);
+            });
+
+            // Helper functions
+            function showLoading() {
+                loadingOverlay.classList.add('active');
+            }
+
+            function hideLoading() {
+                loadingOverlay.classList.remove('active');
+            }
+
+            function getCurrentDateTime() {
+                const now = new Date();
+                return now.toISOString().slice(0, 19).replace(/:/g, '-').replace('T', '_');
+            }
+
+            // Delete modal functionality
+            const deleteModal = document.getElementById('deleteModal');
+            const deleteActivityBtn = document.getElementById('deleteActivityBtn');
+            const cancelDeleteBtn = document.getElementById('cancelDelete');
+            const closeModalBtn = document.querySelector('.close-modal');
+            const deleteForm = document.getElementById('deleteForm');
+
+            // Show modal when delete button is clicked
+            deleteActivityBtn.addEventListener('click', function () {
+                deleteModal.classList.add('active');
+            });
+
+            // Close modal functions
+            function closeModal() {
+                deleteModal.classList.remove('active');
+            }
+
+            cancelDeleteBtn.addEventListener('click', closeModal);
+            closeModalBtn.addEventListener('click', closeModal);
+
+            // Close modal when clicking outside
+            window.addEventListener('click', function (e) {
+                if (e.target === deleteModal) {
+                    closeModal();
+                }
+            });
+
+            // Handle form submission
+            deleteForm.addEventListener('submit', function (e) {
+                const submitBtn = this.querySelector('button[type="submit"]');
+                submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Deleting...';
+                submitBtn.disabled = true;
+            });
+
+            // Profile button functionality
+            document.querySelector('.profile-btn').addEventListener('click', function () {
+                alert('Profile page would open here!');
+            });
+        });
@@ -0,0 +1,42 @@
+        // Add animations to elements
+        document.addEventListener('DOMContentLoaded', function() {
+            const cards = document.querySelectorAll('.card-section, .report-card-header');
+            cards.forEach((card, index) => {
+                card.style.opacity = '0';
+                card.style.transform = 'translateY(20px)';
+                card.style.transition = `opacity 0.6s ease ${index * 0.1}s, transform 0.6s ease ${index * 0.1}s`;
+                
+                setTimeout(() => {
+                    card.style.opacity = '1';
+                    card.style.transform = 'translateY(0)';
+                }, 100);
+            });
+            
+            // Add hover effects to stat cards
+            const statCards = document.querySelectorAll('.stat-card-modern');
+            statCards.forEach(card => {
+                card.addEventListener('mouseenter', function() {
+                    this.style.transform = 'translateY(-5px)';
+                });
+                
+                card.addEventListener('mouseleave', function() {
+                    this.style.transform = 'translateY(0)';
+                });
+            });
+            
+            // Update profile picture display in sidebar
+            function updateProfilePictureDisplay() {
+                // Check if profile picture exists in sidebar
+                const sidebarAvatar = document.querySelector('.user-avatar');
+                const sidebarImg = sidebarAvatar.querySelector('img');
+                const sidebarIcon = sidebarAvatar.querySelector('i');
+                
+                // If profile picture exists, show image and hide icon
+                if (sidebarImg && sidebarImg.src) {
+                    sidebarImg.style.display = 'block';
+                    sidebarIcon.style.display = 'none';
+                }
+            }
+            
+            updateProfilePictureDisplay();
+        });
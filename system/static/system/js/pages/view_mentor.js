@@ -0,0 +1,117 @@
+        // Enhanced animations with Wow effects
+        document.addEventListener('DOMContentLoaded', function() {
+            // Add floating animation to mentor profile card
+            const mentorCard = document.querySelector('.mentor-profile-card');
+            const contactCard = document.querySelector('.contact-info-card');
+            
+            // Create particles effect for the mentor card on hover
+            if (mentorCard) {
+                mentorCard.addEventListener('mouseenter', function() {
+                    createParticles(this);
+                });
+            }
+            
+            // Enhanced intersection observer for staggered animations
+            const enhancedObserverOptions = {
+                threshold: 0.1,
+                rootMargin: '0px 0px -50px 0px'
+            };
+
+            const enhancedObserver = new IntersectionObserver((entries) => {
+                entries.forEach((entry, index) => {
+                    if (entry.isIntersecting) {
+                        // Stagger the animation with delay based on index
+                        setTimeout(() => {
+                            entry.target.style.opacity = '1';
+                            entry.target.style.transform = 'translateY(0) scale(1)';
+                        }, index * 200);
+                    }
+                });
+            }, enhancedObserverOptions);
+
+            // Observe all cards for animation with staggered effect
+            const cards = document.querySelectorAll('.mentor-profile-card, .contact-info-card, .contact-item, .no-mentor');
+            cards.forEach((card, index) => {
+                card.style.opacity = '0';
+                card.style.transform = 'translateY(30px) scale(0.95)';
+                card.style.transition = 'opacity 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.1), transform 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.1)';
+                card.style.transitionDelay = `${index * 0.1}s`;
+                enhancedObserver.observe(card);
+            });
+
+            // Active nav link highlighting
+            const currentPage = window.location.pathname;
+            document.querySelectorAll('.nav-link').forEach(link => {
+                if (link.getAttribute('href') === currentPage ||
+                    (currentPage === '/' && link.getAttribute('href').includes('homepage'))) {
+                    link.classList.add('active');
+                } else {
+                    link.classList.remove('active');
+                }
+            });
+
+            // Add glowing effect to mentor avatar on load
+            setTimeout(() => {
+                const mentorAvatar = document.querySelector('.mentor-avatar, .mentor-avatar-placeholder');
+                if (mentorAvatar) {
+                    mentorAvatar.style.boxShadow = '0 8px 25px rgba(26, 58, 143, 0.3), 0 0 0 4px rgba(26, 58, 143, 0.2)';
+                    
+                    // Pulsing effect
+                    setInterval(() => {
+                        mentorAvatar.style.boxShadow = '0 8px 25px rgba(26, 58, 143, 0.4), 0 0 0 4px rgba(26, 58, 143, 0.3)';
+                        setTimeout(() => {
+                            mentorAvatar.style.boxShadow = '0 8px 20px rgba(0, 0, 0, 0.15), 0 0 0 4px rgba(26, 58, 143, 0.2)';
+                        }, 800);
+                    }, 3000);
+                }
+            }, 1000);
+            
+            // Function to create particles effect
+            function createParticles(element) {
+                const rect = element.getBoundingClientRect();
+                const colors = ['#1a3a8f', '#0d1b4e', '#3b5fc9', '#6c8eff'];
+                
+                for (let i = 0; i < 8; i++) {
+                    const particle = document.createElement('div');
+                    particle.style.position = 'absolute';
+                    particle.style.width = '4px';
+                    particle.style.height = '4px';
+                    particle.style.backgroundColor = colors[Math.floor(Math.random() * colors.length)];
+                    particle.style.borderRadius = '50%';
+                    particle.style.left = Math.random() * rect.width + 'px';
+                    particle.style.top = Math.random() * rect.height + 'px';
+                    particle.style.zIndex = '0';
+                    particle.style.opacity = '0.7';
+                    
+                    element.appendChild(particle);
+                    
+                    // Animate particle
+                    const angle = Math.random() * Math.PI * 2;
+                    const distance = 20 + Math.random() * 30;
+                    
+                    const animation = particle.animate([
+                        { transform: 'translate(0, 0)', opacity: 0.7 },
+                        { transform: `translate(${Math.cos(angle) * distance}px, ${Math.sin(angle) * distance}px)`, opacity: 0 }
+                    ], {
+                        duration: 600 + Math.random() * 400,
+                        easing: 'cubic-bezier(0.1, 0.8, 0.2, 1)'
+                    });
+                    
+                    animation.onfinish = () => {
+                        particle.remove();
+                    };
+                }
+            }
+        });
+
+        // Add floating effect to decorative elements
+        function addFloatingEffects() {
+            const decorations = document.querySelectorAll('.profile-decoration');
+            decorations.forEach((dec, index) => {
+                dec.style.animation = `float ${6 + index * 2}s ease-in-out infinite`;
+                dec.style.animationDelay = `${index * 0.5}s`;
+            });
+        }
+
+        // Initialize floating effects
+        setTimeout(addFloatingEffects, 500);
@@ -0,0 +1,20 @@
+document.addEventListener('DOMContentLoaded', function() {
+    var indicator = document.createElement('div');
+    indicator.className = 'scroll-indicator-container';
+    indicator.innerHTML = '<div class="scroll-indicator-icon"><div class="scroll-indicator-dot"></div></div>';
+    document.body.appendChild(indicator);
+
+    function checkScroll() {
+        var hasScroll = document.documentElement.scrollHeight > window.innerHeight;
+        if (hasScroll && window.scrollY < 100) {
+            indicator.classList.add('visible');
+        } else {
+            indicator.classList.remove('visible');
+        }
+    }
+
+    window.addEventListener('scroll', checkScroll);
+    window.addEventListener('resize', checkScroll);
+    // Initial check
+    setTimeout(checkScroll, 500);
+});
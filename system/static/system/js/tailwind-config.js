@@ -0,0 +1,14 @@
+        // Disable Tailwind preflight to prevent CSS reset interference
+        tailwind.config = {
+            corePlugins: {
+                preflight: false,
+            },
+            theme: {
+                extend: {
+                    colors: {
+                        primary: '#1a3a8f',
+                        secondary: '#0d1b4e',
+                    }
+                }
+            }
+        }
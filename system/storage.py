@@ -0,0 +1,162 @@
+import hashlib
+import os
+import re
+import time
+
+from django.apps import apps
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.storage import FileSystemStorage, default_storage, storages
+from django.db.models import FileField
+from django.utils.functional import cached_property
+
+from .compression import precompress_file
+from .images import delete_derivatives
+
+# Content-addressed media. Uploads to fields using content_addressed_storage
+# are named after a hash of their bytes, e.g.
+# mentee_profile_pictures/3f/3fa2...9c.jpg, so the same file uploaded twice
+# is stored once and a URL never changes content - it can be cached forever.
+# Because rows may share a file, files are removed only when no row refers to
+# them: release() after replacing a file, gc_media for everything else.
+
+HASH_LENGTH = 40  # hex digits of SHA-256; fits FileField's 100-character names
+
+# Matches names this storage produces (and the derived/ renditions of them)
+CONTENT_ADDRESSED_NAME = re.compile(r'(?:^|/)([0-9a-f]{2})/(?:derived/)?(\1[0-9a-f]{%d})(?:-\w+)?\.\w+$' % (HASH_LENGTH - 2))
+
+
+def content_addressed_storage():
+    """Storage callable for FileField(storage=...); configured as STORAGES['content_addressed']"""
+    return storages['content_addressed']
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage that stores each distinct file once, under its content hash"""
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is decided in _save(); an existing file with the same
+        # hash already holds these bytes, so there is never a suffix to add
+        return name
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        if hasattr(content, 'seek'):
+            content.seek(0)
+
+        hashed = digest.hexdigest()[:HASH_LENGTH]
+        directory = os.path.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+        name = '/'.join(part for part in (directory, hashed[:2], hashed + extension) if part)
+        if self.exists(name):
+            return name
+        return super()._save(name, content)
+
+
+class FingerprintedStaticFilesStorage(ManifestStaticFilesStorage):
+    """collectstatic writes app.<hash>.css copies and a manifest; {% static %} links to those.
+
+    Until collectstatic has run (development, tests) there is no manifest and
+    plain names are used instead of failing. Text files also get .br/.gz
+    copies for serve_static to pick from by Accept-Encoding.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        for name in sorted(set(paths) | set(self.hashed_files.values())):
+            if self.exists(name):
+                precompress_file(self.path(name))
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    @cached_property
+    def fingerprinted_names(self):
+        return set(self.hashed_files.values())
+
+    def is_fingerprinted(self, name):
+        return name in self.fingerprinted_names
+
+
+def is_content_addressed(name):
+    return bool(CONTENT_ADDRESSED_NAME.search(name))
+
+
+def content_hash(name):
+    """The hash a content-addressed name was derived from, or None"""
+    match = CONTENT_ADDRESSED_NAME.search(name)
+    return match.group(2) if match else None
+
+
+def file_fields():
+    """(model, field name) for every FileField stored content-addressed"""
+    return [
+        (model, field.name)
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, FileField) and isinstance(field.storage, ContentAddressedStorage)
+    ]
+
+
+def reference_count(name):
+    """How many rows point at a stored file"""
+    return sum(model._default_manager.filter(**{field: name}).count() for model, field in file_fields())
+
+
+def release(name):
+    """Delete a file (and its renditions) if no row refers to it any more; returns whether it was deleted"""
+    if not name or reference_count(name):
+        return False
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    delete_derivatives(name)
+    return True
+
+
+def referenced_names():
+    names = set()
+    for model, field in file_fields():
+        names.update(
+            model._default_manager.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+            .values_list(field, flat=True).iterator()
+        )
+    return names
+
+
+def collect_garbage(grace_seconds=24 * 3600, dry_run=False):
+    """Delete content-addressed files no row refers to; returns [(name, bytes)] removed.
+
+    Files younger than ``grace_seconds`` are kept: an upload is written to
+    storage a moment before the row pointing at it is saved.
+    """
+    referenced = referenced_names()
+    referenced_hashes = {content_hash(name) for name in referenced}
+    # Upload directories, plus those of callable upload_to paths that hold files
+    roots = {field.upload_to.split('/')[0] for model, name in file_fields()
+             for field in [model._meta.get_field(name)] if isinstance(field.upload_to, str)}
+    roots |= {name.split('/')[0] for name in referenced if '/' in name}
+    location = default_storage.location
+    cutoff = time.time() - grace_seconds
+
+    removed = []
+    for root in sorted(roots):
+        for directory, _, filenames in os.walk(os.path.join(location, root)):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, location).replace(os.sep, '/')
+                if not is_content_addressed(name) or os.path.getmtime(path) > cutoff:
+                    continue
+                derived = '/derived/' in name
+                if (name in referenced) or (derived and content_hash(name) in referenced_hashes):
+                    continue
+                removed.append((name, os.path.getsize(path)))
+                if not dry_run:
+                    os.remove(path)
+    return removed
@@ -0,0 +1,28 @@
+from django import template
+from django.core.files.storage import default_storage
+
+from system.images import DERIVATIVE_SIZES, derivative_name, derivatives_available
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def picture_url(context, picture, size='avatar'):
+    """URL of a profile picture rendition: WebP when the browser accepts it, else JPEG.
+
+    Falls back to the original upload until its derivatives exist (new
+    uploads get them straight away; run generate_thumbnails for older ones).
+    Whether they exist comes from the cache, not the disk (see images.py).
+    Usage: <img src="{% picture_url mentee.profile_picture 'avatar' %}">
+    """
+    if not picture:
+        return ''
+    if size not in DERIVATIVE_SIZES:
+        raise template.TemplateSyntaxError(f"picture_url size must be one of {', '.join(DERIVATIVE_SIZES)}")
+
+    request = context.get('request')
+    accepts_webp = request is not None and 'image/webp' in request.headers.get('Accept', '')
+    if derivatives_available(picture.name):
+        # Renditions are written through the default storage, whatever stores the original
+        return default_storage.url(derivative_name(picture.name, size, 'webp' if accepts_webp else 'jpg'))
+    return picture.url
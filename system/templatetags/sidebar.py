@@ -0,0 +1,49 @@
+from django import template
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+from system import metrics
+from system.caching import (SIDEBAR_CACHE_TIMEOUT, SIDEBAR_COUNTERS, get_cache_version, profile_namespace,
+                            sidebar_counters)
+
+register = template.Library()
+
+SIDEBAR_TEMPLATES = {
+    'mentor': 'partials/sidebar_mentor.html',
+    'head': 'partials/sidebar_head.html',
+    'mentee': 'partials/sidebar_mentee.html',
+}
+
+
+@register.simple_tag(takes_context=True)
+def sidebar(context, active=''):
+    """The signed-in user's navigation sidebar, with ``active`` marking the current link.
+
+    Rendered once per user and reused until their profile changes (profile
+    version), an activity moves a badge (counter version) or the day turns
+    over; the profile and counters are only looked up to render a miss.
+    Usage: {% sidebar 'mentoring_schedule' %}
+    """
+    request = context.get('request')
+    user = context.get('user') or getattr(request, 'user', None)
+    if user is None or getattr(user, 'role', None) not in SIDEBAR_TEMPLATES:
+        return ''
+
+    # The avatar URL depends on whether the browser takes WebP (see picture_url)
+    accepts_webp = request is not None and 'image/webp' in request.headers.get('Accept', '')
+    key = 'sidebar:{}:{}:p{}:c{}:{}:{}:{}'.format(
+        user.role, user.pk, get_cache_version(profile_namespace(user.pk)), get_cache_version(SIDEBAR_COUNTERS),
+        timezone.now().date().isoformat(), active, 'webp' if accepts_webp else 'jpg',
+    )
+    html = cache.get(key)
+    metrics.record_cache('sidebar', html is not None)
+    if html is None:
+        html = render_to_string(SIDEBAR_TEMPLATES[user.role], {
+            'user': user,
+            'active': active,
+            'counters': sidebar_counters(user),
+        }, request=request)
+        cache.set(key, html, SIDEBAR_CACHE_TIMEOUT)
+    return mark_safe(html)
@@ -0,0 +1,40 @@
+import shutil
+import tempfile
+
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+from . import metrics
+
+
+class TestRunner(DiscoverRunner):
+    """DiscoverRunner that keeps the suite's cache and metrics out of the project.
+
+    Entries in the shared file cache outlive a run, and a new test database
+    reuses primary keys, so a sidebar cached by one run could be served to
+    a different user in the next. Metrics stay in memory (tests that need
+    the shared file point METRICS_DB at their own), and the requests the
+    suite made are forgotten before the exit flush could write them to the
+    real METRICS_DB.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.scratch = tempfile.mkdtemp(prefix='mmms-tests-')
+        self.overrides = override_settings(
+            CACHES={
+                'default': {
+                    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                    'LOCATION': self.scratch,
+                    'OPTIONS': {'MAX_ENTRIES': 10000},
+                },
+            },
+            METRICS_DB=None,
+        )
+        self.overrides.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.overrides.disable()
+        metrics.REGISTRY = metrics.Registry()
+        shutil.rmtree(self.scratch, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -1,3 +1,1323 @@
-from django.test import TestCase
+import asyncio
+import csv
+import gzip
+import hashlib
+import importlib
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from datetime import time, timedelta
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from PIL import Image
+
+from . import caching, compression, dashboards, events, images, importers, metrics, views
+from .api import encode_cursor
+from .filters import filter_activities
+from .exports import ASSIGNMENT_EXPORT_FIELDS, ATTENDANCE_EXPORT_FIELDS, MENTEE_EXPORT_FIELDS
+from .caching import bump_cache_version, get_mentor_facets, profile_namespace
+from .dashboards import (collect, gather, head_aggregates, head_context, mentee_aggregates, mentee_context,
+                         mentor_aggregates, mentor_context, reset_query_pool)
+from .importers import MENTEE_REQUIRED_COLUMNS, import_users
+from .images import DERIVATIVE_SIZES, derivative_name, generate_derivatives
+from .benchmarks import route_requests, measure_get, quiet_views, _dashboard_request
+from .instrumentation import duplicate_queries
+from .logs import RequestContextFilter
+from .middleware import QueryInstrumentationMiddleware, RequestLoggingMiddleware
+from .models import (Activity, Attendance, ChunkedUpload, CustomUser, HeadofMentorMentee, Mentee, Mentor, MentoringSession,
+                     MentorMenteeAssignment, RequestProfile)
+from .storage import collect_garbage, content_addressed_storage, content_hash, release
+from .views import serve_media
+from .seeding import seed_dataset, clear_dataset
+from .warmup import cache_is_process_local, compile_templates, template_names
+
+# Maximum queries per URL name, measured on a cold cache against SMALL_DATASET.
+# Lower a number when a view gets cheaper; raising one needs a reason in review.
+QUERY_BUDGETS = {
+    'activity_report': 5,
+    'add_mentee': 2,
+    'add_mentor': 2,
+    'api_activities': 3,
+    'api_assignments': 3,
+    'api_attendance': 3,
+    'api_mentees': 3,
+    'api_mentors': 3,
+    'assign_mentees_to_mentor': 8,
+    'assignment_details': 2,
+    'assignment_history': 6,
+    'assignment_history_mentor': 6,
+    'assignment_mentees_list': 16,
+    'assignment_mentors_list': 16,
+    'bulk_import': 2,
+    'bulk_reassign': 2,
+    'complete_mentoring_session': 18,
+    'create_activity': 3,
+    'create_activity_report': 6,
+    'create_mentoring_session': 4,
+    'delete_activity': 3,
+    'delete_activity_report': 4,
+    'delete_assignment': 2,
+    'delete_mentee': 19,  # deleting the user also clears RequestProfile.user and ChunkedUpload rows
+    'delete_mentor': 2,
+    'delete_mentoring_session': 3,
+    'edit_activity': 6,
+    'edit_activity_report': 4,
+    'edit_mentee': 15,
+    'edit_mentor': 3,
+    'event_stream': 0,
+    'export_assignments': 3,
+    'export_assignments_mentor': 3,
+    'export_attendance': 3,
+    'export_mentees': 3,
+    'get_mentor_data': 3,
+    'get_next_activity_id': 3,
+    'head_homepage': 9,
+    'login': 0,
+    'manage_mentees': 5,
+    'manage_mentors': 11,
+    'mentee_homepage': 7,
+    'mentor_assignments': 50,
+    'mentor_homepage': 7,
+    'mentor_mentee_activities': 6,
+    'mentor_update_profile': 5,  # one query reads the page state behind its ETag (conditional.py)
+    'mentor_view_mentee': 8,
+    'mentoring_schedule': 6,
+    'mentoring_schedule_calendar': 4,
+    'password_reset': 0,
+    'password_reset_complete': 0,
+    'password_reset_done': 0,
+    'quick_assign': 6,
+    'signup': 0,
+    'transfer_assignment': 8,
+    'update_personal_info': 4,  # page state, as mentor_update_profile
+    'upload_chunk': 3,
+    'upload_complete': 3,
+    'upload_start': 2,
+    'view_activity': 6,
+    'view_activity_report': 4,
+    'view_activity_schedules': 4,
+    'view_assigned_mentees': 5,
+    'view_assigned_mentor': 5,
+    'view_mentee': 5,  # page state, as mentor_update_profile
+    'view_mentor': 12,  # page state, as mentor_update_profile
+}
+
+# On a cold cache a page also renders the user's sidebar (templatetags/sidebar.py):
+# the profile (reused when the view already loaded it) and the badge count.
+# Later pages reuse the fragment, so budgets above cover the view alone.
+SIDEBAR_FILL_QUERIES = {'head': 1, 'mentor': 2, 'mentee': 2}
+
+# Views whose query count still scales with the data. Each is exempt from the
+# growth check (not from its budget) until fixed - remove the entry then.
+KNOWN_N_PLUS_ONE = {
+    'complete_mentoring_session': 'template reads attendance.mentee per row',
+    'edit_mentee': 'Mentor.has_vacancy counts active assignments per mentor in the dropdown',
+    'manage_mentors': 'Mentor.current_mentees_count per mentor row',
+    'mentor_assignments': 'gender and vacancy counts per mentor',
+    'quick_assign': 'Mentor.has_vacancy per candidate mentor',
+    'view_mentor': 'Mentor.current_mentees_count re-counted on every property access',
+}
+
+# Both datasets grow every list dimension: mentees per mentor, mentors and activities
+SMALL_DATASET = {'mentees': 40, 'mentors': 5, 'activities': 10}
+LARGE_DATASET = {'mentees': 200, 'mentors': 10, 'activities': 30}
+
+
+def describe_queries(name, url, queries, limit=10):
+    """Failure message listing the statements a view repeated"""
+    lines = [f"{name} ({url}) ran {len(queries)} queries. Repeated statements:"]
+    duplicates = duplicate_queries(queries)
+    for sql, count in duplicates[:limit]:
+        lines.append(f"  {count}x {sql}")
+    if not duplicates:
+        lines.append("  (none - every statement was distinct)")
+    return '\n'.join(lines)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class QueryBudgetTests(TestCase):
+    """Guard against views quietly picking up extra or per-row queries"""
+
+    def measure_routes(self):
+        """{url_name: (url, [sql, ...], role)} for every route, each on a cold cache"""
+        urlconf = importlib.import_module('system.urls')
+        measured = {}
+        for name, role, url, client in route_requests(urlconf):
+            if url is None:
+                self.fail(f"{name}: seeded data can't fill in its URL ({client})")
+            cache.clear()
+            with quiet_views():
+                _, _, queries = measure_get(client, url)
+            measured[name] = (url, queries, role)
+        return measured
+
+    def test_every_route_has_a_budget(self):
+        urlconf = importlib.import_module('system.urls')
+        names = {pattern.name for pattern in urlconf.urlpatterns if getattr(pattern, 'name', None)}
+        missing = sorted(names - set(QUERY_BUDGETS) - {'logout', 'password_reset_confirm'})
+        self.assertEqual(missing, [], f"Add QUERY_BUDGETS entries for: {', '.join(missing)}")
+
+    def test_views_stay_within_budget(self):
+        seed_dataset(**SMALL_DATASET)
+        for name, (url, queries, role) in self.measure_routes().items():
+            with self.subTest(view=name):
+                budget = QUERY_BUDGETS.get(name)
+                if budget is not None:
+                    budget += SIDEBAR_FILL_QUERIES.get(role, 0)
+                if budget is not None and len(queries) > budget:
+                    self.fail(f"Over budget ({budget}): " + describe_queries(name, url, queries))
+
+    def test_query_count_does_not_grow_with_rows(self):
+        seed_dataset(**SMALL_DATASET)
+        small = self.measure_routes()
+        clear_dataset()
+        seed_dataset(**LARGE_DATASET)
+        large = self.measure_routes()
+
+        for name, (url, queries, _) in large.items():
+            if name in KNOWN_N_PLUS_ONE or name not in small:
+                continue
+            with self.subTest(view=name):
+                small_count = len(small[name][1])
+                if len(queries) > small_count:
+                    self.fail(
+                        f"Query count grew with the data ({small_count} -> {len(queries)}): "
+                        + describe_queries(name, url, queries)
+                    )
+
+
+class QueryInstrumentationTests(TestCase):
+    """Server-Timing on every response; a log line per request, louder for suspect ones"""
+
+    def run_view(self, queries, statement='SELECT 1'):
+        def view(request):
+            with connection.cursor() as cursor:
+                for _ in range(queries):
+                    cursor.execute(statement)
+            return HttpResponse('ok')
+        return QueryInstrumentationMiddleware(view)(RequestFactory().get('/mmms/somewhere/'))
+
+    def test_server_timing_reports_queries(self):
+        response = self.run_view(2)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="2 queries", app;dur=[\d.]+$')
+
+    def test_ordinary_requests_log_at_debug(self):
+        with self.assertNoLogs('system.middleware', 'INFO'):
+            self.run_view(2)
+        with self.assertLogs('system.middleware', 'DEBUG') as logs:
+            self.run_view(2)
+        self.assertEqual([record.levelname for record in logs.records], ['DEBUG'])
+        self.assertEqual(logs.records[0].queries, 2)
+
+    def test_repeated_statement_warns(self):
+        with self.assertLogs('system.middleware', 'INFO') as logs:
+            self.run_view(10)  # SQL_N_PLUS_ONE_THRESHOLD
+        self.assertEqual([record.levelname for record in logs.records], ['INFO', 'WARNING'])
+        self.assertTrue(logs.records[0].n_plus_one)
+        self.assertIn('Possible N+1', logs.records[1].getMessage())
+        self.assertIn('ran 10 times: SELECT ?', logs.records[1].getMessage())
+
+    @override_settings(SLOW_REQUEST_MS=0)
+    def test_slow_requests_log_at_info(self):
+        with self.assertLogs('system.middleware', 'INFO') as logs:
+            self.run_view(1)
+        self.assertEqual([record.levelname for record in logs.records], ['INFO'])
+
+
+class RequestLoggingTests(TestCase):
+    """Correlation ids on responses and records; DEBUG records sampled per request"""
+
+    def test_echoes_a_well_formed_request_id(self):
+        response = self.client.get(reverse('login'), HTTP_X_REQUEST_ID='lb-7f3a.42_x')
+        self.assertEqual(response['X-Request-ID'], 'lb-7f3a.42_x')
+
+    def test_replaces_a_malformed_request_id(self):
+        for malformed in ('two words', 'x' * 65, 'id\r\nSet-Cookie: a=b'):
+            with self.subTest(request_id=malformed):
+                response = self.client.get(reverse('login'), HTTP_X_REQUEST_ID=malformed)
+                self.assertRegex(response['X-Request-ID'], r'^[0-9a-f]{32}$')
+
+    def log_request(self):
+        """Records a view's DEBUG and WARNING calls leave after the handler filter"""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        handler.addFilter(RequestContextFilter())
+        test_logger = logging.getLogger('system.tests.sampling')
+        test_logger.addHandler(handler)
+        test_logger.setLevel(logging.DEBUG)
+        test_logger.propagate = False  # keep them off the console
+        self.addCleanup(test_logger.removeHandler, handler)
+
+        def view(request):
+            test_logger.debug('row detail')
+            test_logger.warning('something odd')
+            return HttpResponse('ok')
+
+        response = RequestLoggingMiddleware(view)(RequestFactory().get('/'))
+        self.assertTrue(all(record.request_id == response['X-Request-ID'] for record in records))
+        return [(record.levelname, record.getMessage()) for record in records]
+
+    @override_settings(LOG_DEBUG_SAMPLE_RATE=0)
+    def test_unsampled_requests_drop_debug_but_keep_warnings(self):
+        self.assertEqual(self.log_request(), [('WARNING', 'something odd')])
+
+    @override_settings(LOG_DEBUG_SAMPLE_RATE=1.0)
+    def test_sampled_requests_keep_debug(self):
+        self.assertEqual(self.log_request(), [('DEBUG', 'row detail'), ('WARNING', 'something odd')])
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class MetricsEndpointTests(TestCase):
+    """/metrics access rules and cross-process aggregation"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(METRICS_DB=os.path.join(directory, 'metrics.sqlite3'))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        seed_dataset(mentees=10, mentors=2, heads=1, activities=2)
+        self.head = HeadofMentorMentee.objects.select_related('user').first().user
+        self.enterContext(quiet_views())
+
+    def scrape(self):
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+    def sample(self, text, series):
+        for line in text.splitlines():
+            if line.startswith(series + ' '):
+                return float(line.split()[-1])
+        return 0.0
+
+    def test_requires_staff(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.client.force_login(self.head)
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        with override_settings(METRICS_TOKEN='scrape-me'):
+            response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-me')
+            self.assertEqual(response.status_code, 200)
+
+    def test_counts_views_and_sums_processes(self):
+        self.head.is_staff = True
+        self.head.save()
+        self.client.force_login(self.head)
+        series = 'mmms_http_requests_total{method="GET",status="200",view="assignment_history"}'
+        before = self.sample(self.scrape(), series)
+
+        self.client.get(reverse('assignment_history'))
+        text = self.scrape()
+        self.assertEqual(self.sample(text, series), before + 1)
+        self.assertIn('mmms_http_request_duration_seconds_bucket{view="assignment_history",le="+Inf"}', text)
+        self.assertIn('mmms_cache_hit_ratio{cache="mentor_facets"}', text)
+
+        # Another worker's flushed totals are added in
+        other = metrics.Registry()
+        other.inc('mmms_http_requests_total', 5, view='assignment_history', method='GET', status='200')
+        saved, metrics.REGISTRY = metrics.REGISTRY, other
+        try:
+            metrics.flush()
+        finally:
+            metrics.REGISTRY = saved
+        self.assertEqual(self.sample(self.scrape(), series), before + 6)
+
+    def test_exited_workers_are_folded_into_retired_totals(self):
+        self.head.is_staff = True
+        self.head.save()
+        self.client.force_login(self.head)
+        series = 'mmms_http_requests_total{method="GET",status="200",view="assignment_history"}'
+        before = self.sample(self.scrape(), series)
+
+        for process in ('999901-aaaaaaaa', '999902-bbbbbbbb'):
+            worker = metrics.Registry()
+            worker.process = process
+            worker.inc('mmms_http_requests_total', 2, view='assignment_history', method='GET', status='200')
+            worker.inc('mmms_http_requests_in_progress')
+            saved, metrics.REGISTRY = metrics.REGISTRY, worker
+            try:
+                metrics.flush()
+            finally:
+                metrics.REGISTRY = saved
+
+        running = mock.patch.object(metrics, '_is_running', side_effect=lambda pid: pid < 999900)
+        with running:
+            text = self.scrape()
+        self.assertEqual(self.sample(text, series), before + 4)
+        self.assertEqual(self.sample(text, 'mmms_http_requests_in_progress'), 1)  # the scrape itself
+        processes = {row[0] for row in metrics._connection().execute('SELECT process FROM metric_series')}
+        self.assertEqual(processes, {metrics.REGISTRY.process, metrics.RETIRED_PROCESS})
+        # Folding is idempotent
+        with running:
+            self.assertEqual(self.sample(self.scrape(), series), before + 4)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'], PROFILE_RETENTION=2)
+class ProfilerTests(TestCase):
+    """?__profile captures, access and retention"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(PROFILE_DIR=directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.directory = directory
+        seed_dataset(mentees=10, mentors=2, heads=1, activities=2)
+        self.head = HeadofMentorMentee.objects.select_related('user').first().user
+        self.enterContext(quiet_views())
+
+    def test_flag_captures_profile_for_heads_only(self):
+        self.client.force_login(self.head)
+        url = reverse('assignment_history')
+        self.assertNotIn('X-Profile-ID', self.client.get(url))
+        self.assertFalse(RequestProfile.objects.exists())
+
+        response = self.client.get(url + '?__profile=memory')
+        capture = RequestProfile.objects.get(pk=response['X-Profile-ID'])
+        self.assertEqual(capture.view_name, 'assignment_history')
+        self.assertGreater(capture.query_count, 0)
+        self.assertTrue(capture.memory_top)
+        self.assertTrue(os.path.isfile(os.path.join(self.directory, capture.stats_file)))
+
+        self.client.force_login(Mentee.objects.select_related('user').first().user)
+        self.assertNotIn('X-Profile-ID', self.client.get(reverse('update_personal_info') + '?__profile'))
+
+    def test_old_captures_are_pruned_with_their_files(self):
+        self.client.force_login(self.head)
+        for _ in range(3):
+            self.client.get(reverse('assignment_history') + '?__profile')
+        kept = set(RequestProfile.objects.values_list('stats_file', flat=True))
+        self.assertEqual(len(kept), 2)
+        self.assertEqual(set(os.listdir(self.directory)), kept)
+
+
+class ProfilePictureDerivativeTests(TestCase):
+    """Renditions are generated at fixed sizes and picked by the template tag"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(MEDIA_ROOT=directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+        buffer = io.BytesIO()
+        Image.new('RGBA', (1600, 900), (200, 30, 30, 128)).save(buffer, 'PNG')
+        self.name = default_storage.save('mentee_profile_pictures/original.png', ContentFile(buffer.getvalue()))
+
+    def test_generates_every_size_and_format(self):
+        self.assertEqual(generate_derivatives(self.name), 6)
+        for size, (pixels, crop) in DERIVATIVE_SIZES.items():
+            for extension in ('webp', 'jpg'):
+                with default_storage.open(derivative_name(self.name, size, extension)) as stream:
+                    width, height = Image.open(stream).size
+                self.assertEqual(max(width, height), pixels)
+                if crop:
+                    self.assertEqual(width, height)
+        self.assertEqual(generate_derivatives(self.name), 0)
+
+    def test_tag_prefers_webp_and_falls_back_to_original(self):
+        template = Template("{% load profile_pictures %}{% picture_url picture 'avatar' %}")
+        picture = Mentee._meta.get_field('profile_picture').attr_class(None, Mentee._meta.get_field('profile_picture'), self.name)
+
+        def render(accept):
+            request = RequestFactory().get('/', HTTP_ACCEPT=accept)
+            return template.render(Context({'picture': picture, 'request': request}))
+
+        self.assertEqual(render('image/webp,*/*'), default_storage.url(self.name))
+        generate_derivatives(self.name)
+        self.assertTrue(render('text/html,image/webp,*/*').endswith('-avatar.webp'))
+        self.assertTrue(render('text/html').endswith('-avatar.jpg'))
+
+        # Later renders take availability from the cache, not the disk
+        with mock.patch.object(images, 'has_derivatives') as has_derivatives:
+            self.assertTrue(render('text/html').endswith('-avatar.jpg'))
+        has_derivatives.assert_not_called()
+
+    def test_deleting_renditions_clears_the_cached_answer(self):
+        generate_derivatives(self.name)
+        self.assertTrue(images.derivatives_available(self.name))
+        images.delete_derivatives(self.name)
+        self.assertFalse(images.derivatives_available(self.name))
+
+
+class SidebarCacheTests(TestCase):
+    """Sidebars render once per user and follow profile and activity changes"""
+
+    def setUp(self):
+        cache.clear()
+        seed_dataset(mentees=5, mentors=1, activities=3)
+        self.mentor = Mentor.objects.select_related('user').first()
+        self.template = Template("{% load sidebar %}{% sidebar 'mentoring_schedule' %}")
+
+    def render(self):
+        # A fresh user per call, as each request loads its own
+        request = RequestFactory().get('/')
+        request.user = type(self.mentor.user).objects.get(pk=self.mentor.user_id)
+        return self.template.render(Context({'request': request, 'user': request.user}))
+
+    def test_reuses_fragment_until_profile_changes(self):
+        first = self.render()
+        self.assertIn(self.mentor.MentorName, first)
+        self.assertIn('href="/mmms/mentor/schedule/" class="nav-link active"', first)
+        with self.assertNumQueries(1):  # only the user itself
+            self.assertEqual(self.render(), first)
+
+        self.mentor.MentorName = 'Renamed Mentor'
+        self.mentor.save()
+        self.assertIn('Renamed Mentor', self.render())
+
+    def test_badge_follows_activity_changes(self):
+        Activity.objects.filter(PrimaryMentor=self.mentor).delete()
+        self.assertNotIn('nav-badge', self.render())
+
+        Activity.objects.create(
+            ActivityID='SIDEBAR1', ActivityName='Check-in', ActivityType='mentoring', Location='Room 1',
+            Date=timezone.now().date() + timedelta(days=1), StartTime=time(9), EndTime=time(10),
+            CreatedBy=self.mentor.user, IsMentoringSession=True, PrimaryMentor=self.mentor,
+        )
+        self.assertIn('<span class="nav-badge">1</span>', self.render())
+
+    def test_bump_in_another_worker_reaches_this_one(self):
+        self.assertFalse(cache_is_process_local())
+        first = self.render()
+        # Another worker saves the mentor: its signal bumps the version through its own cache connection
+        Mentor.objects.filter(pk=self.mentor.pk).update(MentorName='Renamed Elsewhere')
+        with mock.patch.object(caching, 'cache', caches.create_connection('default')):
+            bump_cache_version(profile_namespace(self.mentor.user_id))
+        self.assertNotEqual(self.render(), first)
+        self.assertIn('Renamed Elsewhere', self.render())
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class MentorFacetCacheTests(TestCase):
+    """Filter dropdowns follow assignments made in any worker"""
+
+    def setUp(self):
+        cache.clear()
+        seed_dataset(mentees=4, mentors=2, activities=0)
+
+    def test_assignment_in_another_worker_refreshes_vacancies(self):
+        facets = {facet['MentorID']: facet['vacancy_count'] for facet in get_mentor_facets()}
+        mentor = Mentor.objects.order_by('MentorID').first()
+        mentee = Mentee.objects.exclude(assigned_mentor=mentor).first()
+        # The assignment is saved by another worker, whose signal bumps the facets through its own cache connection
+        with mock.patch.object(caching, 'cache', caches.create_connection('default')):
+            mentee.assign_to_mentor(mentor)
+        with self.assertNumQueries(1):
+            refreshed = {facet['MentorID']: facet['vacancy_count'] for facet in get_mentor_facets()}
+        self.assertEqual(refreshed[mentor.MentorID], facets[mentor.MentorID] - 1)
+
+
+class ListFragmentTests(TestCase):
+    """?fragment=rows returns only a list's rows and pagination, without the page's other queries"""
+
+    def setUp(self):
+        seed_dataset(mentees=30, mentors=3, heads=1, activities=12)
+        self.head = HeadofMentorMentee.objects.select_related('user').first().user
+        self.mentor = Mentor.objects.filter(mentee__isnull=False).select_related('user').first().user
+        self.enterContext(quiet_views())
+
+    def fetch(self, user, name, query=''):
+        self.client.force_login(user)
+        cache.clear()
+        with self.assertNumQueries(4):  # session, user, COUNT (or mentor) and the rows
+            response = self.client.get(reverse(name) + '?fragment=rows' + query)
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode()
+        self.assertNotIn('class="sidebar"', content)
+        self.assertNotIn('<html', content)
+        return content
+
+    def test_every_list_page_serves_its_rows(self):
+        for user, name, row in ((self.head, 'manage_mentees', 'mentee-row'),
+                                (self.head, 'assignment_history', 'assignment-row'),
+                                (self.head, 'mentor_mentee_activities', 'activity-row'),
+                                (self.mentor, 'view_assigned_mentees', 'mentee-row')):
+            with self.subTest(view=name):
+                self.assertIn(f'class="{row}', self.fetch(user, name))
+                page = self.client.get(reverse(name)).content.decode()
+                self.assertIn('data-list-fragment', page)
+                self.assertIn('class="sidebar"', page)
+
+    def test_filters_and_paging_apply_on_the_server(self):
+        unassigned = Mentee.objects.filter(assigned_mentor__isnull=True).count()
+        content = self.fetch(self.head, 'manage_mentees', '&status=unassigned&per_page=100')
+        self.assertEqual(content.count('class="mentee-row"'), unassigned)
+
+        content = self.fetch(self.head, 'mentor_mentee_activities', '&per_page=10&page=2')
+        self.assertEqual(content.count('class="activity-row"'), Activity.objects.count() - 10)
+        self.assertNotIn('fragment=rows', content)
+
+        # Pagination links point at the page, not the fragment, and keep the filters
+        content = self.fetch(self.head, 'assignment_history', '&status=active')
+        self.assertNotIn('fragment=', content)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ListApiTests(TestCase):
+    """Sparse fieldsets and keyset cursors on the read-only JSON lists"""
+
+    def setUp(self):
+        seed_dataset(mentees=25, mentors=3, heads=1, activities=4)
+        self.head = HeadofMentorMentee.objects.select_related('user').first().user
+        self.client.force_login(self.head)
+        self.enterContext(quiet_views())
+
+    def get(self, name, **params):
+        return self.client.get(reverse(name), params)
+
+    def test_returns_only_the_requested_fields(self):
+        response = self.get('api_mentees', fields='id,mentor_name', limit=5)
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(len(results), 5)
+        self.assertEqual(set(results[0]), {'id', 'mentor_name'})
+
+        response = self.get('api_mentees', fields='id,MenteeIC')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('MenteeIC', response.json()['error'])
+
+    def test_cursor_walks_every_row_once(self):
+        for name, model in (('api_mentees', Mentee), ('api_attendance', Attendance)):
+            with self.subTest(api=name):
+                seen, cursor = [], None
+                while True:
+                    params = {'fields': 'id', 'limit': 7}
+                    if cursor:
+                        params['cursor'] = cursor
+                    with self.assertNumQueries(3):  # session, user and the page
+                        page = self.get(name, **params).json()
+                    seen += [row['id'] for row in page['results']]
+                    cursor = page['next_cursor']
+                    if cursor is None:
+                        break
+                self.assertEqual(seen, list(model.objects.order_by('pk').values_list('pk', flat=True)))
+        self.assertEqual(self.get('api_mentors', cursor='not a cursor').status_code, 400)
+
+    def test_cursor_of_the_wrong_type_is_a_400(self):
+        # Valid base64 JSON, but attendance pages on an integer key
+        response = self.get('api_attendance', cursor=encode_cursor('abc'))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid cursor')
+
+    def test_malformed_dates_are_a_400(self):
+        for name in ('api_assignments', 'api_attendance'):
+            for params in ({'date_from': 'notadate'}, {'date_to': '2024-02-30'}):
+                with self.subTest(api=name, **params):
+                    response = self.get(name, **params)
+                    self.assertEqual(response.status_code, 400)
+                    self.assertIn('expected YYYY-MM-DD', response.json()['error'])
+        # The HTML page and its export share the filters
+        self.assertEqual(self.get('assignment_history', date_from='notadate').status_code, 400)
+        self.assertEqual(self.get('export_attendance', date_to='notadate').status_code, 400)
+        self.assertEqual(self.get('api_assignments', date_from='2000-01-01').status_code, 200)
+
+    def test_applies_the_list_page_filters(self):
+        unassigned = Mentee.objects.filter(assigned_mentor__isnull=True).count()
+        results = self.get('api_mentees', status='unassigned', limit=1000).json()['results']
+        self.assertEqual(len(results), unassigned)
+        self.assertTrue(all(row['mentor_id'] is None for row in results))
+
+    def test_heads_only(self):
+        mentor = Mentor.objects.select_related('user').first().user
+        self.client.force_login(mentor)
+        self.assertEqual(self.get('api_assignments').status_code, 403)
+
+
+class CsvExportTests(TestCase):
+    """Streamed CSV exports contain exactly the rows of the filtered list page"""
+
+    def setUp(self):
+        seed_dataset(mentees=60, mentors=4, heads=1, activities=6)
+        self.client.force_login(HeadofMentorMentee.objects.select_related('user').first().user)
+        self.enterContext(quiet_views())
+
+    def export(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        return list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+
+    def listed(self, name, **params):
+        return self.client.get(reverse(name), params).context['page_obj'].paginator.count
+
+    def test_exports_match_their_list_pages(self):
+        mentor = Mentor.objects.order_by('MentorID').first()
+        cases = [
+            ('export_mentees', 'manage_mentees', MENTEE_EXPORT_FIELDS, {'status': 'unassigned'}),
+            ('export_mentees', 'manage_mentees', MENTEE_EXPORT_FIELDS, {'search': 'Computer'}),
+            ('export_assignments', 'assignment_history', ASSIGNMENT_EXPORT_FIELDS,
+             {'mentor': mentor.MentorID, 'status': 'active'}),
+        ]
+        for export_name, list_name, fields, params in cases:
+            with self.subTest(export=export_name, **params):
+                rows = self.export(export_name, **params)
+                self.assertEqual(rows[0], [label for _, label in fields])
+                self.assertEqual(len(rows) - 1, self.listed(list_name, **params))
+                self.assertGreater(len(rows), 1)
+
+    def test_attendance_export_follows_the_activity_filters(self):
+        activity = Activity.objects.filter(attendance__isnull=False).order_by('ActivityID').first()
+        params = {'search': activity.ActivityID, 'attended': 'yes'}
+        rows = self.export('export_attendance', **params)
+        self.assertEqual(rows[0], [label for _, label in ATTENDANCE_EXPORT_FIELDS])
+        expected = Attendance.objects.filter(activity__ActivityID__icontains=activity.ActivityID, attended=True)
+        self.assertEqual(len(rows) - 1, expected.count())
+        attended = rows[0].index('Attended')
+        self.assertEqual({row[attended] for row in rows[1:]}, {'Present'})
+
+    def test_attendance_export_follows_the_status_and_type_filters(self):
+        today = timezone.now().date()
+        checked = []
+        for status, dates in (('completed', {'Date__lt': today}), ('upcoming', {'Date__gt': today})):
+            activity_type = Activity.objects.filter(attendance__isnull=False, **dates).values_list(
+                'ActivityType', flat=True).first()
+            if activity_type is None:
+                continue
+            with self.subTest(status=status, type=activity_type):
+                params = {'status': status, 'type': activity_type}
+                listed = set(filter_activities(Activity.objects.all(), params).values_list('ActivityID', flat=True))
+                rows = self.export('export_attendance', **params)
+                exported = [row[0] for row in rows[1:]]
+                self.assertTrue(exported)
+                self.assertLessEqual(set(exported), listed)
+                self.assertEqual(len(exported), Attendance.objects.filter(activity__ActivityID__in=listed).count())
+                # Activities the list hides have attendance, and none of it is exported
+                self.assertTrue(Attendance.objects.exclude(activity__ActivityID__in=listed).exists())
+                checked.append(status)
+        self.assertTrue(checked, 'the seeded activities should have attendance')
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'], IMPORT_UPLOAD_WORKERS=1)
+class ImportUsersTests(TestCase):
+    """CSV imports reject duplicates, survive insert races and set usable passwords"""
+
+    def setUp(self):
+        seed_dataset(mentees=2, mentors=1, heads=1, activities=0)
+        self.existing = Mentee.objects.select_related('user').first()
+
+    def csv(self, *rows):
+        stream = io.StringIO(newline='')
+        writer = csv.DictWriter(stream, fieldnames=MENTEE_REQUIRED_COLUMNS)
+        writer.writeheader()
+        for mentee_id, email, ic in rows:
+            writer.writerow({
+                'MenteeID': mentee_id, 'MenteeName': f'Mentee {mentee_id}', 'MenteeCourse': 'CS',
+                'MenteeSemester': '1', 'MenteeGender': 'female', 'MenteeEmail': email, 'MenteeIC': ic,
+            })
+        stream.seek(0)
+        return stream
+
+    def test_rejects_ids_already_taken_or_repeated_in_the_file(self):
+        result = import_users(self.csv(
+            (self.existing.MenteeID, 'new1@example.com', '900101010001'),
+            ('bcs2401-001', 'new2@example.com', '900101010002'),
+            ('BCS2401-001', 'new3@example.com', '900101010003'),
+        ), 'mentee', workers=1)
+        self.assertEqual(result['created'], 1)
+        self.assertEqual([(error['row'], error['error']) for error in result['errors']], [
+            (2, f'This ID already exists: {self.existing.MenteeID}'),
+            (4, 'This ID already exists: BCS2401-001'),
+        ])
+        # IDs are stored upper-case
+        self.assertTrue(Mentee.objects.filter(MenteeID='BCS2401-001').exists())
+
+    def test_rejects_emails_whatever_their_case(self):
+        result = import_users(self.csv(
+            ('BCS2401-001', self.existing.user.email.upper(), '900101010001'),
+            ('BCS2401-002', 'New@Example.com', '900101010002'),
+            ('BCS2401-003', 'new@example.COM', '900101010003'),
+        ), 'mentee', workers=1)
+        self.assertEqual(result['created'], 1)
+        self.assertEqual([error['row'] for error in result['errors']], [2, 4])
+        self.assertTrue(all(error['error'] == 'This email address is already registered.'
+                            for error in result['errors']))
+
+    def test_falls_back_to_row_by_row_when_the_batch_insert_conflicts(self):
+        # Another request took BCS2401-002 after the import read the existing identifiers
+        seen = importers._SeenValues(importers._ImportSpec('mentee'))
+        CustomUser.objects.create_user(username='bcs2401-002', email='taken@example.com', role='mentee')
+        with mock.patch.object(importers, '_SeenValues', return_value=seen):
+            result = import_users(self.csv(
+                ('BCS2401-001', 'new1@example.com', '900101010001'),
+                ('BCS2401-002', 'new2@example.com', '900101010002'),
+                ('BCS2401-003', 'new3@example.com', '900101010003'),
+            ), 'mentee', workers=1)
+        self.assertEqual(result['created'], 2)
+        self.assertEqual([(error['row'], error['id']) for error in result['errors']], [(3, 'BCS2401-002')])
+        self.assertEqual(set(Mentee.objects.filter(MenteeID__startswith='BCS2401').values_list('MenteeID', flat=True)),
+                         {'BCS2401-001', 'BCS2401-003'})
+
+    def test_initial_password_is_the_ic_number(self):
+        import_users(self.csv(('BCS2401-001', 'new1@example.com', '900101010001')), 'mentee', workers=1)
+        user = CustomUser.objects.get(username='bcs2401-001')
+        self.assertTrue(user.check_password('900101010001'))
+        self.assertFalse(user.check_password('BCS2401-001'))
+
+    def test_upload_hashes_in_a_bounded_pool(self):
+        self.client.force_login(HeadofMentorMentee.objects.select_related('user').first().user)
+        upload = SimpleUploadedFile('mentees.csv', self.csv(
+            ('BCS2401-001', 'new1@example.com', '900101010001')).getvalue().encode())
+        with quiet_views(), mock.patch.object(views, 'import_uploaded_file',
+                                              wraps=views.import_uploaded_file) as import_file:
+            self.client.post(reverse('bulk_import'), {'role': 'mentee', 'csv_file': upload})
+        self.assertEqual(import_file.call_args.kwargs['workers'], 1)
+        self.assertTrue(Mentee.objects.filter(MenteeID='BCS2401-001').exists())
+
+    @override_settings(IMPORT_UPLOAD_MAX_ROWS=2)
+    def test_upload_over_the_row_cap_points_to_the_command(self):
+        self.client.force_login(HeadofMentorMentee.objects.select_related('user').first().user)
+        rows = [(f'BCS2401-00{n}', f'new{n}@example.com', f'90010101000{n}') for n in range(1, 4)]
+        with quiet_views(), mock.patch.object(views, 'import_uploaded_file',
+                                              return_value={'created': 2, 'errors': []}) as import_file:
+            response = self.client.post(reverse('bulk_import'), {
+                'role': 'mentee', 'csv_file': SimpleUploadedFile('mentees.csv', self.csv(*rows).getvalue().encode()),
+            })
+            import_file.assert_not_called()
+            self.assertIn('manage.py import_users mentee',
+                          ' '.join(str(message) for message in response.context['messages']))
+
+            # A file at the cap still goes through
+            self.client.post(reverse('bulk_import'), {
+                'role': 'mentee', 'csv_file': SimpleUploadedFile('mentees.csv', self.csv(*rows[:2]).getvalue().encode()),
+            })
+            import_file.assert_called_once()
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class EventStreamTests(TestCase):
+    """Assignment and session events reach the affected users' event streams"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(EVENTS_DB=os.path.join(directory, 'events.sqlite3'))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        seed_dataset(mentees=8, mentors=2, heads=1, activities=0)
+        self.mentor = Mentor.objects.select_related('user').order_by('MentorID').first()
+        self.enterContext(quiet_views())
+
+    def schedule_session(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Activity.objects.create(
+                ActivityID='LIVE1', ActivityName='Check-in', ActivityType='mentoring', Location='Room 1',
+                Date=timezone.now().date() + timedelta(days=1), StartTime=time(9), EndTime=time(10),
+                CreatedBy=self.mentor.user, IsMentoringSession=True, PrimaryMentor=self.mentor,
+            )
+
+    def test_wsgi_response_carries_pending_events(self):
+        self.client.force_login(self.mentor.user)
+        first = self.client.get(reverse('event_stream'))
+        self.assertEqual(first['Content-Type'], 'text/event-stream')
+        last_id = re.search(r'^id: (\d+)$', first.content.decode(), re.M).group(1)
+
+        mentee = Mentee.objects.exclude(assignments__mentor=self.mentor).select_related('user').first()
+        with self.captureOnCommitCallbacks(execute=True):
+            mentee.assign_to_mentor(self.mentor)
+        body = self.client.get(reverse('event_stream'), HTTP_LAST_EVENT_ID=last_id).content.decode()
+        self.assertIn('retry: 30000', body)
+        self.assertIn('event: assignment.created', body)
+        self.assertIn('"counters":{"assigned_mentees":1}', body)
+
+        # The mentee heard about it too; heads have no stream
+        self.client.force_login(mentee.user)
+        self.assertIn(f'"mentor_id":"{self.mentor.MentorID}"',
+                      self.client.get(reverse('event_stream'), HTTP_LAST_EVENT_ID=last_id).content.decode())
+        self.client.force_login(HeadofMentorMentee.objects.first().user)
+        self.assertEqual(self.client.get(reverse('event_stream')).status_code, 403)
+
+    def test_transfer_is_published_once(self):
+        assignment = MentorMenteeAssignment.objects.filter(assignment_status='active').first()
+        with mock.patch.object(events, 'assignment_transferred') as transferred:
+            assignment.assignment_status = 'transferred'
+            assignment.save()
+            self.assertEqual(transferred.call_count, 1)
+
+            # Later saves of the transferred row, on this instance or a fresh one, are not transfers
+            assignment.notes = 'Moved for timetable reasons'
+            assignment.save()
+            reloaded = MentorMenteeAssignment.objects.get(pk=assignment.pk)
+            reloaded.notes = 'Edited in the admin'
+            reloaded.save()
+            deferred = MentorMenteeAssignment.objects.only('pk', 'notes').get(pk=assignment.pk)
+            deferred.save()
+        self.assertEqual(transferred.call_count, 1)
+
+    async def test_asgi_stream_pushes_new_sessions(self):
+        await self.async_client.aforce_login(self.mentor.user)
+        response = await self.async_client.get(reverse('event_stream'))
+        self.assertTrue(response.streaming)
+        content = response.streaming_content
+        try:
+            self.assertIn(b'retry: ', await anext(content))
+            await sync_to_async(self.schedule_session)()
+            message = (await asyncio.wait_for(anext(content), 5)).decode()
+        finally:
+            await content.aclose()
+        self.assertIn('event: session.created', message)
+        self.assertIn('"upcoming_sessions":1', message)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class DashboardTests(TransactionTestCase):
+    """The async homepages gather the same statistics as the sync ones, on pooled connections"""
+
+    def setUp(self):
+        seed_dataset(mentees=20, mentors=3, heads=1, activities=6)
+        self.addCleanup(reset_query_pool)
+
+    def test_concurrent_aggregates_match_sequential(self):
+        today = timezone.now().date()
+        mentor = Mentor.objects.filter(mentee__isnull=False).first()
+        mentee = Mentee.objects.filter(assigned_mentor=mentor).first()
+        threads = set()
+
+        def traced(aggregate):
+            def run():
+                threads.add(threading.current_thread().name)
+                return aggregate()
+            return run
+
+        for role, aggregates, build_context in (('head', head_aggregates(today), head_context),
+                                                ('mentor', mentor_aggregates(mentor, today), mentor_context),
+                                                ('mentee', mentee_aggregates(mentee, today), mentee_context)):
+            with self.subTest(role=role):
+                expected = build_context(collect(aggregates))
+                self.assertTrue(any(expected.values()))
+                traced_aggregates = {name: traced(aggregate) for name, aggregate in aggregates.items()}
+                self.assertEqual(build_context(async_to_sync(gather)(traced_aggregates)), expected)
+        self.assertTrue(threads and all(name.startswith('dashboard') for name in threads), threads)
+
+    def test_pooled_queries_are_instrumented_and_released(self):
+        user = HeadofMentorMentee.objects.select_related('user').first().user
+        aggregate_count = len(head_aggregates(timezone.now().date()))
+
+        # Server-Timing counts the same queries whichever view ran them
+        with mock.patch.object(dashboards, 'close_old_connections') as release, quiet_views():
+            QueryInstrumentationMiddleware(views.head_homepage)(_dashboard_request(user))  # fills the sidebar cache
+            sync = QueryInstrumentationMiddleware(views.head_homepage)(_dashboard_request(user))
+            concurrent = QueryInstrumentationMiddleware(
+                lambda request: async_to_sync(views.head_homepage_async)(request))(_dashboard_request(user))
+        queries = re.compile(r'desc="(\d+) queries"')
+        self.assertEqual(queries.search(concurrent['Server-Timing']).group(1),
+                         queries.search(sync['Server-Timing']).group(1))
+        # Pool threads apply CONN_MAX_AGE before and after every aggregate
+        self.assertEqual(release.call_count, 2 * aggregate_count)
+
+
+class ContentAddressedStorageTests(TestCase):
+    """Uploads are stored once under their hash and freed only when no row uses them"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(MEDIA_ROOT=directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        seed_dataset(mentees=2, mentors=1, seed=3)
+        self.first, self.second = Mentee.objects.order_by('MenteeID')[:2]
+
+    def upload(self, mentee, content=b'same picture bytes', name='photo.JPG'):
+        mentee.profile_picture.save(name, ContentFile(content))
+        return mentee.profile_picture.name
+
+    def test_identical_uploads_share_one_file(self):
+        name = self.upload(self.first)
+        self.assertEqual(self.upload(self.second, name='other.jpg'), name)
+        self.assertRegex(name, r'^mentee_profile_pictures/[0-9a-f]{2}/[0-9a-f]{40}\.jpg$')
+        self.assertEqual(len(os.listdir(os.path.dirname(content_addressed_storage().path(name)))), 1)
+
+        self.assertFalse(release(name))
+        self.first.profile_picture = None
+        self.first.save()
+        self.assertFalse(release(name))
+        self.assertTrue(content_addressed_storage().exists(name))
+        self.second.profile_picture = None
+        self.second.save()
+        self.assertTrue(release(name))
+        self.assertFalse(content_addressed_storage().exists(name))
+
+    def test_collect_garbage_keeps_referenced_and_recent_files(self):
+        kept = self.upload(self.first)
+        orphan = content_addressed_storage().save('mentee_profile_pictures/x.jpg', ContentFile(b'orphan'))
+        self.assertEqual(collect_garbage(), [])
+        self.assertEqual([name for name, _ in collect_garbage(grace_seconds=-60, dry_run=True)], [orphan])
+        collect_garbage(grace_seconds=-60)
+        self.assertFalse(content_addressed_storage().exists(orphan))
+        self.assertTrue(content_addressed_storage().exists(kept))
+
+    def test_serves_hashed_names_as_immutable(self):
+        name = self.upload(self.first)
+        request = RequestFactory().get('/media/' + name)
+        request.user = self.second.user
+        response = serve_media(request, name)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], f'"{content_hash(name)}"')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        request = RequestFactory().get('/media/' + name, HTTP_IF_NONE_MATCH=response['ETag'])
+        request.user = self.second.user
+        self.assertEqual(serve_media(request, name).status_code, 304)
+
+
+class MediaServingTests(TestCase):
+    """Uploads are served by role, in ranges, or handed to the front proxy"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(MEDIA_ROOT=directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        seed_dataset(mentees=6, mentors=2, heads=1, activities=0, seed=5)
+        self.mentor, self.other_mentor = Mentor.objects.select_related('user').order_by('MentorID')[:2]
+        mentees = list(Mentee.objects.select_related('user').order_by('MenteeID'))
+        self.invited, self.outsider = mentees[0], mentees[1]
+        self.invited.assigned_mentor = self.other_mentor
+        self.invited.save()
+        self.outsider.assigned_mentor = self.other_mentor
+        self.outsider.save()
+
+        activity = Activity.objects.create(
+            ActivityID='FILE1', ActivityName='Study plan', ActivityType='mentoring', Location='Room 2',
+            Date=timezone.now().date(), StartTime=time(9), EndTime=time(10),
+            CreatedBy=self.mentor.user, IsMentoringSession=True, PrimaryMentor=self.mentor,
+        )
+        Attendance.objects.create(activity=activity, mentee=self.invited)
+        session = MentoringSession.objects.create(activity=activity, topic='Planning')
+        session.materials.save('plan.pdf', ContentFile(bytes(range(256)) * 4))
+        self.url = settings.MEDIA_URL + session.materials.name
+        self.enterContext(quiet_views())
+
+    def get(self, user, **headers):
+        self.client.force_login(user)
+        return self.client.get(self.url, **headers)
+
+    def test_session_materials_follow_the_session(self):
+        self.assertEqual(self.get(self.mentor.user).status_code, 200)
+        self.assertEqual(self.get(self.invited.user).status_code, 200)
+        self.assertEqual(self.get(HeadofMentorMentee.objects.first().user).status_code, 200)
+        self.assertEqual(self.get(self.other_mentor.user).status_code, 404)
+        self.assertEqual(self.get(self.outsider.user).status_code, 404)
+        # Mentees of the session's mentor see it on their schedule
+        self.outsider.assigned_mentor = self.mentor
+        self.outsider.save()
+        self.assertEqual(self.get(self.outsider.user).status_code, 200)
+
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+        self.client.force_login(self.mentor.user)
+        self.assertEqual(self.client.get(settings.MEDIA_URL + '../settings.py').status_code, 404)
+
+    def test_range_and_conditional_requests(self):
+        full = self.get(self.mentor.user)
+        self.assertEqual(full['Accept-Ranges'], 'bytes')
+        body = b''.join(full.streaming_content)
+        self.assertEqual(len(body), 1024)
+
+        partial = self.get(self.mentor.user, HTTP_RANGE='bytes=100-199')
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial['Content-Range'], 'bytes 100-199/1024')
+        self.assertEqual(partial['Content-Type'], 'application/pdf')
+        self.assertEqual(b''.join(partial.streaming_content), body[100:200])
+        suffix = self.get(self.mentor.user, HTTP_RANGE='bytes=-24')
+        self.assertEqual(b''.join(suffix.streaming_content), body[-24:])
+        self.assertEqual(self.get(self.mentor.user, HTTP_RANGE='bytes=2048-').status_code, 416)
+
+        # A stale If-Range gets the whole file; a matching one the range
+        self.assertEqual(self.get(self.mentor.user, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"old"').status_code, 200)
+        self.assertEqual(self.get(self.mentor.user, HTTP_RANGE='bytes=0-9',
+                                  HTTP_IF_RANGE=full['ETag']).status_code, 206)
+        self.assertEqual(self.get(self.mentor.user, HTTP_IF_NONE_MATCH=full['ETag']).status_code, 304)
+        self.assertEqual(self.get(self.mentor.user, HTTP_IF_MODIFIED_SINCE=full['Last-Modified']).status_code, 304)
+        self.assertTrue(full['Cache-Control'].startswith('private'))
+
+    def test_front_proxy_sends_the_file(self):
+        name = self.url[len(settings.MEDIA_URL):]
+        with self.settings(MEDIA_SENDFILE='x-accel-redirect'):
+            response = self.get(self.mentor.user, HTTP_RANGE='bytes=0-9')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['X-Accel-Redirect'], '/protected-media/' + name)
+            self.assertEqual(response['Content-Type'], 'application/pdf')
+            self.assertEqual(response.content, b'')
+        with self.settings(MEDIA_SENDFILE='x-sendfile'):
+            response = self.get(self.mentor.user)
+            self.assertEqual(response['X-Sendfile'], content_addressed_storage().path(name))
+
+
+class ConditionalPageTests(TestCase):
+    """Detail and profile pages answer 304 until something they show changes"""
+
+    def setUp(self):
+        seed_dataset(mentees=6, mentors=2, heads=1, activities=0, seed=9)
+        self.head = HeadofMentorMentee.objects.select_related('user').first().user
+        self.mentee = Mentee.objects.select_related('assigned_mentor__user', 'user').exclude(assigned_mentor=None).first()
+        self.enterContext(quiet_views())
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_unchanged_page_is_not_rendered_again(self):
+        self.client.force_login(self.head)
+        url = reverse('view_mentee', args=[self.mentee.MenteeID])
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('no-cache', first['Cache-Control'])
+        # Session, user and the page state
+        with self.assertNumQueries(3), self.assertTemplateNotUsed('head_view_mentee.html'):
+            self.assertEqual(self.revalidate(url, first).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified']).status_code, 304)
+
+        # Editing the mentee, or the mentor shown on their page, changes it
+        self.mentee.save()
+        second = self.revalidate(url, first)
+        self.assertEqual(second.status_code, 200)
+        self.mentee.assigned_mentor.save()
+        self.assertEqual(self.revalidate(url, second).status_code, 200)
+
+    def test_mentor_page_follows_their_mentees_and_badges(self):
+        self.client.force_login(self.head)
+        mentor = self.mentee.assigned_mentor
+        url = reverse('view_mentor', args=[mentor.MentorID])
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        Mentee.objects.filter(pk=self.mentee.pk).update(MenteeName='Renamed')  # no updated_at bump
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        Mentee.objects.get(pk=self.mentee.pk).save()
+        response = self.revalidate(url, response)
+        self.assertContains(response, 'Renamed')
+
+        # A new activity moves the sidebar badges on every page
+        Activity.objects.create(
+            ActivityID='ETAG1', ActivityName='Briefing', ActivityType='meeting', Location='Hall',
+            Date=timezone.now().date() + timedelta(days=3), StartTime=time(9), EndTime=time(10),
+            CreatedBy=self.head,
+        )
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_profile_form_renders_for_flash_messages(self):
+        self.client.force_login(self.mentee.user)
+        url = reverse('update_personal_info')
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        # A rejected upload saves nothing but leaves a message for the next page to show
+        self.client.post(url, {'profile_picture': SimpleUploadedFile('notes.txt', b'text', 'text/plain')})
+        self.assertContains(self.revalidate(url, response), 'Please upload a valid image file.')
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+
+@override_settings(UPLOAD_CHUNK_SIZE=4)
+class ChunkedUploadTests(TestCase):
+    """Materials arrive in verified chunks, resume by offset and attach to the session"""
+
+    def setUp(self):
+        for setting in ('MEDIA_ROOT', 'UPLOAD_TEMP_DIR'):
+            directory = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, directory)
+            settings_override = override_settings(**{setting: directory})
+            settings_override.enable()
+            self.addCleanup(settings_override.disable)
+        seed_dataset(mentees=4, mentors=1, heads=1, activities=10)
+        self.session = MentoringSession.objects.select_related('activity__PrimaryMentor__user').first()
+        self.client.force_login(self.session.activity.PrimaryMentor.user)
+        self.enterContext(quiet_views())
+
+    def start(self, content, **extra):
+        response = self.client.post(reverse('upload_start'), dict({
+            'target': 'session_materials', 'activity_id': self.session.activity.ActivityID,
+            'filename': 'slides.pdf', 'size': len(content),
+        }, **extra))
+        self.assertEqual(response.status_code, 201)
+        return reverse('upload_chunk', args=[response.json()['upload_id']])
+
+    def put(self, url, offset, chunk, checksum=None):
+        headers = {'HTTP_UPLOAD_OFFSET': str(offset)}
+        if checksum:
+            headers['HTTP_UPLOAD_CHECKSUM'] = checksum
+        return self.client.put(url, chunk, content_type='application/octet-stream', **headers)
+
+    def test_resumes_from_reported_offset_and_attaches(self):
+        content = b'0123456789'
+        url = self.start(content, checksum=hashlib.sha256(content).hexdigest())
+        self.assertEqual(self.put(url, 0, content[:4]).json()['offset'], 4)
+        # A retried or out-of-order chunk is refused with the offset to resume from
+        conflict = self.put(url, 0, content[:4])
+        self.assertEqual((conflict.status_code, conflict.json()['offset']), (409, 4))
+        self.assertEqual(self.put(url, 4, content[4:8], checksum='0' * 64).status_code, 422)
+        self.assertEqual(self.client.get(url).json()['offset'], 4)
+        self.put(url, 4, content[4:8], checksum=hashlib.sha256(content[4:8]).hexdigest())
+        self.assertEqual(self.client.post(url + 'complete/').status_code, 409)
+        self.put(url, 8, content[8:])
+        self.assertTrue(self.client.post(url + 'complete/').json()['completed'])
+
+        upload = ChunkedUpload.objects.get()
+        response = self.client.post(
+            reverse('complete_mentoring_session', args=[self.session.activity.ActivityID]),
+            {'session_materials_upload': str(upload.upload_id)}, HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+        self.assertTrue(response.json()['success'])
+        self.session.refresh_from_db()
+        self.assertTrue(self.session.completed)
+        with self.session.materials.open('rb') as stream:
+            self.assertEqual(stream.read(), content)
+        self.assertFalse(ChunkedUpload.objects.exists())
+        self.assertEqual(os.listdir(settings.UPLOAD_TEMP_DIR), [])
+
+    def test_whole_file_checksum_mismatch_restarts(self):
+        url = self.start(b'abcd', checksum=hashlib.sha256(b'wxyz').hexdigest())
+        self.put(url, 0, b'abcd')
+        response = self.client.post(url + 'complete/')
+        self.assertEqual((response.status_code, response.json()['offset']), (422, 0))
+
+    def test_only_the_owner_can_use_an_upload(self):
+        self.assertEqual(self.client.post(reverse('upload_start'), {
+            'target': 'session_materials', 'activity_id': self.session.activity.ActivityID,
+            'filename': 'script.exe', 'size': 10,
+        }).status_code, 400)
+        url = self.start(b'abcd')
+        self.client.force_login(HeadofMentorMentee.objects.select_related('user').first().user)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class StaticBundleTests(TestCase):
+    """Pages link fingerprinted stylesheets, which are served as immutable"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(STATIC_ROOT=directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+    def get_static(self, path):
+        response = self.client.get(settings.STATIC_URL + path)
+        response.close()
+        return response
+
+    def test_fingerprinted_names_are_immutable(self):
+        page = self.client.get(reverse('login')).content.decode()
+        self.assertNotIn('<style>', page)
+        stylesheet = re.search(r'href="/static/(system/css/pages/login\.[0-9a-f]{12}\.css)"', page).group(1)
+
+        response = self.get_static(stylesheet)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(self.get_static('system/css/pages/login.css')['Cache-Control'], 'no-cache')
+
+    def test_serves_precompressed_copies(self):
+        name = 'system/css/pages/login.css'
+        response = self.client.get(settings.STATIC_URL + name, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        body = b''.join(response.streaming_content)
+        response.close()
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'].split(';')[0], 'text/css')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        with open(os.path.join(settings.STATIC_ROOT, name), 'rb') as original:
+            self.assertEqual(gzip.decompress(body), original.read())
+
+        self.assertFalse(self.get_static(name).has_header('Content-Encoding'))
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class CompressionTests(TestCase):
+    """Text responses are compressed per Accept-Encoding; cached JSON reuses its compressed body"""
+
+    def setUp(self):
+        cache.clear()
+        seed_dataset(mentees=10, mentors=2, activities=6)
+        self.enterContext(quiet_views())
+
+    def test_compresses_pages_the_client_accepts(self):
+        plain = self.client.get(reverse('login'))
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        compressed = self.client.get(reverse('login'), HTTP_ACCEPT_ENCODING='gzip;q=0.5, identity')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertEqual(int(compressed['Content-Length']), len(compressed.content))
+        self.assertLess(len(compressed.content), len(plain.content))
+        self.assertIn(b'</html>', gzip.decompress(compressed.content))
+
+        refused = self.client.get(reverse('login'), HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertFalse(refused.has_header('Content-Encoding'))
+
+    @override_settings(COMPRESS_MIN_SIZE=10)
+    def test_json_variants_are_cached_by_etag(self):
+        mentor = Mentor.objects.select_related('user').first()
+        for day in range(1, 11):
+            activity = Activity.objects.create(
+                ActivityID=f'CAL{day:02d}', ActivityName='Weekly check-in', ActivityType='mentoring',
+                Location='Room 1', Date=timezone.now().date().replace(day=day), StartTime=time(9), EndTime=time(10),
+                CreatedBy=mentor.user, IsMentoringSession=True, PrimaryMentor=mentor,
+            )
+            MentoringSession.objects.create(activity=activity, topic='Progress')
+        self.client.force_login(mentor.user)
+        url = reverse('mentoring_schedule_calendar')
+        first = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(first['Content-Encoding'], 'gzip')
+        self.assertTrue(first['ETag'].startswith('W/"'))
+        self.assertIsNotNone(cache.get(f'compressed_variants:gzip:{first["ETag"][2:]}'))
+
+        second = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        # gzip output carries random header bytes, so equal bodies mean the cached copy was used
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(json.loads(gzip.decompress(second.content))['month'], timezone.now().strftime('%Y-%m'))
+
+    def test_pages_with_a_csrf_token_are_never_brotli(self):
+        request = RequestFactory().get('/')
+        with mock.patch.object(compression, 'brotli', object()):
+            self.assertEqual(compression.response_encodings(request, b'{"month": "2024-05"}'), ['br', 'gzip'])
+            self.assertEqual(compression.response_encodings(
+                request, b'<input type="hidden" name="csrfmiddlewaretoken" value="x">'), ['gzip'])
+            request.META['CSRF_COOKIE_NEEDS_UPDATE'] = True
+            self.assertEqual(compression.response_encodings(request, b'<p>token in a script</p>'), ['gzip'])
+
+            # The login form carries the token, so a brotli-first client still gets gzip
+            response = self.client.get(reverse('login'), HTTP_ACCEPT_ENCODING='br, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+
+class WarmupTests(TestCase):
+    """`manage.py warmup` compiles every template and primes shared caches"""
+
+    def test_compiles_every_template(self):
+        timings = dict(compile_templates())
+        self.assertEqual(set(timings), set(template_names()))
+        self.assertIn('partials/sidebar_mentor.html', timings)
+        self.assertEqual([name for name, seconds in timings.items() if seconds is None], [])
+
+    def test_command_primes_mentor_facets(self):
+        cache.clear()
+        seed_dataset(mentees=4, mentors=2, activities=1)
+        mentors = Mentor.objects.count()
+        output = io.StringIO()
+        call_command('warmup', top=0, stdout=output)
+        self.assertIn('base.html', output.getvalue())
+        self.assertIn(f'mentor facets ({mentors})', output.getvalue())
+        with self.assertNumQueries(0):
+            self.assertEqual(len(get_mentor_facets()), mentors)
@@ -0,0 +1,193 @@
+import hashlib
+import logging
+import os
+import re
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.utils import timezone
+
+from .models import ChunkedUpload
+
+# Chunked, resumable uploads for session materials and report files. The
+# browser creates an upload (start_upload), PUTs consecutive chunks at the
+# offset the server reports (append_chunk) - after a dropped connection it
+# asks for the offset and carries on from there - then completes it
+# (finish_upload), which checks the size and the whole-file checksum. The
+# form that owns the file submits the upload id instead of the file and the
+# view attaches it with claimed_file(). Chunks are copied to the part file in
+# small pieces, so memory use does not grow with the file.
+
+UPLOAD_EXTENSIONS = {
+    'session_materials': {'.pdf', '.doc', '.docx', '.jpg', '.jpeg', '.png', '.zip',
+                          '.ppt', '.pptx', '.xls', '.xlsx', '.mp4', '.mov', '.webm', '.mp3', '.m4a'},
+    'report_file': {'.pdf', '.doc', '.docx', '.txt', '.jpg', '.jpeg', '.png'},
+}
+COPY_BUFFER = 64 * 1024
+SHA256_HEX = re.compile(r'^[0-9a-f]{64}$')
+
+logger = logging.getLogger(__name__)
+
+
+class UploadError(Exception):
+    """A rejected upload request; ``status`` is the HTTP status to answer with"""
+
+    def __init__(self, message, status=400, offset=None):
+        super().__init__(message)
+        self.status = status
+        self.offset = offset
+
+
+def chunk_size():
+    return getattr(settings, 'UPLOAD_CHUNK_SIZE', 4 * 1024 * 1024)
+
+
+def upload_dir():
+    return str(getattr(settings, 'UPLOAD_TEMP_DIR', os.path.join(settings.BASE_DIR, '.uploads')))
+
+
+def part_path(upload):
+    return os.path.join(upload_dir(), f'{upload.upload_id.hex}.part')
+
+
+def start_upload(user, activity, target, filename, size, checksum=''):
+    """Validate and register a new upload; returns the ChunkedUpload"""
+    if target not in UPLOAD_EXTENSIONS:
+        raise UploadError(f'Unknown upload target {target!r}')
+    filename = os.path.basename(filename or '').strip()
+    if os.path.splitext(filename)[1].lower() not in UPLOAD_EXTENSIONS[target]:
+        raise UploadError(f'{filename or "This file"} is not an accepted file type')
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise UploadError('size must be the file size in bytes')
+    max_size = getattr(settings, 'UPLOAD_MAX_SIZE', 1024 ** 3)
+    if size <= 0 or size > max_size:
+        raise UploadError(f'Files must be between 1 byte and {max_size // 1024 ** 2} MB', status=413)
+    checksum = (checksum or '').lower()
+    if checksum and not SHA256_HEX.match(checksum):
+        raise UploadError('checksum must be a hex SHA-256 digest')
+
+    prune_stale_uploads()
+    upload = ChunkedUpload.objects.create(
+        user=user, activity=activity, target=target, filename=filename[:255], size=size, checksum=checksum,
+    )
+    os.makedirs(upload_dir(), exist_ok=True)
+    open(part_path(upload), 'wb').close()
+    return upload
+
+
+def append_chunk(upload, offset, stream, length, checksum=None):
+    """Write ``length`` bytes read from ``stream`` at ``offset``; returns the new offset.
+
+    The chunk only counts once all of it arrived (and matches ``checksum``,
+    the chunk's hex SHA-256, when given); otherwise the part file is cut back
+    and the client resends the chunk from the offset it is told.
+    """
+    if upload.completed_at:
+        raise UploadError('Upload is already complete', status=409, offset=upload.offset)
+    if offset != upload.offset:
+        raise UploadError(f'Expected offset {upload.offset}', status=409, offset=upload.offset)
+    if length <= 0 or length > chunk_size() or offset + length > upload.size:
+        raise UploadError(f'Chunks must be 1 to {chunk_size()} bytes and end within the file',
+                          status=413, offset=upload.offset)
+
+    digest = hashlib.sha256()
+    received = 0
+    with open(part_path(upload), 'r+b') as part:
+        part.seek(offset)
+        part.truncate()  # drop bytes of an earlier attempt at this chunk
+        while received < length:
+            piece = stream.read(min(COPY_BUFFER, length - received))
+            if not piece:
+                break
+            part.write(piece)
+            digest.update(piece)
+            received += len(piece)
+        if received != length or (checksum and digest.hexdigest() != checksum.lower()):
+            part.truncate(offset)
+            if received != length:
+                raise UploadError(f'Chunk ended after {received} of {length} bytes', offset=offset)
+            raise UploadError('Chunk checksum mismatch', status=422, offset=offset)
+
+    # Only advance if no concurrent request moved the offset meanwhile
+    if not ChunkedUpload.objects.filter(pk=upload.pk, offset=offset).update(
+            offset=offset + length, updated_at=timezone.now()):
+        upload.refresh_from_db()
+        raise UploadError(f'Expected offset {upload.offset}', status=409, offset=upload.offset)
+    upload.offset = offset + length
+    return upload.offset
+
+
+def finish_upload(upload):
+    """Check the assembled file and mark the upload complete"""
+    if upload.completed_at:
+        return upload
+    if upload.offset != upload.size:
+        raise UploadError(f'Only {upload.offset} of {upload.size} bytes received', status=409, offset=upload.offset)
+
+    path = part_path(upload)
+    if os.path.getsize(path) != upload.size:
+        raise UploadError('Stored size does not match; restart the upload', status=409, offset=0)
+    if upload.checksum:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as part:
+            for piece in iter(lambda: part.read(COPY_BUFFER), b''):
+                digest.update(piece)
+        if digest.hexdigest() != upload.checksum:
+            open(path, 'wb').close()
+            upload.offset = 0
+            upload.save(update_fields=['offset', 'updated_at'])
+            raise UploadError('File checksum mismatch; restart the upload', status=422, offset=0)
+
+    upload.completed_at = timezone.now()
+    upload.save(update_fields=['completed_at', 'updated_at'])
+    logger.info('Upload %s complete: %s, %d bytes', upload.upload_id, upload.filename, upload.size)
+    return upload
+
+
+@contextmanager
+def claimed_file(request, activity, target):
+    """The file for ``target`` of a submitted form: a regular multipart file, or a
+    completed chunked upload whose id was posted as ``<target>_upload``.
+
+    Yields None when neither was sent. A chunked upload is discarded once the
+    block exits without error, by which time the caller has saved it to a field.
+    """
+    if target in request.FILES:
+        yield request.FILES[target]
+        return
+    upload_id = request.POST.get(f'{target}_upload')
+    upload = None
+    if upload_id:
+        try:
+            upload = ChunkedUpload.objects.get(
+                upload_id=upload_id, user=request.user, activity=activity, target=target, completed_at__isnull=False,
+            )
+        except (ChunkedUpload.DoesNotExist, ValidationError):
+            logger.warning('Ignoring unknown or incomplete upload %s for %s', upload_id, target)
+    if upload is None:
+        yield None
+        return
+    with open(part_path(upload), 'rb') as part:
+        yield File(part, name=upload.filename)
+    upload.delete()  # post_delete removes the part file
+
+
+def remove_part_file(upload):
+    path = part_path(upload)
+    if os.path.isfile(path):
+        os.remove(path)
+
+
+def prune_stale_uploads(max_age=None):
+    """Delete uploads untouched for UPLOAD_EXPIRY (abandoned or never claimed)"""
+    if max_age is None:
+        max_age = getattr(settings, 'UPLOAD_EXPIRY', timedelta(days=1))
+    stale = list(ChunkedUpload.objects.filter(updated_at__lt=timezone.now() - max_age))
+    for upload in stale:
+        upload.delete()
+    return len(stale)
@@ -2,7 +2,6 @@ from django.urls import path
 from . import views
 from django.contrib.auth import views as auth_views
 from django.conf import settings
-from django.conf.urls.static import static
 
 urlpatterns = [
     path('', views.login_view, name='login'),
@@ -15,10 +14,16 @@ urlpatterns = [
     path('password-reset-confirm/<uidb64>/<token>/', auth_views.PasswordResetConfirmView.as_view(template_name='password_reset_confirm.html'), name='password_reset_confirm'),
     path('password-reset-complete/', auth_views.PasswordResetCompleteView.as_view(template_name='password_reset_complete.html'), name='password_reset_complete'),
 
-    # Homepage URLs
-    path('homepage/mentee/', views.mentee_homepage, name='mentee_homepage'),
-    path('homepage/mentor/', views.mentor_homepage, name='mentor_homepage'),
-    path('homepage/head/', views.head_homepage, name='head_homepage'),
+    # Live updates (server-sent events) for mentors and mentees
+    path('events/', views.event_stream, name='event_stream'),
+
+    # Homepage URLs (async versions run their statistics concurrently, see system/dashboards.py)
+    path('homepage/mentee/', views.mentee_homepage_async if settings.ASYNC_DASHBOARDS else views.mentee_homepage,
+         name='mentee_homepage'),
+    path('homepage/mentor/', views.mentor_homepage_async if settings.ASYNC_DASHBOARDS else views.mentor_homepage,
+         name='mentor_homepage'),
+    path('homepage/head/', views.head_homepage_async if settings.ASYNC_DASHBOARDS else views.head_homepage,
+         name='head_homepage'),
 
     # Mentee URLs
     path('mentee/mentor/', views.view_assigned_mentor, name='view_assigned_mentor'),
@@ -29,6 +34,7 @@ urlpatterns = [
     path('mentor/mentees/', views.view_assigned_mentees, name='view_assigned_mentees'),
     path('mentor/mentees/view/<str:mentee_id>/', views.mentor_view_mentee, name='mentor_view_mentee'),
     path('mentor/schedule/', views.mentoring_schedule, name='mentoring_schedule'),
+    path('mentor/schedule/calendar.json', views.mentoring_schedule_calendar, name='mentoring_schedule_calendar'),
     path('mentor/session/create/', views.create_mentoring_session, name='create_mentoring_session'),
     path('mentor/session/<str:activity_id>/complete/', views.complete_mentoring_session, name='complete_mentoring_session'),
     path('mentor/session/<str:activity_id>/delete/', views.delete_mentoring_session, name='delete_mentoring_session'),
@@ -38,10 +44,15 @@ urlpatterns = [
     path('mentor/reports/edit/<str:activity_id>/', views.edit_activity_report, name='edit_activity_report'),
     path('mentor/reports/delete/<str:activity_id>/', views.delete_activity_report, name='delete_activity_report'),
     path('mentor/profile/', views.mentor_update_profile, name='mentor_update_profile'), 
+    path('mentor/uploads/', views.upload_start, name='upload_start'),
+    path('mentor/uploads/<uuid:upload_id>/', views.upload_chunk, name='upload_chunk'),
+    path('mentor/uploads/<uuid:upload_id>/complete/', views.upload_complete, name='upload_complete'),
 
     # Head URLs - Mentee Management
     path('head/mentees/', views.manage_mentees, name='manage_mentees'),
     path('head/mentees/add/', views.add_mentee, name='add_mentee'),
+    path('head/mentees/export/', views.export_mentees, name='export_mentees'),
+    path('head/import/', views.bulk_import, name='bulk_import'),
     path('head/mentees/view/<str:mentee_id>/', views.view_mentee, name='view_mentee'),
     path('head/mentees/edit/<str:mentee_id>/', views.edit_mentee, name='edit_mentee'),
     path('head/mentees/delete/<str:mentee_id>/', views.delete_mentee, name='delete_mentee'),
@@ -56,7 +67,9 @@ urlpatterns = [
     # Head URLs - Assignment Management
     path('head/assignments/', views.mentor_assignments, name='mentor_assignments'),
     path('head/assignments/history/', views.assignment_history, name='assignment_history'),
+    path('head/assignments/history/export/', views.export_assignments, name='export_assignments'),
     path('head/assignments/history/<str:mentor_id>/', views.assignment_history, name='assignment_history_mentor'),
+    path('head/assignments/history/<str:mentor_id>/export/', views.export_assignments, name='export_assignments_mentor'),
     path('head/assignments/details/<int:assignment_id>/', views.assignment_details, name='assignment_details'),
     path('head/assignments/transfer/<int:assignment_id>/', views.transfer_assignment, name='transfer_assignment'),
     path('head/assignments/delete/<int:assignment_id>/', views.delete_assignment, name='delete_assignment'),
@@ -70,11 +83,16 @@ urlpatterns = [
     # Head URLs - Activity Management
     path('head/activities/', views.mentor_mentee_activities, name='mentor_mentee_activities'),
     path('head/activities/create/', views.create_activity, name='create_activity'),
+    path('head/activities/attendance/export/', views.export_attendance, name='export_attendance'),
     path('head/activities/view/<str:activity_id>/', views.view_activity, name='view_activity'),
     path('head/activities/edit/<str:activity_id>/', views.edit_activity, name='edit_activity'),
     path('head/activities/delete/<str:activity_id>/', views.delete_activity, name='delete_activity'),  
     path('head/activities/get-next-id/', views.get_next_activity_id, name='get_next_activity_id'),
-]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+    # Head URLs - Read-only JSON lists for internal tools
+    path('head/api/mentees/', views.api_list, {'resource': 'mentees'}, name='api_mentees'),
+    path('head/api/mentors/', views.api_list, {'resource': 'mentors'}, name='api_mentors'),
+    path('head/api/assignments/', views.api_list, {'resource': 'assignments'}, name='api_assignments'),
+    path('head/api/activities/', views.api_list, {'resource': 'activities'}, name='api_activities'),
+    path('head/api/attendance/', views.api_list, {'resource': 'attendance'}, name='api_attendance'),
+]
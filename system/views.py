@@ -1,22 +1,57 @@
+import logging
 import time
 import os
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.contrib.auth.decorators import login_required, user_passes_test
-from .models import CustomUser, Mentee, Mentor, HeadofMentorMentee, Activity, Attendance, MentoringSession, ActivityReport, MentorMenteeAssignment
+from .models import CustomUser, Mentee, Mentor, HeadofMentorMentee, Activity, Attendance, MentoringSession, ActivityReport, MentorMenteeAssignment, ChunkedUpload
+from .models import MENTEE_ID_REGEX, MENTOR_ID_REGEX, get_course_full_name
 import re
+from asgiref.sync import sync_to_async
 from datetime import datetime, date, timedelta
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import constant_time_compare
+from django.views.static import serve as static_serve
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.contrib.staticfiles.views import serve as staticfiles_serve
+from django.conf import settings
 from django.db import models  
-from django.db.models import F, Q, Count
-from django.db.models.functions import TruncMonth, TruncDay
+from django.db.models import F, Q, Count, Prefetch
+from django.db.models.functions import TruncDay
 from .forms import ActivityForm
-from django.http import JsonResponse
+from .caching import get_mentor_facets
+from .dashboards import (collect, gather, head_aggregates, head_context, mentee_aggregates, mentee_context,
+                         mentor_aggregates, mentor_context)
+from .conditional import (conditional_page, head_mentee_state, head_mentor_state, own_mentee_state,
+                          own_mentor_state)
+from .compression import FILE_SUFFIXES, compressed_variants, encodings, negotiate
+from .importers import import_uploaded_file, uploaded_row_count, MENTEE_REQUIRED_COLUMNS, MENTOR_REQUIRED_COLUMNS
+from .filters import filter_mentees, filter_assignments, filter_activities, filter_attendance
+from .fragments import render_list, wants_fragment
+from .api import api_list_response
+from .exports import export_mentees_csv, export_assignments_csv, export_attendance_csv
+from .logs import debug_enabled
+from .images import refresh_derivatives
+from .storage import release
+from .uploads import UploadError, append_chunk, chunk_size as upload_chunk_size, claimed_file, finish_upload, start_upload
+from . import events, media, metrics
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger  # ADD THIS IMPORT
 import csv  # ADD THIS IMPORT FOR EXPORT FUNCTIONALITY
 from django.http import HttpResponse  # ADD THIS IMPORT FOR EXPORT FUNCTIONALITY
 
+logger = logging.getLogger(__name__)
+
+# Activity schedule window (days either side of today) and "load more" limit
+SCHEDULE_WINDOW_DAYS = 90
+SCHEDULE_MAX_WINDOW_DAYS = 3650
+
+# Rejected rows listed on the bulk import page (the full count is always shown)
+IMPORT_ERRORS_SHOWN = 500
+
 def signup_view(request):
     """View for user registration - mentees and mentors only"""
     if request.method == 'POST':
@@ -62,8 +97,7 @@ def signup_view(request):
         # Validate ID format based on role
         if role == 'mentee':
             # Updated regex to match mentee ID format
-            mentee_id_regex = r'^(B(CS|DA|DB|LH)\d{4}-\d{3}|(IEP|CFAB)\d{4}-\d{3})$'
-            if not re.match(mentee_id_regex, identification_id):
+            if not re.match(MENTEE_ID_REGEX, identification_id):
                 errors.append(
                     "Student ID format is incorrect.\n\n"
                     "For diploma programs: B + Program + Year + Month + Number\n"
@@ -77,8 +111,7 @@ def signup_view(request):
             
         elif role == 'mentor':
             # Validate mentor ID format
-            mentor_id_regex = r'^ST(A|B|C|D|GS)\d{3}$'
-            if not re.match(mentor_id_regex, identification_id):
+            if not re.match(MENTOR_ID_REGEX, identification_id):
                 errors.append(
                     "Staff ID format is incorrect.\n\n"
                     "Format: ST + Department Code + 3-digit number\n\n"
@@ -344,21 +377,20 @@ def logout_view(request):
     return redirect('login')
 
 # ===== MENTEE VIEWS =====
-@login_required
-def mentee_homepage(request):
-    # Get mentee data
+def _mentee_profile(user):
+    """The user's Mentee profile, created with placeholder details if it doesn't exist yet"""
     try:
-        mentee = request.user.mentee
+        mentee = user.mentee
     except:
         # If mentee profile doesn't exist, create a placeholder
         from .models import Mentee
         from datetime import date
         mentee, created = Mentee.objects.get_or_create(
-            user=request.user,
+            user=user,
             defaults={
-                'MenteeID': request.user.username,
-                'MenteeName': request.user.username,
-                'MenteeEmail': f"{request.user.username}@student.edu",
+                'MenteeID': user.username,
+                'MenteeName': user.username,
+                'MenteeEmail': f"{user.username}@student.edu",
                 'MenteeJoinDate': date.today(),
                 # Add other required fields with blank values
                 'MenteeCourse': '',
@@ -383,82 +415,32 @@ def mentee_homepage(request):
                 'MenteeMotherPhone': '',
             }
         )
-    
-    # Calculate real statistics
-    today = timezone.now().date()
-    
-    # Get upcoming sessions (activities where mentee is assigned and date is today or future)
-    # FIXED: Changed 'Mentor' to 'PrimaryMentor'
-    upcoming_sessions = Activity.objects.filter(
-        Q(attendance__mentee=mentee) | Q(PrimaryMentor=mentee.assigned_mentor),
-        Date__gte=today,
-        IsMentoringSession=True
-    ).distinct().count()
-    
-    # Get completed activities (past activities)
-    # FIXED: Changed 'Mentor' to 'PrimaryMentor'
-    completed_activities = Activity.objects.filter(
-        Q(attendance__mentee=mentee) | Q(PrimaryMentor=mentee.assigned_mentor),
-        Date__lt=today
-    ).distinct().count()
-    
-    # Calculate progress rate (based on attendance)
-    total_attended = Attendance.objects.filter(
-        mentee=mentee,
-        attended=True
-    ).count()
-    
-    total_invited = Attendance.objects.filter(mentee=mentee).count()
-    
-    if total_invited > 0:
-        progress_rate = int((total_attended / total_invited) * 100)
-    else:
-        progress_rate = 0
-    
-    # Get achievements (completed mentoring sessions with materials)
-    achievements = MentoringSession.objects.filter(
-        activity__attendance__mentee=mentee,
-        activity__attendance__attended=True,
-        completed=True
-    ).distinct().count()
-    
-    # NEW: Calculate upcoming activities count for notification badge
-    # This includes both mentoring sessions and general activities
-    if mentee.assigned_mentor:
-        # Get activities where mentee is specifically invited or general activities
-        mentoring_activities = Activity.objects.filter(
-            IsMentoringSession=True,
-            PrimaryMentor=mentee.assigned_mentor,
-            Date__gte=today
-        )
-        
-        # Get general activities (not mentoring sessions)
-        general_activities = Activity.objects.filter(
-            IsMentoringSession=False,
-            Date__gte=today
-        )
-        
-        # Combine both types of activities and count
-        upcoming_activities_count = (mentoring_activities.count() + general_activities.count())
-    else:
-        # If no mentor assigned, only show general activities
-        upcoming_activities_count = Activity.objects.filter(
-            IsMentoringSession=False,
-            Date__gte=today
-        ).count()
-    
+    return mentee
+
+@login_required
+def mentee_homepage(request):
+    mentee = _mentee_profile(request.user)
     context = {
         'user': request.user,
         'mentee': mentee,
-        'upcoming_sessions': upcoming_sessions,
-        'completed_activities': completed_activities,
-        'progress_rate': progress_rate,
-        'achievements': achievements,
-        'upcoming_activities_count': upcoming_activities_count,  # NEW: For notification badge
+        **mentee_context(collect(mentee_aggregates(mentee, timezone.now().date()))),
     }
     return render(request, 'homepage_mentee.html', context)
 
 @login_required
+async def mentee_homepage_async(request):
+    """mentee_homepage with its statistics queried concurrently (see dashboards.py)"""
+    user = await request.auser()
+    mentee = await sync_to_async(_mentee_profile)(user)
+    context = {
+        'user': user,
+        'mentee': mentee,
+        **mentee_context(await gather(mentee_aggregates(mentee, timezone.now().date()))),
+    }
+    return await sync_to_async(render)(request, 'homepage_mentee.html', context)
+
+@login_required
+@conditional_page(own_mentee_state, form=True)
 def update_personal_info(request):
     mentee = get_object_or_404(Mentee, user=request.user)
     
@@ -487,8 +469,7 @@ def update_personal_info(request):
     
     if request.method == 'POST':
         try:
-            print("DEBUG: Form submitted with CSRF token")
-            print(f"DEBUG: Files in request: {list(request.FILES.keys())}")
+            logger.debug('Mentee %s profile update, files: %s', mentee.MenteeID, list(request.FILES))
             
             # Update all personal information fields
             mentee.MenteeName = request.POST.get('MenteeName', mentee.MenteeName)
@@ -564,14 +545,15 @@ def update_personal_info(request):
             
             # FIXED: Profile picture handling - check both possible field names
             profile_picture = None
+            old_picture = None
             if 'profile_picture' in request.FILES:
                 profile_picture = request.FILES['profile_picture']
-                print(f"DEBUG: Found profile_picture in FILES: {profile_picture.name}")
             elif 'profile_picture' in request.POST:
-                print("DEBUG: profile_picture found in POST data")
+                logger.debug('profile_picture sent as a form field, not a file upload')
             
             if profile_picture:
-                print(f"DEBUG: Processing profile picture - Name: {profile_picture.name}, Size: {profile_picture.size}, Type: {profile_picture.content_type}")
+                logger.debug('Processing profile picture %s (%d bytes, %s)',
+                             profile_picture.name, profile_picture.size, profile_picture.content_type)
                 
                 try:
                     # Enhanced file validation
@@ -597,55 +579,31 @@ def update_personal_info(request):
                         messages.error(request, 'Invalid file extension. Please upload JPG, PNG, GIF, or WEBP files.')
                         return redirect('update_personal_info')
                     
-                    # Delete old profile picture if exists
-                    if mentee.profile_picture:
-                        try:
-                            if os.path.isfile(mentee.profile_picture.path):
-                                os.remove(mentee.profile_picture.path)
-                                print("DEBUG: Old profile picture deleted")
-                        except Exception as e:
-                            print(f"DEBUG: Error deleting old profile picture: {str(e)}")
-                            # Continue with new upload even if old file deletion fails
-                    
-                    # Generate unique filename
-                    file_extension = os.path.splitext(profile_picture.name)[1].lower()
-                    unique_filename = f"mentee_{mentee.MenteeID}_{int(time.time())}{file_extension}"
-                    
-                    # Save the profile picture
-                    mentee.profile_picture.save(unique_filename, profile_picture, save=False)
-                    print(f"DEBUG: Profile picture saved to mentee model: {mentee.profile_picture.name}")
+                    # Storage names the file by its content hash; the old picture is
+                    # released once the new one is saved (other rows may share it)
+                    old_picture = mentee.profile_picture.name
+                    mentee.profile_picture.save(profile_picture.name, profile_picture, save=False)
+                    logger.debug('Saved profile picture %s', mentee.profile_picture.name)
                     
                     messages.success(request, 'Profile picture updated successfully!')
                     
                 except Exception as e:
-                    print(f"DEBUG: Error uploading profile picture: {str(e)}")
-                    import traceback
-                    print(f"DEBUG: Traceback: {traceback.format_exc()}")
+                    logger.exception('Profile picture upload failed for mentee %s', mentee.MenteeID)
                     messages.error(request, f'Error uploading profile picture: {str(e)}')
-            else:
-                print("DEBUG: No profile picture uploaded in this request")
 
             # Save all mentee changes (including profile picture if uploaded)
             mentee.save()
-            print("DEBUG: Mentee profile saved successfully")
-            
-            # Debug information after save
-            if mentee.profile_picture:
-                print(f"DEBUG: Final profile picture path: {mentee.profile_picture.path}")
-                print(f"DEBUG: Final profile picture URL: {mentee.profile_picture.url}")
-                try:
-                    file_exists = os.path.exists(mentee.profile_picture.path)
-                    print(f"DEBUG: File exists: {file_exists}")
-                except:
-                    print("DEBUG: Could not check file existence")
+            if profile_picture:
+                refresh_derivatives(mentee.profile_picture)
+            if old_picture and old_picture != mentee.profile_picture.name:
+                release(old_picture)
+            logger.debug('Mentee %s profile saved, picture: %s', mentee.MenteeID, mentee.profile_picture.name or None)
             
             messages.success(request, 'Profile updated successfully!')
             return redirect('update_personal_info')
             
         except Exception as e:
-            print(f"DEBUG: Error saving profile: {str(e)}")
-            import traceback
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.exception('Profile update failed for mentee %s', mentee.MenteeID)
             messages.error(request, f'Error updating profile: {str(e)}')
     
     # For GET requests, render the form with display course
@@ -656,64 +614,60 @@ def update_personal_info(request):
     return render(request, 'mentee_profile.html', context)
 
 @login_required
+@conditional_page(own_mentee_state)
 def view_assigned_mentor(request):
     mentee = get_object_or_404(Mentee, user=request.user)
     return render(request, 'view_mentor.html', {'mentee': mentee})
 
 @login_required
 def view_activity_schedules(request):
-    mentee = get_object_or_404(Mentee, user=request.user)
+    mentee = get_object_or_404(Mentee.objects.select_related('assigned_mentor'), user=request.user)
     
     # Get today's date
     today = timezone.now().date()
     
-    # Get all activities that this mentee should attend
-    if mentee.assigned_mentor:
-        # Get activities where mentee is specifically invited or general activities
-        mentoring_activities = Activity.objects.filter(
-            IsMentoringSession=True,
-            PrimaryMentor=mentee.assigned_mentor,
-        ).order_by('Date', 'StartTime')
-        
-        # Get general activities (not mentoring sessions)
-        general_activities = Activity.objects.filter(
-            IsMentoringSession=False,
-        ).order_by('Date', 'StartTime')
-        
-        # Combine both types of activities
-        all_activities = list(mentoring_activities) + list(general_activities)
-        all_activities.sort(key=lambda x: (x.Date, x.StartTime))
-    else:
-        # If no mentor assigned, only show general activities
-        all_activities = Activity.objects.filter(
-            IsMentoringSession=False,
-        ).order_by('Date', 'StartTime')
+    # Only load activities within +/- window days of today; "load more" widens the window
+    try:
+        window_days = int(request.GET.get('window', SCHEDULE_WINDOW_DAYS))
+    except ValueError:
+        window_days = SCHEDULE_WINDOW_DAYS
+    window_days = min(max(window_days, SCHEDULE_WINDOW_DAYS), SCHEDULE_MAX_WINDOW_DAYS)
+    window_start = today - timedelta(days=window_days)
+    window_end = today + timedelta(days=window_days)
+    
+    # General activities, plus mentoring sessions run by the mentee's own mentor
+    schedule_filter = Q(IsMentoringSession=False)
+    if mentee.assigned_mentor_id:
+        schedule_filter |= Q(IsMentoringSession=True, PrimaryMentor_id=mentee.assigned_mentor_id)
+    
+    # Single query - session completion comes in through the reverse one-to-one join
+    all_activities = Activity.objects.filter(
+        schedule_filter,
+        Date__range=(window_start, window_end),
+    ).select_related('mentoringsession', 'PrimaryMentor').order_by('Date', 'StartTime')
     
     # PROPERLY CATEGORIZE ACTIVITIES
-    # Upcoming activities: Future dates only
-    upcoming_activities = [activity for activity in all_activities if activity.Date > today]
-    
-    # Completed activities: Past dates OR mentoring sessions that are explicitly marked as completed
+    upcoming_activities = []
     completed_activities = []
     for activity in all_activities:
-        # For mentoring sessions, check if they are explicitly completed
+        # Upcoming activities: Future dates only
+        if activity.Date > today:
+            upcoming_activities.append(activity)
+        
+        # Completed activities: Past dates OR mentoring sessions that are explicitly marked as completed
         if activity.IsMentoringSession:
             try:
-                mentoring_session = MentoringSession.objects.get(activity=activity)
-                # Show in completed if session is marked as completed OR has materials uploaded
-                if mentoring_session.completed or mentoring_session.materials:
-                    completed_activities.append(activity)
-                # Also include past mentoring sessions even if not explicitly completed
-                elif activity.Date < today:
-                    completed_activities.append(activity)
+                mentoring_session = activity.mentoringsession
             except MentoringSession.DoesNotExist:
-                # If no mentoring session record exists but date is past, include it
-                if activity.Date < today:
-                    completed_activities.append(activity)
-        else:
-            # For non-mentoring sessions, just use date comparison
-            if activity.Date < today:
+                mentoring_session = None
+            # Show in completed if session is marked as completed OR has materials uploaded
+            if mentoring_session and (mentoring_session.completed or mentoring_session.materials):
                 completed_activities.append(activity)
+            elif activity.Date < today:
+                completed_activities.append(activity)
+        elif activity.Date < today:
+            # For non-mentoring sessions, just use date comparison
+            completed_activities.append(activity)
     
     # Sort completed activities by date (most recent first)
     completed_activities.sort(key=lambda x: x.Date, reverse=True)
@@ -723,26 +677,29 @@ def view_activity_schedules(request):
         'upcoming_activities': upcoming_activities,
         'completed_activities': completed_activities,
         'today': today,
+        'window_days': window_days,
+        'window_start': window_start,
+        'window_end': window_end,
+        'next_window': window_days + SCHEDULE_WINDOW_DAYS if window_days < SCHEDULE_MAX_WINDOW_DAYS else None,
     }
     
     return render(request, 'activity_schedule.html', context)
 
 # ===== MENTOR VIEWS =====
-@login_required
-def mentor_homepage(request):
-    # Get mentor data
+def _mentor_profile(user):
+    """The user's Mentor profile, created with placeholder details if it doesn't exist yet"""
     try:
-        mentor = request.user.mentor
+        mentor = user.mentor
     except:
         # If mentor profile doesn't exist, create a placeholder
         from .models import Mentor
         from datetime import date
         mentor, created = Mentor.objects.get_or_create(
-            user=request.user,
+            user=user,
             defaults={
-                'MentorID': request.user.username,
-                'MentorName': request.user.username,
-                'MentorEmail': f"{request.user.username}@staff.edu",
+                'MentorID': user.username,
+                'MentorName': user.username,
+                'MentorEmail': f"{user.username}@staff.edu",
                 'MentorJoinDate': date.today(),
                 # Add other required fields with default values
                 'MentorPhone': 'Not set',
@@ -757,106 +714,33 @@ def mentor_homepage(request):
                 'MaxMentees': 10,
             }
         )
-    
-    # Calculate real statistics
-    today = timezone.now().date()
-    
-    # Get total assigned mentees (mentees where this mentor is assigned_mentor)
-    assigned_mentees_count = Mentee.objects.filter(assigned_mentor=mentor).count()
-    
-    # Get total mentees in the entire system (not just assigned to this mentor)
-    total_mentees_system = Mentee.objects.count()
-    
-    # Get system-wide assigned and pending mentees
-    mentees_with_mentor = Mentee.objects.filter(assigned_mentor__isnull=False).count()
-    mentees_pending = Mentee.objects.filter(assigned_mentor__isnull=True).count()
-    
-    # Get upcoming sessions (activities where mentor is primary mentor and date is today or future)
-    upcoming_sessions = Activity.objects.filter(
-        PrimaryMentor=mentor,
-        Date__gte=today,
-        IsMentoringSession=True
-    ).count()
-    
-    # Get completed sessions (past mentoring sessions)
-    completed_sessions = Activity.objects.filter(
-        PrimaryMentor=mentor,
-        Date__lt=today,
-        IsMentoringSession=True
-    ).count()
-    
-    # Calculate total sessions (upcoming + completed)
-    total_sessions = upcoming_sessions + completed_sessions
-    
-    # Get pending reports (activities without completed mentoring sessions)
-    pending_reports = Activity.objects.filter(
-        PrimaryMentor=mentor,
-        IsMentoringSession=True,
-        Date__lt=today
-    ).exclude(
-        mentoringsession__completed=True
-    ).count()
-    
-    # Calculate completion rate based on mentoring sessions
-    total_past_sessions = Activity.objects.filter(
-        PrimaryMentor=mentor,
-        Date__lt=today,
-        IsMentoringSession=True
-    ).count()
-    
-    completed_sessions_with_materials = MentoringSession.objects.filter(
-        activity__PrimaryMentor=mentor,
-        activity__Date__lt=today,
-        completed=True
-    ).count()
-    
-    if total_past_sessions > 0:
-        completion_rate = int((completed_sessions_with_materials / total_past_sessions) * 100)
-    else:
-        completion_rate = 0
-    
-    # Calculate monthly sessions for the current year (for graph)
-    from django.db.models import Count
-    from django.db.models.functions import ExtractMonth
-    import json
-    
-    current_year = today.year
-    monthly_sessions_query = Activity.objects.filter(
-        PrimaryMentor=mentor,
-        IsMentoringSession=True,
-        Date__year=current_year
-    ).annotate(
-        month=ExtractMonth('Date')
-    ).values('month').annotate(
-        count=Count('ActivityID')
-    ).order_by('month')
-    
-    # Create array of 12 months with counts
-    monthly_sessions_data = [0] * 12  # Initialize with zeros for all 12 months
-    for item in monthly_sessions_query:
-        month_index = item['month'] - 1  # Convert 1-12 to 0-11 for array indexing
-        monthly_sessions_data[month_index] = item['count']
-    
-    # Convert to JSON string for JavaScript
-    monthly_sessions_json = json.dumps(monthly_sessions_data)
-    
+    return mentor
+
+@login_required
+def mentor_homepage(request):
+    mentor = _mentor_profile(request.user)
     context = {
         'user': request.user,
         'mentor': mentor,
-        'assigned_mentees': assigned_mentees_count,
-        'total_mentees_system': total_mentees_system,
-        'mentees_with_mentor': mentees_with_mentor,
-        'mentees_pending': mentees_pending,
-        'total_sessions': total_sessions,
-        'upcoming_sessions': upcoming_sessions,
-        'pending_reports': pending_reports,
-        'completion_rate': completion_rate,
-        'monthly_sessions': monthly_sessions_json,
+        **mentor_context(collect(mentor_aggregates(mentor, timezone.now().date()))),
     }
     return render(request, 'homepage_mentor.html', context)
 
+@login_required
+async def mentor_homepage_async(request):
+    """mentor_homepage with its statistics queried concurrently (see dashboards.py)"""
+    user = await request.auser()
+    mentor = await sync_to_async(_mentor_profile)(user)
+    context = {
+        'user': user,
+        'mentor': mentor,
+        **mentor_context(await gather(mentor_aggregates(mentor, timezone.now().date()))),
+    }
+    return await sync_to_async(render)(request, 'homepage_mentor.html', context)
+
 
 @login_required
+@conditional_page(own_mentor_state, form=True)
 def mentor_update_profile(request):
     """View for mentor to update their profile - FIXED VERSION"""
     if request.user.role != 'mentor':
@@ -867,8 +751,7 @@ def mentor_update_profile(request):
     
     if request.method == 'POST':
         try:
-            print("DEBUG: Form submitted with CSRF token")
-            print(f"DEBUG: Files in request: {list(request.FILES.keys())}")
+            logger.debug('Mentor %s profile update, files: %s', mentor.MentorID, list(request.FILES))
             
             # Update mentor information
             mentor.MentorName = request.POST.get('MentorName')
@@ -882,9 +765,11 @@ def mentor_update_profile(request):
             mentor.MentorReligion = request.POST.get('MentorReligion')
             
             # FIXED: Enhanced profile picture handling for mentor
+            old_picture = None
             if 'profile_picture' in request.FILES:
                 profile_picture = request.FILES['profile_picture']
-                print(f"DEBUG: Processing profile picture - Name: {profile_picture.name}, Size: {profile_picture.size}, Type: {profile_picture.content_type}")
+                logger.debug('Processing profile picture %s (%d bytes, %s)',
+                             profile_picture.name, profile_picture.size, profile_picture.content_type)
                 
                 # Enhanced file validation
                 try:
@@ -911,50 +796,31 @@ def mentor_update_profile(request):
                         messages.error(request, 'Invalid file extension. Please upload JPG, PNG, GIF, or WEBP files.')
                         return redirect('mentor_update_profile')
                     
-                    # Delete old profile picture if exists
-                    if mentor.profile_picture:
-                        try:
-                            old_file_path = mentor.profile_picture.path
-                            if os.path.isfile(old_file_path):
-                                os.remove(old_file_path)
-                                print("DEBUG: Old profile picture deleted")
-                        except Exception as e:
-                            print(f"DEBUG: Error deleting old profile picture: {str(e)}")
-                            # Continue with new upload even if old file deletion fails
-                    
-                    # Generate unique filename
-                    file_extension = os.path.splitext(profile_picture.name)[1].lower()
-                    unique_filename = f"mentor_{mentor.MentorID}_{int(time.time())}{file_extension}"
-                    
-                    # Save to mentor's profile_picture field
-                    mentor.profile_picture.save(unique_filename, profile_picture, save=False)
-                    print(f"DEBUG: Profile picture saved to mentor model: {mentor.profile_picture.name}")
+                    # Storage names the file by its content hash; the old picture is
+                    # released once the new one is saved (other rows may share it)
+                    old_picture = mentor.profile_picture.name
+                    mentor.profile_picture.save(profile_picture.name, profile_picture, save=False)
+                    logger.debug('Saved profile picture %s', mentor.profile_picture.name)
                     
                     messages.success(request, 'Profile picture updated successfully!')
                     
                 except Exception as e:
-                    print(f"DEBUG: Error uploading profile picture: {str(e)}")
+                    logger.exception('Profile picture upload failed for mentor %s', mentor.MentorID)
                     messages.error(request, f'Error uploading profile picture: {str(e)}')
-            else:
-                print("DEBUG: No profile picture in request")
 
             # Save mentor changes
             mentor.save()
-            print("DEBUG: Mentor profile saved successfully")
-            
-            # Debug information after save
-            if mentor.profile_picture:
-                print(f"DEBUG: Final profile picture path: {mentor.profile_picture.path}")
-                print(f"DEBUG: Final profile picture URL: {mentor.profile_picture.url}")
-                print(f"DEBUG: File exists: {os.path.exists(mentor.profile_picture.path) if mentor.profile_picture else 'No file'}")
+            if 'profile_picture' in request.FILES:
+                refresh_derivatives(mentor.profile_picture)
+            if old_picture and old_picture != mentor.profile_picture.name:
+                release(old_picture)
+            logger.debug('Mentor %s profile saved, picture: %s', mentor.MentorID, mentor.profile_picture.name or None)
             
             messages.success(request, 'Profile updated successfully!')
             return redirect('mentor_update_profile')
             
         except Exception as e:
-            print(f"DEBUG: Error saving profile: {str(e)}")
-            import traceback
-            print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.exception('Profile update failed for mentor %s', mentor.MentorID)
             messages.error(request, f'Error updating profile: {str(e)}')
     
     return render(request, 'mentor_profile.html', {'mentor': mentor})
@@ -1053,7 +919,7 @@ def view_assigned_mentees(request):
     mentor = get_object_or_404(Mentor, user=request.user)
     
     # Get assigned mentees for this mentor
-    assigned_mentees = Mentee.objects.filter(assigned_mentor=mentor)
+    assigned_mentees = Mentee.objects.filter(assigned_mentor=mentor).select_related('assigned_mentor')
     
     # Get ALL mentees initially for stats and search capability
     all_mentees = Mentee.objects.all().select_related('assigned_mentor')
@@ -1093,27 +959,26 @@ def view_assigned_mentees(request):
     elif sort_by == 'course_asc':
         display_mentees = display_mentees.order_by('MenteeCourse', 'MenteeName')
     
-    # Calculate statistics (for assigned mentees only)
-    active_mentees_count = assigned_mentees.filter(MenteeStatus='active').count()
-    male_mentees_count = assigned_mentees.filter(MenteeGender='male').count()
-    female_mentees_count = assigned_mentees.filter(MenteeGender='female').count()
-    
     context = {
         'mentor': mentor,
-        'assigned_mentees': assigned_mentees,  # For statistics
         'display_mentees': display_mentees,    # For display in table
-        'active_mentees_count': active_mentees_count,
-        'male_mentees_count': male_mentees_count,
-        'female_mentees_count': female_mentees_count,
         'search_query': search_query,
         'status_filter': status_filter,
         'sort_by': sort_by,
         'is_searching': is_searching,
-        'total_mentees_count': all_mentees.count(),  # Total in system
-        'assigned_count': assigned_mentees.count(),  # Count of assigned mentees
     }
-    
-    return render(request, 'view_mentees.html', context)
+
+    # Statistics (for assigned mentees only) - the rows fragment doesn't show them
+    if not wants_fragment(request):
+        stats = assigned_mentees.aggregate(
+            assigned_count=Count('pk'),
+            active_mentees_count=Count('pk', filter=Q(MenteeStatus='active')),
+            male_mentees_count=Count('pk', filter=Q(MenteeGender='male')),
+            female_mentees_count=Count('pk', filter=Q(MenteeGender='female')),
+        )
+        context.update(stats)
+
+    return render_list(request, 'view_mentees.html', 'partials/view_mentees_rows.html', context)
 
 @login_required
 def mentoring_schedule(request):
@@ -1128,42 +993,39 @@ def mentoring_schedule(request):
     # Get time filter from request, default to 'all'
     time_filter = request.GET.get('time_filter', 'all')
     
+    # Only activities that have a MentoringSession row - joined in the same query
+    mentoring_activities = Activity.objects.filter(
+        IsMentoringSession=True,
+        PrimaryMentor=mentor,
+        mentoringsession__isnull=False,
+    ).select_related('mentoringsession').prefetch_related(
+        Prefetch('attendance_set', queryset=Attendance.objects.select_related('mentee'))
+    )
+    
     # FIXED: Proper filtering logic for mentoring sessions
     if time_filter == 'completed':
         # Show ONLY sessions that are explicitly marked as completed
-        mentoring_activities = Activity.objects.filter(
-            IsMentoringSession=True,
-            PrimaryMentor=mentor,
-            mentoringsession__completed=True  # Only explicitly completed sessions
-        ).distinct().order_by('-Date', 'StartTime')
+        mentoring_activities = mentoring_activities.filter(
+            mentoringsession__completed=True
+        ).order_by('-Date', 'StartTime')
     
     elif time_filter == 'upcoming':
         # Show ONLY sessions that are NOT completed AND have future dates
-        mentoring_activities = Activity.objects.filter(
-            IsMentoringSession=True,
-            PrimaryMentor=mentor,
-        ).exclude(
-            mentoringsession__completed=True  # Exclude any completed sessions
-        ).filter(
+        mentoring_activities = mentoring_activities.filter(
+            mentoringsession__completed=False,
             Date__gte=today  # Only future or today's dates
-        ).distinct().order_by('Date', 'StartTime')
+        ).order_by('Date', 'StartTime')
     
     elif time_filter == 'today':
         # Show today's sessions that are NOT completed
-        mentoring_activities = Activity.objects.filter(
-            IsMentoringSession=True,
-            PrimaryMentor=mentor,
+        mentoring_activities = mentoring_activities.filter(
+            mentoringsession__completed=False,
             Date=today,
-        ).exclude(
-            mentoringsession__completed=True  # Exclude completed sessions
-        ).distinct().order_by('StartTime')
+        ).order_by('StartTime')
     
     else:  # 'all' (default)
         # Show all sessions regardless of status
-        mentoring_activities = Activity.objects.filter(
-            IsMentoringSession=True,
-            PrimaryMentor=mentor,
-        ).distinct().order_by('-Date', 'StartTime')
+        mentoring_activities = mentoring_activities.order_by('-Date', 'StartTime')
     
     # Get mentoring session details for each activity
     sessions_data = []
@@ -1171,22 +1033,19 @@ def mentoring_schedule(request):
     upcoming_count = 0
     
     for activity in mentoring_activities:
-        try:
-            mentoring_session = MentoringSession.objects.get(activity=activity)
+        mentoring_session = activity.mentoringsession
+        
+        # Count completed vs upcoming for context
+        if mentoring_session.completed:
+            completed_count += 1
+        else:
+            upcoming_count += 1
             
-            # Count completed vs upcoming for context
-            if mentoring_session.completed:
-                completed_count += 1
-            else:
-                upcoming_count += 1
-                
-            sessions_data.append({
-                'activity': activity,
-                'mentoring_session': mentoring_session,
-                'attendance': Attendance.objects.filter(activity=activity)
-            })
-        except MentoringSession.DoesNotExist:
-            continue
+        sessions_data.append({
+            'activity': activity,
+            'mentoring_session': mentoring_session,
+            'attendance': activity.attendance_set.all()
+        })
     
     context = {
         'mentor': mentor,
@@ -1201,6 +1060,59 @@ def mentoring_schedule(request):
     
     return render(request, 'mentoring_schedule.html', context)
 
+@login_required
+@compressed_variants
+def mentoring_schedule_calendar(request):
+    """JSON API: compact per-day mentoring sessions for one month of the mentor's calendar"""
+    if request.user.role != 'mentor':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    mentor = get_object_or_404(Mentor, user=request.user)
+    
+    # ?month=YYYY-MM, defaults to the current month
+    month_param = request.GET.get('month')
+    try:
+        if month_param:
+            month_start = datetime.strptime(month_param, '%Y-%m').date()
+        else:
+            month_start = timezone.now().date().replace(day=1)
+    except ValueError:
+        return JsonResponse({'error': 'month must be in YYYY-MM format'}, status=400)
+    
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    
+    sessions = Activity.objects.filter(
+        IsMentoringSession=True,
+        PrimaryMentor=mentor,
+        mentoringsession__isnull=False,
+        Date__gte=month_start,
+        Date__lt=next_month,
+    ).annotate(
+        attendee_count=Count('attendance')
+    ).values(
+        'ActivityID', 'ActivityName', 'Date', 'StartTime', 'EndTime', 'Location',
+        'mentoringsession__session_type', 'mentoringsession__completed', 'attendee_count',
+    ).order_by('Date', 'StartTime')
+    
+    # Keyed by day of month so the client can drop entries straight into its grid
+    days = {}
+    for session in sessions:
+        days.setdefault(str(session['Date'].day), []).append({
+            'id': session['ActivityID'],
+            'name': session['ActivityName'],
+            'start': session['StartTime'].strftime('%H:%M'),
+            'end': session['EndTime'].strftime('%H:%M'),
+            'location': session['Location'],
+            'type': session['mentoringsession__session_type'],
+            'completed': session['mentoringsession__completed'],
+            'attendees': session['attendee_count'],
+        })
+    
+    return JsonResponse({
+        'month': month_start.strftime('%Y-%m'),
+        'days': days,
+    })
+
 @login_required
 def create_mentoring_session(request):
     """View for mentor to create a new mentoring session"""
@@ -1260,7 +1172,7 @@ def create_mentoring_session(request):
             if session_type == 'group':
                 # Get all selected attendees
                 attendee_ids = request.POST.getlist('attendees')
-                print(f"DEBUG: Selected attendees for group session: {attendee_ids}")
+                logger.debug('Group session %s attendees: %s', activity_id, attendee_ids)
                 
                 if not attendee_ids:
                     messages.error(request, 'Please select at least one mentee for group session.')
@@ -1274,7 +1186,6 @@ def create_mentoring_session(request):
                             mentee=mentee,
                             attended=False
                         )
-                        print(f"DEBUG: Added {mentee.MenteeName} to group session")
                     except Mentee.DoesNotExist:
                         messages.warning(request, f'Mentee with ID {mentee_id} not found.')
                         continue
@@ -1294,10 +1205,7 @@ def create_mentoring_session(request):
             
         except Exception as e:
             messages.error(request, f'Error creating session: {str(e)}')
-            # Debug information
-            import traceback
-            print(f"ERROR: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception('Creating mentoring session failed for mentor %s', mentor.MentorID)
     
     # If GET request, show form
     assigned_mentees = Mentee.objects.filter(assigned_mentor=mentor)
@@ -1321,26 +1229,26 @@ def complete_mentoring_session(request, activity_id):
     mentoring_session = get_object_or_404(MentoringSession, activity=activity)
     
     if request.method == 'POST':
+        was_completed = mentoring_session.completed
         try:
-            # Handle file upload
-            if 'session_materials' in request.FILES:
-                mentoring_session.materials = request.FILES['session_materials']
-                # Auto-mark as completed when materials are uploaded
-                mentoring_session.completed = True
-                mentoring_session.completion_date = timezone.now()
-                mentoring_session.save()
-                
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': True, 'message': 'Materials uploaded and session marked as completed!'})
+            # Handle file upload (multipart, or a finished chunked upload)
+            with claimed_file(request, activity, 'session_materials') as materials:
+                if materials:
+                    mentoring_session.materials = materials
+                    # Auto-mark as completed when materials are uploaded
+                    mentoring_session.completed = True
+                    mentoring_session.completion_date = timezone.now()
+                    mentoring_session.save()
+            
+            if materials and request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                if not was_completed:
+                    events.session_completed(activity)
+                return JsonResponse({'success': True, 'message': 'Materials uploaded and session marked as completed!'})
             
             # Original form submission (mark as completed with materials)
             mentoring_session.completed = True
             mentoring_session.completion_date = timezone.now()
             
-            # Handle file upload
-            if 'session_materials' in request.FILES:
-                mentoring_session.materials = request.FILES['session_materials']
-            
             # Update attendance
             attendance_records = Attendance.objects.filter(activity=activity)
             for attendance in attendance_records:
@@ -1350,6 +1258,8 @@ def complete_mentoring_session(request, activity_id):
                     attendance.save()
             
             mentoring_session.save()
+            if not was_completed:
+                events.session_completed(activity)
             
             messages.success(request, 'Session marked as completed successfully!')
             return redirect('mentoring_schedule')
@@ -1438,11 +1348,8 @@ def create_activity_report(request, activity_id):
         messages.error(request, 'Access denied. Mentor role required.')
         return redirect('homepage')
     
-    # Get mentor with profile picture
-    mentor = get_object_or_404(Mentor, user=request.user)
-    
-    # Get activity and mentoring session
-    activity = get_object_or_404(Activity, ActivityID=activity_id, PrimaryMentor=mentor)
+    # The sidebar brings its own (cached) mentor profile, so only ownership is checked here
+    activity = get_object_or_404(Activity, ActivityID=activity_id, PrimaryMentor__user=request.user)
     mentoring_session = get_object_or_404(MentoringSession, activity=activity)
     
     # Check if report already exists
@@ -1452,13 +1359,10 @@ def create_activity_report(request, activity_id):
     
     if request.method == 'POST':
         try:
-            # DEBUG: Print all POST data to see what's being submitted
-            print("=== DEBUG: CREATE ACTIVITY REPORT POST DATA ===")
-            print(f"Activity: {activity.ActivityID} - {activity.ActivityName}")
-            for key, value in request.POST.items():
-                if 'attended' in key or 'summary' in key:
-                    print(f"  {key}: {value}")
-            print("=== END DEBUG ===")
+            verbose = debug_enabled(logger)
+            if verbose:
+                logger.debug('Creating report for activity %s, attendance/summary fields: %s', activity.ActivityID,
+                             {key: value for key, value in request.POST.items() if 'attended' in key or 'summary' in key})
             
             # Create the activity report
             activity_report = ActivityReport.objects.create(
@@ -1466,14 +1370,14 @@ def create_activity_report(request, activity_id):
                 summary=request.POST.get('report_summary', ''),
             )
             
-            # Handle file upload
-            if 'report_file' in request.FILES:
-                activity_report.report_file = request.FILES['report_file']
-                activity_report.save()
+            # Handle file upload (multipart, or a finished chunked upload)
+            with claimed_file(request, activity, 'report_file') as report_file:
+                if report_file:
+                    activity_report.report_file = report_file
+                    activity_report.save()
             
             # Update attendance based on form submission - WITH ENHANCED DEBUGGING
             attendance_records = Attendance.objects.filter(activity=activity)
-            print(f"DEBUG: Processing {attendance_records.count()} attendance records")
             
             present_count = 0
             absent_count = 0
@@ -1484,37 +1388,30 @@ def create_activity_report(request, activity_id):
                 if attended_field in request.POST:
                     attendance.attended = True
                     present_count += 1
-                    print(f"DEBUG: ✅ {attendance.mentee.MenteeName} - MARKED AS PRESENT (checkbox found in POST)")
                 else:
                     attendance.attended = False
                     absent_count += 1
-                    print(f"DEBUG: ❌ {attendance.mentee.MenteeName} - MARKED AS ABSENT (checkbox NOT found in POST)")
+                if verbose:
+                    logger.debug('Attendance %s: %s', attendance.mentee_id, 'present' if attendance.attended else 'absent')
                 attendance.save()
             
-            print(f"DEBUG: FINAL ATTENDANCE - Present: {present_count}, Absent: {absent_count}, Total: {attendance_records.count()}")
+            logger.info('Activity %s report created: %d present, %d absent', activity.ActivityID, present_count, absent_count)
             
             messages.success(request, 'Activity report created successfully!')
             return redirect('activity_report')
             
         except Exception as e:
             messages.error(request, f'Error creating report: {str(e)}')
-            print(f"ERROR creating report: {str(e)}")
-            import traceback
-            print(f"TRACEBACK: {traceback.format_exc()}")
+            logger.exception('Creating report for activity %s failed', activity.ActivityID)
     
     # Get attendance for this activity
     attendance = Attendance.objects.filter(activity=activity).select_related('mentee')
     
-    # DEBUG: Print current attendance status
-    print(f"=== DEBUG: CURRENT ATTENDANCE STATUS FOR ACTIVITY {activity_id} ===")
-    for record in attendance:
-        print(f"  {record.mentee.MenteeName}: attended={record.attended}")
-    print(f"Total attendees: {attendance.count()}")
-    print("=== END DEBUG ===")
+    if debug_enabled(logger):
+        logger.debug('Activity %s current attendance: %s', activity_id,
+                     {record.mentee_id: record.attended for record in attendance})
     
-    # FIXED: Ensure mentor is passed to template with profile picture
     return render(request, 'create_activity_report.html', {
-        'mentor': mentor,  # This is crucial for the sidebar profile picture
         'activity': activity,
         'mentoring_session': mentoring_session,
         'attendance': attendance
@@ -1527,15 +1424,11 @@ def view_activity_report(request, activity_id):
         messages.error(request, 'Access denied. Mentor role required.')
         return redirect('homepage')
     
-    # Get mentor with profile picture
-    mentor = get_object_or_404(Mentor, user=request.user)
-    
-    activity = get_object_or_404(Activity, ActivityID=activity_id, PrimaryMentor=mentor)
+    activity = get_object_or_404(Activity, ActivityID=activity_id, PrimaryMentor__user=request.user)
     activity_report = get_object_or_404(ActivityReport, activity=activity)
     attendance = Attendance.objects.filter(activity=activity).select_related('mentee')
     
     return render(request, 'view_activity_report.html', {
-        'mentor': mentor,  # This is crucial for the sidebar
         'activity': activity,
         'activity_report': activity_report,
         'attendance': attendance
@@ -1548,21 +1441,18 @@ def edit_activity_report(request, activity_id):
         messages.error(request, 'Access denied. Mentor role required.')
         return redirect('homepage')
     
-    # Get mentor with profile picture
-    mentor = get_object_or_404(Mentor, user=request.user)
-    
-    activity = get_object_or_404(Activity, ActivityID=activity_id, PrimaryMentor=mentor)
+    activity = get_object_or_404(Activity, ActivityID=activity_id, PrimaryMentor__user=request.user)
     activity_report = get_object_or_404(ActivityReport, activity=activity)
     
     if request.method == 'POST':
         try:
             activity_report.summary = request.POST.get('report_summary', '')
             
-            # Handle file upload
-            if 'report_file' in request.FILES:
-                activity_report.report_file = request.FILES['report_file']
-            
-            activity_report.save()
+            # Handle file upload (multipart, or a finished chunked upload)
+            with claimed_file(request, activity, 'report_file') as report_file:
+                if report_file:
+                    activity_report.report_file = report_file
+                activity_report.save()
             
             # Update attendance
             attendance_records = Attendance.objects.filter(activity=activity)
@@ -1583,7 +1473,6 @@ def edit_activity_report(request, activity_id):
     attendance = Attendance.objects.filter(activity=activity).select_related('mentee')
     
     return render(request, 'edit_activity_report.html', {
-        'mentor': mentor,  # This is crucial for the sidebar
         'activity': activity,
         'activity_report': activity_report,
         'attendance': attendance
@@ -1605,97 +1494,100 @@ def delete_activity_report(request, activity_id):
     
     return redirect('activity_report')
 
-# ===== HEAD VIEWS =====
+def _upload_error(error):
+    body = {'error': str(error)}
+    if error.offset is not None:
+        body['offset'] = error.offset
+    return JsonResponse(body, status=error.status)
+
+def _upload_state(upload):
+    return {
+        'upload_id': str(upload.upload_id),
+        'offset': upload.offset,
+        'size': upload.size,
+        'completed': upload.completed_at is not None,
+    }
+
 @login_required
-def head_homepage(request):
-    """Head of Mentor Mentee homepage with system overview"""
-    if request.user.role != 'head':
-        messages.error(request, 'Access denied. Head role required.')
-        return redirect('homepage')
-    
-    # Get actual statistics
-    total_mentors = Mentor.objects.count()
-    total_mentees = Mentee.objects.count()
-    
-    # Calculate session statistics
-    today = timezone.now().date()
-    
-    # Count completed sessions (past) - ALL activities
-    completed_sessions = Activity.objects.filter(
-        Date__lt=today
-    ).count()
-    
-    # Count upcoming sessions (future) - ALL activities
-    upcoming_sessions = Activity.objects.filter(
-        Date__gt=today
-    ).count()
-    
-    # Count today's sessions - ALL activities
-    today_sessions = Activity.objects.filter(
-        Date=today
-    ).count()
+def upload_start(request):
+    """Register a chunked upload of session materials or a report file for one of the mentor's sessions"""
+    if request.user.role != 'mentor':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST required'}, status=405)
     
-    # Total sessions for display
-    total_sessions = completed_sessions + upcoming_sessions + today_sessions
-
+    activity = get_object_or_404(Activity, ActivityID=request.POST.get('activity_id', ''),
+                                 PrimaryMentor__user=request.user, IsMentoringSession=True)
+    try:
+        upload = start_upload(request.user, activity, request.POST.get('target'), request.POST.get('filename'),
+                              request.POST.get('size'), request.POST.get('checksum', ''))
+    except UploadError as error:
+        return _upload_error(error)
     
-    # Calculate system usage (percentage of mentors with mentees)
-    mentors_with_mentees = Mentor.objects.filter(CurrentMentees__gt=0).count()
-    system_usage = int((mentors_with_mentees / total_mentors * 100)) if total_mentors > 0 else 0
-
+    return JsonResponse(dict(_upload_state(upload), chunk_size=upload_chunk_size()), status=201)
 
-    # --- GRAPH DATA PREPARATION ---
-    
-    # 1. Department Distribution (Pie Chart)
-    dept_data = Mentor.objects.values('MentorDepartment').annotate(count=Count('MentorID')).order_by('-count')
-    dept_labels = [item['MentorDepartment'] for item in dept_data]
-    dept_counts = [item['count'] for item in dept_data]
+@login_required
+def upload_chunk(request, upload_id):
+    """GET reports how much has arrived (to resume); PUT appends the chunk starting at the Upload-Offset header"""
+    upload = get_object_or_404(ChunkedUpload, upload_id=upload_id, user=request.user)
+    if request.method == 'GET':
+        return JsonResponse(_upload_state(upload))
+    if request.method != 'PUT':
+        return JsonResponse({'error': 'GET or PUT required'}, status=405)
     
-    # 2. Activity Trends (Line Chart) - Last 6 months
-    six_months_ago = timezone.now().date() - timedelta(days=180)
-    activity_trend = Activity.objects.filter(
-        Date__gte=six_months_ago
-    ).annotate(
-        month=TruncMonth('Date')
-    ).values('month').annotate(
-        count=Count('ActivityID')
-    ).order_by('month')
+    try:
+        offset = int(request.headers.get('Upload-Offset', ''))
+        length = int(request.headers.get('Content-Length', ''))
+    except ValueError:
+        return JsonResponse({'error': 'Upload-Offset and Content-Length headers are required'}, status=400)
+    try:
+        append_chunk(upload, offset, request, length, request.headers.get('Upload-Checksum'))
+    except UploadError as error:
+        return _upload_error(error)
     
-    activity_labels = [item['month'].strftime('%b %Y') for item in activity_trend]
-    activity_data = [item['count'] for item in activity_trend]
+    return JsonResponse(_upload_state(upload))
 
-    # 3. Mentee Intake Distribution (Bar Chart)
-    intake_data = Mentee.objects.values('Year').annotate(count=Count('MenteeID')).order_by('Year')
-    intake_labels = [str(item['Year']) for item in intake_data]
-    intake_counts = [item['count'] for item in intake_data]
+@login_required
+def upload_complete(request, upload_id):
+    """Verify size and checksum; the form then submits the upload id in place of the file"""
+    upload = get_object_or_404(ChunkedUpload, upload_id=upload_id, user=request.user)
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST required'}, status=405)
+    try:
+        finish_upload(upload)
+    except UploadError as error:
+        return _upload_error(error)
+    
+    return JsonResponse(_upload_state(upload))
 
-    # 4. Recent System Activities (for list)
-    # Use CreatedAt if available (it is in Activity model)
-    recent_activities_list = Activity.objects.all().order_by('-CreatedAt')[:5]
+# ===== HEAD VIEWS =====
+@login_required
+def head_homepage(request):
+    """Head of Mentor Mentee homepage with system overview"""
+    if request.user.role != 'head':
+        messages.error(request, 'Access denied. Head role required.')
+        return redirect('homepage')
 
     context = {
         'user': request.user,
-        'total_mentors': total_mentors,
-        'total_mentees': total_mentees,
-        'total_sessions': total_sessions,
-        'completed_sessions': completed_sessions,
-        'upcoming_sessions': upcoming_sessions,
-        'today_sessions': today_sessions,
-        'system_usage': system_usage,
-        
-        # Graph Data
-        'dept_labels': dept_labels,
-        'dept_counts': dept_counts,
-        'activity_labels': activity_labels,
-        'activity_data': activity_data,
-        'intake_labels': intake_labels,
-        'intake_counts': intake_counts,
-        
-        'recent_activities': recent_activities_list,
+        **head_context(collect(head_aggregates(timezone.now().date()))),
     }
-    
     return render(request, 'homepage_head.html', context)
 
+@login_required
+async def head_homepage_async(request):
+    """head_homepage with its statistics queried concurrently (see dashboards.py)"""
+    user = await request.auser()
+    if user.role != 'head':
+        messages.error(request, 'Access denied. Head role required.')
+        return redirect('homepage')
+
+    context = {
+        'user': user,
+        **head_context(await gather(head_aggregates(timezone.now().date()))),
+    }
+    return await sync_to_async(render)(request, 'homepage_head.html', context)
+
 @login_required
 def manage_mentees(request):
     """View for managing mentees with proper data, normalized course names, and pagination"""
@@ -1724,25 +1616,9 @@ def manage_mentees(request):
     # Get all mentees with related mentor data
     mentees = Mentee.objects.all().select_related('assigned_mentor').order_by('MenteeID')
     
-    # Calculate statistics (before filtering for pagination)
-    active_mentees_count = mentees.filter(MenteeStatus='active').count()
-    unassigned_mentees_count = mentees.filter(assigned_mentor__isnull=True).count()
-    male_count = mentees.filter(MenteeGender='male').count()
-    female_count = mentees.filter(MenteeGender='female').count()
-    
-    # Handle search functionality
+    # Handle search and status filter (shared with export_mentees)
     search_query = request.GET.get('search', '')
-    if search_query:
-        mentees = mentees.filter(
-            Q(MenteeID__icontains=search_query) |
-            Q(MenteeName__icontains=search_query) |
-            Q(MenteeCourse__icontains=search_query) |
-            Q(assigned_mentor__MentorName__icontains=search_query)
-        )
-    
-    # Add display course to each mentee
-    for mentee in mentees:
-        mentee.display_course = get_course_full_name(mentee.MenteeCourse)
+    filtered_mentees = filter_mentees(mentees, request.GET)
     
     # PAGINATION - Get records per page from request
     per_page = request.GET.get('per_page', 10)  # Default to 10 per page
@@ -1757,7 +1633,7 @@ def manage_mentees(request):
         per_page = 10
     
     # Create paginator
-    paginator = Paginator(mentees, per_page)
+    paginator = Paginator(filtered_mentees, per_page)
     page_number = request.GET.get('page')
     
     try:
@@ -1769,23 +1645,37 @@ def manage_mentees(request):
         # If page is out of range, deliver last page
         page_obj = paginator.page(paginator.num_pages)
     
-    # Calculate upcoming sessions for sidebar badge
-    today = timezone.now().date()
-    upcoming_sessions = Activity.objects.filter(Date__gt=today).count()
+    # Add display course to the mentees on this page
+    for mentee in page_obj:
+        mentee.display_course = get_course_full_name(mentee.MenteeCourse)
     
     context = {
         'mentees': page_obj,  # Use page_obj instead of queryset
         'page_obj': page_obj,  # For template pagination controls
-        'active_mentees_count': active_mentees_count,
-        'unassigned_mentees_count': unassigned_mentees_count,
-        'male_count': male_count,
-        'female_count': female_count,
         'search_query': search_query,
         'per_page': per_page,  # Pass per_page value to template
-        'upcoming_sessions': upcoming_sessions,
     }
-    
-    return render(request, 'manage_mentees.html', context)
+
+    # Statistics over all mentees - the rows fragment doesn't show them
+    if not wants_fragment(request):
+        context.update(mentees.aggregate(
+            active_mentees_count=Count('pk', filter=Q(MenteeStatus='active')),
+            unassigned_mentees_count=Count('pk', filter=Q(assigned_mentor__isnull=True)),
+            male_count=Count('pk', filter=Q(MenteeGender='male')),
+            female_count=Count('pk', filter=Q(MenteeGender='female')),
+        ))
+
+    return render_list(request, 'manage_mentees.html', 'partials/manage_mentees_rows.html', context)
+
+@login_required
+def export_mentees(request):
+    """Stream the mentee list as CSV, honouring the manage_mentees search"""
+    if request.user.role != 'head':
+        messages.error(request, 'Access denied. Head role required.')
+        return redirect('homepage')
+
+    mentees = filter_mentees(Mentee.objects.all(), request.GET)
+    return export_mentees_csv(mentees)
 
 @login_required
 def add_mentee(request):
@@ -1897,6 +1787,46 @@ def add_mentee(request):
     return render(request, 'add_mentee.html')
 
 @login_required
+def bulk_import(request):
+    """View for head to bulk import mentees or mentors from a CSV file"""
+    if request.user.role != 'head':
+        messages.error(request, 'Access denied. Head role required.')
+        return redirect('homepage')
+    
+    role = request.POST.get('role') or request.GET.get('role', 'mentee')
+    if role not in ('mentee', 'mentor'):
+        role = 'mentee'
+    result = None
+    
+    if request.method == 'POST':
+        csv_file = request.FILES.get('csv_file')
+        if not csv_file:
+            messages.error(request, 'Please choose a CSV file to upload.')
+        elif not csv_file.name.lower().endswith('.csv'):
+            messages.error(request, 'Please upload a .csv file.')
+        elif uploaded_row_count(csv_file, settings.IMPORT_UPLOAD_MAX_ROWS) > settings.IMPORT_UPLOAD_MAX_ROWS:
+            messages.error(request, f'This page imports at most {settings.IMPORT_UPLOAD_MAX_ROWS} rows at a time. '
+                                    f'Split the file, or ask an administrator to run '
+                                    f'"python manage.py import_users {role} <file>" on the server.')
+        else:
+            result = import_uploaded_file(csv_file, role, workers=settings.IMPORT_UPLOAD_WORKERS)
+            if result['created']:
+                messages.success(request, f"Imported {result['created']} {role}s successfully!")
+            if result['errors']:
+                messages.warning(request, f"{len(result['errors'])} rows were rejected. See the report below.")
+    
+    context = {
+        'role': role,
+        'result': result,
+        'shown_errors': result['errors'][:IMPORT_ERRORS_SHOWN] if result else [],
+        'mentee_columns': MENTEE_REQUIRED_COLUMNS,
+        'mentor_columns': MENTOR_REQUIRED_COLUMNS,
+        'max_rows': settings.IMPORT_UPLOAD_MAX_ROWS,
+    }
+    return render(request, 'bulk_import.html', context)
+
+@login_required
+@conditional_page(head_mentee_state)
 def view_mentee(request, mentee_id):
     """View for viewing mentee details"""
     if request.user.role != 'head':
@@ -1996,8 +1926,7 @@ def delete_mentee(request, mentee_id):
         
     except Exception as e:
         messages.error(request, f'Error deleting mentee: {str(e)}')
-        import traceback
-        print(f"Error deleting mentee: {traceback.format_exc()}")
+        logger.exception('Deleting mentee %s failed', mentee_id)
     
     return redirect('manage_mentees')
 
@@ -2135,6 +2064,7 @@ def add_mentor(request):
     return render(request, 'add_mentor.html')
 
 @login_required
+@conditional_page(head_mentor_state)
 def view_mentor(request, mentor_id):
     """View for head to view mentor details"""
     if request.user.role != 'head':
@@ -2385,10 +2315,8 @@ def assign_mentees_to_mentor(request, mentor_id):
     
     try:
         mentor = Mentor.objects.get(MentorID=mentor_id)
-        
-        print(f"=== DEBUG: Assigning to Mentor ===")
-        print(f"Mentor: {mentor.MentorName}")
-        print(f"Mentor Department: {mentor.MentorDepartment}")
+        verbose = debug_enabled(logger)
+        logger.debug('Assigning to mentor %s (%s)', mentor.MentorID, mentor.MentorDepartment)
         
         if request.method == 'POST':
             mentee_ids = request.POST.getlist('mentee_ids')
@@ -2411,11 +2339,12 @@ def assign_mentees_to_mentor(request, mentor_id):
                     # Use the new assignment method
                     mentor.assign_mentee(mentee, assigned_by=request.user)
                     assigned_count += 1
-                    print(f"✅ Successfully assigned {mentee.MenteeName} to {mentor.MentorName}")
+                    if verbose:
+                        logger.debug('Assigned %s to %s', mentee.MenteeID, mentor.MentorID)
                     
                 except (Mentee.DoesNotExist, ValueError) as e:
                     messages.warning(request, f"Could not assign mentee {mentee_id}: {str(e)}")
-                    print(f"❌ Assignment failed for {mentee_id}: {str(e)}")
+                    logger.warning('Could not assign %s to %s: %s', mentee_id, mentor.MentorID, e)
             
             if assigned_count > 0:
                 messages.success(request, f'Successfully assigned {assigned_count} mentees to {mentor.MentorName}!')
@@ -2424,11 +2353,8 @@ def assign_mentees_to_mentor(request, mentor_id):
             return redirect('mentor_assignments')
         
         # FIXED: Get unassigned mentees using CONSISTENT logic
-        print(f"=== DEBUG: Finding Unassigned Mentees ===")
-        
         # Get ALL mentees first
         all_mentees = Mentee.objects.all()
-        print(f"Total mentees in system: {all_mentees.count()}")
         
         # Find unassigned mentees by checking both assignment model AND direct assignment
         unassigned_mentees = []
@@ -2446,19 +2372,17 @@ def assign_mentees_to_mentor(request, mentor_id):
             # If neither exists, mentee is unassigned
             if not has_active_assignment and not has_direct_mentor:
                 unassigned_mentees.append(mentee)
-                print(f"UNASSIGNED: {mentee.MenteeName} ({mentee.MenteeID}) - Course: {mentee.MenteeCourse}")
-            else:
-                assignment_source = "assignment model" if has_active_assignment else "direct field"
-                print(f"ASSIGNED: {mentee.MenteeName} - via {assignment_source}")
+            elif verbose:
+                logger.debug('%s already assigned via %s', mentee.MenteeID,
+                             'assignment model' if has_active_assignment else 'direct field')
         
-        print(f"Total unassigned mentees found: {len(unassigned_mentees)}")
+        logger.debug('Unassigned mentees found: %d', len(unassigned_mentees))
         
         # Find eligible mentees for this mentor with department matching
         eligible_mentees = []
         
         for mentee in unassigned_mentees:
             required_department = get_department_for_course(mentee.MenteeCourse)
-            print(f"DEBUG: {mentee.MenteeName} - Course: '{mentee.MenteeCourse}' -> Department: '{required_department}'")
             
             # Department matching logic
             if required_department and mentor.MentorDepartment:
@@ -2482,13 +2406,13 @@ def assign_mentees_to_mentor(request, mentor_id):
                 
                 if match_found:
                     eligible_mentees.append(mentee)
-                    print(f"DEBUG: ✅ ELIGIBLE: {mentee.MenteeName} - {required_department} matches {mentor.MentorDepartment}")
-                else:
-                    print(f"DEBUG: ❌ NOT ELIGIBLE: {mentee.MenteeName} - needed: {required_department}, mentor has: {mentor.MentorDepartment}")
-            else:
-                print(f"DEBUG: ❌ NO DEPARTMENT MAPPING: {mentee.MenteeName} - course: '{mentee.MenteeCourse}' -> {required_department}")
+                elif verbose:
+                    logger.debug('%s not eligible: needs %s, mentor is %s',
+                                 mentee.MenteeID, required_department, mentor.MentorDepartment)
+            elif verbose:
+                logger.debug('%s not eligible: no department for course %r', mentee.MenteeID, mentee.MenteeCourse)
         
-        print(f"Final eligible mentees: {len(eligible_mentees)}")
+        logger.debug('Eligible mentees: %d', len(eligible_mentees))
         
         # Calculate available slots based on assignment model
         current_assignments_count = MentorMenteeAssignment.objects.filter(
@@ -2497,7 +2421,8 @@ def assign_mentees_to_mentor(request, mentor_id):
         ).count()
         available_slots = mentor.MaxMentees - current_assignments_count
         
-        print(f"Current assignments: {current_assignments_count}, Max: {mentor.MaxMentees}, Available: {available_slots}")
+        logger.debug('Mentor %s has %d/%d mentees, %d slots free',
+                     mentor.MentorID, current_assignments_count, mentor.MaxMentees, available_slots)
         
         # Calculate gender needs
         current_gender_dist = mentor.get_mentee_gender_distribution()
@@ -2556,7 +2481,6 @@ def get_department_for_course(mentee_course):
         return None
     
     course = str(mentee_course).strip().lower()
-    print(f"DEBUG: Mapping course '{mentee_course}' -> '{course}'")
     
     # Enhanced mapping with better matching
     course_to_department = {
@@ -2612,31 +2536,33 @@ def get_department_for_course(mentee_course):
     
     # Exact match
     if course in course_to_department:
-        result = course_to_department[course]
-        print(f"DEBUG: Exact match found: {result}")
-        return result
+        return course_to_department[course]
+    
+    verbose = debug_enabled(logger)
     
     # Try partial matches
     for key, value in course_to_department.items():
         if key in course:
-            result = value
-            print(f"DEBUG: Partial match found: '{key}' -> {value}")
-            return result
+            if verbose:
+                logger.debug('Course %r mapped to %s by partial match on %r', mentee_course, value, key)
+            return value
     
     # Try word-based matching
     words = course.split()
     for word in words:
         for key, value in course_to_department.items():
             if word in key.split():
-                result = value
-                print(f"DEBUG: Word match found: '{word}' -> {value}")
-                return result
+                if verbose:
+                    logger.debug('Course %r mapped to %s by word match on %r', mentee_course, value, word)
+                return value
     
-    print(f"DEBUG: No department mapping found for: '{mentee_course}'")
+    if verbose:
+        logger.debug('No department mapping for course %r', mentee_course)
     return None
 
 def auto_assign_smart(request=None):
     """Smart auto-assignment with gender balance consideration using assignment model"""
+    started = time.perf_counter()
     assigned_count = 0
     
     # Get mentees without active assignments
@@ -2645,12 +2571,11 @@ def auto_assign_smart(request=None):
     ).values_list('mentee_id', flat=True)
     
     unassigned_mentees = Mentee.objects.exclude(MenteeID__in=assigned_mentee_ids)
-    
-    print(f"=== SMART AUTO-ASSIGNMENT DEBUG ===")
-    print(f"Unassigned mentees: {unassigned_mentees.count()}")
+    verbose = debug_enabled(logger)
     
     if not unassigned_mentees:
-        print("No unassigned mentees found.")
+        logger.info('Smart auto-assignment: no unassigned mentees')
+        metrics.record_auto_assign('smart', time.perf_counter() - started, 0)
         return 0
     
     # Group mentees by required department and gender
@@ -2666,13 +2591,11 @@ def auto_assign_smart(request=None):
                 mentees_by_department_gender[dept]['male'].append(mentee)
             else:
                 mentees_by_department_gender[dept]['female'].append(mentee)
-            print(f"Added {mentee.MenteeName} ({mentee.MenteeGender}) to {dept} department")
     
     # Process each department
     for dept, gender_groups in mentees_by_department_gender.items():
-        print(f"Processing department: {dept}")
-        print(f"  Male mentees: {len(gender_groups['male'])}")
-        print(f"  Female mentees: {len(gender_groups['female'])}")
+        logger.debug('Department %s: %d male, %d female mentees to place',
+                     dept, len(gender_groups['male']), len(gender_groups['female']))
         
         # Get available mentors in this department
         available_mentors = []
@@ -2697,12 +2620,12 @@ def auto_assign_smart(request=None):
                     'available_slots': available_slots,
                     'total_current': current_assignments
                 })
-                print(f"  Available mentor: {mentor.MentorName} (Slots: {available_slots}, Male: {gender_dist['male']}, Female: {gender_dist['female']})")
-        
-        print(f"  Total available mentors: {len(available_mentors)}")
+                if verbose:
+                    logger.debug('Mentor %s available: %d slots, %d male, %d female',
+                                 mentor.MentorID, available_slots, gender_dist['male'], gender_dist['female'])
         
         if not available_mentors:
-            print(f"  No available mentors in {dept} department")
+            logger.info('Smart auto-assignment: no mentor with free slots in %s', dept)
             continue
         
         # Sort mentors by how balanced they are (closer to 50/50 is better)
@@ -2761,10 +2684,12 @@ def auto_assign_smart(request=None):
                     else:
                         mentor_data['current_female'] += 1
                     
-                    print(f"  ✅ Assigned {mentee_to_assign.MenteeName} ({mentee_to_assign.MenteeGender}) to {mentor.MentorName}")
+                    if verbose:
+                        logger.debug('Assigned %s (%s) to %s',
+                                     mentee_to_assign.MenteeID, mentee_to_assign.MenteeGender, mentor.MentorID)
                     
                 except ValueError as e:
-                    print(f"  ❌ Could not assign {mentee_to_assign.MenteeName}: {str(e)}")
+                    logger.warning('Could not assign %s to %s: %s', mentee_to_assign.MenteeID, mentor.MentorID, e)
                     # Put back in the appropriate list
                     if mentee_to_assign.MenteeGender == 'male':
                         male_mentees.insert(0, mentee_to_assign)
@@ -2782,11 +2707,13 @@ def auto_assign_smart(request=None):
             if not available_mentors:
                 break
     
-    print(f"TOTAL ASSIGNED IN SMART ASSIGNMENT: {assigned_count}")
+    logger.info('Smart auto-assignment assigned %d mentees', assigned_count)
+    metrics.record_auto_assign('smart', time.perf_counter() - started, assigned_count)
     return assigned_count
 
 def auto_assign_mentees():
     """Automatically assign unassigned mentees to appropriate mentors using assignment model"""
+    started = time.perf_counter()
     assigned_count = 0
     
     # Get mentees without active assignments
@@ -2817,8 +2744,9 @@ def auto_assign_mentees():
                 best_mentor.assign_mentee(mentee)
                 assigned_count += 1
             except ValueError as e:
-                print(f"Could not assign {mentee.MenteeName} to {best_mentor.MentorName}: {str(e)}")
+                logger.warning('Could not assign %s to %s: %s', mentee.MenteeID, best_mentor.MentorID, e)
     
+    metrics.record_auto_assign('department', time.perf_counter() - started, assigned_count)
     return assigned_count
 
 @login_required
@@ -2830,10 +2758,8 @@ def assign_mentees_to_mentor(request, mentor_id):
     
     try:
         mentor = Mentor.objects.get(MentorID=mentor_id)
-        
-        print(f"=== DEBUG: Assigning to Mentor ===")
-        print(f"Mentor: {mentor.MentorName}")
-        print(f"Mentor Department: {mentor.MentorDepartment}")
+        verbose = debug_enabled(logger)
+        logger.debug('Assigning to mentor %s (%s)', mentor.MentorID, mentor.MentorDepartment)
         
         if request.method == 'POST':
             mentee_ids = request.POST.getlist('mentee_ids')
@@ -2860,22 +2786,20 @@ def assign_mentees_to_mentor(request, mentor_id):
         ).values_list('mentee_id', flat=True)
         
         unassigned_mentees = Mentee.objects.exclude(MenteeID__in=assigned_mentee_ids)
-        print(f"Total unassigned mentees: {unassigned_mentees.count()}")
         
         # Find mentees that match this mentor's department
         eligible_mentees = []
         
         for mentee in unassigned_mentees:
             required_department = get_department_for_course(mentee.MenteeCourse)
-            print(f"DEBUG: {mentee.MenteeName} - Course: '{mentee.MenteeCourse}' -> Department: '{required_department}'")
             
             if required_department and required_department in mentor.MentorDepartment:
                 eligible_mentees.append(mentee)
-                print(f"DEBUG: ✅ ELIGIBLE: {mentee.MenteeName} matches {mentor.MentorDepartment}")
-            else:
-                print(f"DEBUG: ❌ NOT ELIGIBLE: {mentee.MenteeName} - needed: {required_department}, mentor has: {mentor.MentorDepartment}")
+            elif verbose:
+                logger.debug('%s not eligible: needs %s, mentor is %s',
+                             mentee.MenteeID, required_department, mentor.MentorDepartment)
         
-        print(f"Final eligible mentees: {len(eligible_mentees)}")
+        logger.debug('Eligible mentees: %d', len(eligible_mentees))
         
         # Calculate available slots
         current_assignments = MentorMenteeAssignment.objects.filter(
@@ -2924,10 +2848,9 @@ def quick_assign(request, mentee_id):
         mentee = Mentee.objects.get(MenteeID=mentee_id)
         required_department = get_department_for_course(mentee.MenteeCourse)
         
-        print(f"=== DEBUG QUICK ASSIGN ===")
-        print(f"Mentee: {mentee.MenteeName}")
-        print(f"Course: {mentee.MenteeCourse}")
-        print(f"Required Department: {required_department}")
+        verbose = debug_enabled(logger)
+        logger.debug('Quick assign %s: course %r -> department %s',
+                     mentee.MenteeID, mentee.MenteeCourse, required_department)
         
         if request.method == 'POST':
             mentor_id = request.POST.get('mentor_id')
@@ -2944,15 +2867,11 @@ def quick_assign(request, mentee_id):
             return redirect('mentor_assignments')
         
         # FIXED: Get available mentors using assignment model
-        print(f"Finding available mentors for department: {required_department}")
-        
         # Get all mentors in the required department
         department_mentors = Mentor.objects.filter(
             MentorDepartment__icontains=required_department
         ) if required_department else Mentor.objects.all()
         
-        print(f"Mentors in department: {department_mentors.count()}")
-        
         # Filter mentors with available capacity using assignment model
         available_mentors = []
         for mentor in department_mentors:
@@ -2964,14 +2883,16 @@ def quick_assign(request, mentee_id):
             
             available_slots = mentor.MaxMentees - current_assignments
             
-            print(f"Mentor: {mentor.MentorName}, Current: {current_assignments}, Max: {mentor.MaxMentees}, Available: {available_slots}")
+            if verbose:
+                logger.debug('Mentor %s has %d/%d mentees, %d slots free',
+                             mentor.MentorID, current_assignments, mentor.MaxMentees, available_slots)
             
             if available_slots > 0:
                 # Add current assignments count to mentor object for template
                 mentor.CurrentMentees = current_assignments
                 available_mentors.append(mentor)
         
-        print(f"Available mentors found: {len(available_mentors)}")
+        logger.debug('Available mentors for %s: %d', mentee.MenteeID, len(available_mentors))
         
         context = {
             'mentee': mentee,
@@ -3062,88 +2983,58 @@ def assignment_history(request, mentor_id=None):
         messages.error(request, 'Access denied. Head role required.')
         return redirect('homepage')
     
-    print(f"DEBUG: User: {request.user}")
-    print(f"DEBUG: User authenticated: {request.user.is_authenticated}")
-    print(f"DEBUG: User username: {request.user.username}")
-    
     # Get all assignments with related objects
     assignments = MentorMenteeAssignment.objects.all().select_related(
         'mentor', 'mentee', 'assigned_by'
     ).order_by('-assigned_date')
     
-    # Apply filters
-    mentor_filter = request.GET.get('mentor')
-    status_filter = request.GET.get('status')
-    date_from = request.GET.get('date_from')
-    date_to = request.GET.get('date_to')
-    
-    if mentor_filter:
-        assignments = assignments.filter(mentor__MentorID=mentor_filter)
-    
-    if status_filter:
-        assignments = assignments.filter(assignment_status=status_filter)
-    
-    if date_from:
-        assignments = assignments.filter(assigned_date__gte=date_from)
-    
-    if date_to:
-        assignments = assignments.filter(assigned_date__lte=date_to)
+    # Apply filters (shared with export_assignments)
+    mentor_filter = request.GET.get('mentor') or mentor_id
+    assignments = filter_assignments(assignments, request.GET, mentor_id)
     
-    # Pagination
     paginator = Paginator(assignments, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
-    # Statistics
-    total_assignments = assignments.count()
-    active_assignments = assignments.filter(assignment_status='active').count()
-    transferred_assignments = assignments.filter(assignment_status='transferred').count()
-    completed_assignments = assignments.filter(assignment_status='completed').count()
-    
-    # Get all mentors for filter dropdown
-    mentors = Mentor.objects.all().order_by('MentorName')
-    
-    # Get head user information
-    try:
-        head_user = HeadofMentorMentee.objects.get(user=request.user)
-        print(f"DEBUG: Head user found: {head_user}")
-    except HeadofMentorMentee.DoesNotExist:
-        head_user = None
-        print("DEBUG: Head user not found, creating one...")
-        # Create head profile if it doesn't exist
-        head_user = HeadofMentorMentee.objects.create(
-            user=request.user,
-            HeadofMentorMenteeID=request.user.username,
-            HeadofMentorMenteeName=request.user.get_full_name() or "Head Administrator",
-            HeadofMentorMenteeEmail=request.user.email or "head@example.com",
-            HeadofMentorMenteePhone="",
-            HeadofMentorMenteeIC="",
-            HeadofMentorMenteeAddress="",
-            HeadofMentorMenteePostcode="",
-            HeadofMentorMenteeCity="",
-            HeadofMentorMenteeState="",
-            HeadofMentorMenteeRace="",
-            HeadofMentorMenteeReligion="",
-            HeadofMentorMenteeDepartment="",
-        )
-    
     context = {
-        'assignments': page_obj,
-        'page_obj': page_obj,
         'paginator': paginator,
-        'is_paginated': paginator.num_pages > 1,
-        'total_assignments': total_assignments,
-        'active_assignments': active_assignments,
-        'transferred_assignments': transferred_assignments,
-        'completed_assignments': completed_assignments,
-        'mentors': mentors,
         'selected_mentor': mentor_filter,
         'user': request.user,  # Ensure user is in context
-        'head_user': head_user,
     }
-    
-    print(f"DEBUG: Context keys: {list(context.keys())}")
-    return render(request, 'assignment_history.html', context)
+
+    if not wants_fragment(request):
+        # Statistics - one GROUP BY over the filtered queryset instead of four COUNTs
+        status_counts = dict(
+            assignments.order_by().values_list('assignment_status').annotate(count=Count('pk'))
+        )
+        # Reuse the grouped total so the paginator doesn't COUNT again
+        paginator.count = sum(status_counts.values())
+        context.update({
+            'total_assignments': paginator.count,
+            'active_assignments': status_counts.get('active', 0),
+            'transferred_assignments': status_counts.get('transferred', 0),
+            'completed_assignments': status_counts.get('completed', 0),
+            # Mentors for the filter/transfer dropdowns, served from the versioned cache
+            'mentors': get_mentor_facets(),
+            # Get head user information (read-only - GET requests must not create rows)
+            'head_user': HeadofMentorMentee.objects.filter(user=request.user).first(),
+        })
+
+    page_obj = paginator.get_page(request.GET.get('page'))
+    context.update({
+        'assignments': page_obj,
+        'page_obj': page_obj,
+        'is_paginated': paginator.num_pages > 1,
+    })
+
+    return render_list(request, 'assignment_history.html', 'partials/assignment_history_rows.html', context)
+
+@login_required
+def export_assignments(request, mentor_id=None):
+    """Stream assignment history as CSV, honouring the assignment_history filters"""
+    if request.user.role != 'head':
+        messages.error(request, 'Access denied. Head role required.')
+        return redirect('homepage')
+
+    assignments = filter_assignments(MentorMenteeAssignment.objects.all(), request.GET, mentor_id)
+    return export_assignments_csv(assignments)
 
 @login_required
 def assignment_details(request, assignment_id):
@@ -3362,12 +3253,10 @@ def delete_assignment(request, assignment_id):
                     assignment.mentee.assigned_mentor = None
                     assignment.mentee.save()
             
-            # Optional: Log deletion details before deleting
-            print(f"ASSIGNMENT DELETED: {mentor_name} - {mentee_name}")
-            print(f"  Status: {assignment_status}")
-            print(f"  Reason: {deletion_reason}")
-            print(f"  Deleted by: {request.user}")
-            print(f"  Deleted at: {timezone.now()}")
+            # Log deletion details before deleting
+            logger.info('Assignment %s deleted (%s -> %s, %s) by %s: %s',
+                        assignment_id, assignment.mentor_id, assignment.mentee_id,
+                        assignment_status, request.user, deletion_reason)
             
             # Delete the assignment
             assignment.delete()
@@ -3393,44 +3282,54 @@ def mentor_mentee_activities(request):
     # Get all activities ordered by date and time
     activities = Activity.objects.all().order_by('-Date', 'StartTime')
     
-    # Search functionality
+    # Search, status and type filters (search is shared with export_attendance)
     search_query = request.GET.get('search', '')
-    if search_query:
-        activities = activities.filter(
-            Q(ActivityID__icontains=search_query) |
-            Q(ActivityName__icontains=search_query) |
-            Q(ActivityType__icontains=search_query) |
-            Q(Location__icontains=search_query)
-        )
-    
-    # Calculate statistics for the dashboard
-    total_activities = activities.count()
+    activities = filter_activities(activities, request.GET)
     
-    # Get today's date for filtering
-    today = timezone.now().date()
-    
-    # Count activities by status
-    upcoming_activities = activities.filter(Date__gt=today).count()
-    ongoing_activities = activities.filter(Date=today).count()
-    past_activities = activities.filter(Date__lt=today).count()
+    # Pagination, with the same per-page choices as manage_mentees
+    try:
+        per_page = int(request.GET.get('per_page', 10))
+    except ValueError:
+        per_page = 10
+    if per_page not in [10, 25, 50, 100]:
+        per_page = 10
     
-    # Calculate total participants across all activities - FIXED: use attendance_set
-    total_participants = 0
-    for activity in activities:
-        total_participants += activity.attendance_set.count()  # Changed from attendance to attendance_set
+    # Primary mentor joined and participants counted in the page query instead of once per row
+    paginator = Paginator(
+        activities.select_related('PrimaryMentor').annotate(participant_count=Count('attendance')), per_page
+    )
+    page_obj = paginator.get_page(request.GET.get('page'))
     
     context = {
-        'activities': activities,
+        'activities': page_obj,
+        'page_obj': page_obj,
         'search_query': search_query,
-        'total_activities': total_activities,
-        'upcoming_activities': upcoming_activities,
-        'ongoing_activities': ongoing_activities,
-        'past_activities': past_activities,
-        'total_participants': total_participants,
-        'current_month': timezone.now().strftime('%B %Y'),
+        'per_page': per_page,
     }
     
-    return render(request, 'mentor_mentee_activities.html', context)
+    if not wants_fragment(request):
+        # Calculate statistics for the dashboard - one aggregate over the filtered activities
+        today = timezone.now().date()
+        context.update(activities.aggregate(
+            total_activities=Count('pk'),
+            upcoming_activities=Count('pk', filter=Q(Date__gt=today)),
+            ongoing_activities=Count('pk', filter=Q(Date=today)),
+            past_activities=Count('pk', filter=Q(Date__lt=today)),
+        ))
+        context['total_participants'] = Attendance.objects.filter(activity__in=activities).count()
+        context['current_month'] = timezone.now().strftime('%B %Y')
+    
+    return render_list(request, 'mentor_mentee_activities.html', 'partials/mentor_mentee_activities_rows.html', context)
+
+@login_required
+def export_attendance(request):
+    """Stream attendance records as CSV, filtered by the activities search, activity, attended and date range"""
+    if request.user.role != 'head':
+        messages.error(request, 'Access denied. Head role required.')
+        return redirect('homepage')
+
+    attendance = filter_attendance(Attendance.objects.all(), request.GET)
+    return export_attendance_csv(attendance)
 
 @login_required
 def create_activity(request):
@@ -3516,6 +3415,14 @@ def get_next_activity_id(request):
     
     return JsonResponse({'next_id': next_id})
 
+@login_required
+def api_list(request, resource):
+    """Read-only JSON list of mentees, mentors, assignments, activities or attendance (see api.py)"""
+    if request.user.role != 'head':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    return api_list_response(resource, request.GET)
+
 @login_required
 def view_activity(request, activity_id):
     """View for head to view activity details"""
@@ -3634,14 +3541,62 @@ def delete_activity(request, activity_id):
     # If it's a GET request, redirect to view activity page
     return redirect('view_activity', activity_id=activity_id)
 
-def get_course_full_name(course_code):
-    """Map course codes to full course names"""
-    course_mapping = {
-        'CS': 'Diploma in Computer Science',
-        'DA': 'Diploma in Accounting', 
-        'DB': 'Diploma in Business Studies',
-        'LH': 'Diploma in Landscape Horticulture',
-        'IEP': 'Intensive English Programme',
-        'CFAB': 'Certificate in Finance, Accountancy and Business'
-    }
-    return course_mapping.get(course_code, course_code)
\ No newline at end of file
+@login_required
+async def event_stream(request):
+    """Server-sent events for the signed-in mentor or mentee (see events.py).
+
+    Under ASGI the connection stays open and events arrive as they happen.
+    A WSGI worker can't spare a thread per browser, so there the response
+    carries whatever is pending and the browser reconnects EVENTS_WSGI_RETRY
+    seconds later.
+    """
+    user = await request.auser()
+    if user.role not in events.EVENT_ROLES:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    last_id = await sync_to_async(events.start_id)(request.headers.get('Last-Event-ID'))
+    if not isinstance(request, ASGIRequest):
+        body = await sync_to_async(events.pending)(user.pk, last_id)
+        response = HttpResponse(body, content_type='text/event-stream')
+    else:
+        response = StreamingHttpResponse(events.stream(user.pk, last_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Tell nginx not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+def metrics_view(request):
+    """Prometheus metrics for all workers - staff sessions, or a scraper sending METRICS_TOKEN as a bearer token"""
+    allowed = request.user.is_authenticated and request.user.is_staff
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if not allowed and token:
+        allowed = constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}')
+    if not allowed:
+        return HttpResponse('Access denied', status=403, content_type='text/plain')
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@login_required
+def serve_media(request, path):
+    """An uploaded file, for users its directory allows (see media.py); Range requests and proxy offload supported"""
+    if not media.can_read(request.user, path):
+        raise Http404('Not found')
+    return media.file_response(request, path)
+
+def serve_static(request, path):
+    """Collected static files; fingerprinted names never change content, so they are cached as immutable"""
+    if settings.DEBUG:
+        # Straight from the app directories, no collectstatic needed
+        return staticfiles_serve(request, path, insecure=True)
+    # collectstatic wrote .br/.gz copies of text files; send the best one the client takes
+    variants = [encoding for encoding in encodings()
+                if os.path.isfile(os.path.join(settings.STATIC_ROOT, path + FILE_SUFFIXES[encoding]))]
+    encoding = negotiate(request.headers.get('Accept-Encoding'), variants) if variants else None
+    response = static_serve(request, path + FILE_SUFFIXES[encoding] if encoding else path,
+                            document_root=settings.STATIC_ROOT)
+    if variants:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    if getattr(staticfiles_storage, 'is_fingerprinted', None) and staticfiles_storage.is_fingerprinted(path):
+        response['Cache-Control'] = f'public, max-age={settings.STATIC_IMMUTABLE_MAX_AGE}, immutable'
+    else:
+        response['Cache-Control'] = 'no-cache'
+    return response
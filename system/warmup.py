@@ -0,0 +1,121 @@
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+from django.template import engines
+from django.urls import get_resolver
+
+from .caching import get_cache_version, get_mentor_facets, MENTOR_FACETS, SIDEBAR_COUNTERS
+
+# Work a worker otherwise does on its first requests after a deploy: parsing
+# every template (the cached loader keeps compiled templates per process),
+# loading the static manifest and URL resolver, and filling shared caches.
+# Run it with `manage.py warmup`, or in each worker at boot by setting
+# WARMUP_ON_BOOT (see mentormenteesystem/wsgi.py and asgi.py). With gunicorn
+# --preload the boot warm-up runs once in the master and workers inherit it.
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+logger = logging.getLogger(__name__)
+
+
+def template_names(directory=TEMPLATE_DIR):
+    """Names of every template under ``directory``, as passed to get_template()"""
+    names = []
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            if filename.endswith('.html'):
+                names.append(os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, '/'))
+    return sorted(names)
+
+
+def compile_templates(names=None):
+    """Compile templates into the cached loader; returns [(name, seconds)], slowest first.
+
+    A template that fails to compile is logged and reported with seconds=None.
+    """
+    engine = engines['django'].engine
+    timings = []
+    for name in template_names() if names is None else names:
+        started = time.perf_counter()
+        try:
+            engine.get_template(name)
+        except Exception:
+            logger.exception('Template %s failed to compile', name)
+            timings.append((name, None))
+            continue
+        timings.append((name, time.perf_counter() - started))
+    return sorted(timings, key=lambda timing: -1 if timing[1] is None else timing[1], reverse=True)
+
+
+def _static_manifest():
+    return len(staticfiles_storage.fingerprinted_names)
+
+
+def _url_resolver():
+    resolver = get_resolver()
+    return len(resolver.reverse_dict)
+
+
+def _cache_versions():
+    return [get_cache_version(namespace) for namespace in (MENTOR_FACETS, SIDEBAR_COUNTERS)]
+
+
+def _mentor_facets():
+    return len(get_mentor_facets())
+
+
+# label: callable; each is timed and its result shown by `manage.py warmup`
+CACHE_WARMERS = {
+    'static manifest': _static_manifest,
+    'url resolver': _url_resolver,
+    'cache versions': _cache_versions,
+    'mentor facets': _mentor_facets,
+}
+
+
+def prime_caches():
+    """Run every CACHE_WARMERS entry; returns [(label, result, seconds)]"""
+    results = []
+    for label, warmer in CACHE_WARMERS.items():
+        started = time.perf_counter()
+        try:
+            result = warmer()
+        except Exception:
+            logger.exception('Warming %s failed', label)
+            result = None
+        results.append((label, result, time.perf_counter() - started))
+    return results
+
+
+def cache_is_process_local():
+    """Entries primed into a per-process cache are not seen by other workers"""
+    return isinstance(caches['default'], LocMemCache)
+
+
+def warm_up():
+    """Compile templates and prime caches; returns (template timings, cache results)"""
+    started = time.perf_counter()
+    templates = compile_templates()
+    primed = prime_caches()
+    logger.info('Warm-up: %d templates compiled, %d caches primed in %.0f ms',
+                len(templates), len(primed), (time.perf_counter() - started) * 1000)
+    return templates, primed
+
+
+def warm_up_worker():
+    """Boot hook for wsgi.py/asgi.py: warm up when WARMUP_ON_BOOT is set, never fail the boot"""
+    if not getattr(settings, 'WARMUP_ON_BOOT', False):
+        return
+    try:
+        warm_up()
+    except Exception:
+        logger.exception('Warm-up at boot failed')
+    finally:
+        # Don't hand a connection opened here to forked workers
+        connections.close_all()